@@ -31,6 +31,7 @@ from roadmap.common.observability.otel_init import initialize_tracing
 
 # Import core classes for backward compatibility with tests
 from roadmap.infrastructure.coordination.core import RoadmapCore
+from roadmap.settings import get_tracing_config
 
 console = get_console()
 
@@ -190,8 +191,11 @@ def _detect_project_context():
 @click.pass_context
 def main(ctx: click.Context):
     """Roadmap CLI - A command line tool for creating and managing roadmaps."""
-    # Initialize OpenTelemetry tracing
-    initialize_tracing()
+    # Initialize OpenTelemetry tracing only when opted in; otherwise none of
+    # the exporter/SDK modules are imported
+    tracing = get_tracing_config()
+    if tracing["enabled"]:
+        initialize_tracing(endpoint=tracing["endpoint"])
 
     # Ensure that ctx.obj exists and is a dict (in case `cli()` is called
     # by means other than the `if` block below)
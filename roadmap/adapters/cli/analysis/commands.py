@@ -346,14 +346,16 @@ def _format_csv_export(result, issues: list) -> str:
             "issue_id,title,duration_hours,dependencies,slack_hours,is_critical,status"
         ]
 
+        nodes = {node.issue_id: node for node in result.critical_path}
+        nodes.update(result.schedule)
+        critical_ids = set(result.critical_issue_ids)
+
         for issue in issues:
             deps = ",".join(issue.depends_on) if issue.depends_on else ""
             # Find corresponding node
-            node = next(
-                (n for n in result.critical_path if n.issue_id == issue.id), None
-            )
+            node = nodes.get(issue.id)
             slack = f"{node.slack_time:.1f}" if node else "N/A"
-            critical = "yes" if issue.id in result.critical_issue_ids else "no"
+            critical = "yes" if issue.id in critical_ids else "no"
 
             lines.append(
                 f'"{issue.id}","{issue.title}",{issue.estimated_hours or 0},"{deps}",{slack},{critical},{issue.status}'
@@ -76,6 +76,10 @@ class CriticalPathPresenter:
 
         lines.append(f"Critical Issues:     {len(result.critical_issue_ids)}")
 
+        # Dependency cycles leave issues unschedulable
+        for cycle in result.dependency_cycles:
+            lines.append(f"⚠️  Dependency cycle: {' → '.join(cycle)}")
+
         # Risk assessment
         risk_level = self._assess_risk(result)
         lines.append(f"Risk Level:          {risk_level}")
@@ -159,6 +159,33 @@ def hooks_status(ctx: click.Context):
         ctx.exit(1)
 
 
+@git.command("hooks-daemon")
+@click.argument(
+    "action", type=click.Choice(["start", "stop", "status"]), default="status"
+)
+@click.option(
+    "--foreground",
+    is_flag=True,
+    help="Run the daemon in this process instead of in the background",
+)
+@click.pass_context
+@require_initialized
+def hooks_daemon(ctx: click.Context, action: str, foreground: bool):
+    """Manage the background worker that applies Git hook events.
+
+    While it runs, installed hooks hand their events to it over a socket in
+    .git instead of starting roadmap for every commit, checkout and merge.
+    Hooks fall back to handling events themselves when it is not running.
+    """
+    core = ctx.obj["core"]
+
+    try:
+        handler = GitHooksHandler(console)
+        handler.manage_daemon(core, action, foreground)
+    except Exception:
+        ctx.exit(1)
+
+
 @git.command("sync")
 @click.option(
     "--dry-run",
@@ -3,6 +3,7 @@
 import structlog
 from rich.console import Console
 
+from roadmap.adapters.git import hook_daemon
 from roadmap.adapters.git.git_hooks_manager import GitHookManager
 from roadmap.infrastructure.coordination.core import RoadmapCore
 
@@ -103,3 +104,44 @@ class GitHooksHandler:
         except Exception as e:
             self.console.print(f"❌ Error checking hooks: {e}", style="bold red")
             raise
+
+    def manage_daemon(self, core: RoadmapCore, action: str, foreground: bool = False):
+        """Start, stop or report on the Git hook daemon.
+
+        Args:
+            core: RoadmapCore instance
+            action: One of "start", "stop" or "status"
+            foreground: Run the daemon in this process (start only)
+
+        Raises:
+            Exception: If the daemon cannot be started
+        """
+        try:
+            if action == "start" and foreground:
+                self.console.print(
+                    "Hook daemon running, press Ctrl+C to stop", style="green"
+                )
+                try:
+                    hook_daemon.HookDaemon(GitHookManager(core)).serve_forever()
+                except KeyboardInterrupt:
+                    pass
+            elif action == "start":
+                if hook_daemon.start_daemon():
+                    self.console.print("✅ Hook daemon running", style="bold green")
+                else:
+                    raise RuntimeError("the daemon did not answer after starting")
+            elif action == "stop":
+                if hook_daemon.stop_daemon():
+                    self.console.print("✅ Hook daemon stopped", style="bold green")
+                else:
+                    self.console.print("Hook daemon is not running", style="yellow")
+            elif hook_daemon.is_daemon_running():
+                self.console.print("✅ Hook daemon running", style="bold green")
+            else:
+                self.console.print(
+                    "Hook daemon is not running; hooks handle events in-process",
+                    style="yellow",
+                )
+        except Exception as e:
+            self.console.print(f"❌ Error managing hook daemon: {e}", style="bold red")
+            raise
@@ -36,9 +36,18 @@ def _validate_and_get_issues(
     next_milestone: bool,
     milestone: str | None,
     overdue: bool,
+    open_flag: bool = False,
+    blocked: bool = False,
+    status: str | None = None,
+    priority: str | None = None,
+    issue_type: str | None = None,
 ) -> tuple[list[IssueDTO] | None, str | None]:
     """Validate filter combinations and get filtered issues as DTOs.
 
+    The SQLite issue list index answers all filters at once when it is up
+    to date; otherwise the primary filters are applied to the YAML issues
+    and the rest are left to _apply_additional_filters().
+
     Args:
         core: RoadmapCore instance
         backlog: Show backlog issues
@@ -48,6 +57,11 @@ def _validate_and_get_issues(
         next_milestone: Show next milestone issues
         milestone: Filter by milestone name
         overdue: Show overdue issues
+        open_flag: Show only open issues
+        blocked: Show only blocked issues
+        status: Filter by status
+        priority: Filter by priority
+        issue_type: Filter by issue type
 
     Returns:
         Tuple of (issues DTOs list or None, filter description or None)
@@ -60,7 +74,7 @@ def _validate_and_get_issues(
         return None, None
 
     query_service = IssueQueryService(core)
-    issues, filter_description = query_service.get_filtered_issues(
+    result = query_service.get_indexed_issues(
         milestone=milestone,
         backlog=backlog,
         overdue=overdue,
@@ -68,7 +82,23 @@ def _validate_and_get_issues(
         next_milestone=next_milestone,
         assignee=assignee,
         my_issues=my_issues,
+        open_only=open_flag,
+        blocked_only=blocked,
+        status=status,
+        priority=priority,
+        issue_type=issue_type,
     )
+    if result is None:
+        result = query_service.get_filtered_issues(
+            milestone=milestone,
+            backlog=backlog,
+            overdue=overdue,
+            unassigned=unassigned,
+            next_milestone=next_milestone,
+            assignee=assignee,
+            my_issues=my_issues,
+        )
+    issues, filter_description = result
 
     # Convert domain Issues to DTOs for CLI presentation
     issue_dtos = (
@@ -276,6 +306,11 @@ def list_issues(  # noqa: F841 - verbose is used by decorator
             params.next_milestone,
             params.milestone,
             params.overdue,
+            params.open,
+            params.blocked,
+            params.status,
+            params.priority,
+            params.issue_type,
         )
 
         if issues is None:
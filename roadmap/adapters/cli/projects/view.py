@@ -69,9 +69,9 @@ def view_project(ctx: click.Context, project_id: str):
     if project.milestones:
         all_milestones = core.milestones.list()
         milestones = [m for m in all_milestones if m.name in project.milestones]
-        milestone_progress = {
-            m.name: core.milestones.get_progress(m.name) for m in milestones
-        }
+        milestone_progress = core.milestones.get_all_progress(
+            [m.name for m in milestones]
+        )
 
     # Build effort data
     effort_data = None
@@ -10,6 +10,7 @@ Handles all business logic related to:
 from datetime import UTC, datetime
 
 from roadmap.common.logging import get_logger
+from roadmap.core.services.milestone_service import with_completion_percentage
 from roadmap.infrastructure.coordination.core import RoadmapCore
 
 logger = get_logger(__name__)
@@ -85,16 +86,9 @@ class MilestoneProgressService:
             }
         """
         try:
-            progress = core.milestones.get_progress(milestone_name)
-            return {
-                "total": progress.get("total", 0),
-                "completed": progress.get("completed", 0),
-                "percentage": (
-                    (progress.get("completed", 0) / progress.get("total", 1)) * 100
-                    if progress.get("total", 0) > 0
-                    else 0
-                ),
-            }
+            return with_completion_percentage(
+                core.milestones.get_progress(milestone_name)
+            )
         except Exception as e:
             logger.error(
                 "failed_to_get_milestone_progress",
@@ -115,12 +109,21 @@ class MilestoneProgressService:
         Returns:
             Dictionary mapping milestone name to progress dict
         """
-        progress_data = {}
-        for ms in milestones:
-            progress_data[ms.name] = MilestoneProgressService.get_milestone_progress(
-                core, ms.name
+        names = [ms.name for ms in milestones]
+        try:
+            # One pass over all issues instead of one per milestone
+            all_progress = core.milestones.get_all_progress(names)
+        except Exception as e:
+            logger.error(
+                "failed_to_get_all_milestones_progress",
+                error=str(e),
+                severity="operational",
             )
-        return progress_data
+            all_progress = {}
+
+        return {
+            name: with_completion_percentage(all_progress.get(name)) for name in names
+        }
 
 
 class MilestoneTimeEstimateService:
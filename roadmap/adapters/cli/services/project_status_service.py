@@ -14,6 +14,7 @@ from roadmap.adapters.persistence.parser import MilestoneParser, ProjectParser
 from roadmap.common.logging import get_logger
 from roadmap.common.models import ColumnDef, ColumnType, TableData
 from roadmap.core.domain import MilestoneStatus, ProjectStatus, Status
+from roadmap.core.services.milestone_service import with_completion_percentage
 from roadmap.infrastructure.coordination.core import RoadmapCore
 from roadmap.infrastructure.validation.file_enumeration import FileEnumerationService
 
@@ -84,17 +85,9 @@ class MilestoneProgressService:
             }
         """
         try:
-            progress = core.db.get_milestone_progress(milestone_name)
-            if progress and progress["total"] > 0:
-                percentage = (progress["completed"] / progress["total"]) * 100
-            else:
-                percentage = 0
-
-            return {
-                "total": progress.get("total", 0),
-                "completed": progress.get("completed", 0),
-                "percentage": percentage,
-            }
+            return with_completion_percentage(
+                core.db.get_milestone_progress(milestone_name)
+            )
         except Exception as e:
             logger.error(
                 "failed_to_get_milestone_progress",
@@ -115,12 +108,21 @@ class MilestoneProgressService:
         Returns:
             Dictionary mapping milestone name to progress dict
         """
-        progress_data = {}
-        for milestone in milestones:
-            progress_data[milestone.name] = (
-                MilestoneProgressService.get_milestone_progress(core, milestone.name)
+        try:
+            # One grouped query instead of a progress query per milestone
+            all_progress = core.db.get_all_milestones_progress()
+        except Exception as e:
+            logger.error(
+                "failed_to_get_all_milestones_progress",
+                error=str(e),
+                severity="operational",
             )
-        return progress_data
+            all_progress = {}
+
+        return {
+            milestone.name: with_completion_percentage(all_progress.get(milestone.name))
+            for milestone in milestones
+        }
 
 
 class IssueStatisticsService:
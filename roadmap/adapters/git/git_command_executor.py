@@ -12,9 +12,9 @@ class GitCommandExecutor:
         self.repo_path = repo_path or Path.cwd()
         self._git_dir = self._find_git_directory()
 
-    def _find_git_directory(self) -> Path | None:
+    def _find_git_directory(self, start: Path | None = None) -> Path | None:
         """Find the .git directory by walking up the directory tree."""
-        current = self.repo_path.resolve()
+        current = (start or self.repo_path).resolve()
 
         while current != current.parent:
             git_dir = current / ".git"
@@ -30,6 +30,15 @@ class GitCommandExecutor:
             self._git_dir = self._find_git_directory()
         return self._git_dir is not None
 
+    def top_level(self, path: Path | None = None) -> Path | None:
+        """Get the root of the working tree holding path (default repo_path).
+
+        Returns:
+            The directory containing ``.git``, or None outside a Git repository
+        """
+        git_dir = self._find_git_directory(path)
+        return git_dir.parent if git_dir is not None else None
+
     def run(self, args: list[str], cwd: Path | None = None) -> str | None:
         """Run a git command and return the output.
 
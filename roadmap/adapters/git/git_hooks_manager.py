@@ -88,17 +88,34 @@ class GitHookManager:
             "hooks_status": self.get_hooks_status(),
         }
 
-    def handle_post_commit(self):
+    def handle_hook(self, hook_name: str, ref: str | None = None) -> None:
+        """Dispatch a hook event to its handler.
+
+        Args:
+            hook_name: Name of the hook (e.g., 'post-commit')
+            ref: Commit SHA or branch name reported by the hook, if known
+        """
+        handler = getattr(self, f"handle_{hook_name.replace('-', '_')}")
+        handler(ref)
+
+    def handle_post_commit(self, latest_commit_sha: str | None = None):
         """Handle post-commit hook - log commit info and trigger auto-sync.
 
         Note: CI tracking (post-1.0 feature) has been moved to future/ci_tracking.py
+
+        Args:
+            latest_commit_sha: The new commit, read from git if not given
         """
         try:
-            # Get the latest commit SHA for logging
-            result = subprocess.run(
-                ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
-            )
-            latest_commit_sha = result.stdout.strip()
+            if latest_commit_sha is None:
+                # Get the latest commit SHA for logging
+                result = subprocess.run(
+                    ["git", "rev-parse", "HEAD"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                latest_commit_sha = result.stdout.strip()
 
             if not latest_commit_sha:
                 return
@@ -115,20 +132,24 @@ class GitHookManager:
                 "handle_post_commit_failed", error=str(e), severity="operational"
             )
 
-    def handle_post_checkout(self):
+    def handle_post_checkout(self, branch_name: str | None = None):
         """Handle post-checkout hook - track branch changes and trigger auto-sync.
 
         Note: Advanced CI branch tracking (post-1.0 feature) has been moved to future/ci_tracking.py
+
+        Args:
+            branch_name: The checked-out branch, read from git if not given
         """
         try:
-            # Get current branch
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            branch_name = result.stdout.strip()
+            if branch_name is None:
+                # Get current branch
+                result = subprocess.run(
+                    ["git", "branch", "--show-current"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                branch_name = result.stdout.strip()
 
             if not branch_name:
                 return
@@ -145,20 +166,24 @@ class GitHookManager:
                 "handle_post_checkout_failed", error=str(e), severity="operational"
             )
 
-    def handle_pre_push(self):
+    def handle_pre_push(self, current_branch: str | None = None):
         """Handle pre-push hook - basic push notification and trigger auto-sync.
 
         Note: Advanced CI automation (post-1.0 feature) has been moved to future/ci_tracking.py
+
+        Args:
+            current_branch: The branch being pushed, read from git if not given
         """
         try:
-            # Get current branch
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-            current_branch = result.stdout.strip()
+            if current_branch is None:
+                # Get current branch
+                result = subprocess.run(
+                    ["git", "branch", "--show-current"],
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                current_branch = result.stdout.strip()
 
             if not current_branch:
                 return
@@ -173,21 +198,26 @@ class GitHookManager:
             # Silent fail to avoid breaking Git operations
             logger.error("handle_pre_push_failed", error=str(e), severity="operational")
 
-    def handle_post_merge(self):
-        """Handle post-merge hook - update milestone progress and trigger auto-sync."""
+    def handle_post_merge(self, merge_commit_sha: str | None = None):
+        """Handle post-merge hook - update milestone progress and trigger auto-sync.
+
+        Args:
+            merge_commit_sha: The merge commit, read from git if not given
+        """
         try:
             # After a merge, check if any milestones should be updated
             self._update_milestone_progress()
 
             # Trigger auto-sync if enabled
             try:
-                result = subprocess.run(
-                    ["git", "rev-parse", "HEAD"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                merge_commit_sha = result.stdout.strip()
+                if merge_commit_sha is None:
+                    result = subprocess.run(
+                        ["git", "rev-parse", "HEAD"],
+                        capture_output=True,
+                        text=True,
+                        check=True,
+                    )
+                    merge_commit_sha = result.stdout.strip()
                 self._trigger_auto_sync_on_merge(merge_commit_sha)
             except Exception as e:
                 logger.debug("trigger_auto_sync_on_merge_failed", error=str(e))
@@ -249,7 +279,10 @@ class GitHookManager:
                 issue.git_commits.append(commit_ref)
 
             # Save updated issue
-            issue_path = self.core.issues_dir / issue.filename
+            if issue.file_path:
+                issue_path = Path(issue.file_path)
+            else:
+                issue_path = self.core.issues_dir / issue.filename
             IssueParser.save_issue_file(issue, issue_path)
 
         except Exception as e:
@@ -282,7 +315,10 @@ class GitHookManager:
                 }
 
                 issue.git_commits.append(completion_ref)
-                issue_path = self.core.issues_dir / issue.filename
+                if issue.file_path:
+                    issue_path = Path(issue.file_path)
+                else:
+                    issue_path = self.core.issues_dir / issue.filename
                 IssueParser.save_issue_file(issue, issue_path)
 
         except Exception as e:
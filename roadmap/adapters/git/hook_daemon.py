@@ -0,0 +1,239 @@
+"""Long-lived worker that applies Git hook events with warm state.
+
+Without it, every hook starts a fresh interpreter that imports the CLI
+stack and builds RoadmapCore before doing any work. While the hook daemon
+runs, hooks only send a one-line message over a Unix socket in .git and
+return; the daemon applies the events in order on a worker thread, reusing
+its RoadmapCore, database connection and parsed-file cache. Hooks handle
+the event in-process as before when no daemon answers.
+
+Protocol: a client sends one line, ``<hook-name> <ref>`` (ref is the commit
+SHA or branch name the hook saw, possibly empty), and reads one line back:
+``queued`` once the event is accepted. ``ping`` and ``shutdown`` are
+answered with ``pong`` and ``bye``.
+"""
+
+import os
+import queue
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from structlog import get_logger
+
+from roadmap.common.cache import clear_session_cache
+
+from .hook_registry import HookRegistry
+
+logger = get_logger()
+
+SOCKET_PATH = Path(".git") / "roadmap-hooks.sock"
+
+_CLIENT_TIMEOUT = 2.0
+
+
+def _request(message: str, socket_path: Path = SOCKET_PATH) -> str | None:
+    """Send one message to the daemon and return its reply.
+
+    Returns:
+        The reply line, or None if no daemon is listening
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(_CLIENT_TIMEOUT)
+            client.connect(os.fspath(socket_path))
+            client.sendall(f"{message}\n".encode())
+            with client.makefile("r", encoding="utf-8") as reply:
+                return reply.readline().strip()
+    except OSError:
+        return None
+
+
+def send_hook_event(
+    hook_name: str, ref: str | None = None, socket_path: Path = SOCKET_PATH
+) -> bool:
+    """Hand a hook event to the daemon.
+
+    Args:
+        hook_name: Name of the hook (e.g., 'post-commit')
+        ref: Commit SHA or branch name the hook reports
+        socket_path: Daemon socket
+
+    Returns:
+        True if the daemon queued the event
+    """
+    return _request(f"{hook_name} {ref or ''}", socket_path) == "queued"
+
+
+def is_daemon_running(socket_path: Path = SOCKET_PATH) -> bool:
+    """Check whether a daemon answers on the socket."""
+    return _request("ping", socket_path) == "pong"
+
+
+def stop_daemon(socket_path: Path = SOCKET_PATH) -> bool:
+    """Ask the daemon to exit once its queued events are applied.
+
+    Returns:
+        True if a daemon was running and accepted the request
+    """
+    return _request("shutdown", socket_path) == "bye"
+
+
+def start_daemon(socket_path: Path = SOCKET_PATH, timeout: float = 30.0) -> bool:
+    """Start a detached daemon for the repository in the current directory.
+
+    Args:
+        socket_path: Socket the daemon listens on
+        timeout: Seconds to wait for the daemon to answer
+
+    Returns:
+        True once the daemon answers, including when one was already running
+    """
+    if is_daemon_running(socket_path):
+        return True
+    subprocess.Popen(
+        [sys.executable, "-m", "roadmap.adapters.git.hook_daemon"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if is_daemon_running(socket_path):
+            return True
+        time.sleep(0.1)
+    return False
+
+
+class _HookEventHandler(socketserver.StreamRequestHandler):
+    """Reads one message per connection and replies with one line."""
+
+    def handle(self):
+        line = self.rfile.readline(1024).decode("utf-8", errors="replace")
+        reply = self.server.hook_daemon.receive(line.strip())  # type: ignore[attr-defined]
+        self.wfile.write(f"{reply}\n".encode())
+
+
+class HookDaemon:
+    """Serves hook events on a Unix socket and applies them in order."""
+
+    def __init__(self, hook_manager: Any, socket_path: Path = SOCKET_PATH):
+        """Initialize HookDaemon.
+
+        Args:
+            hook_manager: GitHookManager that applies the events
+            socket_path: Socket to listen on
+        """
+        self.hook_manager = hook_manager
+        self.socket_path = socket_path
+        self._events: queue.Queue[tuple[str, str | None] | None] = queue.Queue()
+        self._server: socketserver.UnixStreamServer | None = None
+        self._ready = threading.Event()
+
+    def receive(self, message: str) -> str:
+        """Handle one client message.
+
+        Args:
+            message: The message line without its newline
+
+        Returns:
+            The reply line
+        """
+        command, _, ref = message.partition(" ")
+        if command == "ping":
+            return "pong"
+        if command == "shutdown":
+            # shutdown() waits for serve_forever(), which is running this
+            # handler, so it has to be called from another thread
+            threading.Thread(target=self.shutdown, daemon=True).start()
+            return "bye"
+        if not HookRegistry.is_valid_hook(command):
+            return "unknown"
+        self._events.put((command, ref.strip() or None))
+        return "queued"
+
+    def apply_event(self, hook_name: str, ref: str | None) -> None:
+        """Apply one hook event with the warm hook manager.
+
+        Per-command caches are dropped first so the event sees edits made
+        by other roadmap processes since the previous event; the parsed-file
+        cache stays, as it revalidates entries by file stat.
+        """
+        clear_session_cache()
+        self.hook_manager.core.issues.clear_cache()
+        self.hook_manager.handle_hook(hook_name, ref)
+
+    def _apply_events(self) -> None:
+        while (event := self._events.get()) is not None:
+            hook_name, ref = event
+            try:
+                self.apply_event(hook_name, ref)
+            except Exception as e:
+                logger.error(
+                    "hook_daemon_event_failed",
+                    hook=hook_name,
+                    error=str(e),
+                    severity="operational",
+                )
+
+    def _bind(self) -> socketserver.UnixStreamServer:
+        if self.socket_path.exists():
+            if is_daemon_running(self.socket_path):
+                raise RuntimeError(
+                    f"A hook daemon is already running on {self.socket_path}"
+                )
+            # Left behind by a daemon that did not shut down cleanly
+            self.socket_path.unlink()
+        server = socketserver.UnixStreamServer(
+            os.fspath(self.socket_path), _HookEventHandler
+        )
+        server.hook_daemon = self  # type: ignore[attr-defined]
+        return server
+
+    def serve_forever(self) -> None:
+        """Serve until shutdown, then apply the events still queued."""
+        self._server = self._bind()
+        worker = threading.Thread(
+            target=self._apply_events, name="roadmap-hook-daemon", daemon=True
+        )
+        worker.start()
+        logger.info("hook_daemon_started", socket=str(self.socket_path))
+        self._ready.set()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            self._events.put(None)
+            worker.join()
+            logger.info("hook_daemon_stopped", socket=str(self.socket_path))
+
+    def wait_ready(self, timeout: float | None = None) -> bool:
+        """Wait until the daemon is accepting connections."""
+        return self._ready.wait(timeout)
+
+    def shutdown(self) -> None:
+        """Stop serving; serve_forever() returns after the queue is drained."""
+        if self._server is not None:
+            self._server.shutdown()
+
+
+def run_daemon(socket_path: Path = SOCKET_PATH) -> None:
+    """Run a daemon for the repository in the current directory until stopped."""
+    from roadmap.infrastructure.coordination.core import RoadmapCore
+
+    from .git_hooks_manager import GitHookManager
+
+    HookDaemon(GitHookManager(RoadmapCore()), socket_path).serve_forever()
+
+
+if __name__ == "__main__":
+    run_daemon()
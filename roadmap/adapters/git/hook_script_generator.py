@@ -2,6 +2,8 @@
 
 import shutil
 
+from .hook_daemon import SOCKET_PATH
+
 
 class HookContentGenerator:
     """Generates content for Git hook bash scripts."""
@@ -17,8 +19,29 @@ REPO_ROOT="$(cd "$HOOK_DIR/../.." && pwd)"
 # Change to repository root
 cd "$REPO_ROOT"
 
-# Execute roadmap hook handler
-{python_exec} << 'PYTHON_HOOK_EOF'
+# Commit SHA or branch name this hook reports
+HOOK_REF="$({ref_command} 2>/dev/null)"
+
+# Hand the event to the hook daemon if one is running
+# (roadmap git hooks-daemon start); it applies the event in the background
+if [ -S "{socket_path}" ] && {python_exec} -S - "{hook_name}" "$HOOK_REF" << 'PYTHON_CLIENT_EOF'
+import socket
+import sys
+try:
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(2)
+    client.connect("{socket_path}")
+    client.sendall(("%s %s\\n" % (sys.argv[1], sys.argv[2])).encode())
+    sys.exit(0 if client.makefile().readline().strip() == "queued" else 1)
+except OSError:
+    sys.exit(1)
+PYTHON_CLIENT_EOF
+then
+    exit 0
+fi
+
+# Otherwise execute roadmap hook handler in this process
+{python_exec} - "$HOOK_REF" << 'PYTHON_HOOK_EOF'
 import sys
 sys.path.insert(0, '.')
 try:
@@ -26,13 +49,21 @@ try:
     from roadmap.infrastructure.coordination.core import RoadmapCore
     core = RoadmapCore()
     hook_manager = GitHookManager(core)
-    getattr(hook_manager, "{handler_name}")()
+    getattr(hook_manager, "handle_{handler_name}")(sys.argv[1] or None)
 except Exception as e:
     # Silent fail to avoid breaking Git operations
     pass
 PYTHON_HOOK_EOF
 """
 
+    # Commands whose output is the ref passed to each hook's handler
+    REF_COMMANDS = {
+        "post-commit": "git rev-parse HEAD",
+        "post-merge": "git rev-parse HEAD",
+        "post-checkout": "git branch --show-current",
+        "pre-push": "git branch --show-current",
+    }
+
     @staticmethod
     def get_python_executable() -> str:
         """Get the path to Python executable."""
@@ -55,4 +86,6 @@ PYTHON_HOOK_EOF
             hook_name=hook_name,
             handler_name=handler_name,
             python_exec=python_exec,
+            ref_command=cls.REF_COMMANDS.get(hook_name, "true"),
+            socket_path=SOCKET_PATH.as_posix(),
         )
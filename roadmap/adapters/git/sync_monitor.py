@@ -1,5 +1,6 @@
 """GitSyncMonitor - Detect and sync file changes to database cache."""
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -104,15 +105,20 @@ class GitSyncMonitor:
             )
             return {}
 
-    def sync_to_database(self, changes: dict[str, str]) -> bool:
+    def sync_to_database(
+        self, changes: dict[str, str], *, full_index: bool = False
+    ) -> bool:
         """Sync detected changes to database cache.
 
         This syncs remote_ids from changed YAML files to the database cache,
         enabling fast O(1) lookups during sync operations instead of scanning
-        all YAML files.
+        all YAML files, and updates the issue list index rows used by
+        `roadmap issue list`.
 
         Args:
             changes: Dictionary of changes from detect_changes()
+            full_index: True when changes lists every issue file, so the
+                index is complete afterwards even if it was never built
 
         Returns:
             True if sync successful, False otherwise
@@ -128,49 +134,56 @@ class GitSyncMonitor:
         try:
             logger.debug("Syncing changes to database", change_count=len(changes))
 
-            # Sync remote_ids from changed files to database
-            from roadmap.adapters.persistence.parser import IssueParser
-
-            if self.state_manager.remote_links:
-                synced_count = 0
-                for file_path, change_type in changes.items():
-                    try:
-                        if change_type == "deleted":
-                            # For deleted files, we can't read them, so skip
-                            continue
-
-                        # Load issue from file using IssueParser
-                        file_path_obj = Path(file_path)
-                        if not file_path_obj.is_absolute():
-                            # Make path absolute relative to repo root
-                            file_path_obj = self.repo_path / file_path_obj
-
-                        if not file_path_obj.exists():
-                            continue
-
-                        issue = IssueParser.parse_issue_file(file_path_obj)
-                        if issue and issue.remote_ids:
-                            # Sync remote_ids to database
-                            for backend_name, remote_id in issue.remote_ids.items():
-                                if self.state_manager.remote_links.link_issue(
-                                    issue.id, backend_name, remote_id
-                                ):
-                                    synced_count += 1
-                    except Exception as e:
-                        logger.warning(
-                            "Failed to sync remote_ids for file",
-                            file_path=file_path,
-                            error=str(e),
-                        )
-
-                if synced_count > 0:
-                    logger.debug(
-                        "Synced remote_ids to database",
-                        synced_count=synced_count,
+            issue_list_index = self.state_manager.issue_list_index
+            # A delta only completes an index already synced to the previous
+            # commit; otherwise the next refresh must rebuild it from scratch
+            previous_commit = self._get_last_synced_commit()
+            index_ok = full_index or (
+                previous_commit is not None
+                and issue_list_index.get_synced_commit() == previous_commit
+            )
+            indexed: dict[str, tuple[str, Any]] = {}
+            for file_path, change_type in changes.items():
+                try:
+                    indexed[file_path] = self._read_issue_file(file_path, change_type)
+                except Exception as e:
+                    index_ok = False
+                    logger.warning(
+                        "Failed to update issue list index for file",
+                        file_path=file_path,
+                        error=str(e),
                     )
+            if not self._write_index_entries(indexed.values()):
+                index_ok = False
 
-            # Update last synced commit
-            self._save_last_synced_commit()
+            synced_count = 0
+            for file_path, (_, issue) in indexed.items():
+                # Sync remote_ids from changed files to database
+                if issue is None or not self.state_manager.remote_links:
+                    continue
+                try:
+                    for backend_name, remote_id in issue.remote_ids.items():
+                        if self.state_manager.remote_links.link_issue(
+                            issue.id, backend_name, remote_id
+                        ):
+                            synced_count += 1
+                except Exception as e:
+                    logger.warning(
+                        "Failed to sync remote_ids for file",
+                        file_path=file_path,
+                        error=str(e),
+                    )
+
+            if synced_count > 0:
+                logger.debug(
+                    "Synced remote_ids to database",
+                    synced_count=synced_count,
+                )
+
+            # Update last synced commit; the index only counts as synced to
+            # it when it was current and every changed file made it in
+            if self._save_last_synced_commit() and index_ok:
+                issue_list_index.set_synced_commit(self._cached_last_synced_commit)
 
             logger.debug("Sync to database complete")
             return True
@@ -184,6 +197,152 @@ class GitSyncMonitor:
             )
             return False
 
+    def refresh_issue_list_index(self) -> bool:
+        """Bring the issue list index in line with the issue files on disk.
+
+        Committed changes are applied through detect_changes() and
+        sync_to_database(). Files with uncommitted changes, and files that had
+        them at the previous refresh, are then re-read from disk. HEAD and the
+        uncommitted changes come from a single `git status` call.
+
+        Returns:
+            True if the index matches the issue files, False if it could not
+            be refreshed (no state manager, not a git repository, no commits)
+        """
+        if not self.state_manager:
+            return False
+
+        if not self.git_executor.is_git_repository():
+            return False
+
+        status = self._get_working_tree_status()
+        if status is None:
+            return False
+        current_commit, dirty = status
+        if not current_commit:
+            return False
+        self._cached_current_commit = current_commit
+
+        issue_list_index = self.state_manager.issue_list_index
+        last_synced = self._get_last_synced_commit()
+        rebuild = (
+            last_synced is None or issue_list_index.get_synced_commit() != last_synced
+        )
+        if not rebuild:
+            changes = self.detect_changes()
+        else:
+            # Index never built, or behind the sync state: index every file
+            logger.debug("Rebuilding issue list index", commit=current_commit[:8])
+            issue_list_index.clear()
+            changes = self._get_all_issues_files()
+            if not changes:
+                if not self._save_last_synced_commit():
+                    return False
+                issue_list_index.set_synced_commit(current_commit)
+
+        if changes and not self.sync_to_database(changes, full_index=rebuild):
+            return False
+
+        if issue_list_index.get_synced_commit() != self._get_last_synced_commit():
+            return False
+
+        return self._sync_working_tree_to_index(dirty)
+
+    def _sync_working_tree_to_index(self, dirty: set[str]) -> bool:
+        """Re-index issue files with uncommitted changes.
+
+        Args:
+            dirty: Issue files with uncommitted changes, relative to the repo root
+
+        Returns:
+            True if the working tree state was applied to the index
+        """
+        if not self.state_manager:
+            return False
+
+        issue_list_index = self.state_manager.issue_list_index
+        previous = issue_list_index.get_dirty_paths()
+        entries = [self._read_issue_file(file_path) for file_path in dirty | previous]
+        if not self._write_index_entries(entries):
+            return False
+
+        if dirty != previous:
+            issue_list_index.set_dirty_paths(dirty)
+
+        logger.debug("Synced working tree to issue list index", dirty_count=len(dirty))
+        return True
+
+    def _read_issue_file(
+        self, file_path: str, change_type: str = "modified"
+    ) -> tuple[str, Any]:
+        """Read an issue file for its row in the issue list index.
+
+        Args:
+            file_path: Issue file path, absolute or relative to the repo root
+            change_type: Change type from detect_changes()
+
+        Returns:
+            The absolute file path and the parsed Issue, or None if the file
+            is gone or unparseable and its row should be removed
+        """
+        from roadmap.adapters.persistence.parser import IssueParser
+
+        file_path_obj = Path(file_path)
+        if not file_path_obj.is_absolute():
+            # Make path absolute relative to repo root
+            file_path_obj = self.repo_path / file_path_obj
+
+        if change_type == "deleted" or not file_path_obj.exists():
+            return str(file_path_obj), None
+
+        try:
+            issue = IssueParser.parse_issue_file(file_path_obj)
+        except Exception as e:
+            # Unparseable files are skipped by YAML listing too
+            logger.debug(
+                "Skipping unparseable issue file",
+                file_path=str(file_path_obj),
+                error=str(e),
+            )
+            return str(file_path_obj), None
+
+        return str(file_path_obj), issue
+
+    def _write_index_entries(self, entries: Iterable[tuple[str, Any]]) -> bool:
+        """Record or remove issue list index rows in one batch each.
+
+        Args:
+            entries: (absolute file path, parsed Issue or None) pairs from
+                _read_issue_file(); None removes the file's row
+
+        Returns:
+            True if every row was written
+        """
+        if not self.state_manager:
+            return False
+
+        recorded = []
+        removed = []
+        for file_path, issue in entries:
+            if issue is None:
+                removed.append(file_path)
+            else:
+                recorded.append((issue, file_path))
+
+        issue_list_index = self.state_manager.issue_list_index
+        try:
+            issue_list_index.record_many(recorded)
+            issue_list_index.remove_many(removed)
+        except Exception as e:
+            logger.warning(
+                "Failed to write issue list index rows",
+                recorded=len(recorded),
+                removed=len(removed),
+                error=str(e),
+            )
+            return False
+        return True
+
     def _get_changed_files(self, base_commit: str | None = None) -> dict[str, str]:
         """Get list of changed files since base commit.
 
@@ -202,7 +361,7 @@ class GitSyncMonitor:
 
             # Get changed files between base and current
             changed_files = self.git_executor.run(
-                ["diff", "--name-status", base_commit, "HEAD"]
+                ["diff", "--name-status", "--relative", base_commit, "HEAD"]
             )
 
             if not changed_files:
@@ -276,6 +435,65 @@ class GitSyncMonitor:
             )
             return {}
 
+    def _get_working_tree_status(self) -> tuple[str | None, set[str]] | None:
+        """Get HEAD and the issue files with uncommitted changes in one call.
+
+        Covers staged and unstaged changes to tracked files, both sides of
+        renames, and untracked files.
+
+        Returns:
+            The HEAD commit SHA (None before the first commit) and the set
+            of changed issue files relative to the repo root, or None if
+            git failed
+        """
+        output = self.git_executor.run(
+            [
+                "status",
+                "--porcelain=v2",
+                "--branch",
+                "--untracked-files=all",
+                "-z",
+                "--",
+                ".",
+            ],
+            cwd=self.repo_path,
+        )
+        top_level = self.git_executor.top_level(self.repo_path)
+        if output is None or top_level is None:
+            return None
+
+        # Porcelain paths are relative to the work tree root, not repo_path
+        prefix = self.repo_path.resolve().relative_to(top_level.resolve()).as_posix()
+        prefix = "" if prefix == "." else f"{prefix}/"
+
+        commit = None
+        paths = []
+        entries = output.split("\0")
+        index = 0
+        while index < len(entries):
+            entry = entries[index]
+            index += 1
+            if entry.startswith("# branch.oid "):
+                oid = entry.removeprefix("# branch.oid ")
+                commit = None if oid == "(initial)" else oid
+            elif entry.startswith(("1 ", "u ")):
+                paths.append(entry.split(" ", 8 if entry[0] == "1" else 10)[-1])
+            elif entry.startswith("2 "):
+                # Renames and copies are followed by the original path
+                paths.append(entry.split(" ", 9)[-1])
+                if index < len(entries):
+                    paths.append(entries[index])
+                    index += 1
+            elif entry.startswith("? "):
+                paths.append(entry[2:])
+
+        dirty = {
+            path.removeprefix(prefix)
+            for path in paths
+            if path.startswith(prefix) and self._is_issues_file(path)
+        }
+        return commit, dirty
+
     def _is_issues_file(self, path: str) -> bool:
         """Check if path is a .roadmap/issues/ file.
 
@@ -194,7 +194,10 @@ class WorkflowAutomation:
         )
 
         if updated:
-            issue_path = self.core.issues_dir / issue.filename
+            if issue.file_path:
+                issue_path = Path(issue.file_path)
+            else:
+                issue_path = self.core.issues_dir / issue.filename
             IssueParser.save_issue_file(issue, issue_path)
 
         return updated
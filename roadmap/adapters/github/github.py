@@ -193,6 +193,7 @@ class GitHubClient(BaseGitHubHandler):
         milestone: str | None = None,
         assignee: str | None = None,
         per_page: int = 100,
+        since: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get issues from the repository.
 
@@ -202,6 +203,7 @@ class GitHubClient(BaseGitHubHandler):
             milestone: Optional milestone title to filter by
             assignee: Optional assignee username to filter by
             per_page: Number of issues per page (max 100)
+            since: Optional ISO 8601 timestamp to fetch only updated issues
 
         Returns:
             List of issue dictionaries
@@ -214,8 +216,25 @@ class GitHubClient(BaseGitHubHandler):
             milestone=milestone,
             assignee=assignee,
             per_page=per_page,
+            since=since,
         )
 
+    def get_issues_graphql(
+        self, state: str = "all", since: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Get issues with labels, assignees and milestone through GraphQL.
+
+        Args:
+            state: Issue state ('open', 'closed', 'all')
+            since: Optional ISO 8601 timestamp to fetch only updated issues
+
+        Returns:
+            List of issue dictionaries in the REST payload shape
+        """
+        self._issue_handler.owner = self.owner
+        self._issue_handler.repo = self.repo
+        return self._issue_handler.get_issues_graphql(state=state, since=since)
+
     def fetch_issue(self, issue_number: int) -> dict[str, Any]:
         """Fetch a GitHub issue by number.
 
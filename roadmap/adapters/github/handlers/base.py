@@ -5,6 +5,8 @@ from typing import Any
 import requests
 
 from roadmap.adapters.base_paginated_adapter import BasePaginatedAdapter
+from roadmap.adapters.github.rate_limiter import get_rate_limiter
+from roadmap.adapters.github.response_cache import get_response_cache
 from roadmap.common.logging import get_logger, log_external_service_error
 
 
@@ -52,6 +54,37 @@ class BaseGitHubHandler(BasePaginatedAdapter):
                 "Repository not set. Use set_repository() or provide owner/repo in constructor."
             )
 
+    # Times a request rejected by a rate limit is resent after the wait
+    RATE_LIMIT_RETRIES = 2
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        resource: str = "core",
+        mutation: bool | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Send a request paced by the shared rate limiter.
+
+        Responses rejected by a rate limit are resent once the limiter's
+        pause or budget reset has passed, up to RATE_LIMIT_RETRIES times.
+        """
+        limiter = get_rate_limiter()
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            with limiter.request(method, resource, mutation):
+                response = self.session.request(method, url, **kwargs)
+            if not limiter.record_response(response, resource):
+                break
+            if attempt < self.RATE_LIMIT_RETRIES:
+                get_logger().info(
+                    "github_request_rate_limited_retrying",
+                    method=method,
+                    url=url,
+                    attempt=attempt + 1,
+                )
+        return response
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
         """Make a request to the GitHub API.
 
@@ -68,9 +101,40 @@ class BaseGitHubHandler(BasePaginatedAdapter):
         """
         url = f"{self.BASE_URL}{endpoint}"
 
+        # Conditional GET: send stored validators and reuse the body on a 304
+        cache = get_response_cache() if method.upper() == "GET" else None
+        cache_key = None
+        cached = None
+        if cache is not None:
+            cache_key = cache.make_key(
+                url, kwargs.get("params"), self.session.headers.get("Authorization")
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                kwargs["headers"] = {
+                    **(kwargs.get("headers") or {}),
+                    **cached.conditional_headers(),
+                }
+
         try:
-            response = self.session.request(method, url, **kwargs)
+            if endpoint == "/graphql":
+                query = (kwargs.get("json") or {}).get("query", "")
+                response = self._send(
+                    method,
+                    url,
+                    resource="graphql",
+                    mutation=query.lstrip().startswith("mutation"),
+                    **kwargs,
+                )
+            else:
+                response = self._send(method, url, **kwargs)
+            if cache is not None and cached is not None and response.status_code == 304:
+                cache.record_hit()
+                return cached.to_response()
             response.raise_for_status()
+            if cache is not None and cache_key is not None:
+                cache.record_miss()
+                cache.store(cache_key, response)
             return response
         except requests.exceptions.HTTPError as e:
             status_code = response.status_code
@@ -249,6 +313,39 @@ class BaseGitHubHandler(BasePaginatedAdapter):
             )
             raise GitHubAPIError(f"Request failed: {e}") from e
 
+    def _graphql_request(
+        self, query: str, variables: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Run a GraphQL query against the GitHub API.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables
+
+        Returns:
+            The response's ``data`` object
+
+        Raises:
+            GitHubAPIError: If the request fails or the response has errors
+                and no data
+        """
+        response = self._make_request(
+            "POST", "/graphql", json={"query": query, "variables": variables or {}}
+        )
+        payload = response.json()
+        errors = payload.get("errors")
+        if errors:
+            messages = "; ".join(
+                str(error.get("message", error))
+                if isinstance(error, dict)
+                else str(error)
+                for error in errors
+            )
+            if not payload.get("data"):
+                raise GitHubAPIError(f"GraphQL error: {messages}")
+            get_logger().warning("github_graphql_partial_errors", errors=messages)
+        return payload.get("data") or {}
+
     def test_authentication(self) -> dict[str, Any]:
         """Test authentication and get user info."""
         response = self._make_request("GET", "/user")
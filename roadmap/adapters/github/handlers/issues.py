@@ -2,7 +2,83 @@
 
 from typing import Any
 
-from roadmap.adapters.github.handlers.base import BaseGitHubHandler
+from roadmap.adapters.github.handlers.base import BaseGitHubHandler, GitHubAPIError
+
+# GraphQL issue listing: nested connection sizes and page size bounds
+GRAPHQL_LABELS_PER_ISSUE = 20
+GRAPHQL_ASSIGNEES_PER_ISSUE = 10
+GRAPHQL_MAX_PAGE_SIZE = 100
+GRAPHQL_MIN_PAGE_SIZE = 10
+
+_GRAPHQL_ISSUES_QUERY = """
+query(
+  $owner: String!, $repo: String!, $first: Int!, $after: String,
+  $states: [IssueState!], $since: DateTime, $labels: Int!, $assignees: Int!
+) {
+  rateLimit { cost remaining resetAt }
+  repository(owner: $owner, name: $repo) {
+    issues(
+      first: $first, after: $after, states: $states,
+      filterBy: {since: $since}, orderBy: {field: UPDATED_AT, direction: ASC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        id
+        number
+        title
+        body
+        state
+        updatedAt
+        labels(first: $labels) { totalCount nodes { name } }
+        assignees(first: $assignees) { nodes { login } }
+        milestone { number title }
+      }
+    }
+  }
+}
+"""
+
+_GRAPHQL_STATES = {"open": ["OPEN"], "closed": ["CLOSED"], "all": None}
+
+
+def estimate_issue_page_cost(page_size: int) -> int:
+    """Estimate the rate limit cost of one GraphQL issue page.
+
+    GitHub charges one point per 100 connection requests: the issues
+    connection itself plus the labels and assignees of every issue.
+    """
+    return max(1, round((1 + 2 * page_size) / 100))
+
+
+def _graphql_issue_to_rest(node: dict[str, Any]) -> dict[str, Any]:
+    """Convert a GraphQL issue node to the REST issue payload shape."""
+    assignees = [
+        {"login": assignee["login"]}
+        for assignee in (node.get("assignees") or {}).get("nodes") or []
+        if assignee and assignee.get("login")
+    ]
+    milestone = node.get("milestone")
+    return {
+        "number": node.get("number"),
+        "node_id": node.get("id"),
+        "title": node.get("title"),
+        "body": node.get("body"),
+        "state": (node.get("state") or "").lower(),
+        "labels": [
+            {"name": label["name"]}
+            for label in (node.get("labels") or {}).get("nodes") or []
+            if label and label.get("name")
+        ],
+        "assignee": assignees[0] if assignees else None,
+        "assignees": assignees,
+        "milestone": {
+            "number": milestone.get("number"),
+            "title": milestone.get("title"),
+        }
+        if milestone
+        else None,
+        "updated_at": node.get("updatedAt"),
+    }
 
 
 class IssueHandler(BaseGitHubHandler):
@@ -15,6 +91,7 @@ class IssueHandler(BaseGitHubHandler):
         milestone: str | None = None,
         assignee: str | None = None,
         per_page: int = 100,
+        since: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get issues from the repository, handling pagination.
 
@@ -27,6 +104,8 @@ class IssueHandler(BaseGitHubHandler):
             milestone: Optional milestone title to filter by
             assignee: Optional assignee username to filter by
             per_page: Items per page (max 100)
+            since: Optional ISO 8601 timestamp; only issues updated at or
+                after it are returned, oldest update first
 
         Returns:
             List of all issue dictionaries across all pages
@@ -34,7 +113,12 @@ class IssueHandler(BaseGitHubHandler):
         from structlog import get_logger
 
         logger = get_logger()
-        logger.info("issue_handler_get_issues_called", state=state, per_page=per_page)
+        logger.info(
+            "issue_handler_get_issues_called",
+            state=state,
+            per_page=per_page,
+            since=since,
+        )
 
         self._check_repository()
 
@@ -43,6 +127,8 @@ class IssueHandler(BaseGitHubHandler):
             "sort": "created",
             "direction": "desc",
         }
+        if since:
+            params.update({"since": since, "sort": "updated", "direction": "asc"})
 
         if labels:
             params["labels"] = ",".join(labels)
@@ -73,6 +159,113 @@ class IssueHandler(BaseGitHubHandler):
         )
         return issues_only
 
+    def get_issues_graphql(
+        self,
+        state: str = "all",
+        since: str | None = None,
+        page_size: int = GRAPHQL_MAX_PAGE_SIZE,
+    ) -> list[dict[str, Any]]:
+        """Get issues through cursor-paginated GraphQL queries.
+
+        Each page carries labels, assignees and milestone, so a full listing
+        takes one request per page. Results use the REST issue payload shape
+        and never include pull requests.
+
+        Page size adapts to cost: pages are capped so their estimated cost
+        fits the remaining GraphQL budget, a page that fails (timeouts or
+        resource limits on large bodies) is retried at half the size, and
+        the size grows back after each successful page.
+
+        Args:
+            state: Issue state ('open', 'closed', 'all')
+            since: Optional ISO 8601 timestamp; only issues updated at or
+                after it are returned
+            page_size: Largest number of issues per query (max 100)
+
+        Returns:
+            List of issue dictionaries, oldest update first
+
+        Raises:
+            GitHubAPIError: If a page fails at the smallest page size
+        """
+        from structlog import get_logger
+
+        logger = get_logger()
+        self._check_repository()
+
+        max_size = max(GRAPHQL_MIN_PAGE_SIZE, min(page_size, GRAPHQL_MAX_PAGE_SIZE))
+        size = max_size
+        remaining: int | None = None
+        cursor: str | None = None
+        pages = 0
+        total_cost = 0
+        issues: list[dict[str, Any]] = []
+
+        while True:
+            if remaining is not None:
+                while (
+                    size > GRAPHQL_MIN_PAGE_SIZE
+                    and estimate_issue_page_cost(size) > remaining
+                ):
+                    size //= 2
+            variables = {
+                "owner": self.owner,
+                "repo": self.repo,
+                "first": size,
+                "after": cursor,
+                "states": _GRAPHQL_STATES.get(state),
+                "since": since,
+                "labels": GRAPHQL_LABELS_PER_ISSUE,
+                "assignees": GRAPHQL_ASSIGNEES_PER_ISSUE,
+            }
+            try:
+                data = self._graphql_request(_GRAPHQL_ISSUES_QUERY, variables)
+            except GitHubAPIError as e:
+                if size <= GRAPHQL_MIN_PAGE_SIZE:
+                    raise
+                size = max(GRAPHQL_MIN_PAGE_SIZE, size // 2)
+                logger.warning(
+                    "issue_handler_graphql_page_retry",
+                    page_size=size,
+                    error=str(e),
+                    severity="operational",
+                )
+                continue
+
+            pages += 1
+            rate_limit = data.get("rateLimit") or {}
+            if isinstance(rate_limit.get("remaining"), int):
+                remaining = rate_limit["remaining"]
+            if isinstance(rate_limit.get("cost"), int):
+                total_cost += rate_limit["cost"]
+
+            connection = (data.get("repository") or {}).get("issues") or {}
+            for node in connection.get("nodes") or []:
+                if not node:
+                    continue
+                issue = _graphql_issue_to_rest(node)
+                if (node.get("labels") or {}).get("totalCount", 0) > len(
+                    issue["labels"]
+                ):
+                    # Rare: more labels than one query fetches per issue
+                    issue["labels"] = self.get_issue(issue["number"]).get("labels", [])
+                issues.append(issue)
+
+            page_info = connection.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            cursor = page_info.get("endCursor")
+            size = min(max_size, size * 2)
+
+        logger.info(
+            "issue_handler_get_issues_graphql_complete",
+            total_issues=len(issues),
+            pages=pages,
+            cost=total_cost,
+            since=since,
+        )
+        return issues
+
     def get_issue(self, issue_number: int) -> dict[str, Any]:
         """Get a specific issue by number."""
         self._check_repository()
@@ -0,0 +1,445 @@
+"""Adaptive rate limiting shared by every GitHub API call of the process.
+
+GitHub enforces two kinds of limits. The primary limit is a per-resource
+budget (REST "core", "graphql", ...) reported on every response in the
+X-RateLimit-Remaining / X-RateLimit-Reset / X-RateLimit-Resource headers.
+Secondary limits are only reported once they are hit, with a 403 or 429
+and usually Retry-After: about 900 points per minute for REST and 2,000
+for GraphQL (reads cost 1 point, writes and mutations 5), and 80
+content-creating requests per minute and 500 per hour.
+
+GitHubRateLimiter lets requests through as fast as all of these allow:
+
+- the per-minute point budgets and the content-creation budgets are token
+  buckets sized so that no rolling window can exceed the documented limit;
+- the primary budget of each resource is tracked from response headers and
+  counted down locally between responses; when it reaches a small reserve,
+  requests for that resource wait for its reset;
+- concurrency adapts: it grows by one after each round of successful
+  responses, and a secondary-limit response halves it and pauses every
+  request for Retry-After (at least a minute, doubling on repeats).
+
+A primary budget can take up to an hour to reset. Rather than sleep that
+long, acquire() raises GitHubRateLimitError naming the reset time when the
+wait exceeds ``max_wait``, and any wait longer than a few seconds is logged
+as a warning before sleeping.
+
+The limiter is process-wide so every handler, session and thread shares the
+same budget.
+"""
+
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from roadmap.common.errors import GitHubRateLimitError
+from roadmap.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Documented secondary limits, scaled down slightly for clock skew between
+# our buckets and GitHub's windows
+_SAFETY_FACTOR = 0.9
+REST_POINTS_PER_MINUTE = 900
+GRAPHQL_POINTS_PER_MINUTE = 2000
+CONTENT_CREATION_PER_MINUTE = 80
+CONTENT_CREATION_PER_HOUR = 500
+
+READ_COST = 1
+WRITE_COST = 5
+
+# Primary-budget requests left untouched for other tools using the token
+PRIMARY_RESERVE = 10
+
+# GitHub asks clients to wait at least a minute after a secondary limit
+# response without Retry-After, and longer on repeats
+_SECONDARY_BACKOFF_SECONDS = 60.0
+_MAX_BACKOFF_SECONDS = 900.0
+
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Longest wait for a primary budget reset before giving up with an error
+DEFAULT_MAX_WAIT_SECONDS = 300.0
+
+# Waits longer than this are logged as warnings before sleeping
+LONG_WAIT_WARNING_SECONDS = 5.0
+
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class TokenBucket:
+    """Token bucket whose reservations may overdraw it.
+
+    Overdrawing makes the caller wait for the deficit to refill, so callers
+    are served in reservation order and the refill rate is never exceeded.
+    Not thread-safe; GitHubRateLimiter serializes access.
+    """
+
+    def __init__(self, limit: float, window_seconds: float, clock: Callable[[], float]):
+        """Initialize a bucket that allows ``limit`` tokens per window.
+
+        Capacity plus a window's refill equals the scaled limit, so no
+        rolling window of ``window_seconds`` can spend more than it.
+        """
+        budget = limit * _SAFETY_FACTOR
+        self.capacity = max(1.0, budget * 0.1)
+        self.rate = (budget - self.capacity) / window_seconds
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def reserve(self, cost: float) -> float:
+        """Take ``cost`` tokens and return how long the caller must wait."""
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= cost
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+@dataclass
+class RateLimitStats:
+    """Counters describing how the limiter paced a run of requests."""
+
+    requests: int = 0
+    throttled_requests: int = 0
+    wait_seconds: float = 0.0
+    secondary_limit_hits: int = 0
+    primary_limit_waits: int = 0
+    remaining: dict[str, int] = field(default_factory=dict)
+    concurrency: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert stats to a dictionary for metrics storage."""
+        return {
+            "requests": self.requests,
+            "throttled_requests": self.throttled_requests,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "secondary_limit_hits": self.secondary_limit_hits,
+            "primary_limit_waits": self.primary_limit_waits,
+            "remaining": dict(self.remaining),
+            "concurrency": self.concurrency,
+        }
+
+
+def _header_int(headers: Any, name: str) -> int | None:
+    """Read an integer header, tolerating missing or malformed values."""
+    try:
+        value = headers.get(name)
+    except Exception:
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(float(value))
+        except ValueError:
+            return None
+    return None
+
+
+class GitHubRateLimiter:
+    """Paces GitHub requests to stay within primary and secondary limits."""
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+        max_wait: float = DEFAULT_MAX_WAIT_SECONDS,
+    ):
+        """Initialize limiter.
+
+        Args:
+            max_concurrency: Most requests allowed in flight at once
+            clock: Monotonic clock used for pacing
+            wall_clock: Epoch clock X-RateLimit-Reset is compared against
+            sleep: Sleep function used for waiting
+            max_wait: Longest wait for a primary budget reset, in seconds
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_wait = max(0.0, max_wait)
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._lock = threading.Condition()
+        self._points = {
+            "core": TokenBucket(REST_POINTS_PER_MINUTE, 60, clock),
+            "graphql": TokenBucket(GRAPHQL_POINTS_PER_MINUTE, 60, clock),
+        }
+        self._creations = (
+            TokenBucket(CONTENT_CREATION_PER_MINUTE, 60, clock),
+            TokenBucket(CONTENT_CREATION_PER_HOUR, 3600, clock),
+        )
+        # resource -> [remaining, reset epoch seconds]
+        self._budgets: dict[str, list[int]] = {}
+        self._concurrency = self.max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._consecutive_secondary_hits = 0
+        self._stats = RateLimitStats(concurrency=self._concurrency)
+
+    @property
+    def concurrency(self) -> int:
+        """Current number of requests allowed in flight."""
+        return self._concurrency
+
+    def _primary_wait(self, resource: str) -> float:
+        budget = self._budgets.get(resource)
+        if budget is None or budget[0] > PRIMARY_RESERVE:
+            return 0.0
+        return max(0.0, budget[1] - self._wall_clock() + 1)
+
+    def acquire(
+        self, method: str, resource: str = "core", mutation: bool | None = None
+    ) -> None:
+        """Wait until a request may be sent, then take a concurrency slot.
+
+        Args:
+            method: HTTP method
+            resource: Rate limit resource ("core" for REST, "graphql")
+            mutation: Whether the request changes data; defaults to the
+                method not being a read. Mutations cost more points, and
+                REST POSTs and GraphQL mutations count as content creation.
+
+        Raises:
+            GitHubRateLimitError: If the resource's primary budget is
+                exhausted and resets more than ``max_wait`` seconds from now
+        """
+        if mutation is None:
+            mutation = method.upper() not in _READ_METHODS
+        cost = WRITE_COST if mutation else READ_COST
+        creates = mutation and (resource == "graphql" or method.upper() == "POST")
+        waited = 0.0
+        with self._lock:
+            while True:
+                primary_wait = self._primary_wait(resource)
+                wait = max(self._paused_until - self._clock(), primary_wait)
+                if wait > 0:
+                    if primary_wait > 0:
+                        if primary_wait > self.max_wait:
+                            raise self._budget_exhausted(resource, primary_wait)
+                        self._stats.primary_limit_waits += 1
+                        logger.info(
+                            "github_rate_limit_budget_wait",
+                            resource=resource,
+                            wait_seconds=round(wait, 1),
+                        )
+                    self._warn_long_wait(
+                        resource,
+                        wait,
+                        "primary_budget"
+                        if primary_wait > 0
+                        else "secondary_limit_pause",
+                    )
+                    self._lock.release()
+                    try:
+                        self._sleep(wait)
+                    finally:
+                        self._lock.acquire()
+                    waited += wait
+                    continue
+                if self._in_flight < self._concurrency:
+                    break
+                self._lock.wait()
+
+            self._in_flight += 1
+            budget = self._budgets.get(resource)
+            if budget is not None:
+                budget[0] -= 1
+            bucket = self._points.get(resource, self._points["core"])
+            wait = bucket.reserve(cost)
+            if creates:
+                wait = max(wait, *(b.reserve(1) for b in self._creations))
+            self._stats.requests += 1
+
+        if wait > 0:
+            self._warn_long_wait(resource, wait, "secondary_limit_pacing")
+            self._sleep(wait)
+            waited += wait
+        if waited > 0:
+            with self._lock:
+                self._stats.throttled_requests += 1
+                self._stats.wait_seconds += waited
+
+    def _budget_exhausted(self, resource: str, wait: float) -> GitHubRateLimitError:
+        reset_at = self._budgets[resource][1]
+        reset_time = datetime.fromtimestamp(reset_at, UTC).strftime(
+            "%Y-%m-%d %H:%M:%S UTC"
+        )
+        logger.warning(
+            "github_rate_limit_wait_exceeds_max",
+            resource=resource,
+            wait_seconds=round(wait, 1),
+            max_wait_seconds=self.max_wait,
+            reset_at=reset_time,
+            severity="operational",
+        )
+        return GitHubRateLimitError(
+            f"GitHub {resource} rate limit exhausted until {reset_time} "
+            f"({wait:.0f}s away, longer than the {self.max_wait:.0f}s max wait)",
+            resource=resource,
+            reset_at=reset_at,
+        )
+
+    def _warn_long_wait(self, resource: str, wait: float, reason: str) -> None:
+        if wait > LONG_WAIT_WARNING_SECONDS:
+            logger.warning(
+                "github_rate_limit_long_wait",
+                resource=resource,
+                wait_seconds=round(wait, 1),
+                reason=reason,
+                severity="operational",
+            )
+
+    def release(self) -> None:
+        """Give back the concurrency slot taken by acquire()."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._lock.notify()
+
+    @contextmanager
+    def request(
+        self, method: str, resource: str = "core", mutation: bool | None = None
+    ) -> Iterator[None]:
+        """Hold a concurrency slot for the duration of one request."""
+        self.acquire(method, resource, mutation)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def record_response(self, response: Any, resource: str = "core") -> bool:
+        """Update budgets, pacing and concurrency from a response.
+
+        Args:
+            response: The HTTP response
+            resource: Resource to attribute the response to when it carries
+                no X-RateLimit-Resource header
+
+        Returns:
+            True if the response is a rate-limit rejection worth retrying
+            after the limiter's wait
+        """
+        headers = getattr(response, "headers", None)
+        status = getattr(response, "status_code", None)
+        if headers is None or not isinstance(status, int):
+            return False
+
+        name = headers.get("X-RateLimit-Resource")
+        resource = name if isinstance(name, str) and name else resource
+        remaining = _header_int(headers, "X-RateLimit-Remaining")
+        reset = _header_int(headers, "X-RateLimit-Reset")
+
+        with self._lock:
+            if remaining is not None and reset is not None:
+                self._budgets[resource] = [remaining, reset]
+                self._stats.remaining[resource] = remaining
+
+            if status not in (403, 429):
+                if status < 400:
+                    self._on_success()
+                return False
+
+            retry_after = _header_int(headers, "Retry-After")
+            if retry_after is not None or status == 429 or _is_secondary(response):
+                self._on_secondary_limit(retry_after)
+                return True
+            # Primary budget exhausted: acquire() waits for the reset
+            return remaining == 0
+
+    def record_rate_limited(self, retry_after: int | None = None) -> None:
+        """Back off after a rate limit reported outside the HTTP status.
+
+        Used for GraphQL payloads carrying RESOURCE_LIMITS_EXCEEDED errors,
+        which arrive with a 200 response.
+        """
+        with self._lock:
+            self._on_secondary_limit(retry_after)
+
+    def _on_success(self) -> None:
+        self._consecutive_secondary_hits = 0
+        self._successes += 1
+        if self._successes >= self._concurrency:
+            self._successes = 0
+            if self._concurrency < self.max_concurrency:
+                self._concurrency += 1
+                self._stats.concurrency = self._concurrency
+                self._lock.notify()
+
+    def _on_secondary_limit(self, retry_after: int | None) -> None:
+        self._consecutive_secondary_hits += 1
+        backoff = min(
+            _MAX_BACKOFF_SECONDS,
+            _SECONDARY_BACKOFF_SECONDS * 2 ** (self._consecutive_secondary_hits - 1),
+        )
+        pause = float(retry_after) if retry_after is not None else backoff
+        self._paused_until = max(self._paused_until, self._clock() + pause)
+        self._concurrency = max(1, self._concurrency // 2)
+        self._successes = 0
+        self._stats.secondary_limit_hits += 1
+        self._stats.concurrency = self._concurrency
+        logger.warning(
+            "github_secondary_rate_limit_hit",
+            pause_seconds=pause,
+            concurrency=self._concurrency,
+            severity="operational",
+        )
+
+    def stats(self) -> RateLimitStats:
+        """Snapshot of the counters since the last reset_stats()."""
+        with self._lock:
+            return RateLimitStats(
+                requests=self._stats.requests,
+                throttled_requests=self._stats.throttled_requests,
+                wait_seconds=self._stats.wait_seconds,
+                secondary_limit_hits=self._stats.secondary_limit_hits,
+                primary_limit_waits=self._stats.primary_limit_waits,
+                remaining=dict(self._stats.remaining),
+                concurrency=self._concurrency,
+            )
+
+    def reset_stats(self) -> None:
+        """Start counting a new run; budgets and pacing state are kept."""
+        with self._lock:
+            self._stats = RateLimitStats(
+                remaining=dict(self._stats.remaining), concurrency=self._concurrency
+            )
+
+
+def _is_secondary(response: Any) -> bool:
+    """Check a 403 body for GitHub's secondary rate limit message."""
+    try:
+        text = response.text
+    except Exception:
+        return False
+    return isinstance(text, str) and "secondary rate limit" in text.lower()
+
+
+_rate_limiter: GitHubRateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> GitHubRateLimiter:
+    """Get the process-wide rate limiter, creating it on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = GitHubRateLimiter()
+    return _rate_limiter
+
+
+def reset_rate_limiter() -> None:
+    """Drop the process-wide rate limiter and all of its state."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        _rate_limiter = None
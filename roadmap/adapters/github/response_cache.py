@@ -0,0 +1,317 @@
+"""Persistent HTTP response cache for conditional GitHub API requests.
+
+GitHub answers a GET carrying `If-None-Match` / `If-Modified-Since` with
+`304 Not Modified` when nothing changed, and 304s do not count against the
+rate limit. This cache stores the validators and body of every cacheable
+GET response in `.roadmap/db/` so unchanged pages are never re-downloaded.
+
+The cache is process-wide: GitHubSyncBackend enables it for the project
+being synced, and BaseGitHubHandler consults it when it is enabled.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from roadmap.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_FILENAME = "github_response_cache.db"
+
+# Response headers replayed on a cache hit (Link drives pagination)
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+# Query parameters left out of the cache key. Incremental syncs send a new
+# `since` on every run; keying on it would add rows forever, while the
+# stored ETag already tells GitHub whether the body changed.
+_UNKEYED_PARAMS = frozenset({"since"})
+
+# Rows kept after each write; the least recently stored are pruned
+DEFAULT_MAX_ENTRIES = 2000
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A stored response body with its validators."""
+
+    url: str
+    etag: str | None
+    last_modified: str | None
+    body: bytes
+    headers: dict[str, str]
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Build the validator headers for a conditional request."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a 200 response carrying the stored body."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = "utf-8"
+        response._content = self.body
+        return response
+
+
+class GitHubResponseCache:
+    """SQLite-backed store of GitHub GET responses keyed by URL and params.
+
+    Keys also include a fingerprint of the Authorization header, since
+    different tokens can see different data. The table is capped at
+    max_entries rows, pruning the least recently stored on write. All
+    operations are fail-safe: a broken cache only costs the conditional
+    request, never the sync.
+    """
+
+    def __init__(self, db_path: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize cache.
+
+        Args:
+            db_path: SQLite file to store responses in
+            max_entries: Maximum number of stored responses
+        """
+        self.db_path = Path(db_path)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    cache_key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    headers TEXT NOT NULL,  -- JSON object
+                    body BLOB NOT NULL,
+                    stored_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+            self._connection = connection
+        return self._connection
+
+    @staticmethod
+    def make_key(
+        url: str, params: dict[str, Any] | None, authorization: str | None
+    ) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            url: Full request URL
+            params: Query parameters; `since` is ignored
+            authorization: Authorization header value, if any
+
+        Returns:
+            Hex digest identifying the request
+        """
+        normalized_params = sorted(
+            (str(key), str(value))
+            for key, value in (params or {}).items()
+            if key not in _UNKEYED_PARAMS
+        )
+        token_fingerprint = (
+            hashlib.sha256(authorization.encode()).hexdigest() if authorization else ""
+        )
+        payload = json.dumps([url, normalized_params, token_fingerprint])
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, cache_key: str) -> CachedResponse | None:
+        """Look up a stored response.
+
+        Args:
+            cache_key: Key from make_key
+
+        Returns:
+            CachedResponse, or None if not stored or the cache is unusable
+        """
+        try:
+            with self._lock:
+                row = (
+                    self._get_connection()
+                    .execute(
+                        """
+                    SELECT url, etag, last_modified, headers, body
+                    FROM responses WHERE cache_key = ?
+                """,
+                        (cache_key,),
+                    )
+                    .fetchone()
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                "github_response_cache_read_failed",
+                error=str(e),
+                severity="operational",
+            )
+            return None
+
+        if not row:
+            return None
+        url, etag, last_modified, headers, body = row
+        return CachedResponse(
+            url=url,
+            etag=etag,
+            last_modified=last_modified,
+            body=bytes(body),
+            headers=json.loads(headers),
+        )
+
+    def store(self, cache_key: str, response: requests.Response) -> bool:
+        """Store a response if it carries a validator.
+
+        Args:
+            cache_key: Key from make_key
+            response: Successful GET response
+
+        Returns:
+            True if the response was stored
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not isinstance(etag, str) and not isinstance(last_modified, str):
+            return False
+
+        headers = {
+            name: response.headers[name]
+            for name in _STORED_HEADERS
+            if isinstance(response.headers.get(name), str)
+        }
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                connection.execute(
+                    """
+                    INSERT OR REPLACE INTO responses
+                    (cache_key, url, etag, last_modified, headers, body)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    (
+                        cache_key,
+                        response.url,
+                        etag if isinstance(etag, str) else None,
+                        last_modified if isinstance(last_modified, str) else None,
+                        json.dumps(headers),
+                        response.content,
+                    ),
+                )
+                self._prune(connection)
+                connection.commit()
+            return True
+        except (sqlite3.Error, OSError, TypeError) as e:
+            logger.warning(
+                "github_response_cache_write_failed",
+                error=str(e),
+                severity="operational",
+            )
+            return False
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        """Delete the least recently stored rows beyond max_entries."""
+        connection.execute(
+            """
+            DELETE FROM responses WHERE cache_key NOT IN (
+                SELECT cache_key FROM responses
+                ORDER BY stored_at DESC, rowid DESC
+                LIMIT ?
+            )
+        """,
+            (self.max_entries,),
+        )
+
+    def record_hit(self) -> None:
+        """Count a request answered from the cache."""
+        self.hits += 1
+
+    def record_miss(self) -> None:
+        """Count a request that downloaded a body."""
+        self.misses += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable requests answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                connection.execute("DELETE FROM responses")
+                connection.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                "github_response_cache_clear_failed",
+                error=str(e),
+                severity="operational",
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+_response_cache: GitHubResponseCache | None = None
+_response_cache_lock = threading.Lock()
+
+
+def enable_response_cache(db_dir: Path) -> GitHubResponseCache:
+    """Enable the process-wide response cache stored under a db directory.
+
+    Args:
+        db_dir: Directory holding the cache file (normally `.roadmap/db`)
+
+    Returns:
+        The active cache
+    """
+    global _response_cache
+    db_path = Path(db_dir) / CACHE_FILENAME
+    with _response_cache_lock:
+        if _response_cache is None or _response_cache.db_path != db_path:
+            if _response_cache is not None:
+                _response_cache.close()
+            _response_cache = GitHubResponseCache(db_path)
+        return _response_cache
+
+
+def disable_response_cache() -> None:
+    """Disable the process-wide response cache."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is not None:
+            _response_cache.close()
+        _response_cache = None
+
+
+def get_response_cache() -> GitHubResponseCache | None:
+    """Get the process-wide response cache, if enabled."""
+    return _response_cache
@@ -247,6 +247,8 @@ class DatabaseManager:
             content_hash TEXT NOT NULL,
             file_size INTEGER,
             last_modified TIMESTAMP,
+            mtime_ns INTEGER,
+            inode INTEGER,
             last_synced TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         );
 
@@ -404,6 +406,85 @@ class DatabaseManager:
                 CREATE INDEX IF NOT EXISTS idx_sync_metrics_operation_id ON sync_metrics (operation_id);
             """)
 
+        # Migration 7: Create issue_list_index table for indexed issue list queries
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='issue_list_index'"
+        )
+        if not cursor.fetchone():
+            migrations.append("""
+                CREATE TABLE issue_list_index (
+                    file_path TEXT PRIMARY KEY,
+                    issue_id TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    priority TEXT NOT NULL,
+                    priority_rank INTEGER NOT NULL,
+                    issue_type TEXT NOT NULL,
+                    assignee TEXT,
+                    milestone TEXT,
+                    due_date TEXT,  -- UTC, fixed-width so it compares as text
+                    created TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_status ON issue_list_index (status);
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_priority ON issue_list_index (priority);
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_issue_type ON issue_list_index (issue_type);
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_assignee ON issue_list_index (assignee);
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_milestone ON issue_list_index (milestone);
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_due_date ON issue_list_index (due_date);
+                CREATE INDEX IF NOT EXISTS idx_issue_list_index_order ON issue_list_index (priority_rank, created);
+            """)
+
+        # Migration 8: Secondary indexes for milestone progress, remote link
+        # lookups and dependency cascades (checked by test_query_plans.py)
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND name='idx_issues_milestone_status'"
+        )
+        if not cursor.fetchone():
+            migrations.append("""
+                CREATE INDEX IF NOT EXISTS idx_issues_milestone_status ON issues (milestone_id, status);
+                CREATE INDEX IF NOT EXISTS idx_issues_status_priority ON issues (status, priority);
+                CREATE INDEX IF NOT EXISTS idx_milestones_title ON milestones (title);
+                CREATE INDEX IF NOT EXISTS idx_issue_dependencies_depends_on ON issue_dependencies (depends_on_id);
+                CREATE INDEX IF NOT EXISTS idx_issue_labels_label ON issue_labels (label);
+                CREATE INDEX IF NOT EXISTS idx_issue_remote_links_remote_id
+                    ON issue_remote_links (backend_name, remote_id, issue_uuid);
+            """)
+
+        # Migration 9: Create remote_issue_snapshots table for incremental remote fetches
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name='remote_issue_snapshots'"
+        )
+        if not cursor.fetchone():
+            migrations.append("""
+                CREATE TABLE remote_issue_snapshots (
+                    backend_name TEXT NOT NULL,
+                    repository TEXT NOT NULL,
+                    remote_id TEXT NOT NULL,
+                    updated_at TEXT,
+                    data TEXT NOT NULL,  -- JSON issue payload
+                    PRIMARY KEY (backend_name, repository, remote_id)
+                );
+            """)
+
+        # Migration 10: Add content_hash to sync_base_state for delta baseline writes
+        cursor.execute("PRAGMA table_info(sync_base_state)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "content_hash" not in columns:
+            migrations.append("""
+                ALTER TABLE sync_base_state ADD COLUMN content_hash TEXT;
+                CREATE INDEX IF NOT EXISTS idx_sync_base_state_content_hash
+                    ON sync_base_state (issue_id, content_hash);
+            """)
+
+        # Migration 11: Add stat metadata to file_sync_state for stat-first checks
+        cursor.execute("PRAGMA table_info(file_sync_state)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "mtime_ns" not in columns:
+            migrations.append(
+                "ALTER TABLE file_sync_state ADD COLUMN mtime_ns INTEGER;"
+            )
+        if "inode" not in columns:
+            migrations.append("ALTER TABLE file_sync_state ADD COLUMN inode INTEGER;")
+
         # Execute migrations
         for migration_sql in migrations:
             try:
@@ -109,14 +109,17 @@ class EntitySyncCoordinator:
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO file_sync_state
-                    (file_path, content_hash, file_size, last_modified)
-                    VALUES (?, ?, ?, ?)
+                    (file_path, content_hash, file_size, last_modified,
+                     mtime_ns, inode)
+                    VALUES (?, ?, ?, ?, ?, ?)
                 """,
                     (
                         str(file_path),
                         metadata["hash"],
                         metadata["size"],
                         metadata["modified_time"],
+                        metadata.get("mtime_ns"),
+                        metadata.get("inode"),
                     ),
                 )
 
@@ -73,7 +73,8 @@ class FileParser:
         """Extract file metadata without parsing YAML.
 
         Returns:
-            Dictionary with 'hash', 'size', and 'modified_time' keys
+            Dictionary with 'hash', 'size', 'modified_time', 'mtime_ns' and
+            'inode' keys
         """
         try:
             file_stat = file_path.stat()
@@ -81,6 +82,8 @@ class FileParser:
                 "hash": FileParser.calculate_file_hash(file_path),
                 "size": file_stat.st_size,
                 "modified_time": datetime.fromtimestamp(file_stat.st_mtime),
+                "mtime_ns": file_stat.st_mtime_ns,
+                "inode": file_stat.st_ino,
             }
         except Exception as e:
             logger.error(
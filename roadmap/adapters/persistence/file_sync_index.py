@@ -0,0 +1,125 @@
+"""Stat-first change detection against the file_sync_state table.
+
+Each synced file's row records the content hash together with the stat
+metadata (mtime_ns, size, inode) the file had when it was synced. A file
+whose stat still matches its row is unchanged without being read; only
+files whose stat differs are hashed, so touching a file without editing it
+is still reported unchanged. All rows are loaded with one query so a scan
+over thousands of files costs one stat() call per file.
+"""
+
+import os
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from roadmap.adapters.persistence.file_parser import FileParser
+
+
+class SyncedFile(NamedTuple):
+    """A file_sync_state row as change detection reads it."""
+
+    content_hash: str | None
+    file_size: int | None
+    mtime_ns: int | None
+    inode: int | None
+
+    def matches_stat(self, stat: os.stat_result) -> bool:
+        """Check whether the file's stat is the one recorded at sync time."""
+        return (
+            self.mtime_ns == stat.st_mtime_ns
+            and self.file_size == stat.st_size
+            and self.inode == stat.st_ino
+        )
+
+
+_SELECT_SYNCED_FILES = """
+    SELECT file_path, content_hash, file_size, mtime_ns, inode
+    FROM file_sync_state
+"""
+
+
+def load_synced_files(conn: Any) -> dict[str, SyncedFile]:
+    """Load every file_sync_state row keyed by file path."""
+    make = SyncedFile._make
+    return {row[0]: make(row[1:]) for row in conn.execute(_SELECT_SYNCED_FILES)}
+
+
+def load_synced_file(conn: Any, file_path: str) -> SyncedFile | None:
+    """Load the file_sync_state row of a single file."""
+    row = conn.execute(
+        _SELECT_SYNCED_FILES + " WHERE file_path = ?", (file_path,)
+    ).fetchone()
+    return SyncedFile(*row[1:]) if row else None
+
+
+def scan_markdown_files(directory: Path) -> Iterator[tuple[str, os.stat_result]]:
+    """Yield the path and stat of every .md file below directory.
+
+    Paths are joined the way pathlib renders them, so they match the
+    file_path keys written for files found with Path.glob.
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    try:
+                        yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+
+
+def check_file(
+    file_path: Path,
+    synced: SyncedFile | None,
+    hash_file: Callable[[Path], str] = FileParser.calculate_file_hash,
+    stat: os.stat_result | None = None,
+) -> tuple[bool, os.stat_result | None]:
+    """Check whether a file differs from its synced row.
+
+    Args:
+        file_path: File to check
+        synced: The file's row, or None if it was never synced
+        hash_file: Hash function used when the stat does not match
+        stat: The file's stat if the caller already has it
+
+    Returns:
+        Tuple of (changed, stale_stat). stale_stat is the file's current
+        stat when the content is unchanged but the row's stat is not, so
+        the caller can refresh the row and skip hashing next time.
+    """
+    if synced is None:
+        return True, None
+    if stat is None:
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return True, None
+    if synced.matches_stat(stat):
+        return False, None
+    if hash_file(file_path) != synced.content_hash:
+        return True, None
+    return False, stat
+
+
+def refresh_synced_stats(
+    conn: Any, stale: Iterable[tuple[str, os.stat_result]]
+) -> None:
+    """Record the current stat of files whose content was unchanged."""
+    conn.executemany(
+        """
+        UPDATE file_sync_state SET file_size = ?, mtime_ns = ?, inode = ?
+        WHERE file_path = ?
+        """,
+        [
+            (stat.st_size, stat.st_mtime_ns, stat.st_ino, file_path)
+            for file_path, stat in stale
+        ],
+    )
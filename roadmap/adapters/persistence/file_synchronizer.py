@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any
 
 from roadmap.adapters.persistence.file_parser import FileParser
+from roadmap.adapters.persistence.file_sync_index import SyncedFile, check_file
 from roadmap.adapters.persistence.sync_orchestrator import SyncOrchestrator
 from roadmap.common.logging import get_logger
 
@@ -39,7 +40,8 @@ class FileSynchronizer:
         conn = self._get_connection()
         row = conn.execute(
             """
-            SELECT file_path, content_hash, file_size, last_modified
+            SELECT file_path, content_hash, file_size, last_modified,
+                   mtime_ns, inode
             FROM file_sync_state WHERE file_path = ?
         """,
             (file_path,),
@@ -66,13 +68,18 @@ class FileSynchronizer:
             if not file_path.exists():
                 return True
 
-            current_hash = self._parser.calculate_file_hash(file_path)
             sync_status = self.get_file_sync_status(str(file_path))
-
             if not sync_status:
                 return True
 
-            return current_hash != sync_status["content_hash"]
+            synced = SyncedFile(
+                sync_status["content_hash"],
+                sync_status.get("file_size"),
+                sync_status.get("mtime_ns"),
+                sync_status.get("inode"),
+            )
+            changed, _ = check_file(file_path, synced, self._parser.calculate_file_hash)
+            return changed
 
         except Exception as e:
             logger.error(
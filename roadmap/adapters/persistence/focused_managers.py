@@ -135,6 +135,10 @@ class FocusedQueryStateManager(QueryStateManager):
         """Get progress stats for a milestone."""
         return self._state_manager.get_milestone_progress(milestone_name)
 
+    def get_all_milestones_progress(self) -> dict[str, dict[str, int]]:
+        """Get progress stats for every milestone, keyed by milestone title."""
+        return self._state_manager.get_all_milestones_progress()
+
     def get_issues_by_status(self) -> dict[str, int]:
         """Get issue counts by status."""
         return self._state_manager.get_issues_by_status()
@@ -6,10 +6,13 @@ enabling three-way merge without a database. Key functions:
 - get_file_at_timestamp: Get file content as it existed at a specific time
 - find_commit_at_time: Find the git commit closest to a timestamp
 - get_file_at_commit: Get file content at a specific commit SHA
+- get_files_at_timestamp: Get many files at a timestamp in one pass
 """
 
+import posixpath
 import subprocess
 from datetime import datetime
+from pathlib import Path
 
 from roadmap.common.logging import get_logger
 
@@ -229,6 +232,193 @@ def get_file_at_head(file_path: str, cwd: str = ".") -> str:
     return get_file_at_commit(file_path, "HEAD", cwd)
 
 
+class GitObjectReader:
+    """Reads git objects through one long-lived `git cat-file --batch` process.
+
+    Each read is a request/response round trip on the process pipes, so
+    reading thousands of blobs costs one fork instead of one per blob.
+    Use as a context manager so the process is always reaped.
+    """
+
+    def __init__(self, cwd: str = "."):
+        """Initialize reader.
+
+        Args:
+            cwd: Working directory inside the repository
+        """
+        self.cwd = cwd
+        self._process: subprocess.Popen | None = None
+
+    def __enter__(self) -> "GitObjectReader":
+        """Start the cat-file process."""
+        self._start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Stop the cat-file process."""
+        self.close()
+
+    def _start(self) -> subprocess.Popen:
+        """Start the cat-file process if it is not running."""
+        if self._process is None:
+            try:
+                self._process = subprocess.Popen(
+                    ["git", "cat-file", "--batch"],
+                    cwd=self.cwd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                )
+            except FileNotFoundError as e:
+                raise GitHistoryError("Git not found in PATH") from e
+        return self._process
+
+    def read_blob(self, object_name: str) -> bytes | None:
+        """Read the raw content of an object.
+
+        Args:
+            object_name: Object SHA or any name cat-file accepts (e.g. 'HEAD:path')
+
+        Returns:
+            Object content, or None if the object does not exist
+
+        Raises:
+            GitHistoryError: If the cat-file process dies
+        """
+        process = self._start()
+        assert process.stdin is not None and process.stdout is not None
+
+        try:
+            process.stdin.write(f"{object_name}\n".encode())
+            process.stdin.flush()
+        except BrokenPipeError as e:
+            raise GitHistoryError("git cat-file exited unexpectedly") from e
+
+        # Header is "<sha> <type> <size>" or "<name> missing"
+        header = process.stdout.readline().split()
+        if not header:
+            raise GitHistoryError("git cat-file exited unexpectedly")
+        if len(header) != 3:
+            return None
+
+        content = process.stdout.read(int(header[2]))
+        process.stdout.read(1)  # Trailing newline after each object
+        return content
+
+    def close(self) -> None:
+        """Stop the cat-file process."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        if process.stdin:
+            process.stdin.close()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        if process.stdout:
+            process.stdout.close()
+
+
+def _list_tree_blobs(commit_sha: str, directory: str, cwd: str) -> dict[str, str]:
+    """Map repo-relative paths under a directory to blob SHAs at a commit.
+
+    Args:
+        commit_sha: Git commit SHA
+        directory: Directory relative to repo root ('.' for the whole tree)
+        cwd: Repository root
+
+    Returns:
+        Dict of path -> blob SHA
+    """
+    output = _run_git_command(["ls-tree", "-r", "-z", commit_sha, "--", directory], cwd)
+
+    blobs = {}
+    for entry in output.split("\0"):
+        if not entry:
+            continue
+        # Entries are "<mode> <type> <sha>\t<path>"
+        meta, path = entry.split("\t", 1)
+        _, object_type, sha = meta.split()
+        if object_type == "blob":
+            blobs[path] = sha
+    return blobs
+
+
+def get_files_at_timestamp(
+    file_paths: list[str], timestamp: datetime | str, cwd: str = "."
+) -> dict[str, str]:
+    """Get the content of many files as they existed at a specific timestamp.
+
+    Batched form of get_file_at_timestamp: the commit is resolved once, its
+    tree is listed once with `git ls-tree -r`, and all blobs are streamed
+    through a single GitObjectReader.
+
+    Args:
+        file_paths: Paths to files (absolute, or relative to cwd)
+        timestamp: Datetime or ISO 8601 string
+        cwd: Working directory
+
+    Returns:
+        Dict of file path (as given) -> content. Files that did not exist
+        at the timestamp, or are not valid UTF-8, are omitted.
+
+    Raises:
+        NotAGitRepository: If not in a git repository
+        GitHistoryError: If git operations fail
+    """
+    if not file_paths:
+        return {}
+
+    root = Path(get_repository_root(cwd)).resolve()
+    relative_paths = {}
+    for file_path in file_paths:
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = Path(cwd) / path
+        try:
+            relative_paths[file_path] = path.resolve().relative_to(root).as_posix()
+        except ValueError:
+            logger.debug("file_outside_repository", file=file_path, root=str(root))
+
+    if not relative_paths:
+        return {}
+
+    commit_sha = find_commit_at_time(timestamp, cwd=str(root))
+    directory = posixpath.commonpath(
+        [posixpath.dirname(path) for path in relative_paths.values()]
+    )
+    blobs = _list_tree_blobs(commit_sha, directory or ".", str(root))
+
+    contents = {}
+    with GitObjectReader(str(root)) as reader:
+        for file_path, relative_path in relative_paths.items():
+            blob_sha = blobs.get(relative_path)
+            if blob_sha is None:
+                continue
+            content = reader.read_blob(blob_sha)
+            if content is None:
+                continue
+            try:
+                contents[file_path] = content.decode("utf-8")
+            except UnicodeDecodeError as e:
+                logger.warning(
+                    "file_at_timestamp_undecodable",
+                    file=file_path,
+                    error=str(e),
+                    severity="operational",
+                )
+
+    logger.debug(
+        "files_retrieved_at_timestamp",
+        requested=len(file_paths),
+        found=len(contents),
+        commit=commit_sha[:8],
+    )
+    return contents
+
+
 def get_last_modified_time(file_path: str, cwd: str = ".") -> datetime | None:
     """Get the timestamp of the last commit that modified a file.
 
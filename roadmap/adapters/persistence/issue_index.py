@@ -0,0 +1,289 @@
+"""Persistent issue ID → file path index.
+
+Looking up a single issue by ID used to require enumerating and fully
+parsing every issue file. This module keeps a small sidecar index in
+``.roadmap/db/issue_index.json`` mapping issue IDs to their file location,
+together with the ``st_mtime_ns``/``st_size`` observed when the entry was
+recorded.
+
+The index is advisory: callers always parse the indexed file and confirm
+the ID before trusting it, so a stale or corrupt index only costs a
+fallback rescan, never a wrong answer. IDs a rescan did not find are
+remembered in memory until an issue directory changes, so repeated misses
+(unknown or archived IDs) rescan once.
+
+Changes are only marked dirty. The sidecar is written once per command:
+when the owning repository is closed, or at interpreter exit for indexes
+that still have pending changes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any
+
+from roadmap.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+INDEX_FILENAME = "issue_index.json"
+INDEX_VERSION = 1
+
+# Indexes with changes not yet written, flushed at interpreter exit
+_pending_flush: weakref.WeakSet[IssuePathIndex] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_pending() -> None:
+    """Write every index that still has pending changes."""
+    for index in list(_pending_flush):
+        index.flush()
+
+
+class IssuePathIndex:
+    """Sidecar index mapping issue IDs to markdown file paths.
+
+    Paths are stored relative to the issues directory so the index survives
+    moving the repository. Each entry also records the file's mtime and size
+    so :meth:`lookup` can tell whether the file changed since it was indexed.
+    """
+
+    def __init__(self, issues_dir: Path, index_path: Path | None = None):
+        """Initialize the index.
+
+        Args:
+            issues_dir: Root directory containing issue files
+            index_path: Location of the sidecar file. Defaults to
+                ``<issues_dir>/../db/issue_index.json``.
+        """
+        self.issues_dir = Path(issues_dir)
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.issues_dir.parent / "db" / INDEX_FILENAME
+        )
+        self._entries: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self._misses: set[str] = set()
+        self._misses_signature: tuple[tuple[str, int], ...] | None = None
+
+    # ------------------------------------------------------------------
+    # Loading and persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """Load entries from disk on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        entries: dict[str, dict[str, Any]] = {}
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+            if isinstance(data, dict) and data.get("version") == INDEX_VERSION:
+                raw_entries = data.get("entries", {})
+                if isinstance(raw_entries, dict):
+                    entries = raw_entries
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.debug(
+                "issue_index_load_failed",
+                path=str(self.index_path),
+                error=str(e),
+                severity="operational",
+            )
+
+        self._entries = entries
+        return entries
+
+    def flush(self) -> None:
+        """Write the index to disk if it has pending changes.
+
+        Writes go to a temporary file that is atomically renamed into place,
+        so concurrent readers never observe a partially written index.
+        Failures are logged and swallowed; the index is only an accelerator.
+        """
+        with self._lock:
+            _pending_flush.discard(self)
+            if not self._dirty or self._entries is None:
+                return
+
+            payload = {"version": INDEX_VERSION, "entries": self._entries}
+            tmp_path = self.index_path.with_name(
+                f"{self.index_path.name}.{os.getpid()}.tmp"
+            )
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path.write_text(
+                    json.dumps(payload, separators=(",", ":")), encoding="utf-8"
+                )
+                os.replace(tmp_path, self.index_path)
+                self._dirty = False
+                logger.debug(
+                    "issue_index_flushed",
+                    path=str(self.index_path),
+                    entries=len(self._entries),
+                )
+            except OSError as e:
+                logger.debug(
+                    "issue_index_flush_failed",
+                    path=str(self.index_path),
+                    error=str(e),
+                    severity="operational",
+                )
+                tmp_path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def lookup(self, issue_id: str) -> Path | None:
+        """Find the indexed file for an issue ID or unique ID prefix.
+
+        Args:
+            issue_id: Full issue ID or a prefix of one
+
+        Returns:
+            Path to the indexed file if it still exists, None on a miss.
+            Entries whose file has disappeared are dropped.
+        """
+        with self._lock:
+            entries = self._load()
+            key = issue_id if issue_id in entries else None
+            if key is None:
+                matches = sorted(k for k in entries if k.startswith(issue_id))
+                if not matches:
+                    return None
+                key = matches[0]
+
+            entry = entries[key]
+            path = self.issues_dir / entry.get("path", "")
+            try:
+                stat = path.stat()
+            except OSError:
+                self._remove(key)
+                return None
+
+            if stat.st_mtime_ns != entry.get("mtime_ns") or stat.st_size != entry.get(
+                "size"
+            ):
+                logger.debug("issue_index_entry_changed", issue_id=key)
+            return path
+
+    def tree_signature(self) -> tuple[tuple[str, int], ...]:
+        """Modification times of the issues directory and its subdirectories.
+
+        Creating, removing or renaming an issue file changes the mtime of the
+        directory holding it, so a changed signature means a rescan could
+        find issues it did not find before.
+        """
+        signature: list[tuple[str, int]] = []
+        try:
+            signature.append(("", self.issues_dir.stat().st_mtime_ns))
+            with os.scandir(self.issues_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        signature.append((entry.name, entry.stat().st_mtime_ns))
+        except OSError:
+            pass
+        return tuple(sorted(signature))
+
+    def is_known_missing(self, issue_id: str) -> bool:
+        """Check whether a rescan already failed to find an issue ID.
+
+        Args:
+            issue_id: Full issue ID or a prefix of one
+
+        Returns:
+            True if no issue directory changed since that rescan
+        """
+        with self._lock:
+            if issue_id not in self._misses:
+                return False
+            if self.tree_signature() != self._misses_signature:
+                self._misses = set()
+                return False
+            return True
+
+    def record_missing(
+        self, issue_id: str, signature: tuple[tuple[str, int], ...]
+    ) -> None:
+        """Remember that a rescan did not find an issue ID.
+
+        Args:
+            issue_id: Full issue ID or a prefix of one
+            signature: tree_signature() taken before the rescan started
+        """
+        with self._lock:
+            if signature != self._misses_signature:
+                self._misses = set()
+                self._misses_signature = signature
+            self._misses.add(issue_id)
+
+    def __len__(self) -> int:
+        """Return the number of indexed issues."""
+        with self._lock:
+            return len(self._load())
+
+    # ------------------------------------------------------------------
+    # Mutations
+    # ------------------------------------------------------------------
+
+    def record(self, issue_id: str, file_path: str | Path) -> None:
+        """Record (or refresh) the location of an issue.
+
+        Args:
+            issue_id: Issue identifier
+            file_path: Path to the issue's markdown file
+        """
+        path = Path(file_path)
+        try:
+            stat = path.stat()
+            relative = path.resolve().relative_to(self.issues_dir.resolve())
+        except (OSError, ValueError):
+            # File missing or outside the issues tree. Archived issues live
+            # outside it and are not indexed: get() only finds active issues.
+            return
+
+        entry = {
+            "path": relative.as_posix(),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+        with self._lock:
+            entries = self._load()
+            if entries.get(issue_id) != entry:
+                entries[issue_id] = entry
+                self._mark_dirty()
+
+    def remove(self, issue_id: str) -> None:
+        """Drop an issue from the index.
+
+        Args:
+            issue_id: Issue identifier
+        """
+        with self._lock:
+            self._load()
+            self._remove(issue_id)
+
+    def _remove(self, issue_id: str) -> None:
+        if self._entries is not None and self._entries.pop(issue_id, None):
+            self._mark_dirty()
+
+    def _mark_dirty(self) -> None:
+        """Note pending changes for the next flush, at the latest at exit."""
+        self._dirty = True
+        _pending_flush.add(self)
+
+    def clear(self) -> None:
+        """Discard all entries."""
+        with self._lock:
+            if self._load():
+                self._entries = {}
+                self._mark_dirty()
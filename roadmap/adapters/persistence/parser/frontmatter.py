@@ -7,13 +7,25 @@ from typing import Any
 
 import yaml
 
+from roadmap.common.cache import get_parsed_file_cache
 from roadmap.common.utils.file_utils import ensure_directory_exists, file_exists_check
 
+# Prefer the libyaml-backed C loader/dumper; fall back to pure Python when
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as YAMLDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
+
 
 class FrontmatterParser:
     """Parser for markdown files with YAML frontmatter."""
 
-    FRONTMATTER_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+    OPENING_DELIMITER = re.compile(r"---\s*\n")
+    CLOSING_DELIMITER = re.compile(r"\n---[^\S\n]*\n")
+    READ_CHUNK_SIZE = 4096
 
     @classmethod
     def parse_file(cls, file_path: Path) -> tuple[dict[str, Any], str]:
@@ -24,24 +36,99 @@ class FrontmatterParser:
         content = file_path.read_text(encoding="utf-8")
         return cls.parse_content(content)
 
+    @classmethod
+    def parse_frontmatter_file(cls, file_path: Path) -> dict[str, Any]:
+        """Parse only the frontmatter of a markdown file.
+
+        Reads the file in chunks and stops as soon as the closing ``---`` has
+        been seen, so the markdown body is never read or decoded. Use this
+        when only metadata is needed.
+
+        Args:
+            file_path: Markdown file to read
+
+        Returns:
+            Frontmatter dictionary (empty if the file has no frontmatter)
+        """
+        if not file_exists_check(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        with open(file_path, encoding="utf-8") as f:
+            buffer = f.read(cls.READ_CHUNK_SIZE)
+            opening = cls.OPENING_DELIMITER.match(buffer)
+            if not opening:
+                return {}
+            while True:
+                closing = cls.CLOSING_DELIMITER.search(buffer, opening.end())
+                if closing:
+                    return cls._load_yaml(buffer[opening.end() : closing.start()])
+                chunk = f.read(cls.READ_CHUNK_SIZE)
+                if not chunk:
+                    # No closing delimiter: not frontmatter
+                    return {}
+                buffer += chunk
+
+    @classmethod
+    def parse_body_file(cls, file_path: Path) -> str:
+        """Read only the markdown body of a file, skipping YAML loading.
+
+        Args:
+            file_path: Markdown file to read
+
+        Returns:
+            Markdown body with surrounding whitespace stripped
+        """
+        if not file_exists_check(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        _, body = cls._split_content(file_path.read_text(encoding="utf-8"))
+        return body
+
     @classmethod
     def parse_content(cls, content: str) -> tuple[dict[str, Any], str]:
-        """Parse markdown content and return frontmatter and body."""
-        match = cls.FRONTMATTER_PATTERN.match(content)
+        """Parse markdown content and return frontmatter and body.
 
-        if not match:
+        Locates the delimiters with anchored searches instead of matching
+        the whole document, and hands the YAML block to the C loader when
+        libyaml is available.
+        """
+        frontmatter_str, body = cls._split_content(content)
+        if frontmatter_str is None:
             # No frontmatter found, return empty dict and full content
-            return {}, content
+            return {}, body
+
+        return cls._load_yaml(frontmatter_str), body
+
+    @classmethod
+    def _split_content(cls, content: str) -> tuple[str | None, str]:
+        """Split content into its raw frontmatter block and stripped body.
+
+        Returns ``(None, content)`` when there is no complete frontmatter block.
+        """
+        if not content.startswith("---"):
+            return None, content
+
+        opening = cls.OPENING_DELIMITER.match(content)
+        if not opening:
+            return None, content
 
-        frontmatter_str, markdown_content = match.groups()
+        closing = cls.CLOSING_DELIMITER.search(content, opening.end())
+        if not closing:
+            return None, content
 
+        return (
+            content[opening.end() : closing.start()],
+            content[closing.end() :].strip(),
+        )
+
+    @staticmethod
+    def _load_yaml(frontmatter_str: str) -> dict[str, Any]:
+        """Load a YAML frontmatter block into a dict."""
         try:
-            loaded = yaml.safe_load(frontmatter_str)
-            frontmatter = loaded if isinstance(loaded, dict) else {}
+            loaded = yaml.load(frontmatter_str, Loader=YAMLLoader)  # nosec B506 - safe loader
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML frontmatter: {e}") from e
-
-        return frontmatter, markdown_content.strip()
+        return loaded if isinstance(loaded, dict) else {}
 
     @classmethod
     def serialize_file(
@@ -64,7 +151,10 @@ class FrontmatterParser:
         serializable_frontmatter = cls._prepare_frontmatter_for_yaml(frontmatter)
 
         frontmatter_str = yaml.dump(
-            serializable_frontmatter, default_flow_style=False, sort_keys=False
+            serializable_frontmatter,
+            Dumper=YAMLDumper,
+            default_flow_style=False,
+            sort_keys=False,
         )
 
         # Strip trailing whitespace from frontmatter to prevent ruff errors
@@ -77,6 +167,9 @@ class FrontmatterParser:
 
         file_path.write_text(full_content, encoding="utf-8")
 
+        # Written content supersedes anything parsed from this path earlier
+        get_parsed_file_cache().invalidate(file_path)
+
     @classmethod
     def _prepare_frontmatter_for_yaml(
         cls, frontmatter: dict[str, Any]
@@ -2,6 +2,7 @@
 
 import uuid
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -48,10 +49,8 @@ class IssueParser:
             frontmatter["blocks"] = []
 
     @classmethod
-    def parse_issue_file(cls, file_path: Path) -> Issue:
-        """Parse an issue markdown file and return an Issue object."""
-        frontmatter, content = FrontmatterParser.parse_file(file_path)
-
+    def _prepare_frontmatter(cls, frontmatter: dict, file_path: Path) -> None:
+        """Convert raw frontmatter values into Issue field values in-place."""
         # Parse date fields
         cls._parse_datetime_field(frontmatter, "created")
         cls._parse_datetime_field(frontmatter, "updated")
@@ -67,6 +66,33 @@ class IssueParser:
         # Ensure list fields exist
         cls._ensure_list_fields(frontmatter)
 
+    @staticmethod
+    def _apply_headline_fallback(frontmatter: dict, content: str) -> None:
+        """Use the first line of content as headline when none is provided."""
+        if "headline" not in frontmatter or not frontmatter["headline"]:
+            first_line = content.split("\n")[0] if content else ""
+            frontmatter["headline"] = first_line[:100]  # Limit to 100 chars
+
+    @classmethod
+    def parse_issue_file(cls, file_path: Path) -> Issue:
+        """Parse an issue markdown file and return an Issue object."""
+        return cls.build_issue(cls.read_issue_file(file_path), file_path)
+
+    @staticmethod
+    def read_issue_file(file_path: Path) -> tuple[dict[str, Any], str]:
+        """Read an issue file's raw frontmatter and body without validating.
+
+        This is the I/O and YAML half of parse_issue_file; it is safe to run
+        in a worker process and its result pickles cheaply.
+        """
+        return FrontmatterParser.parse_file(file_path)
+
+    @classmethod
+    def build_issue(cls, raw: tuple[dict[str, Any], str], file_path: Path) -> Issue:
+        """Build an Issue from read_issue_file() output."""
+        frontmatter, content = raw
+        cls._prepare_frontmatter(frontmatter, file_path)
+
         # Map legacy "description" field to "content" if present
         if "description" in frontmatter and "content" not in frontmatter:
             frontmatter["content"] = frontmatter.pop("description")
@@ -75,12 +101,29 @@ class IssueParser:
             frontmatter["content"] = content
 
         # If headline is not provided, use first line of content as fallback
-        if "headline" not in frontmatter or not frontmatter["headline"]:
-            first_line = content.split("\n")[0] if content else ""
-            frontmatter["headline"] = first_line[:100]  # Limit to 100 chars
+        cls._apply_headline_fallback(frontmatter, content)
 
         return Issue(**frontmatter)
 
+    @classmethod
+    def parse_issue_file_lazy(cls, file_path: Path) -> Issue:
+        """Parse an issue file's frontmatter, deferring the markdown body.
+
+        Only the frontmatter is read up front; the body is read from disk the
+        first time ``Issue.content`` is accessed. Intended for list views that
+        never look at the body. Files without a headline still need the body
+        for the headline fallback and are parsed eagerly.
+        """
+        frontmatter = FrontmatterParser.parse_frontmatter_file(file_path)
+        if not frontmatter.get("headline") or "description" in frontmatter:
+            return cls.parse_issue_file(file_path)
+
+        cls._prepare_frontmatter(frontmatter, file_path)
+        frontmatter.pop("content", None)
+        return Issue.with_lazy_content(
+            partial(FrontmatterParser.parse_body_file, file_path), **frontmatter
+        )
+
     @classmethod
     def save_issue_file(
         cls, issue: Issue, file_path: Path, sync_metadata: dict | None = None
@@ -110,7 +153,7 @@ class IssueParser:
         Returns:
             Sync metadata dictionary or None if not present
         """
-        frontmatter, _ = FrontmatterParser.parse_file(file_path)
+        frontmatter = FrontmatterParser.parse_frontmatter_file(file_path)
         return FrontmatterParser.extract_sync_metadata(frontmatter)
 
     @classmethod
@@ -1,8 +1,10 @@
 """Repository classes for persistence layer."""
 
+from .issue_list_index_repository import IssueListIndexRepository
 from .issue_repository import IssueRepository
 from .milestone_repository import MilestoneRepository
 from .project_repository import ProjectRepository
+from .remote_issue_snapshot_repository import RemoteIssueSnapshotRepository
 from .remote_link_repository import RemoteLinkRepository
 from .sync_state_repository import SyncStateRepository
 
@@ -10,6 +12,8 @@ __all__ = [
     "ProjectRepository",
     "MilestoneRepository",
     "IssueRepository",
+    "IssueListIndexRepository",
     "SyncStateRepository",
     "RemoteLinkRepository",
+    "RemoteIssueSnapshotRepository",
 ]
@@ -0,0 +1,241 @@
+"""Repository for the SQLite issue list index.
+
+The issue_list_index table holds one row per issue file with the columns
+that `roadmap issue list` filters on. It is a read cache over the YAML
+files: GitSyncMonitor keeps it current, and callers fall back to the YAML
+files whenever it cannot be brought up to date.
+"""
+
+import json
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from roadmap.common.constants import Priority, Status
+from roadmap.common.logging import get_logger
+from roadmap.core.domain.issue import Issue
+
+logger = get_logger(__name__)
+
+# Fixed-width UTC timestamps so SQLite can compare them as plain strings
+_TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+# Same order IssueService uses when sorting issue lists
+PRIORITY_RANK = {
+    Priority.CRITICAL: 0,
+    Priority.HIGH: 1,
+    Priority.MEDIUM: 2,
+    Priority.LOW: 3,
+}
+
+SYNCED_COMMIT_KEY = "issue_list_index_commit"
+DIRTY_PATHS_KEY = "issue_list_index_dirty"
+
+
+def _to_utc_timestamp(value: datetime | None) -> str | None:
+    """Format a datetime as a sortable UTC timestamp string."""
+    if value is None:
+        return None
+    if value.tzinfo:
+        value = value.astimezone(UTC)
+    else:
+        value = value.replace(tzinfo=UTC)
+    return value.strftime(_TIMESTAMP_FORMAT)
+
+
+class IssueListIndexRepository:
+    """Handles issue list index database operations.
+
+    Rows are keyed by the issue's file path so that renames and deletions
+    detected by git can be applied without parsing the old file.
+    """
+
+    def __init__(self, get_connection, transaction):
+        """Initialize repository with database connection methods.
+
+        Args:
+            get_connection: Callable that returns sqlite3 Connection
+            transaction: Context manager for database transactions
+        """
+        self._get_connection = get_connection
+        self._transaction = transaction
+
+    def record(self, issue: Issue, file_path: str) -> None:
+        """Insert or replace the index row for an issue file.
+
+        Args:
+            issue: Parsed issue
+            file_path: Absolute path of the issue file
+        """
+        self.record_many([(issue, file_path)])
+
+    def record_many(self, entries: Iterable[tuple[Issue, str]]) -> None:
+        """Insert or replace the index rows for several issue files at once.
+
+        Args:
+            entries: (parsed issue, absolute issue file path) pairs
+        """
+        rows = [
+            (
+                file_path,
+                issue.id,
+                issue.status.value,
+                issue.priority.value,
+                PRIORITY_RANK.get(issue.priority, 999),
+                issue.issue_type.value,
+                issue.assignee,
+                issue.milestone or None,
+                _to_utc_timestamp(issue.due_date),
+                _to_utc_timestamp(issue.created),
+            )
+            for issue, file_path in entries
+        ]
+        if not rows:
+            return
+        with self._transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO issue_list_index
+                (file_path, issue_id, status, priority, priority_rank, issue_type,
+                 assignee, milestone, due_date, created)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
+
+    def remove(self, file_path: str) -> None:
+        """Remove the index row for an issue file, if any.
+
+        Args:
+            file_path: Absolute path of the issue file
+        """
+        self.remove_many([file_path])
+
+    def remove_many(self, file_paths: Iterable[str]) -> None:
+        """Remove the index rows for several issue files at once.
+
+        Args:
+            file_paths: Absolute paths of the issue files
+        """
+        rows = [(file_path,) for file_path in file_paths]
+        if not rows:
+            return
+        with self._transaction() as conn:
+            conn.executemany("DELETE FROM issue_list_index WHERE file_path = ?", rows)
+
+    def clear(self) -> None:
+        """Remove all index rows and the sync markers."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM issue_list_index")
+            conn.execute(
+                "DELETE FROM sync_metadata WHERE key IN (?, ?)",
+                (SYNCED_COMMIT_KEY, DIRTY_PATHS_KEY),
+            )
+
+    def query(
+        self,
+        path_prefix: str,
+        status: str | None = None,
+        priority: str | None = None,
+        issue_type: str | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[str]:
+        """Find issue files matching all given filters.
+
+        Args:
+            path_prefix: Only return files under this directory
+            status: Exact status value
+            priority: Exact priority value
+            issue_type: Exact issue type value
+            assignee: Exact assignee
+            milestone: Exact milestone name
+            backlog: Only issues without a milestone
+            overdue: Only issues whose due date has passed
+            open_only: Exclude closed issues
+            blocked_only: Only blocked issues
+
+        Returns:
+            Matching file paths, ordered by priority then creation date
+        """
+        clauses = ["substr(file_path, 1, ?) = ?"]
+        params: list[object] = [len(path_prefix), path_prefix]
+
+        for column, value in (
+            ("status", status),
+            ("priority", priority),
+            ("issue_type", issue_type),
+            ("assignee", assignee),
+            ("milestone", milestone),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+
+        if backlog:
+            clauses.append("milestone IS NULL")
+        if overdue:
+            clauses.append("due_date < ?")
+            params.append(_to_utc_timestamp(datetime.now(UTC)))
+        if open_only:
+            clauses.append("status != ?")
+            params.append(Status.CLOSED.value)
+        if blocked_only:
+            clauses.append("status = ?")
+            params.append(Status.BLOCKED.value)
+
+        sql = (
+            "SELECT file_path FROM issue_list_index WHERE "  # nosec B608 - fixed column names
+            + " AND ".join(clauses)
+            + " ORDER BY priority_rank, created"
+        )
+        conn = self._get_connection()
+        return [row[0] for row in conn.execute(sql, params).fetchall()]
+
+    def get_synced_commit(self) -> str | None:
+        """Get the commit the index was last synced to."""
+        return self._get_metadata(SYNCED_COMMIT_KEY)
+
+    def set_synced_commit(self, commit: str) -> None:
+        """Record the commit the index has been synced to."""
+        self._set_metadata(SYNCED_COMMIT_KEY, commit)
+
+    def get_dirty_paths(self) -> set[str]:
+        """Get issue files that had uncommitted changes at the last refresh."""
+        value = self._get_metadata(DIRTY_PATHS_KEY)
+        if not value:
+            return set()
+        try:
+            return set(json.loads(value))
+        except json.JSONDecodeError:
+            logger.warning(
+                "failed_to_parse_issue_list_index_dirty_paths",
+                severity="data_error",
+            )
+            return set()
+
+    def set_dirty_paths(self, paths: set[str]) -> None:
+        """Record issue files that currently have uncommitted changes."""
+        self._set_metadata(DIRTY_PATHS_KEY, json.dumps(sorted(paths)))
+
+    def _get_metadata(self, key: str) -> str | None:
+        """Read a value from the sync_metadata table."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT value FROM sync_metadata WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_metadata(self, key: str, value: str) -> None:
+        """Write a value to the sync_metadata table."""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO sync_metadata (key, value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """,
+                (key, value),
+            )
@@ -0,0 +1,223 @@
+"""Repository for locally cached snapshots of remote issues.
+
+Sync backends that support incremental fetches keep the last known state
+of every remote issue here, plus a high-water mark (the newest remote
+`updated_at` seen) in sync_metadata. Each sync then only downloads issues
+updated since the mark and merges them into the snapshot. Deltas never
+report deleted or transferred issues, so the time of the last full fetch
+is recorded too and callers periodically replace the whole snapshot.
+"""
+
+import json
+from datetime import UTC, datetime
+from typing import Any
+
+from roadmap.common.logging import get_logger
+
+logger = get_logger(__name__)
+
+HIGH_WATER_KEY_PREFIX = "remote_issues_high_water"
+FULL_FETCH_KEY_PREFIX = "remote_issues_full_fetch"
+
+
+def _high_water_key(backend_name: str, repository: str) -> str:
+    return f"{HIGH_WATER_KEY_PREFIX}:{backend_name}:{repository}"
+
+
+def _full_fetch_key(backend_name: str, repository: str) -> str:
+    return f"{FULL_FETCH_KEY_PREFIX}:{backend_name}:{repository}"
+
+
+def _snapshot_rows(
+    backend_name: str, repository: str, issues: list[dict[str, Any]]
+) -> list[tuple]:
+    return [
+        (
+            backend_name,
+            repository,
+            str(issue["number"]),
+            issue.get("updated_at"),
+            json.dumps(issue),
+        )
+        for issue in issues
+    ]
+
+
+class RemoteIssueSnapshotRepository:
+    """Handles remote issue snapshot database operations."""
+
+    def __init__(self, get_connection, transaction):
+        """Initialize repository with database connection methods.
+
+        Args:
+            get_connection: Callable that returns sqlite3 Connection
+            transaction: Context manager for database transactions
+        """
+        self._get_connection = get_connection
+        self._transaction = transaction
+
+    def get_all(self, backend_name: str, repository: str) -> list[dict[str, Any]]:
+        """Get every cached remote issue for a repository.
+
+        Args:
+            backend_name: Backend name (e.g., 'github')
+            repository: Remote repository identifier (e.g., 'owner/repo')
+
+        Returns:
+            Cached issue dicts, in remote ID order
+        """
+        conn = self._get_connection()
+        rows = conn.execute(
+            """
+            SELECT data FROM remote_issue_snapshots
+            WHERE backend_name = ? AND repository = ?
+            ORDER BY CAST(remote_id AS INTEGER), remote_id
+        """,
+            (backend_name, repository),
+        ).fetchall()
+
+        issues = []
+        for row in rows:
+            try:
+                issues.append(json.loads(row[0]))
+            except json.JSONDecodeError:
+                logger.warning(
+                    "failed_to_parse_remote_issue_snapshot",
+                    backend_name=backend_name,
+                    repository=repository,
+                    severity="data_error",
+                )
+        return issues
+
+    def upsert(
+        self, backend_name: str, repository: str, issues: list[dict[str, Any]]
+    ) -> None:
+        """Insert or replace cached remote issues.
+
+        Args:
+            backend_name: Backend name (e.g., 'github')
+            repository: Remote repository identifier
+            issues: Issue dicts; each must carry 'number' and 'updated_at'
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO remote_issue_snapshots
+                (backend_name, repository, remote_id, updated_at, data)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                _snapshot_rows(backend_name, repository, issues),
+            )
+
+    def replace_all(
+        self, backend_name: str, repository: str, issues: list[dict[str, Any]]
+    ) -> None:
+        """Replace the whole snapshot for a repository.
+
+        Also records the current time as the repository's last full fetch.
+
+        Args:
+            backend_name: Backend name (e.g., 'github')
+            repository: Remote repository identifier
+            issues: Complete list of remote issue dicts
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM remote_issue_snapshots WHERE backend_name = ? AND repository = ?",
+                (backend_name, repository),
+            )
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO remote_issue_snapshots
+                (backend_name, repository, remote_id, updated_at, data)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                _snapshot_rows(backend_name, repository, issues),
+            )
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO sync_metadata (key, value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """,
+                (
+                    _full_fetch_key(backend_name, repository),
+                    datetime.now(UTC).isoformat(),
+                ),
+            )
+
+    def delete(
+        self, backend_name: str, repository: str, remote_ids: list[int | str]
+    ) -> None:
+        """Remove cached remote issues, e.g. after deleting them remotely.
+
+        Args:
+            backend_name: Backend name (e.g., 'github')
+            repository: Remote repository identifier
+            remote_ids: Remote issue numbers to remove
+        """
+        with self._transaction() as conn:
+            conn.executemany(
+                """
+                DELETE FROM remote_issue_snapshots
+                WHERE backend_name = ? AND repository = ? AND remote_id = ?
+            """,
+                [(backend_name, repository, str(rid)) for rid in remote_ids],
+            )
+
+    def clear(self, backend_name: str, repository: str) -> None:
+        """Remove the snapshot, high-water mark and full fetch time.
+
+        Args:
+            backend_name: Backend name (e.g., 'github')
+            repository: Remote repository identifier
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM remote_issue_snapshots WHERE backend_name = ? AND repository = ?",
+                (backend_name, repository),
+            )
+            conn.executemany(
+                "DELETE FROM sync_metadata WHERE key = ?",
+                [
+                    (_high_water_key(backend_name, repository),),
+                    (_full_fetch_key(backend_name, repository),),
+                ],
+            )
+
+    def get_high_water_mark(self, backend_name: str, repository: str) -> str | None:
+        """Get the newest remote updated_at merged into the snapshot."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT value FROM sync_metadata WHERE key = ?",
+            (_high_water_key(backend_name, repository),),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_last_full_fetch(
+        self, backend_name: str, repository: str
+    ) -> datetime | None:
+        """Get when the snapshot was last replaced by a full fetch."""
+        conn = self._get_connection()
+        row = conn.execute(
+            "SELECT value FROM sync_metadata WHERE key = ?",
+            (_full_fetch_key(backend_name, repository),),
+        ).fetchone()
+        if not row:
+            return None
+        try:
+            return datetime.fromisoformat(row[0])
+        except ValueError:
+            return None
+
+    def set_high_water_mark(
+        self, backend_name: str, repository: str, updated_at: str
+    ) -> None:
+        """Record the newest remote updated_at merged into the snapshot."""
+        with self._transaction() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO sync_metadata (key, value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+            """,
+                (_high_water_key(backend_name, repository), updated_at),
+            )
@@ -1,9 +1,15 @@
 """Database query service for aggregations and complex queries."""
 
-import hashlib
 import json
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from roadmap.adapters.persistence.file_sync_index import (
+    check_file,
+    load_synced_files,
+    refresh_synced_stats,
+    scan_markdown_files,
+)
 from roadmap.common.logging import get_logger
 
 if TYPE_CHECKING:
@@ -23,42 +29,45 @@ class QueryService:
         """
         self.state_manager = state_manager
 
-    def has_file_changes(self) -> bool:
-        """Check if .roadmap/ files have changes since last sync."""
-        try:
-            # Get roadmap directory from database path
-            roadmap_dir = self.state_manager.db_path.parent
+    def has_file_changes(self, roadmap_dir: Path | None = None) -> bool:
+        """Check if .roadmap/ files have changes since last sync.
 
-            # Check for Markdown files with YAML frontmatter in relevant directories
-            md_files = []
-            for subdir in ["issues", "milestones", "projects"]:
-                subdir_path = roadmap_dir / subdir
-                if subdir_path.exists():
-                    md_files.extend(subdir_path.rglob("*.md"))
+        Args:
+            roadmap_dir: The .roadmap directory. Defaults to the directory
+                holding the database's db/ folder (.roadmap/db/state.db)
 
-            if not md_files:
-                return False
+        Returns:
+            bool: True if changes detected
+        """
+        try:
+            if roadmap_dir is None:
+                roadmap_dir = self.state_manager.db_path.parent.parent
 
-            # Check each file against stored hash
+            # Compare each Markdown file's stat with its stored row; only
+            # files whose stat differs are hashed
             with self.state_manager.transaction() as conn:
-                for file_path in md_files:
-                    if not file_path.exists():
-                        continue
-
-                    # Calculate current hash
-                    current_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
-
-                    # Get stored hash
-                    result = conn.execute(
-                        "SELECT content_hash FROM file_sync_state WHERE file_path = ?",
-                        (str(file_path.relative_to(roadmap_dir)),),
-                    ).fetchone()
-
-                    if not result or result[0] != current_hash:
-                        # File is new or changed
-                        return True
-
-            return False
+                synced_files = load_synced_files(conn)
+                stale_stats = []
+                changed = False
+                for subdir in ["issues", "milestones", "projects"]:
+                    for key, stat in scan_markdown_files(roadmap_dir / subdir):
+                        synced = synced_files.get(key)
+                        if synced is not None and synced.matches_stat(stat):
+                            continue
+                        file_changed, stale_stat = check_file(
+                            Path(key), synced, stat=stat
+                        )
+                        if file_changed:
+                            changed = True
+                            break
+                        stale_stats.append((key, stale_stat))
+                    if changed:
+                        break
+
+                if stale_stats:
+                    refresh_synced_stats(conn, stale_stats)
+
+            return changed
 
         except Exception as e:
             logger.warning(
@@ -205,6 +214,33 @@ class QueryService:
             )
             return {"total": 0, "completed": 0}
 
+    def get_all_milestones_progress(self) -> dict[str, dict[str, int]]:
+        """Get progress stats for every milestone in one grouped query."""
+        try:
+            with self.state_manager.transaction() as conn:
+                rows = conn.execute("""
+                    SELECT m.title,
+                           COUNT(i.id),
+                           SUM(CASE WHEN i.status = 'closed' THEN 1 ELSE 0 END)
+                    FROM milestones m
+                    LEFT JOIN issues i ON i.milestone_id = m.id
+                    GROUP BY m.id
+                    ORDER BY m.rowid
+                """).fetchall()
+
+            progress: dict[str, dict[str, int]] = {}
+            for title, total, completed in rows:
+                # Duplicate titles resolve to the first milestone, as in
+                # get_milestone_progress
+                progress.setdefault(
+                    title, {"total": total, "completed": completed or 0}
+                )
+            return progress
+
+        except Exception as e:
+            logger.error("failed_to_get_all_milestones_progress", error=str(e))
+            return {}
+
     def get_issues_by_status(self) -> dict[str, int]:
         """Get issue counts by status."""
         try:
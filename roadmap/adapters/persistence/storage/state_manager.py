@@ -1,5 +1,7 @@
 """State manager and database errors for persistence layer."""
 
+import hashlib
+import json
 import sqlite3
 from datetime import UTC, datetime
 from pathlib import Path
@@ -10,9 +12,11 @@ from roadmap.common.logging import get_logger
 from ..database_manager import DatabaseManager
 from ..file_synchronizer import FileSynchronizer
 from ..repositories import (
+    IssueListIndexRepository,
     IssueRepository,
     MilestoneRepository,
     ProjectRepository,
+    RemoteIssueSnapshotRepository,
     RemoteLinkRepository,
     SyncStateRepository,
 )
@@ -28,6 +32,20 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _baseline_row_hash(state: dict[str, Any]) -> str:
+    """Hash the stored fields of one baseline entry to detect changed rows."""
+    fields = (
+        state.get("status"),
+        state.get("assignee"),
+        state.get("milestone"),
+        state.get("description"),
+        state.get("headline"),
+        state.get("content"),
+        state.get("labels", []),
+    )
+    return hashlib.sha256(repr(fields).encode("utf-8")).hexdigest()
+
+
 class DatabaseError(Exception):
     """Base exception for database operations."""
 
@@ -80,6 +98,12 @@ class StateManager:
         self._remote_link_repo = RemoteLinkRepository(
             self._db_manager._get_connection, self._db_manager.transaction
         )
+        self._issue_list_index_repo = IssueListIndexRepository(
+            self._db_manager._get_connection, self._db_manager.transaction
+        )
+        self._remote_issue_snapshot_repo = RemoteIssueSnapshotRepository(
+            self._db_manager._get_connection, self._db_manager.transaction
+        )
 
         # Initialize storage layers
         self._connection_manager = ConnectionManager(self._db_manager)
@@ -101,6 +125,7 @@ class StateManager:
 
         # Note: Remote links initialization moved to RoadmapCore.initialize_remote_links()
         # because StateManager doesn't have access to roadmap_dir
+        self._pending_remote_links_dir: Path | str | None = None
 
     # Connection management - delegate to ConnectionManager
     def _get_connection(self) -> sqlite3.Connection:
@@ -154,6 +179,16 @@ class StateManager:
         """
         self._initialize_remote_links_impl(roadmap_dir)
 
+    def defer_remote_links_initialization(self, roadmap_dir: Path | str) -> None:
+        """Initialize remote_links from YAML on first access to remote_links.
+
+        Commands that never touch remote links skip the scan of issue files.
+
+        Args:
+            roadmap_dir: Path to the roadmap directory
+        """
+        self._pending_remote_links_dir = roadmap_dir
+
     def _initialize_remote_links_impl(self, roadmap_dir: Path | str) -> None:
         """Initialize remote links from storage.
 
@@ -353,8 +388,45 @@ class StateManager:
     @property
     def remote_links(self) -> RemoteLinkRepository:
         """Get remote link repository for sync backend operations."""
+        if self._pending_remote_links_dir is not None:
+            roadmap_dir = self._pending_remote_links_dir
+            self._pending_remote_links_dir = None
+            self._initialize_remote_links_impl(roadmap_dir)
         return self._remote_link_repo
 
+    # Remote issue snapshot operations - delegate to RemoteIssueSnapshotRepository
+    @property
+    def remote_issue_snapshots(self) -> RemoteIssueSnapshotRepository:
+        """Get remote issue snapshot repository for incremental remote fetches."""
+        return self._remote_issue_snapshot_repo
+
+    # Issue list index operations - delegate to IssueListIndexRepository
+    @property
+    def issue_list_index(self) -> IssueListIndexRepository:
+        """Get issue list index repository for indexed issue queries."""
+        return self._issue_list_index_repo
+
+    def refresh_issue_list_index(self) -> bool:
+        """Bring the issue list index up to date via the GitSyncMonitor.
+
+        Returns:
+            True if the index reflects the issue files on disk, False if it
+            could not be refreshed and callers should read the YAML files
+        """
+        if self._git_sync_monitor is None:
+            return False
+
+        try:
+            return self._git_sync_monitor.refresh_issue_list_index()
+        except Exception as e:
+            logger.warning(
+                "issue_list_index_refresh_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                severity="operational",
+            )
+            return False
+
     # Sync baseline operations - store/retrieve baseline for three-way merge
     def get_sync_baseline(self) -> dict[str, Any] | None:
         """Get the sync baseline from database.
@@ -366,8 +438,6 @@ class StateManager:
             Dictionary mapping issue_id to baseline state, or None if no baseline exists
         """
         try:
-            import json
-
             self._sync_git_state()
 
             conn = self._get_connection()
@@ -435,7 +505,10 @@ class StateManager:
         """Save the current sync baseline to database.
 
         Called after a successful sync to establish the new baseline for the
-        next sync's three-way merge.
+        next sync's three-way merge. Only the delta against the stored
+        baseline is written: rows whose content hash changed are upserted,
+        rows for issues no longer in the baseline are deleted, and unchanged
+        rows (including their synced_at) are left alone.
 
         Args:
             baseline: Dictionary mapping issue_id to state dict with keys:
@@ -445,8 +518,6 @@ class StateManager:
             True if saved successfully, False otherwise
         """
         try:
-            import json
-
             now = datetime.now(UTC).isoformat()
 
             logger.debug(
@@ -454,24 +525,19 @@ class StateManager:
                 issue_count=len(baseline),
             )
 
-            # Get connection and disable FK constraints for this operation
-            conn = self._connection_manager.get_connection()
-            conn.execute("PRAGMA foreign_keys = OFF")
-
-            try:
-                conn.execute("BEGIN IMMEDIATE")
-                # Clear old baseline
-                conn.execute("DELETE FROM sync_base_state")
-                logger.debug("cleared_old_sync_baseline_from_database")
+            with self.transaction() as conn:
+                stored_hashes = dict(
+                    conn.execute(
+                        "SELECT issue_id, content_hash FROM sync_base_state"
+                    ).fetchall()
+                )
 
-                # Insert new baseline
+                changed_rows = []
                 for issue_id, state in baseline.items():
-                    conn.execute(
-                        """
-                        INSERT INTO sync_base_state
-                        (issue_id, status, assignee, milestone, description, headline, content, labels, synced_at)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
+                    row_hash = _baseline_row_hash(state)
+                    if stored_hashes.get(issue_id) == row_hash:
+                        continue
+                    changed_rows.append(
                         (
                             issue_id,
                             state.get("status"),
@@ -481,17 +547,46 @@ class StateManager:
                             state.get("headline"),
                             state.get("content"),
                             json.dumps(state.get("labels", [])),
+                            row_hash,
                             now,
-                        ),
+                        )
+                    )
+                removed_ids = [
+                    (issue_id,)
+                    for issue_id in stored_hashes
+                    if issue_id not in baseline
+                ]
+
+                if removed_ids:
+                    conn.executemany(
+                        "DELETE FROM sync_base_state WHERE issue_id = ?", removed_ids
+                    )
+                if changed_rows:
+                    conn.executemany(
+                        """
+                        INSERT INTO sync_base_state
+                        (issue_id, status, assignee, milestone, description, headline,
+                         content, labels, content_hash, synced_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(issue_id) DO UPDATE SET
+                            status = excluded.status,
+                            assignee = excluded.assignee,
+                            milestone = excluded.milestone,
+                            description = excluded.description,
+                            headline = excluded.headline,
+                            content = excluded.content,
+                            labels = excluded.labels,
+                            content_hash = excluded.content_hash,
+                            synced_at = excluded.synced_at
+                    """,
+                        changed_rows,
                     )
-                conn.execute("COMMIT")
-            finally:
-                # Re-enable foreign keys
-                conn.execute("PRAGMA foreign_keys = ON")
 
             logger.info(
                 "sync_baseline_saved_to_database",
                 issue_count=len(baseline),
+                upserted_count=len(changed_rows),
+                deleted_count=len(removed_ids),
                 synced_at=now,
             )
             return True
@@ -563,9 +658,9 @@ class StateManager:
         return self._sync_state_storage.smart_sync(roadmap_dir)
 
     # Query operations - these delegate complex queries to query service
-    def has_file_changes(self) -> bool:
+    def has_file_changes(self, roadmap_dir: Path | None = None) -> bool:
         """Check if .roadmap/ files have changes since last sync."""
-        return self._sync_state_storage.has_file_changes(self)
+        return self._sync_state_storage.has_file_changes(self, roadmap_dir)
 
     def get_all_issues(self) -> list[dict[str, Any]]:
         """Get all issues from database."""
@@ -588,6 +683,12 @@ class StateManager:
 
         return QueryService(self).get_milestone_progress(milestone_name)
 
+    def get_all_milestones_progress(self) -> dict[str, dict[str, int]]:
+        """Get progress stats for every milestone, keyed by milestone title."""
+        from .queries import QueryService
+
+        return QueryService(self).get_all_milestones_progress()
+
     def get_issues_by_status(self) -> dict[str, int]:
         """Get issue counts by status."""
         from .queries import QueryService
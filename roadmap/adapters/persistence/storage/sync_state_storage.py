@@ -190,11 +190,13 @@ class SyncStateStorage:
             return {"error": str(e), "files_failed": 1}
 
     # File changes checking - needs state manager context
-    def has_file_changes(self, state_manager) -> bool:
+    def has_file_changes(self, state_manager, roadmap_dir: Path | None = None) -> bool:
         """Check if .roadmap/ files have changes since last sync.
 
         Args:
             state_manager: StateManager instance for database access
+            roadmap_dir: The .roadmap directory; derived from the database
+                path if omitted
 
         Returns:
             bool: True if changes detected
@@ -202,6 +204,6 @@ class SyncStateStorage:
         from .queries import QueryService
 
         logger.debug("Checking file changes")
-        result = QueryService(state_manager).has_file_changes()
+        result = QueryService(state_manager).has_file_changes(roadmap_dir)
         logger.debug("File changes check completed", has_changes=result)
         return result
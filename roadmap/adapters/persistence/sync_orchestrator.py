@@ -10,6 +10,13 @@ from roadmap.adapters.persistence.entity_sync_coordinators import (
     ProjectSyncCoordinator,
 )
 from roadmap.adapters.persistence.file_parser import FileParser
+from roadmap.adapters.persistence.file_sync_index import (
+    SyncedFile,
+    check_file,
+    load_synced_file,
+    load_synced_files,
+    refresh_synced_stats,
+)
 from roadmap.adapters.persistence.sync_state_tracker import SyncStateTracker
 from roadmap.common.logging import get_logger
 
@@ -36,22 +43,37 @@ class SyncOrchestrator:
         )
         self._project_sync = ProjectSyncCoordinator(get_connection, transaction_context)
 
-    def _has_file_changed(self, file_path: Path) -> bool:
-        """Check if file has changed since last sync."""
+    def _has_file_changed(
+        self,
+        file_path: Path,
+        synced_files: dict[str, SyncedFile] | None = None,
+        stale_stats: list | None = None,
+    ) -> bool:
+        """Check if file has changed since last sync.
+
+        Args:
+            file_path: File to check
+            synced_files: Preloaded file_sync_state rows; the file's row is
+                queried on its own when omitted
+            stale_stats: Collects (file_path, stat) for unchanged files whose
+                recorded stat is out of date
+        """
         try:
             if not file_path.exists():
                 return True
 
-            current_hash = self._parser.calculate_file_hash(file_path)
-            conn = self._get_connection()
-            row = conn.execute(
-                "SELECT content_hash FROM file_sync_state WHERE file_path = ?",
-                (str(file_path),),
-            ).fetchone()
+            key = str(file_path)
+            if synced_files is None:
+                synced = load_synced_file(self._get_connection(), key)
+            else:
+                synced = synced_files.get(key)
 
-            if not row:
-                return True  # Never synced
-            return current_hash != row[0]
+            changed, stale_stat = check_file(
+                file_path, synced, self._parser.calculate_file_hash
+            )
+            if stale_stat is not None and stale_stats is not None:
+                stale_stats.append((key, stale_stat))
+            return changed
 
         except Exception as e:
             logger.error(
@@ -62,6 +84,32 @@ class SyncOrchestrator:
             )
             return True
 
+    def _load_synced_files(self) -> dict[str, SyncedFile] | None:
+        """Load all file_sync_state rows, or None to fall back to per-file checks."""
+        try:
+            return load_synced_files(self._get_connection())
+        except Exception as e:
+            logger.warning(
+                "failed_to_load_file_sync_state",
+                error=str(e),
+                severity="operational",
+            )
+            return None
+
+    def _refresh_stale_stats(self, stale_stats: list) -> None:
+        """Record current stat metadata for files found unchanged by hash."""
+        if not stale_stats:
+            return
+        try:
+            with self._transaction() as conn:
+                refresh_synced_stats(conn, stale_stats)
+        except Exception as e:
+            logger.warning(
+                "failed_to_refresh_file_sync_state",
+                error=str(e),
+                severity="operational",
+            )
+
     def _sync_file_by_type(self, file_path: Path, stats: dict) -> bool:
         """Sync file based on its type.
 
@@ -126,6 +174,9 @@ class SyncOrchestrator:
                 "issues/**/*.md",  # All issue files including subdirectories
             ]
 
+            synced_files = self._load_synced_files()
+            stale_stats: list = []
+
             for pattern in patterns:
                 logger.debug(
                     "Processing glob pattern",
@@ -143,7 +194,7 @@ class SyncOrchestrator:
 
                     for file_path in pattern_results:
                         stats["files_checked"] += 1
-                        if self._has_file_changed(file_path):
+                        if self._has_file_changed(file_path, synced_files, stale_stats):
                             stats["files_changed"] += 1
                             self._sync_file_by_type(file_path, stats)
 
@@ -156,6 +207,8 @@ class SyncOrchestrator:
                         severity="operational",
                     )
 
+            self._refresh_stale_stats(stale_stats)
+
             # Update checkpoint
             self._state_tracker.update_last_incremental_sync(str(stats["sync_time"]))
 
@@ -263,10 +316,13 @@ class SyncOrchestrator:
 
             # Count changed files
             changed_files = 0
+            synced_files = self._load_synced_files()
+            stale_stats: list = []
             for pattern in ["issues/**/*.md", "milestones/**/*.md", "projects/**/*.md"]:
                 for file_path in roadmap_dir.glob(pattern):
-                    if self._has_file_changed(file_path):
+                    if self._has_file_changed(file_path, synced_files, stale_stats):
                         changed_files += 1
+            self._refresh_stale_stats(stale_stats)
 
             # Check for missing sync checkpoint
             if not self._state_tracker.get_last_incremental_sync():
@@ -7,15 +7,18 @@ file-based storage while decoupling services from implementation details.
 
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
+from roadmap.adapters.persistence.issue_index import IssuePathIndex
 from roadmap.adapters.persistence.parser import (
     IssueParser,
     MilestoneParser,
     ProjectParser,
 )
 from roadmap.adapters.persistence.storage import StateManager
+from roadmap.common.cache import get_parsed_file_cache
 from roadmap.common.logging import get_logger
 from roadmap.core.domain.issue import Issue
 from roadmap.core.domain.milestone import Milestone
@@ -25,10 +28,16 @@ from roadmap.core.repositories import (
     MilestoneRepository,
     ProjectRepository,
 )
-from roadmap.infrastructure.validation.file_enumeration import FileEnumerationService
+from roadmap.infrastructure.validation.file_enumeration import (
+    FileEnumerationService,
+    SplitParser,
+)
 
 logger = get_logger(__name__)
 
+# Lets full issue loads read and YAML-parse files in worker processes
+ISSUE_SPLIT_PARSER = SplitParser(IssueParser.read_issue_file, IssueParser.build_issue)
+
 
 class YAMLIssueRepository(IssueRepository):
     """Issue repository using YAML file storage.
@@ -53,6 +62,14 @@ class YAMLIssueRepository(IssueRepository):
     - issue.file_path always points to actual file location
     - No orphaned copies left in subdirectories after moves
 
+    **ID Lookup:**
+    - get()/update()/delete() consult a persistent ID → path index first
+    - The indexed file is parsed and its ID verified before being returned
+    - On a miss, the directory is rescanned once, re-indexing each issue
+    - IDs the rescan did not find (unknown or archived) are not rescanned
+      again until an issue directory changes
+    - Index changes are written once, on close() or at interpreter exit
+
     **Error Handling:**
     - If cleanup fails, logs warning but continues (fail-open)
     - If save fails, raises exception (fail-safe)
@@ -68,18 +85,36 @@ class YAMLIssueRepository(IssueRepository):
         """
         self.db = db
         self.issues_dir = issues_dir
+        self.path_index = IssuePathIndex(issues_dir)
+
+    def close(self) -> None:
+        """Write pending path index changes to disk."""
+        self.path_index.flush()
 
     def get(self, issue_id: str) -> Issue | None:
         """Get a specific issue by ID.
 
+        Consults the persistent path index first and only rescans the
+        issues directory on a miss. Archived issues are not searched.
+
         Args:
             issue_id: Issue identifier
 
         Returns:
             Issue object if found, None otherwise
         """
+        issue = self._get_from_index(issue_id)
+        if issue is not None:
+            return issue
+
+        if self.path_index.is_known_missing(issue_id):
+            return None
+
+        # Index miss: rescan, re-indexing every issue we parse on the way
+        signature = self.path_index.tree_signature()
 
         def id_matcher(issue: Issue) -> bool:
+            self._index_issue(issue)
             return issue.id.startswith(issue_id)
 
         issues = FileEnumerationService.enumerate_with_filter(
@@ -87,7 +122,51 @@ class YAMLIssueRepository(IssueRepository):
             IssueParser.parse_issue_file,
             id_matcher,
         )
-        return issues[0] if issues else None
+        if not issues:
+            self.path_index.record_missing(issue_id, signature)
+            return None
+        return issues[0]
+
+    def _get_from_index(self, issue_id: str) -> Issue | None:
+        """Resolve an issue through the path index.
+
+        Args:
+            issue_id: Issue identifier or prefix
+
+        Returns:
+            Parsed issue if the indexed file still holds a matching issue,
+            None on a miss or stale entry
+        """
+        path = self.path_index.lookup(issue_id)
+        if path is None:
+            return None
+
+        try:
+            issue = get_parsed_file_cache().get_or_parse(
+                path, IssueParser.parse_issue_file
+            )
+        except Exception as e:
+            logger.debug(
+                "issue_index_entry_unreadable",
+                issue_id=issue_id,
+                path=str(path),
+                error=str(e),
+            )
+            return None
+
+        if not issue.id.startswith(issue_id):
+            return None
+
+        issue.file_path = str(path)
+        self._index_issue(issue)
+        return issue
+
+    def _index_issue(self, issue: Issue) -> None:
+        """Record an issue's file location in the path index."""
+        file_path = getattr(issue, "file_path", None)
+        issue_id = getattr(issue, "id", None)
+        if isinstance(file_path, str) and isinstance(issue_id, str):
+            self.path_index.record(issue_id, file_path)
 
     def list(
         self, milestone: str | None = None, status: str | None = None
@@ -101,10 +180,10 @@ class YAMLIssueRepository(IssueRepository):
         Returns:
             List of active Issue objects matching filters (not including archived)
         """
-        # Get issues from active directory only
+        # Get issues from active directory only; bodies load on first access
         issues = FileEnumerationService.enumerate_and_parse(
             self.issues_dir,
-            IssueParser.parse_issue_file,
+            IssueParser.parse_issue_file_lazy,
         )
 
         if milestone:
@@ -114,6 +193,63 @@ class YAMLIssueRepository(IssueRepository):
 
         return issues
 
+    def query(
+        self,
+        status: str | None = None,
+        priority: str | None = None,
+        issue_type: str | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[Issue] | None:
+        """Query active issues through the SQLite issue list index.
+
+        All filters are combined with AND logic. Matching files are parsed
+        with deferred bodies, in priority then creation date order.
+
+        Returns:
+            Matching Issue objects, or None if the index is stale and the
+            caller should filter list() instead
+        """
+        if not self.db.refresh_issue_list_index():
+            return None
+
+        paths = self.db.issue_list_index.query(
+            path_prefix=f"{self.issues_dir}{os.sep}",
+            status=status,
+            priority=priority,
+            issue_type=issue_type,
+            assignee=assignee,
+            milestone=milestone,
+            backlog=backlog,
+            overdue=overdue,
+            open_only=open_only,
+            blocked_only=blocked_only,
+        )
+
+        issues = []
+        cache = get_parsed_file_cache()
+        for path in paths:
+            try:
+                issue = cache.get_or_parse(
+                    Path(path), IssueParser.parse_issue_file_lazy
+                )
+            except Exception as e:
+                logger.debug(
+                    "issue_list_index_entry_unreadable",
+                    path=path,
+                    error=str(e),
+                )
+                return None
+            issue.file_path = path
+            issues.append(issue)
+
+        logger.debug("issue_list_index_query", count=len(issues))
+        return issues
+
     def list_all_including_archived(
         self, milestone: str | None = None, status: str | None = None
     ) -> list[Issue]:
@@ -130,6 +266,7 @@ class YAMLIssueRepository(IssueRepository):
         issues = FileEnumerationService.enumerate_and_parse(
             self.issues_dir,
             IssueParser.parse_issue_file,
+            split_parser=ISSUE_SPLIT_PARSER,
         )
 
         # Also get issues from archive directory if it exists
@@ -138,6 +275,7 @@ class YAMLIssueRepository(IssueRepository):
             archived_issues = FileEnumerationService.enumerate_and_parse(
                 archive_dir,
                 IssueParser.parse_issue_file,
+                split_parser=ISSUE_SPLIT_PARSER,
             )
             issues.extend(archived_issues)
 
@@ -158,6 +296,9 @@ class YAMLIssueRepository(IssueRepository):
         Args:
             issue: Issue object to save
         """
+        # Load a deferred body before any stale copy (its source) is removed
+        _ = issue.content
+
         # Determine target directory based on milestone
         if issue.milestone and issue.milestone != "backlog":
             # Save to milestone-specific directory
@@ -238,6 +379,7 @@ class YAMLIssueRepository(IssueRepository):
 
         # Set the file_path on the issue object so it reflects the saved location
         issue.file_path = str(issue_path_target)
+        self._index_issue(issue)
 
     def update(self, issue_id: str, updates: dict) -> Issue | None:
         """Update specific fields of an issue.
@@ -417,7 +559,9 @@ class YAMLIssueRepository(IssueRepository):
                 issue_path.unlink()
             except (OSError, PermissionError):
                 return False
+            get_parsed_file_cache().invalidate(issue_path)
 
+        self.path_index.remove(issue.id)
         return True
 
     def delete_many(self, issue_ids: list[str]) -> int:
@@ -554,6 +698,7 @@ class YAMLMilestoneRepository(MilestoneRepository):
                 milestone_path.unlink()
             except (OSError, PermissionError):
                 return False
+            get_parsed_file_cache().invalidate(milestone_path)
 
         return True
 
@@ -687,5 +832,6 @@ class YAMLProjectRepository(ProjectRepository):
                 project_path.unlink()
             except (OSError, PermissionError):
                 return False
+            get_parsed_file_cache().invalidate(project_path)
 
         return True
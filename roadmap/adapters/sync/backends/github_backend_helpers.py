@@ -226,7 +226,7 @@ class GitHubBackendHelpers:
         updates: dict,
         github_issue_number: str | int | None,
         remote_issue=None,
-    ) -> None:
+    ) -> Any:
         from roadmap.adapters.sync.services import (
             IssuePersistenceService,
             SyncLinkingService,
@@ -253,25 +253,26 @@ class GitHubBackendHelpers:
                     github_number=github_issue_number,
                     local_id=matching_local_issue.id,
                 )
+                return matching_local_issue
 
             elif self.core.issues.get(issue_id):
                 self.core.issues.update(issue_id, **updates)
+                local_issue = self.core.issues.get(issue_id)
 
-                if github_issue_number is not None:
-                    local_issue = self.core.issues.get(issue_id)
-                    if local_issue:
-                        IssuePersistenceService.update_issue_with_remote_id(
-                            local_issue, "github", github_issue_number
-                        )
-                        IssuePersistenceService.save_issue(local_issue, self.core)
-                        SyncLinkingService.link_issue_in_database(
-                            self.remote_link_repo,
-                            issue_id,
-                            "github",
-                            github_issue_number,
-                        )
+                if github_issue_number is not None and local_issue:
+                    IssuePersistenceService.update_issue_with_remote_id(
+                        local_issue, "github", github_issue_number
+                    )
+                    IssuePersistenceService.save_issue(local_issue, self.core)
+                    SyncLinkingService.link_issue_in_database(
+                        self.remote_link_repo,
+                        issue_id,
+                        "github",
+                        github_issue_number,
+                    )
 
                 logger.debug("github_pull_issue_updated", issue_id=issue_id)
+                return local_issue
 
             else:
                 if remote_issue is not None:
@@ -335,6 +336,7 @@ class GitHubBackendHelpers:
                     github_number=github_issue_number,
                     local_id=created_issue.id if created_issue else "unknown",
                 )
+                return created_issue
         except Exception as e:
             log_error_with_context(
                 e,
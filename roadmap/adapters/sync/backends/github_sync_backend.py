@@ -6,21 +6,30 @@ with GitHub repositories. It implements the SyncBackendInterface protocol.
 Updated to use Result<T, SyncError> pattern for explicit error handling.
 """
 
+import sqlite3
 import time
 from collections.abc import Callable
 from datetime import datetime  # noqa: F401  # Used in type hints
+from pathlib import Path
 from typing import Any, TypeVar
 
 from structlog import get_logger
 
+from roadmap.adapters.github.rate_limiter import get_rate_limiter
+from roadmap.adapters.github.response_cache import enable_response_cache
+from roadmap.adapters.persistence.repositories import RemoteIssueSnapshotRepository
 from roadmap.adapters.sync.backends.github_backend_helpers import GitHubBackendHelpers
 from roadmap.adapters.sync.backends.github_client import GitHubClientWrapper
 from roadmap.adapters.sync.backends.services.github_authentication_service import (
     GitHubAuthenticationService,
 )
 from roadmap.adapters.sync.backends.services.github_issue_fetch_service import (
+    BACKEND_NAME,
     GitHubIssueFetchService,
 )
+from roadmap.adapters.sync.backends.services.github_remote_snapshot import (
+    GitHubRemoteSnapshot,
+)
 from roadmap.common.result import Err, Ok, Result
 from roadmap.core.domain.issue import Issue
 from roadmap.core.interfaces import (
@@ -101,15 +110,38 @@ class GitHubSyncBackend:
         ):
             self.remote_link_repo = core.db.remote_links
 
+        # Snapshot of remote issues lets get_issues() fetch only recent changes
+        self.remote_issue_snapshot_repo = None
+        snapshot_repo = getattr(
+            getattr(core, "db", None), "remote_issue_snapshots", None
+        )
+        if isinstance(snapshot_repo, RemoteIssueSnapshotRepository):
+            self.remote_issue_snapshot_repo = snapshot_repo
+
         # Helper utilities extracted for mapping and local persistence
         self._helpers = GitHubBackendHelpers(
             core=self.core, remote_link_repo=self.remote_link_repo
         )
 
+        # Persist ETags and bodies so unchanged pages come back as free 304s
+        db_dir = getattr(core, "db_dir", None)
+        if isinstance(db_dir, Path) and db_dir.is_dir():
+            self._safe_init(
+                lambda: enable_response_cache(db_dir), "GitHubResponseCache"
+            )
+
+        # Bound how long any request may sleep for a primary budget reset
+        max_wait = self._get_rate_limit_max_wait()
+        if max_wait is not None:
+            get_rate_limiter().max_wait = max_wait
+
         # Initialize delegated services
         self._auth_service = GitHubAuthenticationService(config)
         self._fetch_service = None  # Initialized lazily after auth
 
+        # Remote state shared by the phases of one sync, see begin_remote_snapshot()
+        self.remote_snapshot: GitHubRemoteSnapshot | None = None
+
     def _safe_init(self, factory: Callable[[], T], name: str) -> T | None:
         """Safely initialize a component, returning None on failure.
 
@@ -141,6 +173,23 @@ class GitHubSyncBackend:
             )
             return None
 
+    def _get_rate_limit_max_wait(self) -> float | None:
+        """Get the configured cap on waits for a primary rate limit reset."""
+        sync_settings = self.config.get("sync_settings") or {}
+        if not isinstance(sync_settings, dict):
+            return None
+        max_wait = sync_settings.get("rate_limit_max_wait_seconds")
+        if max_wait is None:
+            return None
+        if not isinstance(max_wait, int | float) or max_wait < 0:
+            logger.debug(
+                "github_rate_limit_max_wait_invalid",
+                max_wait=max_wait,
+                severity="data_error",
+            )
+            return None
+        return float(max_wait)
+
     def get_backend_name(self) -> str:
         """Get the canonical name of this backend.
 
@@ -226,6 +275,54 @@ class GitHubSyncBackend:
             repo=self.config.get("repo"),
         )
 
+    def begin_remote_snapshot(self) -> GitHubRemoteSnapshot:
+        """Share one fetch of remote issues, milestones and labels.
+
+        Until end_remote_snapshot(), get_issues(), get_milestones(), pulls
+        and label checks read from the snapshot instead of the API.
+
+        Returns:
+            The active snapshot, created if none is active
+        """
+        if self.remote_snapshot is None:
+            self.remote_snapshot = GitHubRemoteSnapshot(
+                self._load_issues, self._load_milestones, self._load_labels
+            )
+        return self.remote_snapshot
+
+    def end_remote_snapshot(self) -> None:
+        """Drop the active snapshot so the next reads go to the API again."""
+        self.remote_snapshot = None
+
+    def _load_issues(self) -> dict[str, SyncIssue]:
+        """Fetch remote issues, bypassing the snapshot."""
+        if self._fetch_service is None and self.github_client:
+            self._fetch_service = GitHubIssueFetchService(
+                self.github_client,
+                self.config,
+                self._helpers,
+                snapshot_repo=self.remote_issue_snapshot_repo,
+            )
+        if self._fetch_service is None:
+            return {}
+        return self._fetch_service.get_issues()
+
+    def _load_milestones(self) -> dict[str, SyncMilestone]:
+        """Fetch remote milestones, bypassing the snapshot."""
+        from roadmap.adapters.sync.backends.services.github_milestone_fetch_service import (
+            GitHubMilestoneFetchService,
+        )
+
+        if self.github_client is None:
+            return {}
+        fetch_service = GitHubMilestoneFetchService(self.github_client, self.config)
+        return fetch_service.get_milestones(state="all")
+
+    def _load_labels(self) -> list[dict[str, Any]]:
+        """Fetch remote labels, bypassing the snapshot."""
+        client = self.get_label_client()
+        return list(client.get_labels()) if client is not None else []
+
     def get_issues(self) -> Result[dict[str, SyncIssue], SyncError]:
         """Fetch all issues from GitHub remote.
 
@@ -237,7 +334,10 @@ class GitHubSyncBackend:
             # Lazily initialize fetch service after first auth
             if self._fetch_service is None and self.github_client:
                 self._fetch_service = GitHubIssueFetchService(
-                    self.github_client, self.config, self._helpers
+                    self.github_client,
+                    self.config,
+                    self._helpers,
+                    snapshot_repo=self.remote_issue_snapshot_repo,
                 )
 
             if self._fetch_service is None:
@@ -250,7 +350,11 @@ class GitHubSyncBackend:
                     )
                 )
 
-            issues = self._fetch_service.get_issues()
+            issues = (
+                self.remote_snapshot.issues
+                if self.remote_snapshot is not None
+                else self._fetch_service.get_issues()
+            )
             return Ok(issues)
         except Exception as e:
             logger.error(
@@ -556,10 +660,6 @@ class GitHubSyncBackend:
             Ok(dict) mapping milestone_number -> SyncMilestone objects on success
             Err(SyncError) with error details on failure
         """
-        from roadmap.adapters.sync.backends.services.github_milestone_fetch_service import (
-            GitHubMilestoneFetchService,
-        )
-
         if not self.github_client:
             logger.warning("github_milestone_fetch_no_client")
             return Err(
@@ -572,8 +672,11 @@ class GitHubSyncBackend:
             )
 
         try:
-            fetch_service = GitHubMilestoneFetchService(self.github_client, self.config)
-            milestones = fetch_service.get_milestones(state="all")
+            milestones = (
+                self.remote_snapshot.milestones
+                if self.remote_snapshot is not None
+                else self._load_milestones()
+            )
 
             logger.info(
                 "github_milestones_retrieved",
@@ -618,7 +721,7 @@ class GitHubSyncBackend:
         updates: dict,
         github_issue_number: str | int | None,
         remote_issue: SyncIssue | None = None,
-    ) -> None:
+    ) -> Any:
         """Apply updates to an existing local issue or create a new one, and ensure linking/persistence.
 
         Args:
@@ -627,6 +730,9 @@ class GitHubSyncBackend:
             updates: dict of fields to update on local issue
             github_issue_number: numeric GitHub issue number if available
             remote_issue: original SyncIssue object from GitHub (used when creating)
+
+        Returns:
+            The local issue that was updated or created, if known
         """
         return self._helpers._apply_or_create_local_issue(
             issue_id, matching_local_issue, updates, github_issue_number, remote_issue
@@ -672,11 +778,12 @@ class GitHubSyncBackend:
             requested_count=len(issue_numbers),
         )
         deleted_count = 0
+        deleted_numbers: list[int] = []
         skipped_pr_numbers: list[int] = []
         lookup_batch_size = 20
         delete_batch_size = 5
-        inter_batch_delay_seconds = 0.2
-        rate_limit_delay_seconds = 1.0
+        # Batches are paced by the shared rate limiter rather than fixed sleeps
+        limiter = get_rate_limiter()
 
         for i in range(0, len(issue_numbers), lookup_batch_size):
             batch = issue_numbers[i : i + lookup_batch_size]
@@ -701,38 +808,42 @@ class GitHubSyncBackend:
                     token,
                 )
                 deleted_count += batch_deleted
+                deleted_numbers.extend(
+                    number for number in delete_chunk if number not in failed_numbers
+                )
                 logger.info(
                     "github_delete_issues_batch_complete",
                     batch_size=len(delete_chunk),
                     deleted_count=batch_deleted,
                 )
 
+                if rate_limited:
+                    logger.warning("github_delete_issues_rate_limited")
+                    limiter.record_rate_limited()
+
                 if failed_numbers and rate_limited:
                     logger.warning(
                         "github_delete_issues_retrying_failed",
                         failed_count=len(failed_numbers),
-                        delay_seconds=rate_limit_delay_seconds,
                     )
-                    time.sleep(rate_limit_delay_seconds)
                     retry_items = {
                         number: node_ids[number]
                         for number in failed_numbers
                         if number in node_ids
                     }
                     if retry_items:
-                        retry_deleted, _, _ = self._delete_issues_batch(
+                        retry_deleted, _, retry_failed = self._delete_issues_batch(
                             retry_items,
                             token,
                         )
                         deleted_count += retry_deleted
+                        deleted_numbers.extend(
+                            number
+                            for number in retry_items
+                            if number not in retry_failed
+                        )
 
-                time.sleep(inter_batch_delay_seconds)
-                if rate_limited:
-                    logger.warning(
-                        "github_delete_issues_rate_limited",
-                        delay_seconds=rate_limit_delay_seconds,
-                    )
-                    time.sleep(rate_limit_delay_seconds)
+        self._evict_from_snapshot(f"{owner}/{repo}", deleted_numbers)
 
         duration = time.time() - start_time
         failed_count = max(
@@ -756,6 +867,27 @@ class GitHubSyncBackend:
 
         return deleted_count
 
+    def _evict_from_snapshot(self, repository: str, issue_numbers: list[int]) -> None:
+        """Drop deleted issues from the remote issue snapshot.
+
+        Incremental fetches never report deletions, so without this the
+        snapshot would keep serving deleted issues as live.
+        """
+        if not issue_numbers or self.remote_issue_snapshot_repo is None:
+            return
+        try:
+            self.remote_issue_snapshot_repo.delete(
+                BACKEND_NAME, repository, list(issue_numbers)
+            )
+        except sqlite3.Error as e:
+            logger.warning(
+                "github_snapshot_eviction_failed",
+                repository=repository,
+                count=len(issue_numbers),
+                error=str(e),
+                severity="operational",
+            )
+
     def _resolve_issue_node_ids(
         self,
         issue_numbers: list[int],
@@ -965,13 +1097,17 @@ class GitHubSyncBackend:
             "Accept": "application/vnd.github.v4+json",
             "User-Agent": "roadmap-cli/1.0",
         }
+        limiter = get_rate_limiter()
+        mutation = query.lstrip().startswith("mutation")
         try:
-            response = requests.post(
-                "https://api.github.com/graphql",
-                json={"query": query},
-                headers=headers,
-                timeout=30,
-            )
+            with limiter.request("POST", "graphql", mutation=mutation):
+                response = requests.post(
+                    "https://api.github.com/graphql",
+                    json={"query": query},
+                    headers=headers,
+                    timeout=30,
+                )
+            limiter.record_response(response, "graphql")
             response.raise_for_status()
             payload = response.json()
             if payload.get("errors"):
@@ -2,11 +2,14 @@
 
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any, NamedTuple
 
 from structlog import get_logger
 
+from roadmap.adapters.sync.backends.services.github_remote_snapshot import (
+    GitHubRemoteSnapshot,
+)
 from roadmap.common.logging import log_error_with_context
 from roadmap.common.services.retry import API_RETRY
 from roadmap.common.utils.timezone_utils import now_utc
@@ -15,6 +18,22 @@ from roadmap.core.interfaces import SyncReport
 logger = get_logger()
 
 
+class LocalIssueIndex(NamedTuple):
+    """Local issues keyed for matching pulled issues, listed once per pull."""
+
+    by_github_number: dict[str, Any]
+    by_title: dict[str, Any]
+
+
+class PreparedPull(NamedTuple):
+    """A pulled issue converted and matched, ready to be written locally."""
+
+    local_issue: Any
+    github_id: str | int | None
+    matching_local_issue: Any
+    updates: dict[str, Any]
+
+
 class GitHubSyncOps:
     """Perform synchronization operations with GitHub backend."""
 
@@ -28,11 +47,16 @@ class GitHubSyncOps:
         self._create_lock = threading.Lock()
         self._last_create_time = 0.0
         self._create_min_interval_seconds = self._get_create_min_interval_seconds()
+        self._pull_workers = self._get_pull_workers()
         self._label_cache: set[str] | None = None
         self._label_support: bool | None = None
 
     def _get_create_min_interval_seconds(self) -> float:
-        """Get minimum interval between issue creations to avoid secondary limits."""
+        """Get an optional fixed floor between issue creations.
+
+        Creations are already paced by the shared GitHub rate limiter, so
+        no floor is applied unless one is configured.
+        """
         config = getattr(self.backend, "config", {}) or {}
         sync_settings = (
             config.get("sync_settings", {}) if isinstance(config, dict) else {}
@@ -47,7 +71,30 @@ class GitHubSyncOps:
                 interval=interval,
                 severity="data_error",
             )
-        return 1.0
+        return 0.0
+
+    def _get_pull_workers(self) -> int:
+        """Get number of threads preparing pulled issues before they are written."""
+        config = getattr(self.backend, "config", {}) or {}
+        sync_settings = (
+            config.get("sync_settings", {}) if isinstance(config, dict) else {}
+        )
+        workers = sync_settings.get("pull_workers")
+        try:
+            if workers is not None:
+                return max(1, int(workers))
+        except (TypeError, ValueError):
+            logger.debug(
+                "github_pull_workers_invalid",
+                workers=workers,
+                severity="data_error",
+            )
+        return 5
+
+    def _remote_snapshot(self) -> GitHubRemoteSnapshot | None:
+        """Get the backend's active per-sync snapshot of remote state."""
+        snapshot = getattr(self.backend, "remote_snapshot", None)
+        return snapshot if isinstance(snapshot, GitHubRemoteSnapshot) else None
 
     def _sync_labels_enabled(self) -> bool:
         config = getattr(self.backend, "config", {}) or {}
@@ -98,8 +145,11 @@ class GitHubSyncOps:
                 return
             self._label_support = True
         if self._label_cache is None:
+            snapshot = self._remote_snapshot()
             try:
-                existing_labels = client.get_labels()
+                existing_labels = (
+                    snapshot.labels if snapshot is not None else client.get_labels()
+                )
                 self._label_cache = {
                     label["name"]
                     for label in existing_labels
@@ -118,8 +168,12 @@ class GitHubSyncOps:
         missing = [label for label in labels if label not in self._label_cache]
         for label in missing:
             try:
-                client.create_label(label, self._get_label_color(label))
+                color = self._get_label_color(label)
+                client.create_label(label, color)
                 self._label_cache.add(label)
+                snapshot = self._remote_snapshot()
+                if snapshot is not None:
+                    snapshot.add_label({"name": label, "color": color})
                 logger.info("github_label_created", label=label)
             except Exception as e:
                 logger.warning(
@@ -131,7 +185,7 @@ class GitHubSyncOps:
                 )
 
     def _throttle_issue_creation(self) -> None:
-        """Throttle issue creation to reduce secondary rate limit errors."""
+        """Apply the configured fixed floor between issue creations, if any."""
         if self._create_min_interval_seconds <= 0:
             return
 
@@ -626,42 +680,119 @@ class GitHubSyncOps:
             )
             return False, error_msg
 
-    def _pull_single_issue(self, sync_issue: Any) -> tuple[bool, str | None]:
+    def _local_issues_index(self) -> LocalIssueIndex | None:
+        """List local issues once so each pulled issue is matched by lookup.
+
+        Returns:
+            Local issues keyed by GitHub number and lowercased title, or None
+            if they could not be listed
+        """
+        if not hasattr(self.backend, "core") or not self.backend.core:
+            return None
+
+        try:
+            local_issues = LocalIssueIndex({}, {})
+            for issue in self.backend.core.issues.list():
+                self._index_local_issue(local_issues, issue)
+            return local_issues
+        except Exception as e:
+            logger.warning(
+                "failed_to_list_local_issues",
+                error=str(e),
+                severity="operational",
+            )
+            return None
+
+    @staticmethod
+    def _index_local_issue(local_issues: LocalIssueIndex, issue: Any) -> None:
+        """Add a local issue to the index, keeping the first issue per key."""
+        remote_ids = getattr(issue, "remote_ids", None) or {}
+        github_id = remote_ids.get("github")
+        if github_id:
+            local_issues.by_github_number.setdefault(str(github_id), issue)
+        title = getattr(issue, "title", None)
+        if isinstance(title, str) and title.strip():
+            local_issues.by_title.setdefault(title.lower(), issue)
+
+    def _match_local_issue(
+        self,
+        title: str,
+        github_id: str | int | None,
+        local_issues: LocalIssueIndex | None,
+    ) -> Any:
+        """Find the local issue a pulled issue maps to, by GitHub number then title."""
+        if local_issues is None:
+            return self.backend._find_matching_local_issue(title, github_id)
+
+        if github_id is not None:
+            match = local_issues.by_github_number.get(str(github_id))
+            if match is not None:
+                return match
+        if title and title.strip():
+            return local_issues.by_title.get(title.lower())
+        return None
+
+    def _prepare_pull(
+        self, sync_issue: Any, local_issues: LocalIssueIndex | None = None
+    ) -> PreparedPull:
+        """Convert a pulled issue and find the local issue it maps to.
+
+        Only reads local state, so several issues can be prepared at once.
+        """
+        from roadmap.adapters.sync.backends.converters import (
+            GitHubPayloadToIssueConverter,
+        )
+
+        local_issue = GitHubPayloadToIssueConverter.from_sync_issue(sync_issue)
+        github_id = sync_issue.remote_ids.get("github") or sync_issue.backend_id
+
+        matching_local_issue = self._match_local_issue(
+            local_issue.title, github_id, local_issues
+        )
+        updates = {
+            "title": local_issue.title,
+            "description": local_issue.content or "",
+            "status": local_issue.status,
+            "priority": local_issue.priority,
+            "assignee": local_issue.assignee,
+            "milestone": local_issue.milestone,
+            "labels": local_issue.labels,
+        }
+        return PreparedPull(local_issue, github_id, matching_local_issue, updates)
+
+    def _pull_single_issue(
+        self,
+        sync_issue: Any,
+        local_issues: LocalIssueIndex | None = None,
+        prepared: "Future[PreparedPull] | None" = None,
+    ) -> tuple[bool, str | None]:
         """Pull a single issue from GitHub and create/update locally.
 
         Args:
             sync_issue: The SyncIssue from GitHub fetch
+            local_issues: Index of local issues to match against; the issue
+                written is added to it so later pulls in the run match it
+            prepared: Pending result of _prepare_pull for this issue, if it
+                was prepared ahead of time
 
         Returns:
             Tuple of (success: bool, error_message: str | None)
         """
         try:
-            from roadmap.adapters.sync.backends.converters import (
-                GitHubPayloadToIssueConverter,
+            pull = (
+                prepared.result()
+                if prepared is not None
+                else self._prepare_pull(sync_issue, local_issues)
             )
-
-            local_issue = GitHubPayloadToIssueConverter.from_sync_issue(sync_issue)
-            github_id = sync_issue.remote_ids.get("github") or sync_issue.backend_id
-
-            matching_local_issue = self.backend._find_matching_local_issue(
-                local_issue.title, github_id
-            )
-            updates = {
-                "title": local_issue.title,
-                "description": local_issue.content or "",
-                "status": local_issue.status,
-                "priority": local_issue.priority,
-                "assignee": local_issue.assignee,
-                "milestone": local_issue.milestone,
-                "labels": local_issue.labels,
-            }
-            self.backend._apply_or_create_local_issue(
-                local_issue.id,
-                matching_local_issue,
-                updates,
-                github_id,
+            written = self.backend._apply_or_create_local_issue(
+                pull.local_issue.id,
+                pull.matching_local_issue,
+                pull.updates,
+                pull.github_id,
                 remote_issue=sync_issue,
             )
+            if local_issues is not None and written is not None:
+                self._index_local_issue(local_issues, written)
 
             return True, None
 
@@ -676,6 +807,57 @@ class GitHubSyncOps:
             error_msg = str(e)
             return self._handle_pull_error(sync_issue, error_msg)
 
+    def _pull_issues_in_order(self, pullable: list) -> dict[str, str | None]:
+        """Prepare issues on a bounded pool, then write them one at a time.
+
+        Local issues are listed once. Conversion and matching against that
+        listing run on up to ``pull_workers`` threads, and the listing is
+        only read while they run. Local file writes and remote-link updates
+        all happen on the calling thread, in request order, after every
+        issue is prepared. An issue whose title matches one written earlier
+        in the run is matched again before writing, as a sequential pull
+        would have matched it against that issue.
+
+        Args:
+            pullable: (issue_id, lookup_id, sync_issue) tuples to pull
+
+        Returns:
+            Dict mapping issue_id to None on success or an error message
+        """
+        results: dict[str, str | None] = {}
+        if not pullable:
+            return results
+
+        local_issues = self._local_issues_index()
+
+        futures = []
+        with ThreadPoolExecutor(max_workers=self._pull_workers) as executor:
+            for index, (_issue_id, _lookup_id, sync_issue) in enumerate(pullable):
+                future = executor.submit(self._prepare_pull, sync_issue, local_issues)
+                if index == 0:
+                    # Let the first issue build any lazily created core
+                    # components before the other workers share them
+                    future.exception()
+                futures.append(future)
+
+        written_titles: set[str] = set()
+        for (issue_id, _lookup_id, sync_issue), future in zip(
+            pullable, futures, strict=True
+        ):
+            prepared: Future[PreparedPull] | None = future
+            title = (getattr(sync_issue, "title", "") or "").lower()
+            if title in written_titles:
+                prepared = None
+
+            success, error = self._pull_single_issue(sync_issue, local_issues, prepared)
+            if success:
+                written_titles.add(title)
+                results[issue_id] = None
+            else:
+                results[issue_id] = error or "Unknown error"
+
+        return results
+
     def pull_issues(self, issue_ids: list[str]) -> SyncReport:
         """Pull issues from GitHub backend by IDs with dependency resolution.
 
@@ -719,7 +901,11 @@ class GitHubSyncOps:
         )
 
     def _fetch_remote_data(self) -> tuple[dict, dict]:
-        """Fetch issues and milestones from GitHub."""
+        """Fetch issues and milestones from GitHub, or the sync's snapshot."""
+        snapshot = self._remote_snapshot()
+        if snapshot is not None:
+            return snapshot.issues, snapshot.milestones
+
         from roadmap.adapters.sync.backends.services.github_issue_fetch_service import (
             GitHubIssueFetchService,
         )
@@ -731,6 +917,7 @@ class GitHubSyncOps:
             self.backend.github_client,
             self.backend.config,
             self.backend._helpers,
+            snapshot_repo=getattr(self.backend, "remote_issue_snapshot_repo", None),
         )
         all_remote_issues = issue_fetch_service.get_issues()
 
@@ -808,46 +995,51 @@ class GitHubSyncOps:
         successful_pulls = []
         failed_pulls = {}
 
-        logger.info("pulling_issues_phase", issue_count=len(issues_to_pull))
+        logger.info(
+            "pulling_issues_phase",
+            issue_count=len(issues_to_pull),
+            workers=self._pull_workers,
+        )
 
-        for issue_id, _lookup_id, sync_issue in issues_to_pull:
-            try:
-                # Check if issue's milestone was successfully pulled
-                if sync_issue.milestone:
-                    milestone_num = self._find_milestone_number(
-                        sync_issue.milestone, all_remote_milestones
-                    )
+        pullable = []
+        for issue_id, lookup_id, sync_issue in issues_to_pull:
+            # Check if issue's milestone was successfully pulled
+            if sync_issue.milestone:
+                milestone_num = self._find_milestone_number(
+                    sync_issue.milestone, all_remote_milestones
+                )
 
-                    if milestone_num and milestone_num in milestone_pull_report.errors:
-                        failed_pulls[issue_id] = (
-                            f"Milestone '{sync_issue.milestone}' pull failed: "
-                            f"{milestone_pull_report.errors[milestone_num]}"
-                        )
-                        logger.debug(
-                            "issue_skipped_milestone_failed",
-                            issue_id=issue_id,
-                            milestone=sync_issue.milestone,
-                        )
-                        continue
+                if milestone_num and milestone_num in milestone_pull_report.errors:
+                    failed_pulls[issue_id] = (
+                        f"Milestone '{sync_issue.milestone}' pull failed: "
+                        f"{milestone_pull_report.errors[milestone_num]}"
+                    )
+                    logger.debug(
+                        "issue_skipped_milestone_failed",
+                        issue_id=issue_id,
+                        milestone=sync_issue.milestone,
+                    )
+                    continue
 
-                # Pull the issue and create/update locally
-                success, error = self._pull_single_issue(sync_issue)
+            pullable.append((issue_id, lookup_id, sync_issue))
 
-                if success:
-                    successful_pulls.append(issue_id)
-                    logger.debug("pull_issue_processed", issue_id=issue_id)
-                else:
-                    failed_pulls[issue_id] = error or "Unknown error"
+        try:
+            results = self._pull_issues_in_order(pullable)
+        except Exception as e:
+            log_error_with_context(
+                e,
+                operation="pull_issues",
+                entity_type="Issue",
+                include_traceback=False,
+            )
+            results = {issue_id: str(e) for issue_id, _, _ in pullable}
 
-            except Exception as e:
-                failed_pulls[issue_id] = str(e)
-                log_error_with_context(
-                    e,
-                    operation="pull_issue",
-                    entity_type="Issue",
-                    entity_id=issue_id,
-                    include_traceback=False,
-                )
+        for issue_id, error in results.items():
+            if error is None:
+                successful_pulls.append(issue_id)
+                logger.debug("pull_issue_processed", issue_id=issue_id)
+            else:
+                failed_pulls[issue_id] = error
 
         report.pulled = successful_pulls
         report.errors = failed_pulls
@@ -894,14 +1086,19 @@ class GitHubSyncOps:
         )
 
         try:
-            fetch_service = GitHubMilestoneFetchService(
-                self.backend.github_client,
-                self.backend.config,
-            )
-            all_remote_milestones = fetch_service.get_milestones()
+            snapshot = self._remote_snapshot()
+            if snapshot is not None:
+                all_remote_milestones = snapshot.milestones
+            else:
+                fetch_service = GitHubMilestoneFetchService(
+                    self.backend.github_client,
+                    self.backend.config,
+                )
+                all_remote_milestones = fetch_service.get_milestones()
 
             successful_pulls = []
             failed_pulls = {}
+            local_milestones = self._local_milestones_by_name()
 
             logger.info(
                 "pull_milestones_keys_analysis",
@@ -933,7 +1130,9 @@ class GitHubSyncOps:
 
                     # Pull the milestone and create/update locally
                     sync_milestone = all_remote_milestones[lookup_id]
-                    success, error = self._pull_single_milestone(sync_milestone)
+                    success, error = self._pull_single_milestone(
+                        sync_milestone, local_milestones
+                    )
 
                     if success:
                         successful_pulls.append(milestone_id)
@@ -972,11 +1171,37 @@ class GitHubSyncOps:
             report.error = f"Failed to pull milestones: {str(e)}"
             return report
 
-    def _pull_single_milestone(self, sync_milestone) -> tuple[bool, str | None]:
+    def _local_milestones_by_name(self) -> dict[str, Any] | None:
+        """List local milestones once so each pulled milestone is matched by name.
+
+        Returns:
+            Dict mapping milestone name to milestone, or None if unavailable
+        """
+        if not hasattr(self.backend, "core") or not self.backend.core:
+            return None
+
+        try:
+            milestones: dict[str, Any] = {}
+            for ms in self.backend.core.milestones.list():
+                milestones.setdefault(ms.name, ms)
+            return milestones
+        except Exception as e:
+            logger.warning(
+                "failed_to_list_local_milestones",
+                error=str(e),
+                severity="operational",
+            )
+            return None
+
+    def _pull_single_milestone(
+        self, sync_milestone, local_milestones: dict[str, Any] | None = None
+    ) -> tuple[bool, str | None]:
         """Pull a single milestone and persist it locally.
 
         Args:
             sync_milestone: SyncMilestone object from GitHub
+            local_milestones: Local milestones by name, kept up to date as
+                milestones are created; listed from core when omitted
 
         Returns:
             Tuple of (success: bool, error_message: str | None)
@@ -993,11 +1218,13 @@ class GitHubSyncOps:
             existing_milestone = None
 
             # Try to find existing milestone by name (GitHub milestone title)
-            all_milestones = core.milestones.list()
-            for ms in all_milestones:
-                if ms.name == sync_milestone.name:
-                    existing_milestone = ms
-                    break
+            if local_milestones is not None:
+                existing_milestone = local_milestones.get(sync_milestone.name)
+            else:
+                for ms in core.milestones.list():
+                    if ms.name == sync_milestone.name:
+                        existing_milestone = ms
+                        break
 
             if existing_milestone:
                 # Update existing milestone
@@ -1041,6 +1268,9 @@ class GitHubSyncOps:
                     status=sync_milestone.status,
                 )
 
+                if local_milestones is not None:
+                    local_milestones[milestone.name] = milestone
+
                 # Store GitHub milestone number in database metadata
                 self._link_milestone_to_github(milestone.name, github_milestone_num)
 
@@ -1,5 +1,9 @@
 """Service for fetching issues from GitHub API."""
 
+import sqlite3
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
 from structlog import get_logger
 
 from roadmap.adapters.sync.backends.github_backend_helpers import GitHubBackendHelpers
@@ -7,8 +11,45 @@ from roadmap.adapters.sync.backends.github_client import GitHubClientWrapper
 from roadmap.common.logging import log_error_with_context
 from roadmap.core.models.sync_models import SyncIssue
 
+if TYPE_CHECKING:
+    from roadmap.adapters.persistence.repositories import (
+        RemoteIssueSnapshotRepository,
+    )
+
 logger = get_logger()
 
+BACKEND_NAME = "github"
+
+FETCH_APIS = ("rest", "graphql")
+
+# Days between full fetches that drop deleted or transferred issues
+DEFAULT_FULL_FETCH_INTERVAL_DAYS = 7
+
+
+def _snapshot_fields(issue_dict: dict[str, Any]) -> dict[str, Any]:
+    """Trim a GitHub issue payload to the fields _dict_to_sync_issue reads."""
+    labels = [
+        label.get("name") if isinstance(label, dict) else label
+        for label in issue_dict.get("labels") or []
+    ]
+    assignee = issue_dict.get("assignee")
+    milestone = issue_dict.get("milestone")
+    return {
+        "number": issue_dict.get("number"),
+        "node_id": issue_dict.get("node_id"),
+        "title": issue_dict.get("title"),
+        "body": issue_dict.get("body"),
+        "state": issue_dict.get("state"),
+        "labels": labels,
+        "assignee": {"login": assignee.get("login")}
+        if isinstance(assignee, dict)
+        else None,
+        "milestone": {"title": milestone.get("title")}
+        if isinstance(milestone, dict)
+        else None,
+        "updated_at": issue_dict.get("updated_at"),
+    }
+
 
 class GitHubIssueFetchService:
     """Handles fetching issues from GitHub API."""
@@ -18,17 +59,24 @@ class GitHubIssueFetchService:
         github_client: GitHubClientWrapper,
         config: dict,
         helpers: GitHubBackendHelpers,
+        snapshot_repo: "RemoteIssueSnapshotRepository | None" = None,
     ):
         """Initialize fetch service.
 
         Args:
             github_client: GitHubClientWrapper for API access
-            config: Configuration dict with 'owner', 'repo'
+            config: Configuration dict with 'owner', 'repo', optional
+                'incremental_fetch' (default True), optional
+                'sync_settings.issue_fetch_api' ("rest" or "graphql") and
+                optional 'sync_settings.full_fetch_interval_days'
             helpers: GitHubBackendHelpers for conversions
+            snapshot_repo: Optional local snapshot of remote issues; enables
+                incremental fetches with the `since` parameter
         """
         self.github_client = github_client
         self.config = config
         self.helpers = helpers
+        self.snapshot_repo = snapshot_repo
 
     def get_issues(self) -> dict[str, SyncIssue]:
         """Fetch all remote issues from GitHub.
@@ -54,7 +102,7 @@ class GitHubIssueFetchService:
                 owner=owner,
                 repo=repo,
             )
-            issues_data = self.github_client.get_issues(owner, repo, state="all")
+            issues_data = self._fetch_issue_dicts(owner, repo)
 
             logger.info(
                 "github_issues_fetched",
@@ -112,6 +160,151 @@ class GitHubIssueFetchService:
             )
             return {}
 
+    def _get_fetch_api(self) -> str:
+        """Get the API used to list remote issues ("rest" by default)."""
+        sync_settings = self.config.get("sync_settings") or {}
+        api = (
+            sync_settings.get("issue_fetch_api", "rest")
+            if isinstance(sync_settings, dict)
+            else "rest"
+        )
+        if api not in FETCH_APIS:
+            logger.debug(
+                "github_issue_fetch_api_invalid",
+                api=api,
+                severity="data_error",
+            )
+            return "rest"
+        return api
+
+    def _get_full_fetch_interval(self) -> timedelta:
+        """Get how long an incrementally updated snapshot is trusted."""
+        sync_settings = self.config.get("sync_settings") or {}
+        days = (
+            sync_settings.get(
+                "full_fetch_interval_days", DEFAULT_FULL_FETCH_INTERVAL_DAYS
+            )
+            if isinstance(sync_settings, dict)
+            else DEFAULT_FULL_FETCH_INTERVAL_DAYS
+        )
+        if not isinstance(days, int | float) or days < 0:
+            logger.debug(
+                "github_full_fetch_interval_invalid",
+                days=days,
+                severity="data_error",
+            )
+            days = DEFAULT_FULL_FETCH_INTERVAL_DAYS
+        return timedelta(days=days)
+
+    def _needs_full_fetch(self, repository: str, high_water: str | None) -> bool:
+        """Check whether the snapshot must be rebuilt from a full fetch.
+
+        Incremental deltas never report deleted or transferred issues, so
+        the snapshot is replaced when it was never seeded or its last full
+        fetch is older than the configured interval.
+        """
+        if high_water is None or self.snapshot_repo is None:
+            return True
+        last_full = self.snapshot_repo.get_last_full_fetch(BACKEND_NAME, repository)
+        if last_full is None:
+            return True
+        if last_full.tzinfo is None:
+            last_full = last_full.replace(tzinfo=UTC)
+        return datetime.now(UTC) - last_full >= self._get_full_fetch_interval()
+
+    def _list_issues(
+        self, owner: str, repo: str, since: str | None = None
+    ) -> list[dict[str, Any]]:
+        """List remote issues through the configured API.
+
+        GraphQL listing falls back to REST pagination if it fails, e.g. for
+        tokens without GraphQL access.
+        """
+        if self._get_fetch_api() == "graphql":
+            try:
+                return self.github_client.get_issues_graphql(
+                    owner, repo, state="all", since=since
+                )
+            except Exception as e:
+                logger.warning(
+                    "github_issue_graphql_fetch_failed",
+                    owner=owner,
+                    repo=repo,
+                    error=str(e),
+                    severity="operational",
+                )
+        if since is None:
+            return self.github_client.get_issues(owner, repo, state="all")
+        return self.github_client.get_issues(owner, repo, state="all", since=since)
+
+    def _fetch_issue_dicts(self, owner: str, repo: str) -> list[dict[str, Any]]:
+        """Fetch all remote issue payloads, incrementally when possible.
+
+        With a snapshot, only issues updated since the stored high-water mark
+        are downloaded and merged into it. The first fetch, and one every
+        full_fetch_interval_days, is a full one that replaces the snapshot
+        so deleted or transferred issues drop out. Snapshot failures fall
+        back to a full fetch.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            List of GitHub issue dicts
+        """
+        if self.snapshot_repo is None or not self.config.get("incremental_fetch", True):
+            return self._list_issues(owner, repo)
+
+        repository = f"{owner}/{repo}"
+        try:
+            high_water = self.snapshot_repo.get_high_water_mark(
+                BACKEND_NAME, repository
+            )
+            full_fetch = self._needs_full_fetch(repository, high_water)
+            if full_fetch:
+                changed = self._list_issues(owner, repo)
+                self.snapshot_repo.replace_all(
+                    BACKEND_NAME, repository, [_snapshot_fields(i) for i in changed]
+                )
+            else:
+                changed = self._list_issues(owner, repo, since=high_water)
+                self.snapshot_repo.upsert(
+                    BACKEND_NAME, repository, [_snapshot_fields(i) for i in changed]
+                )
+
+            newest = max(
+                (i["updated_at"] for i in changed if i.get("updated_at")),
+                default=high_water,
+            )
+            if newest and newest != high_water:
+                self.snapshot_repo.set_high_water_mark(BACKEND_NAME, repository, newest)
+
+            issues_data = (
+                changed
+                if full_fetch
+                else self.snapshot_repo.get_all(BACKEND_NAME, repository)
+            )
+        except sqlite3.Error as e:
+            logger.warning(
+                "github_issue_snapshot_unavailable",
+                owner=owner,
+                repo=repo,
+                error=str(e),
+                severity="operational",
+            )
+            return self._list_issues(owner, repo)
+
+        logger.info(
+            "github_issues_incremental_fetch",
+            owner=owner,
+            repo=repo,
+            since=None if full_fetch else high_water,
+            changed=len(changed),
+            total=len(issues_data),
+        )
+        return issues_data
+
     @staticmethod
     def _dict_to_sync_issue(issue_dict: dict) -> SyncIssue:
         """Convert GitHub issue dict to SyncIssue object.
@@ -155,4 +348,7 @@ class GitHubIssueFetchService:
             if isinstance(milestone_obj, dict)
             else None,
             backend_id=backend_id,
+            metadata={"node_id": node_id}
+            if (node_id := issue_dict.get("node_id"))
+            else {},
         )
@@ -0,0 +1,119 @@
+"""Remote GitHub state shared by every phase of one sync."""
+
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from structlog import get_logger
+
+from roadmap.core.models.sync_models import SyncIssue, SyncMilestone
+
+logger = get_logger()
+
+
+def _node_id(item: SyncIssue | SyncMilestone) -> str | None:
+    node_id = item.metadata.get("node_id") or item.raw_response.get("node_id")
+    return node_id if isinstance(node_id, str) else None
+
+
+class GitHubRemoteSnapshot:
+    """Issues, milestones and labels of the remote, each fetched at most once.
+
+    Analysis, pull dependency resolution, milestone pulls and label checks
+    all read from the same snapshot instead of downloading the remote again.
+    Each part is loaded on first access; a load that raises is retried on
+    the next access.
+    """
+
+    def __init__(
+        self,
+        load_issues: Callable[[], dict[str, SyncIssue]],
+        load_milestones: Callable[[], dict[str, SyncMilestone]],
+        load_labels: Callable[[], list[dict[str, Any]]],
+    ):
+        """Initialize GitHubRemoteSnapshot.
+
+        Args:
+            load_issues: Fetches issues keyed by issue number string
+            load_milestones: Fetches milestones keyed by milestone number string
+            load_labels: Fetches label payloads
+        """
+        self._loaders = {
+            "issues": load_issues,
+            "milestones": load_milestones,
+            "labels": load_labels,
+        }
+        self._parts: dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._issues_by_node_id: dict[str, SyncIssue] | None = None
+        self._milestones_by_node_id: dict[str, SyncMilestone] | None = None
+        self._milestones_by_title: dict[str, str] | None = None
+
+    def _get(self, part: str) -> Any:
+        with self._lock:
+            if part not in self._parts:
+                self._parts[part] = self._loaders[part]()
+                logger.debug(
+                    "github_remote_snapshot_loaded",
+                    part=part,
+                    count=len(self._parts[part]),
+                )
+            return self._parts[part]
+
+    @property
+    def issues(self) -> dict[str, SyncIssue]:
+        """Remote issues keyed by issue number string."""
+        return self._get("issues")
+
+    @property
+    def milestones(self) -> dict[str, SyncMilestone]:
+        """Remote milestones keyed by milestone number string."""
+        return self._get("milestones")
+
+    @property
+    def labels(self) -> list[dict[str, Any]]:
+        """Remote label payloads."""
+        return self._get("labels")
+
+    def issue_by_number(self, number: int | str) -> SyncIssue | None:
+        """Look up a remote issue by its number."""
+        return self.issues.get(str(number))
+
+    def issue_by_node_id(self, node_id: str) -> SyncIssue | None:
+        """Look up a remote issue by its GraphQL node ID."""
+        if self._issues_by_node_id is None:
+            self._issues_by_node_id = {
+                node: issue
+                for issue in self.issues.values()
+                if (node := _node_id(issue))
+            }
+        return self._issues_by_node_id.get(node_id)
+
+    def milestone_by_number(self, number: int | str) -> SyncMilestone | None:
+        """Look up a remote milestone by its number."""
+        return self.milestones.get(str(number))
+
+    def milestone_by_node_id(self, node_id: str) -> SyncMilestone | None:
+        """Look up a remote milestone by its GraphQL node ID."""
+        if self._milestones_by_node_id is None:
+            self._milestones_by_node_id = {
+                node: milestone
+                for milestone in self.milestones.values()
+                if (node := _node_id(milestone))
+            }
+        return self._milestones_by_node_id.get(node_id)
+
+    def milestone_number_by_title(self, title: str) -> str | None:
+        """Find the number of the remote milestone with the given title."""
+        if self._milestones_by_title is None:
+            by_title: dict[str, str] = {}
+            for number, milestone in self.milestones.items():
+                by_title.setdefault(milestone.name, number)
+            self._milestones_by_title = by_title
+        return self._milestones_by_title.get(title)
+
+    def add_label(self, label: dict[str, Any]) -> None:
+        """Record a label created on the remote during this sync."""
+        with self._lock:
+            if "labels" in self._parts:
+                self._parts["labels"].append(label)
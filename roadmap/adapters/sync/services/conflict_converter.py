@@ -42,13 +42,12 @@ class ConflictConverter:
             try:
                 conflicting_fields = []
                 if change.local_changes:
+                    local_values = change.local_state.model_dump()
                     for field_name, _change_info in change.local_changes.items():
                         if field_name in change.remote_changes:
                             conflict_field = ConflictField(
                                 field_name=field_name,
-                                local_value=change.local_state.__dict__.get(
-                                    field_name, None
-                                ),
+                                local_value=local_values.get(field_name),
                                 remote_value=change.remote_state.get(field_name),
                                 local_updated=change.local_state.updated,
                                 remote_updated=self.state_comparator._extract_timestamp(
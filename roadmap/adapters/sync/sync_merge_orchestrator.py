@@ -10,6 +10,8 @@ from typing import Any
 
 from structlog import get_logger
 
+from roadmap.adapters.github.rate_limiter import get_rate_limiter
+from roadmap.adapters.github.response_cache import get_response_cache
 from roadmap.adapters.sync.services.sync_analysis_service import SyncAnalysisService
 from roadmap.adapters.sync.services.sync_authentication_service import (
     SyncAuthenticationService,
@@ -108,6 +110,23 @@ class SyncMergeOrchestrator:
         )
 
     # Helper extraction to reduce complexity of sync_all_issues
+    def _begin_remote_snapshot(self) -> None:
+        """Let backends that support it fetch remote state once per sync.
+
+        The snapshot started by analyze_all_issues is reused by the apply
+        pass and the pulls it triggers. Every sync_all_issues run, dry or
+        not, drops it when it finishes.
+        """
+        begin = getattr(self.backend, "begin_remote_snapshot", None)
+        if callable(begin):
+            begin()
+
+    def _end_remote_snapshot(self) -> None:
+        """Drop the backend's remote snapshot so the next sync refetches."""
+        end = getattr(self.backend, "end_remote_snapshot", None)
+        if callable(end):
+            end()
+
     def _ensure_authenticated(self, report: SyncReport) -> bool:
         return self._auth_service.ensure_authenticated(report)
 
@@ -187,6 +206,7 @@ class SyncMergeOrchestrator:
         """
         report = SyncReport()
         plan = SyncPlan()
+        self._begin_remote_snapshot()
 
         try:
             # Helper: authenticate and fetch remote issues
@@ -291,7 +311,7 @@ class SyncMergeOrchestrator:
                             local_plan.add(
                                 PushAction(
                                     issue_id=c.issue_id,
-                                    issue_payload=c.local_state.__dict__,
+                                    issue_payload=c.local_state.model_dump(),
                                 )
                             )
                 if not push_only:
@@ -490,9 +510,14 @@ class SyncMergeOrchestrator:
             self.backend.__class__.__name__
         )
         sync_start_time = time.time()
+        response_cache = get_response_cache()
+        if response_cache is not None:
+            response_cache.reset_stats()
+        get_rate_limiter().reset_stats()
 
         report = SyncReport()
         report.operation_id = self._current_operation_id
+        self._begin_remote_snapshot()
 
         try:
             logger.info(
@@ -597,6 +622,8 @@ class SyncMergeOrchestrator:
                 )
             logger.exception("sync_all_issues_failed")
             return report
+        finally:
+            self._end_remote_snapshot()
 
     def _sync_initialize(
         self,
@@ -1223,6 +1250,21 @@ class SyncMergeOrchestrator:
         self._observability.record_sync_links(
             self._current_operation_id, created_count=len(local_issues_dict)
         )
+        response_cache = get_response_cache()
+        if response_cache is not None and response_cache.hits + response_cache.misses:
+            self._observability.record_cache_stats(
+                self._current_operation_id, hit_rate=response_cache.hit_rate
+            )
+        rate_limit_stats = get_rate_limiter().stats()
+        if rate_limit_stats.requests:
+            self._observability.record_rate_limit_stats(
+                self._current_operation_id,
+                api_calls=rate_limit_stats.requests,
+                waits=rate_limit_stats.throttled_requests,
+                wait_seconds=rate_limit_stats.wait_seconds,
+                secondary_hits=rate_limit_stats.secondary_limit_hits,
+                remaining=rate_limit_stats.remaining,
+            )
         if report.error:
             self._observability.record_error(
                 self._current_operation_id,
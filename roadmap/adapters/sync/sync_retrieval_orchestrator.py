@@ -14,6 +14,7 @@ from structlog import get_logger
 
 from roadmap.adapters.persistence.parser.issue import IssueParser
 from roadmap.adapters.sync.sync_merge_orchestrator import SyncMergeOrchestrator
+from roadmap.core.domain.issue import Issue
 from roadmap.core.models.sync_models import SyncIssue
 from roadmap.core.services.baseline.baseline_selector import (
     BaselineStrategy,
@@ -50,6 +51,7 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
         if persistence is None:
             from roadmap.adapters.persistence.git_history import (
                 get_file_at_timestamp,
+                get_files_at_timestamp,
             )
             from roadmap.core.interfaces.persistence import PersistenceInterface
 
@@ -57,6 +59,9 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
                 def get_file_at_timestamp(self, file_path, timestamp):
                     return get_file_at_timestamp(file_path, timestamp)
 
+                def get_files_at_timestamp(self, file_paths, timestamp):
+                    return get_files_at_timestamp(file_paths, timestamp)
+
                 def list_files_in_directory(self, directory):
                     from pathlib import Path
 
@@ -115,7 +120,7 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
             try:
                 local_issues = self.core.issues.list_all_including_archived()
                 for issue in local_issues:
-                    issue_file = self._find_issue_file(issue.id)
+                    issue_file = self._find_issue_file(issue)
                     if not issue_file:
                         continue
 
@@ -366,11 +371,11 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
     def _build_baseline_state_from_git_history(
         self, last_synced: datetime | None
     ) -> SyncState | None:
-        """Build baseline state by querying git history for each issue.
+        """Build baseline state by querying git history for all issues.
 
         Instead of loading from a sync_base_state database table, we reconstruct
         the baseline by reading each issue file as it existed at the last_synced
-        timestamp.
+        timestamp. All files are read in a single batched git pass.
 
         Args:
             last_synced: Timestamp of last sync (from sync_metadata)
@@ -407,44 +412,21 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
                 )
                 return None
 
+            issue_files = {}
             for issue in local_issues:
-                try:
-                    # Find the issue file
-                    issue_file = self._find_issue_file(issue.id)
-                    if not issue_file:
-                        logger.debug(
-                            "baseline_issue_file_not_found",
-                            issue_id=issue.id,
-                        )
-                        continue
-
-                    # Retrieve local baseline from git history
-                    local_baseline = self.baseline_retriever.get_local_baseline(
-                        issue_file, last_synced
-                    )
-
-                    if local_baseline:
-                        baseline.base_issues[issue.id] = local_baseline
-                        logger.debug(
-                            "baseline_issue_reconstructed_from_git",
-                            issue_id=issue.id,
-                            status=local_baseline.status,
-                        )
-                    else:
-                        logger.debug(
-                            "baseline_issue_not_in_git_history",
-                            issue_id=issue.id,
-                            reason="file_did_not_exist_at_timestamp",
-                        )
-
-                except Exception as e:
-                    logger.warning(
-                        "baseline_reconstruction_issue_failed",
+                issue_file = self._find_issue_file(issue)
+                if not issue_file:
+                    logger.debug(
+                        "baseline_issue_file_not_found",
                         issue_id=issue.id,
-                        error=str(e),
-                        severity="operational",
                     )
                     continue
+                issue_files[issue.id] = issue_file
+
+            # Read every file from git history in one pass
+            baseline.base_issues.update(
+                self.baseline_retriever.get_local_baselines(issue_files, last_synced)
+            )
 
             logger.info(
                 "baseline_state_reconstruction_complete",
@@ -485,7 +467,7 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
             try:
                 local_issues = self.core.issues.list_all_including_archived()
                 for issue in local_issues:
-                    issue_file = self._find_issue_file(issue.id)
+                    issue_file = self._find_issue_file(issue)
                     if not issue_file:
                         continue
 
@@ -520,7 +502,7 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
             # Build from sync_metadata remote_state
             for issue in local_issues:
                 try:
-                    issue_file = self._find_issue_file(issue.id)
+                    issue_file = self._find_issue_file(issue)
                     if not issue_file:
                         continue
 
@@ -560,8 +542,27 @@ class SyncRetrievalOrchestrator(SyncMergeOrchestrator):
             )
             return None
 
-    def _find_issue_file(self, issue_id: str) -> Path | None:
-        """Find the actual file path for an issue.
+    def _find_issue_file(self, issue: Issue) -> Path | None:
+        """Find the file an issue was loaded from.
+
+        Issues listed from the repository carry their file_path, so this is
+        a single stat; only issues without one are searched for by ID.
+
+        Args:
+            issue: Issue to locate
+
+        Returns:
+            Path to issue file, or None if not found
+        """
+        file_path = getattr(issue, "file_path", None)
+        if file_path:
+            path = Path(file_path)
+            if path.exists():
+                return path
+        return self._search_issue_file(issue.id)
+
+    def _search_issue_file(self, issue_id: str) -> Path | None:
+        """Search the issue directories for an issue's file.
 
         Issues can be in different directories based on milestone.
 
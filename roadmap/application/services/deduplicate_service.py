@@ -24,6 +24,7 @@ from roadmap.core.domain.issue import Issue
 from roadmap.core.models.sync_models import SyncIssue
 from roadmap.core.repositories import IssueRepository as IssueRepositoryProtocol
 from roadmap.core.services.sync.duplicate_detector import DuplicateDetector
+from roadmap.core.services.sync.remote_issue_index import RemoteIssueIndex
 
 logger = get_logger(__name__)
 
@@ -99,6 +100,9 @@ class DeduplicateService:
             dry_run=dry_run,
         )
 
+        # Built once, shared by remote dedup and remote deletion
+        remote_index = RemoteIssueIndex(remote_issues)
+
         # Phase 1: Deduplicate local issues within themselves
         phase1_start = time.time()
         try:
@@ -127,7 +131,9 @@ class DeduplicateService:
         phase2_start = time.time()
         try:
             logger.debug("deduplication_phase_2_starting", dataset="remote")
-            deduplicated_remote = self.detector.remote_self_dedup(remote_issues)
+            deduplicated_remote = self.detector.remote_self_dedup(
+                remote_issues, remote_index
+            )
             remote_dup_ids = set(remote_issues.keys()) - set(deduplicated_remote.keys())
             # Also track by SyncIssue.id for filtering
             remote_dup_issue_ids = {remote_issues[k].id for k in remote_dup_ids}
@@ -177,7 +183,7 @@ class DeduplicateService:
 
             # Phase B: Delete remote duplicates via GraphQL (batch)
             remote_deleted = self._close_remote_duplicates(
-                remote_dup_issue_ids, remote_issues, deletion_errors
+                remote_dup_issue_ids, remote_issues, deletion_errors, remote_index
             )
 
             deletion_elapsed = time.time() - deletion_start
@@ -361,6 +367,7 @@ class DeduplicateService:
         remote_dup_issue_ids: set[str],
         remote_issues: dict[str, SyncIssue],
         error_list: list[dict],
+        remote_index: RemoteIssueIndex | None = None,
     ) -> int:
         """Delete remote duplicate issues in batch via backend using GraphQL.
 
@@ -368,6 +375,7 @@ class DeduplicateService:
             remote_dup_issue_ids: Set of remote issue IDs to delete
             remote_issues: Dict of all remote issues (for reference)
             error_list: List to accumulate errors
+            remote_index: Optional prebuilt index of remote_issues
 
         Returns:
             Number of successfully deleted issues
@@ -386,22 +394,21 @@ class DeduplicateService:
 
         try:
             # Get remote issue numbers from the SyncIssue objects
+            if remote_index is None:
+                remote_index = RemoteIssueIndex(remote_issues)
             issues_to_delete = []
             for dup_id in remote_dup_issue_ids:
                 # Find the corresponding SyncIssue to get metadata
-                for sync_issue in remote_issues.values():
-                    if sync_issue.id == dup_id:
-                        # Use backend_id (issue number) for GitHub
-                        issue_number = sync_issue.backend_id
-                        if issue_number:
-                            issues_to_delete.append(
-                                {
-                                    "id": dup_id,
-                                    "number": issue_number,
-                                    "title": sync_issue.title,
-                                }
-                            )
-                        break
+                sync_issue = remote_index.get_by_id(dup_id)
+                # Use backend_id (issue number) for GitHub
+                if sync_issue is not None and sync_issue.backend_id:
+                    issues_to_delete.append(
+                        {
+                            "id": dup_id,
+                            "number": sync_issue.backend_id,
+                            "title": sync_issue.title,
+                        }
+                    )
 
             if not issues_to_delete:
                 logger.info(
@@ -3,11 +3,20 @@
 This module provides a thread-safe cache for storing results during a single
 command execution. The cache is designed to be cleared between commands to
 ensure data freshness while reducing redundant operations.
+
+It also provides a process-wide cache of parsed file entities validated
+against file stat metadata, so unchanged files are not re-parsed.
 """
 
+import os
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
 from threading import Lock
-from typing import Any, TypeVar
+from typing import Any, Protocol, TypeVar, runtime_checkable
+
+from pydantic import BaseModel
 
 from .logging import get_logger
 
@@ -16,6 +25,13 @@ logger = get_logger(__name__)
 T = TypeVar("T")
 
 
+@runtime_checkable
+class _HasFilePath(Protocol):
+    """A parsed entity that records the file it was loaded from."""
+
+    file_path: str | None
+
+
 class SessionCache:
     """Thread-safe cache for session-level (single command) data.
 
@@ -207,3 +223,173 @@ def cache_result(key: str, ttl: float = float("inf")):
         return wrapper
 
     return decorator
+
+
+class ParsedFileCache:
+    """Process-wide LRU cache of objects parsed from files.
+
+    Entries are keyed by file path and parser, and validated against the
+    file's ``(st_mtime_ns, st_size, st_ino)`` signature on every lookup. An
+    unchanged file is served from memory without re-reading or re-validating
+    it; any change to the stat signature is a miss.
+
+    Cached objects are handed out as deep copies so callers can mutate the
+    result freely. Only pydantic models are cached; anything else a parser
+    returns is passed through untouched.
+
+    Example:
+        cache = get_parsed_file_cache()
+        issue = cache.get_or_parse(path, IssueParser.parse_issue_file)
+        cache.invalidate(path)  # after writing the file
+    """
+
+    def __init__(self, max_entries: int = 20000) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached files before the least
+                recently used ones are evicted
+        """
+        self.max_entries = max_entries
+        # path -> {parser_func: (stat signature, parsed object)}, in LRU order
+        self._entries: OrderedDict[
+            str, dict[Callable[[Path], Any], tuple[tuple[int, int, int], Any]]
+        ] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _signature(stat: os.stat_result) -> tuple[int, int, int]:
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def get_or_parse(self, file_path: Path, parser_func: Callable[[Path], Any]) -> Any:
+        """Return the parsed object for a file, parsing only on a miss.
+
+        Args:
+            file_path: File to parse
+            parser_func: Parser called with ``file_path`` on a miss
+
+        Returns:
+            Parsed object (a private copy when served from cache)
+
+        Raises:
+            Whatever ``parser_func`` raises on a miss
+        """
+        cached, signature = self.lookup(file_path, parser_func)
+        if cached is not None:
+            return cached
+
+        obj = parser_func(file_path)
+        if signature is not None:
+            self.store(file_path, parser_func, signature, obj)
+        return obj
+
+    def lookup(
+        self, file_path: Path, parser_func: Callable[[Path], Any]
+    ) -> tuple[Any, tuple[int, int, int] | None]:
+        """Look up a file without parsing it.
+
+        Args:
+            file_path: File to look up
+            parser_func: Parser the entry was cached under
+
+        Returns:
+            Tuple of (private copy of the cached object or None, the file's
+            current stat signature or None if it cannot be stat'ed). Pass the
+            signature to store() after parsing a miss.
+        """
+        path_key = os.path.abspath(file_path)
+        try:
+            signature = self._signature(os.stat(file_path))
+        except OSError:
+            self.invalidate(file_path)
+            return None, None
+
+        with self._lock:
+            entry = self._entries.get(path_key, {}).get(parser_func)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path_key)
+                self.hits += 1
+                return entry[1].model_copy(deep=True), signature
+            self.misses += 1
+        return None, signature
+
+    def store(
+        self,
+        file_path: Path,
+        parser_func: Callable[[Path], Any],
+        signature: tuple[int, int, int],
+        obj: Any,
+    ) -> None:
+        """Cache an object parsed from a file.
+
+        Args:
+            file_path: File the object was parsed from
+            parser_func: Parser to cache the object under
+            signature: Stat signature returned by lookup() before parsing
+            obj: Parsed object; only pydantic models are cached
+        """
+        if not isinstance(obj, BaseModel):
+            return
+        if isinstance(obj, _HasFilePath):
+            obj.file_path = str(file_path)
+        with self._lock:
+            parsed = self._entries.setdefault(os.path.abspath(file_path), {})
+            parsed[parser_func] = (signature, obj.model_copy(deep=True))
+            self._entries.move_to_end(os.path.abspath(file_path))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, file_path: Path | str) -> None:
+        """Drop all cached objects parsed from a file.
+
+        Args:
+            file_path: File whose entries should be removed
+        """
+        path_key = os.path.abspath(file_path)
+        with self._lock:
+            removed = self._entries.pop(path_key, None)
+        if removed:
+            logger.debug("parsed_file_cache_invalidated", path=path_key)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with entries, max_entries, hits, misses, evictions
+            and hit_rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Global parsed file cache instance
+_parsed_file_cache = ParsedFileCache()
+
+
+def get_parsed_file_cache() -> ParsedFileCache:
+    """Get the process-wide parsed file cache.
+
+    Returns:
+        The singleton ParsedFileCache instance
+    """
+    return _parsed_file_cache
@@ -33,6 +33,7 @@ from roadmap.common.errors.error_handler import ErrorHandler, handle_errors
 from roadmap.common.errors.error_network import (
     AuthenticationError,
     GitHubAPIError,
+    GitHubRateLimitError,
     NetworkError,
 )
 from roadmap.common.errors.error_security import (
@@ -103,6 +104,7 @@ __all__ = [
     "NetworkError",
     "AuthenticationError",
     "GitHubAPIError",
+    "GitHubRateLimitError",
     "GitOperationError",
     "SecurityError",
     "PathValidationError",
@@ -71,6 +71,26 @@ class GitHubAPIError(NetworkError):
         self.rate_limit_remaining = rate_limit_remaining
 
 
+class GitHubRateLimitError(GitHubAPIError):
+    """Raised when a GitHub rate limit would take too long to reset."""
+
+    def __init__(self, message: str, resource: str, reset_at: float, **kwargs):
+        """Initialize GitHubRateLimitError.
+
+        Args:
+            message: Error message.
+            resource: Rate limit resource that is exhausted ("core", "graphql").
+            reset_at: Epoch seconds at which GitHub resets the budget.
+            **kwargs: Additional arguments passed to parent class.
+        """
+        context = kwargs.pop("context", {})
+        context["resource"] = resource
+        context["reset_at"] = reset_at
+        super().__init__(message, rate_limit_remaining=0, context=context, **kwargs)
+        self.resource = resource
+        self.reset_at = reset_at
+
+
 class AuthenticationError(RoadmapError):
     """Raised when authentication fails."""
 
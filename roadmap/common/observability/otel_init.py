@@ -2,6 +2,10 @@
 
 Sets up trace exporter and OTLP integration for local development.
 Exports traces to local OTLP receiver on port 4317.
+
+Tracing is opt-in: the CLI only calls initialize_tracing() when
+``tracing.enabled`` is set (ROADMAP_TRACING__ENABLED=true). Until then no
+OpenTelemetry module is imported and get_tracer() returns None.
 """
 
 from structlog import get_logger
@@ -12,15 +16,20 @@ logger = get_logger()
 _tracer: object | None = None
 
 
-def initialize_tracing(service_name: str = "roadmap-cli") -> None:
+def initialize_tracing(
+    service_name: str = "roadmap-cli", endpoint: str = "http://localhost:4317"
+) -> None:
     """Initialize OpenTelemetry tracing with OTLP exporter.
 
     This must be called once at application startup before any tracing
     operations. It configures trace export to a local OTLP receiver
     (typically a collector or Jaeger with OTLP native support).
 
+    Calling it again once tracing is initialized does nothing.
+
     Args:
         service_name: Name of the service for tracing (default: "roadmap-cli")
+        endpoint: OTLP gRPC receiver to export spans to
 
     Example:
         from roadmap.common.observability.otel_init import initialize_tracing
@@ -28,6 +37,9 @@ def initialize_tracing(service_name: str = "roadmap-cli") -> None:
     """
     global _tracer
 
+    if _tracer is not None:
+        return
+
     try:
         from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
             OTLPSpanExporter,
@@ -37,7 +49,7 @@ def initialize_tracing(service_name: str = "roadmap-cli") -> None:
 
         # Create OTLP exporter (connects to localhost:4317 by default)
         otlp_exporter = OTLPSpanExporter(
-            endpoint="http://localhost:4317",
+            endpoint=endpoint,
         )
 
         # Create tracer provider
@@ -53,7 +65,7 @@ def initialize_tracing(service_name: str = "roadmap-cli") -> None:
 
         logger.debug(
             "opentelemetry_tracing_initialized",
-            extra={"service": service_name, "exporter": "otlp"},
+            extra={"service": service_name, "exporter": "otlp", "endpoint": endpoint},
         )
 
     except ImportError as e:
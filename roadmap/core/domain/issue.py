@@ -1,10 +1,11 @@
 """Issue domain model."""
 
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
-from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, computed_field, model_validator
 
 from roadmap.common.constants import IssueType, Priority, Status
 from roadmap.core.domain.comment import Comment
@@ -38,7 +39,6 @@ class Issue(BaseModel):
     created: datetime = Field(default_factory=now_utc)
     updated: datetime = Field(default_factory=now_utc)
     assignee: str | None = None
-    content: str = ""  # Markdown content
     estimated_hours: float | None = None  # Estimated time to complete in hours
     due_date: datetime | None = None  # When the issue should be completed
     depends_on: list[str] = Field(
@@ -70,6 +70,66 @@ class Issue(BaseModel):
 
     _modified: bool = PrivateAttr(default=False)
     _local_changes: dict[str, Any] | None = PrivateAttr(default=None)
+    _content: str = PrivateAttr(default="")  # Markdown content
+    _content_loader: Callable[[], str] | None = PrivateAttr(default=None)
+
+    def __init__(self, content: str = "", **data: Any) -> None:
+        """Initialize an issue with its markdown ``content``."""
+        super().__init__(content=content, **data)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def store_content(cls, data: Any, handler: Any) -> Any:
+        """Keep the markdown content in its private attribute."""
+        issue = handler(data)
+        if isinstance(data, dict) and issue is not data:
+            content = data.get("content", "")
+            if not isinstance(content, str):
+                raise ValueError("content: must be a string")
+            issue._content = content
+        return issue
+
+    @classmethod
+    def with_lazy_content(cls, content_loader: Callable[[], str], **data) -> "Issue":
+        """Build an issue whose markdown content is loaded on first access.
+
+        Args:
+            content_loader: Callable returning the markdown content
+            **data: Remaining issue fields
+
+        Returns:
+            Issue that calls ``content_loader`` the first time ``content`` is
+            read; errors raised by the loader propagate to that read
+        """
+        issue = cls(**data)
+        issue._content_loader = content_loader
+        return issue
+
+    @computed_field
+    @property
+    def content(self) -> str:
+        """Markdown content, loaded on first access for lazily parsed issues."""
+        loader = self._content_loader
+        if loader is not None:
+            self._content = loader()
+            self._content_loader = None
+        return self._content
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._content_loader = None
+        self._content = value
+
+    def __iter__(self):
+        """Iterate field values, including the markdown content."""
+        yield from super().__iter__()
+        yield "content", self.content
+
+    def __eq__(self, other: object) -> bool:
+        """Compare issues with any deferred content loaded."""
+        if isinstance(other, Issue):
+            _ = self.content, other.content
+        return super().__eq__(other)
 
     @model_validator(mode="before")
     @classmethod
@@ -39,6 +39,32 @@ class PersistenceInterface(ABC):
         """
         pass
 
+    def get_files_at_timestamp(
+        self, file_paths: list[str], timestamp: datetime
+    ) -> dict[str, str]:
+        """Get the content of many files at a specific git timestamp.
+
+        The default reads each file with get_file_at_timestamp. Git-backed
+        implementations should override it to read all files in one pass.
+
+        Args:
+            file_paths: Paths to files relative to repo root
+            timestamp: Datetime to retrieve files at
+
+        Returns:
+            Dict of file path -> content, omitting files that didn't exist
+
+        Raises:
+            GitHistoryError: If git operation fails
+        """
+        contents = {}
+        for file_path in file_paths:
+            try:
+                contents[file_path] = self.get_file_at_timestamp(file_path, timestamp)
+            except FileNotFound:
+                continue
+        return contents
+
     @abstractmethod
     def list_files_in_directory(self, directory: str) -> list[str]:
         """List all files in a directory at HEAD."""
@@ -106,6 +106,10 @@ class QueryStateManager(Protocol):
         """Get progress stats for a milestone."""
         ...
 
+    def get_all_milestones_progress(self) -> dict[str, dict[str, int]]:
+        """Get progress stats for every milestone, keyed by milestone title."""
+        ...
+
     def get_issues_by_status(self) -> dict[str, int]:
         """Get issue counts by status."""
         ...
@@ -71,6 +71,10 @@ class SyncMetrics:
     circuit_breaker_state: str = "closed"
     database_query_time: float = 0.0
     total_api_calls: int = 0
+    rate_limit_waits: int = 0
+    rate_limit_wait_seconds: float = 0.0
+    secondary_rate_limit_hits: int = 0
+    rate_limit_remaining: dict[str, int] = field(default_factory=dict)
 
     # Phase timing
     analysis_phase_duration: float = 0.0
@@ -138,6 +142,10 @@ class SyncMetrics:
             "circuit_breaker_state": self.circuit_breaker_state,
             "database_query_time": self.database_query_time,
             "total_api_calls": self.total_api_calls,
+            "rate_limit_waits": self.rate_limit_waits,
+            "rate_limit_wait_seconds": self.rate_limit_wait_seconds,
+            "secondary_rate_limit_hits": self.secondary_rate_limit_hits,
+            "rate_limit_remaining": self.rate_limit_remaining,
             # Phase timing
             "analysis_phase_duration": self.analysis_phase_duration,
             "merge_phase_duration": self.merge_phase_duration,
@@ -509,6 +517,43 @@ class SyncObservability:
             hit_rate=hit_rate,
         )
 
+    def record_rate_limit_stats(
+        self,
+        operation_id: str,
+        api_calls: int,
+        waits: int,
+        wait_seconds: float,
+        secondary_hits: int,
+        remaining: dict[str, int] | None = None,
+    ) -> None:
+        """Record API call volume and rate limiter pacing.
+
+        Args:
+            operation_id: ID of the sync operation
+            api_calls: Number of API requests sent
+            waits: Number of requests that waited for rate limit budget
+            wait_seconds: Total time spent waiting for rate limit budget
+            secondary_hits: Number of secondary rate limit responses
+            remaining: Last known primary budget left per resource
+        """
+        metrics = self._get_metrics(operation_id)
+        if not metrics:
+            return
+
+        metrics.total_api_calls = api_calls
+        metrics.rate_limit_waits = waits
+        metrics.rate_limit_wait_seconds = wait_seconds
+        metrics.secondary_rate_limit_hits = secondary_hits
+        metrics.rate_limit_remaining = dict(remaining or {})
+        self._logger.info(
+            "rate_limit_stats_recorded",
+            operation_id=operation_id,
+            api_calls=api_calls,
+            waits=waits,
+            wait_seconds=round(wait_seconds, 3),
+            secondary_hits=secondary_hits,
+        )
+
     def record_circuit_breaker_state(
         self,
         operation_id: str,
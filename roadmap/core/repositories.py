@@ -41,6 +41,37 @@ class IssueRepository(Protocol):
         """
         ...
 
+    def query(
+        self,
+        status: str | None = None,
+        priority: str | None = None,
+        issue_type: str | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[Issue] | None:
+        """Query issues through an index, if the implementation has one.
+
+        Args:
+            status: Optional status filter
+            priority: Optional priority filter
+            issue_type: Optional issue type filter
+            assignee: Optional assignee filter
+            milestone: Optional milestone filter
+            backlog: Only issues without a milestone
+            overdue: Only issues past their due date
+            open_only: Exclude closed issues
+            blocked_only: Only blocked issues
+
+        Returns:
+            Matching issues sorted by priority then creation date, or None
+            if the index cannot answer and list() should be used instead
+        """
+        ...
+
     def save(self, issue: Issue) -> None:
         """Save/create an issue.
 
@@ -145,6 +145,61 @@ class BaselineStateRetriever:
             )
             return None
 
+    def get_local_baselines(
+        self, issue_files: dict[str, Path], last_synced: datetime
+    ) -> dict[str, IssueBaseState]:
+        """Get local baseline states for many issues in one git pass.
+
+        Args:
+            issue_files: Dict of issue_id -> path to issue file
+            last_synced: Timestamp of last successful sync
+
+        Returns:
+            Dict of issue_id -> IssueBaseState, omitting issues whose file
+            didn't exist at that time or couldn't be parsed
+        """
+        try:
+            contents = self.persistence.get_files_at_timestamp(
+                [str(issue_file) for issue_file in issue_files.values()],
+                last_synced,
+            )
+        except GitHistoryError as e:
+            logger.warning(
+                "local_baselines_git_error",
+                issue_count=len(issue_files),
+                error=str(e),
+                severity="operational",
+            )
+            raise BaselineRetrievalError(
+                f"Failed to retrieve baselines from git: {e}"
+            ) from e
+
+        baselines = {}
+        for issue_id, issue_file in issue_files.items():
+            file_content = contents.get(str(issue_file))
+            if not file_content:
+                continue
+            try:
+                baseline = self._extract_baseline_from_content(file_content, issue_file)
+            except Exception as e:
+                logger.warning(
+                    "baseline_reconstruction_issue_failed",
+                    issue_id=issue_id,
+                    error=str(e),
+                    severity="operational",
+                )
+                continue
+            if baseline:
+                baselines[issue_id] = baseline
+
+        logger.debug(
+            "local_baselines_retrieved",
+            requested=len(issue_files),
+            retrieved=len(baselines),
+            last_synced=last_synced.isoformat(),
+        )
+        return baselines
+
     def get_remote_baseline(self, issue_file: Path) -> IssueBaseState | None:
         """Get remote baseline from sync_metadata in issue file.
 
@@ -263,6 +263,7 @@ class GitHubIssueClient:
         milestone: str | None = None,
         assignee: str | None = None,
         per_page: int = 100,
+        since: str | None = None,
     ) -> list[dict[str, Any]]:
         """Get issues from a GitHub repository.
 
@@ -274,6 +275,8 @@ class GitHubIssueClient:
             milestone: Optional milestone title to filter by
             assignee: Optional assignee username to filter by
             per_page: Number of issues per page (max 100)
+            since: Optional ISO 8601 timestamp; only issues updated at or
+                after it are returned
 
         Returns:
             List of issue dictionaries from GitHub API
@@ -296,7 +299,7 @@ class GitHubIssueClient:
                     {"token": self.token, "owner": owner, "repo": repo}
                 )
                 issues_data = client.get_issues(
-                    state, labels, milestone, assignee, per_page
+                    state, labels, milestone, assignee, per_page, since=since
                 )
             else:
                 # If backend provided, use it - backend get_issues() takes no parameters
@@ -344,3 +347,59 @@ class GitHubIssueClient:
                 severity="infrastructure",
             )
             raise GitHubAPIError(f"Failed to fetch issues: {str(e)}") from e
+
+    @traced("get_issues_graphql")
+    def get_issues_graphql(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "all",
+        since: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get issues from a GitHub repository with cursor-paginated GraphQL.
+
+        Returns the same payload shape as get_issues() with labels, assignees
+        and milestone included, in one request per page. With an injected
+        backend, this is the same as get_issues().
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            state: Issue state filter ('open', 'closed', 'all')
+            since: Optional ISO 8601 timestamp; only issues updated at or
+                after it are returned
+
+        Returns:
+            List of issue dictionaries
+
+        Raises:
+            GitHubAPIError: If API call fails
+        """
+        if self._github_backend is not None:
+            return self.get_issues(owner, repo, state=state, since=since)
+
+        logger.info(
+            "fetching_github_issues_graphql",
+            owner=owner,
+            repo=repo,
+            state=state,
+        )
+        try:
+            client = GitHubGateway.get_github_client(
+                {"token": self.token, "owner": owner, "repo": repo}
+            )
+            return client.get_issues_graphql(state=state, since=since)
+        except GitHubAPIError as e:
+            log_external_service_error(
+                e,
+                service_name="GitHub",
+                operation="get_issues_graphql",
+            )
+            raise
+        except Exception as e:
+            log_external_service_error(
+                e,
+                service_name="GitHub",
+                operation="get_issues_graphql",
+            )
+            raise GitHubAPIError(f"Failed to fetch issues: {str(e)}") from e
@@ -154,6 +154,81 @@ class IssueQueryService:
         # Show all issues
         return self.core.issues.list(), "all"
 
+    def get_indexed_issues(
+        self,
+        milestone: str | None = None,
+        backlog: bool = False,
+        unassigned: bool = False,
+        next_milestone: bool = False,
+        assignee: str | None = None,
+        my_issues: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+        status: str | None = None,
+        priority: str | None = None,
+        issue_type: str | None = None,
+    ) -> tuple[list[Issue], str] | None:
+        """Get issues for all list filters from the issue list index.
+
+        Takes the primary filters of get_filtered_issues() and the filters of
+        apply_additional_filters() and answers them with one indexed query.
+        The description only covers the primary filters, so callers still
+        run apply_additional_filters() to describe the rest.
+
+        Returns:
+            Tuple of (issues, filter_description), or None if the index is
+            stale and get_filtered_issues() should be used instead
+        """
+        from roadmap.core.domain import IssueType
+
+        query_assignee = None
+        query_milestone = None
+        query_backlog = False
+        query_overdue = False
+
+        # Same precedence as get_filtered_issues()
+        if my_issues:
+            query_assignee = self.core.team.get_current_user()
+            if not query_assignee:
+                return [], "my"
+            description = "my"
+        elif assignee:
+            query_assignee = assignee
+            description = f"assigned to {assignee}"
+        elif backlog or unassigned:
+            query_backlog = True
+            description = "backlog"
+        elif next_milestone:
+            next_ms = self.core.milestones.get_next()
+            if not next_ms:
+                return [], ""  # Handled by caller
+            query_milestone = next_ms.name
+            description = f"next milestone ({next_ms.name})"
+        elif milestone:
+            query_milestone = milestone
+            description = f"milestone '{milestone}'"
+        elif overdue:
+            query_overdue = True
+            description = "overdue"
+        else:
+            description = "all"
+
+        issues = self.core.issues.query(
+            status=Status(status) if status else None,
+            priority=Priority(priority) if priority else None,
+            issue_type=IssueType(issue_type) if issue_type else None,
+            assignee=query_assignee,
+            milestone=query_milestone,
+            backlog=query_backlog,
+            overdue=query_overdue,
+            open_only=open_only,
+            blocked_only=blocked_only,
+        )
+        if issues is None:
+            return None
+        return issues, description
+
     def apply_additional_filters(
         self,
         issues: list[Issue],
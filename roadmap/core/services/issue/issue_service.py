@@ -224,6 +224,10 @@ class IssueService:
         issues.sort(key=lambda x: (priority_order.get(x.priority, 999), x.created))
         return issues
 
+    def clear_cache(self) -> None:
+        """Drop cached list_issues results so the next call reads the repository."""
+        self._list_issues_cache.clear()
+
     @traced("list_issues")
     def list_issues(
         self,
@@ -310,6 +314,67 @@ class IssueService:
         log_exit("list_issues", issue_count=len(sorted_issues))
         return sorted_issues
 
+    @traced("query_issues")
+    def query_issues(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        issue_type: IssueType | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[Issue] | None:
+        """Query issues through the repository's index.
+
+        All filters are combined with AND logic (all must match).
+
+        Args:
+            status: Filter by status
+            priority: Filter by priority level
+            issue_type: Filter by issue type
+            assignee: Filter by assignee
+            milestone: Filter by milestone name
+            backlog: Only issues without a milestone
+            overdue: Only issues past their due date
+            open_only: Exclude closed issues
+            blocked_only: Only blocked issues
+
+        Returns:
+            Matching issues sorted by priority then date, or None if the
+            index is unavailable and callers should use list_issues()
+        """
+        log_entry("query_issues", milestone=milestone, status=status)
+
+        try:
+            issues = self.repository.query(
+                status=status.value if status else None,
+                priority=priority.value if priority else None,
+                issue_type=issue_type.value if issue_type else None,
+                assignee=assignee,
+                milestone=milestone,
+                backlog=backlog,
+                overdue=overdue,
+                open_only=open_only,
+                blocked_only=blocked_only,
+            )
+        except Exception as e:
+            log_database_error(
+                e,
+                operation="query",
+                entity_type="Issue",
+            )
+            return None
+
+        log_exit(
+            "query_issues",
+            issue_count=len(issues) if issues is not None else None,
+            from_index=issues is not None,
+        )
+        return issues
+
     @traced("list_all_including_archived")
     def list_all_including_archived(self) -> list[Issue]:
         """List all issues including archived ones.
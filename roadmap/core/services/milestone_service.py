@@ -12,6 +12,7 @@ The MilestoneService manages:
 Extracted from core.py to separate business logic.
 """
 
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -38,6 +39,48 @@ logger = structlog.get_logger()
 logger = get_logger(__name__)
 
 
+def _count_by_milestone_and_status(issues: list) -> dict[str | None, Counter]:
+    """Group issues by milestone, counting each status."""
+    counts: dict[str | None, Counter] = {}
+    for issue in issues:
+        counts.setdefault(issue.milestone, Counter())[issue.status] += 1
+    return counts
+
+
+def _progress_from_status_counts(status_counts: Counter | None) -> dict[str, Any]:
+    """Build a milestone progress dict from its issue status counts."""
+    total = sum(status_counts.values()) if status_counts else 0
+    if not status_counts or not total:
+        return {"total": 0, "completed": 0, "progress": 0.0, "by_status": {}}
+
+    completed = status_counts[Status.CLOSED]
+    return {
+        "total": total,
+        "completed": completed,
+        "progress": (completed / total) * 100,
+        "by_status": {status.value: status_counts[status] for status in Status},
+    }
+
+
+def with_completion_percentage(progress: dict | None) -> dict:
+    """Reduce a progress dict to total, completed and completion percentage.
+
+    Args:
+        progress: Progress dict with total and completed counts, or None
+
+    Returns:
+        Dict with total, completed and percentage (0 when there are no issues)
+    """
+    progress = progress or {}
+    total = progress.get("total", 0)
+    completed = progress.get("completed", 0)
+    return {
+        "total": total,
+        "completed": completed,
+        "percentage": (completed / total) * 100 if total > 0 else 0,
+    }
+
+
 class MilestoneService:
     """Service for managing milestones."""
 
@@ -384,40 +427,52 @@ class MilestoneService:
             log_exit("get_milestone_progress", total=0)
             return {"total": 0, "completed": 0, "progress": 0.0, "by_status": {}}
 
-        issues = self.issue_repository.list()
+        status_counts = _count_by_milestone_and_status(self.issue_repository.list())
+        result = _progress_from_status_counts(status_counts.get(milestone_name))
 
-        # Filter issues for this milestone
-        milestone_issues = [i for i in issues if i.milestone == milestone_name]
+        log_metric(
+            "milestone_progress",
+            result["progress"],
+            milestone=milestone_name,
+            total=result["total"],
+            completed=result["completed"],
+        )
+        log_exit(
+            "get_milestone_progress",
+            total=result["total"],
+            completed=result["completed"],
+        )
+        return result
 
-        if not milestone_issues:
-            log_metric("milestone_progress", 0, milestone=milestone_name)
-            log_exit("get_milestone_progress", total=0)
-            return {"total": 0, "completed": 0, "progress": 0.0, "by_status": {}}
+    @traced("get_all_milestones_progress")
+    def get_all_milestones_progress(
+        self, milestone_names: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get progress statistics for many milestones in one pass over issues.
 
-        total = len(milestone_issues)
-        completed = len([i for i in milestone_issues if i.status == Status.CLOSED])
-        progress = (completed / total) * 100 if total > 0 else 0.0
+        Args:
+            milestone_names: Milestones to report; defaults to every milestone
+                that has issues assigned
 
-        by_status = {}
-        for status in Status:
-            by_status[status.value] = len(
-                [i for i in milestone_issues if i.status == status]
-            )
+        Returns:
+            Dict mapping milestone name to the dict get_milestone_progress returns
+        """
+        log_entry("get_all_milestones_progress")
 
-        log_metric(
-            "milestone_progress",
-            progress,
-            milestone=milestone_name,
-            total=total,
-            completed=completed,
+        status_counts = (
+            _count_by_milestone_and_status(self.issue_repository.list())
+            if self.issue_repository
+            else {}
         )
-        log_exit("get_milestone_progress", total=total, completed=completed)
-        return {
-            "total": total,
-            "completed": completed,
-            "progress": progress,
-            "by_status": by_status,
+        if milestone_names is None:
+            milestone_names = [name for name in status_counts if name]
+
+        progress = {
+            name: _progress_from_status_counts(status_counts.get(name))
+            for name in milestone_names
         }
+        log_exit("get_all_milestones_progress", milestone_count=len(progress))
+        return progress
 
     @safe_operation(OperationType.UPDATE, "Milestone")
     def close_milestone(self, name: str) -> Milestone | None:
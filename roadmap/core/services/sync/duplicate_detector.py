@@ -14,6 +14,11 @@ import structlog
 from roadmap.common.union_find import UnionFind
 from roadmap.core.domain.issue import Issue
 from roadmap.core.models.sync_models import SyncIssue
+from roadmap.core.services.sync.remote_issue_index import RemoteIssueIndex
+from roadmap.core.services.sync.similarity_candidates import (
+    minhash_candidate_pairs,
+    qgram_candidate_pairs,
+)
 
 logger = structlog.get_logger()
 
@@ -93,7 +98,11 @@ class DuplicateDetector:
     Uses multiple detection strategies:
     - ID collision detection (same GitHub number, different content)
     - Title matching (exact and fuzzy)
-    - Content similarity (using SequenceMatcher)
+    - Content similarity (using SequenceMatcher, opt-in)
+
+    Fuzzy comparisons only run on candidate pairs from the indexes in
+    similarity_candidates, so cross-set detection scales to thousands of
+    issues per side.
     """
 
     def __init__(
@@ -102,6 +111,7 @@ class DuplicateDetector:
         content_similarity_threshold: float = 0.85,
         auto_resolve_threshold: float = 0.95,
         enable_fuzzy_matching: bool = False,
+        enable_content_matching: bool = False,
     ) -> None:
         """Initialize duplicate detector with configurable thresholds.
 
@@ -110,14 +120,19 @@ class DuplicateDetector:
             content_similarity_threshold: Minimum similarity for content duplicates (default: 0.85)
             auto_resolve_threshold: Minimum confidence for auto-resolution (default: 0.95)
             enable_fuzzy_matching: Enable fuzzy matching in local/remote self-dedup (slower, catches more)
+            enable_content_matching: Also detect content duplicates in detect_all (near-duplicate bodies)
         """
         self.title_similarity_threshold = title_similarity_threshold
         self.content_similarity_threshold = content_similarity_threshold
         self.auto_resolve_threshold = auto_resolve_threshold
         self.enable_fuzzy_matching = enable_fuzzy_matching
+        self.enable_content_matching = enable_content_matching
 
     def detect_all(
-        self, local_issues: list[Issue], remote_issues: dict[str, SyncIssue]
+        self,
+        local_issues: list[Issue],
+        remote_issues: dict[str, SyncIssue],
+        remote_index: RemoteIssueIndex | None = None,
     ) -> list[DuplicateMatch]:
         """Run all detection strategies and return all matches.
 
@@ -128,30 +143,32 @@ class DuplicateDetector:
         Args:
             local_issues: List of deduplicated local Issue objects
             remote_issues: Dictionary mapping remote IDs to deduplicated SyncIssue objects
+            remote_index: Optional prebuilt index of remote_issues, shared with
+                other sync steps; built here if not given
 
         Returns:
             List of DuplicateMatch objects, sorted by confidence (highest first)
         """
         matches: list[DuplicateMatch] = []
+        if remote_index is None:
+            remote_index = RemoteIssueIndex(remote_issues)
 
+        # Check for ID collisions first (highest priority)
+        # This catches: same GitHub issue number with different local ID
         for local_issue in local_issues:
-            # Check for ID collisions first (highest priority)
-            # This catches: same GitHub issue number with different local ID
-            id_matches = self._detect_id_collisions(local_issue, remote_issues)
-            matches.extend(id_matches)
-
-            # Title matching: now safe because input should be deduplicated via
-            # local_self_dedup() and remote_self_dedup() in the orchestrator.
-            # With deduplicated canonical sets (~100 issues each), this is O(100²) = 10K comparisons.
-            # Without dedup, with 1800+ issues each, this would be O(3M+) and produce 80K+ false positives.
-            title_matches = self._detect_title_duplicates(local_issue, remote_issues)
-            matches.extend(title_matches)
-
-            # NOTE: Content duplicate detection disabled - too expensive even with dedup
-            # content_matches = self._detect_content_duplicates(
-            #     local_issue, remote_issues
-            # )
-            # matches.extend(content_matches)
+            github_number = (local_issue.remote_ids or {}).get("github")
+            if not github_number:
+                continue
+            same_number = remote_index.with_backend_id(github_number, "github")
+            if same_number:
+                matches.extend(self._detect_id_collisions(local_issue, same_number))
+
+        # Title and content matching only score candidate pairs from an index,
+        # not every local x remote pair
+        remote_list = list(remote_issues.values())
+        matches.extend(self._detect_title_duplicates(local_issues, remote_list))
+        if self.enable_content_matching:
+            matches.extend(self._detect_content_duplicates(local_issues, remote_list))
 
         # Remove duplicate matches (same local/remote pair)
         matches = self._deduplicate_matches(matches)
@@ -168,7 +185,8 @@ class DuplicateDetector:
 
         Args:
             local_issue: Local issue to check
-            remote_issues: Dictionary of remote issues
+            remote_issues: Dictionary of remote issues; detect_all passes only
+                those sharing the local issue's GitHub number
 
         Returns:
             List of DuplicateMatch objects for ID collisions
@@ -221,26 +239,48 @@ class DuplicateDetector:
         return matches
 
     def _detect_title_duplicates(
-        self, local_issue: Issue, remote_issues: dict[str, SyncIssue]
+        self, local_issues: list[Issue], remote_issues: list[SyncIssue]
     ) -> list[DuplicateMatch]:
         """Detect title duplicates (exact and fuzzy matching).
 
+        Exact matches come from a title lookup. Fuzzy matches are scored only
+        for the pairs qgram_candidate_pairs keeps, which provably include
+        every pair at or above the title threshold.
+
         NOTE: This method works well only when called with deduplicated inputs.
         Without dedup preprocessing, fuzzy matching can produce thousands of
         spurious matches with large datasets.
 
         Args:
-            local_issue: Local issue to check
-            remote_issues: Dictionary of remote issues
+            local_issues: Local issues to check
+            remote_issues: Remote issues to compare against
 
         Returns:
             List of DuplicateMatch objects for title duplicates
         """
         matches: list[DuplicateMatch] = []
-        local_title = local_issue.title.strip().lower()
+        local_titles = [issue.title.strip().lower() for issue in local_issues]
+        remote_titles = [issue.title.strip().lower() for issue in remote_issues]
+
+        remote_by_title: dict[str, list[int]] = {}
+        for j, remote_title in enumerate(remote_titles):
+            remote_by_title.setdefault(remote_title, []).append(j)
+        pairs = {
+            (i, j)
+            for i, local_title in enumerate(local_titles)
+            for j in remote_by_title.get(local_title, ())
+        }
+        pairs.update(
+            qgram_candidate_pairs(
+                local_titles, remote_titles, self.title_similarity_threshold
+            )
+        )
 
-        for _remote_id, remote_issue in remote_issues.items():
-            remote_title = remote_issue.title.strip().lower()
+        for i, j in sorted(pairs):
+            local_issue = local_issues[i]
+            remote_issue = remote_issues[j]
+            local_title = local_titles[i]
+            remote_title = remote_titles[j]
 
             # Check for exact match first
             if local_title == remote_title:
@@ -259,8 +299,7 @@ class DuplicateDetector:
                 )
                 continue
 
-            # Check for fuzzy title match using SequenceMatcher
-            # Safe to do here because input should be deduplicated
+            # Verify the candidate with SequenceMatcher
             similarity = SequenceMatcher(None, local_title, remote_title).ratio()
 
             if similarity >= self.title_similarity_threshold:
@@ -281,27 +320,25 @@ class DuplicateDetector:
         return matches
 
     def _detect_content_duplicates(
-        self, local_issue: Issue, remote_issues: dict[str, SyncIssue]
+        self, local_issues: list[Issue], remote_issues: list[SyncIssue]
     ) -> list[DuplicateMatch]:
         """Detect content duplicates (>85% text similarity).
 
+        Candidate pairs come from MinHash LSH over the normalized content, so
+        near-duplicate bodies are found without scoring every pair.
+
         Args:
-            local_issue: Local issue to check
-            remote_issues: Dictionary of remote issues
+            local_issues: Local issues to check
+            remote_issues: Remote issues to compare against
 
         Returns:
             List of DuplicateMatch objects for content duplicates
         """
         matches: list[DuplicateMatch] = []
 
-        # Skip if local issue has no content
-        if not local_issue.content or not local_issue.content.strip():
-            return matches
-
-        # Skip if no content to compare
-        local_content = local_issue.content.strip() if local_issue.content else ""
-
-        for _remote_id, remote_issue in remote_issues.items():
+        local_contents = [(issue.content or "").strip() for issue in local_issues]
+        remote_contents = []
+        for remote_issue in remote_issues:
             # Get remote content (try headline or metadata)
             remote_content = ""
             if hasattr(remote_issue, "headline") and remote_issue.headline:
@@ -310,14 +347,21 @@ class DuplicateDetector:
                 "content"
             ):
                 remote_content = remote_issue.metadata.get("content", "").strip()
+            remote_contents.append(remote_content)
 
-            # Skip if remote issue has no content
-            if not remote_content:
-                continue
+        # Issues without content never become candidates
+        pairs = minhash_candidate_pairs(
+            [" ".join(content.lower().split()) for content in local_contents],
+            [" ".join(content.lower().split()) for content in remote_contents],
+        )
+
+        for i, j in sorted(pairs):
+            local_issue = local_issues[i]
+            remote_issue = remote_issues[j]
 
             # Calculate content similarity
             content_similarity = self._calculate_text_similarity(
-                local_content, remote_content
+                local_contents[i], remote_contents[j]
             )
 
             if content_similarity >= self.content_similarity_threshold:
@@ -557,17 +601,10 @@ class DuplicateDetector:
         self,
         uf: UnionFind,
         remote_issues: dict[str, "SyncIssue"],
-        remote_id_list: list[str],
+        remote_index: RemoteIssueIndex,
     ) -> int:
         id_collision_count = 0
-        backend_id_map: dict[str, list[str]] = {}
-        for rid in remote_id_list:
-            issue = remote_issues[rid]
-            if issue.backend_id:
-                backend_id_key = str(issue.backend_id)
-                backend_id_map.setdefault(backend_id_key, []).append(rid)
-
-        for backend_id, rids_with_id in backend_id_map.items():
+        for backend_id, rids_with_id in remote_index.backend_id_groups().items():
             if len(rids_with_id) > 1:
                 first_rid = rids_with_id[0]
                 first_issue = remote_issues[first_rid]
@@ -697,7 +734,9 @@ class DuplicateDetector:
         return canonical_issues
 
     def remote_self_dedup(
-        self, remote_issues: dict[str, "SyncIssue"]
+        self,
+        remote_issues: dict[str, "SyncIssue"],
+        remote_index: RemoteIssueIndex | None = None,
     ) -> dict[str, "SyncIssue"]:
         """Deduplicate remote issues by grouping canonical duplicates.
 
@@ -706,6 +745,8 @@ class DuplicateDetector:
 
         Args:
             remote_issues: Dict of remote issue IDs to SyncIssue objects.
+            remote_index: Optional prebuilt index of remote_issues; built here
+                if not given
 
         Returns:
             Dict of canonical remote issues (one per equivalence class).
@@ -738,7 +779,7 @@ class DuplicateDetector:
         id_collision_count = self._union_backend_id_collisions_remote(
             uf,
             remote_issues,
-            remote_id_list,
+            remote_index or RemoteIssueIndex(remote_issues),
         )
         similarity_match_count = self._apply_fuzzy_matches_remote(
             uf,
@@ -0,0 +1,74 @@
+"""Lookup index over a set of remote issues.
+
+Remote issues arrive keyed by backend-specific keys, but several sync steps
+need to find them by backend ID (the GitHub issue number) or by SyncIssue
+ID. Scanning the whole dict for every lookup makes those steps O(N*M);
+RemoteIssueIndex builds the lookup tables once so callers can share them.
+"""
+
+from collections.abc import Mapping
+
+from roadmap.core.models.sync_models import SyncIssue
+
+
+class RemoteIssueIndex:
+    """Backend-ID and ID lookups over one remote issue dict.
+
+    Build it once per sync (or dedup run) from the same dict that is passed
+    to the consumers, and hand it to each of them instead of letting every
+    consumer rescan the remote issues.
+    """
+
+    def __init__(self, remote_issues: Mapping[str, SyncIssue]):
+        """Index remote issues.
+
+        Args:
+            remote_issues: Remote issues keyed by remote key
+        """
+        self.remote_issues = remote_issues
+        self._by_backend_id: dict[str, dict[str, SyncIssue]] = {}
+        self._by_id: dict[str, SyncIssue] = {}
+
+        for remote_key, remote_issue in remote_issues.items():
+            if remote_issue.backend_id:
+                self._by_backend_id.setdefault(str(remote_issue.backend_id), {})[
+                    remote_key
+                ] = remote_issue
+            # First issue wins, matching a front-to-back scan
+            self._by_id.setdefault(remote_issue.id, remote_issue)
+
+    def __len__(self) -> int:
+        """Number of indexed remote issues."""
+        return len(self.remote_issues)
+
+    def with_backend_id(
+        self, backend_id: int | str, backend_name: str | None = None
+    ) -> dict[str, SyncIssue]:
+        """Get remote issues carrying a backend ID.
+
+        Args:
+            backend_id: Backend ID (e.g., GitHub issue number)
+            backend_name: Only return issues from this backend, if given
+
+        Returns:
+            Matching issues keyed by remote key (empty if none)
+        """
+        matches = self._by_backend_id.get(str(backend_id), {})
+        if backend_name is None:
+            return dict(matches)
+        return {
+            remote_key: remote_issue
+            for remote_key, remote_issue in matches.items()
+            if remote_issue.backend_name == backend_name
+        }
+
+    def backend_id_groups(self) -> dict[str, list[str]]:
+        """Get remote keys grouped by backend ID, in remote dict order."""
+        return {
+            backend_id: list(issues)
+            for backend_id, issues in self._by_backend_id.items()
+        }
+
+    def get_by_id(self, issue_id: str) -> SyncIssue | None:
+        """Get the first remote issue with a SyncIssue ID."""
+        return self._by_id.get(issue_id)
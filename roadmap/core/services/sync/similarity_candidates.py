@@ -0,0 +1,228 @@
+"""Candidate pair generation for thresholded text similarity.
+
+DuplicateDetector scores local/remote pairs with difflib.SequenceMatcher,
+which costs far too much to run on every pair of a large sync. The
+generators here return only the pairs that can plausibly reach a
+similarity threshold, so SequenceMatcher verifies the survivors alone.
+
+qgram_candidate_pairs is lossless for SequenceMatcher.ratio(): a pair it
+drops provably scores below the threshold, so results match the all-pairs
+scan exactly. It suits short strings such as titles.
+
+minhash_candidate_pairs is a locality-sensitive hash over character
+shingles. It keeps near-duplicates with high probability but is not
+lossless, and suits long text where no useful lossless bound exists.
+"""
+
+import math
+import zlib
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from functools import lru_cache
+
+# MinHash bins hold the minimum 32-bit shingle hash; empty bins keep this
+_EMPTY_BIN = 0xFFFFFFFF
+
+
+def _qgram_tokens(text: str, q: int) -> list[tuple[str, int]]:
+    """Split text into q-grams, numbering repeats so the list acts as a set.
+
+    Args:
+        text: Text to split
+        q: Gram length
+
+    Returns:
+        (gram, occurrence) tokens; the shared token count of two strings is
+        their multiset q-gram overlap
+    """
+    seen: Counter[str] = Counter()
+    tokens = []
+    for start in range(len(text) - q + 1):
+        gram = text[start : start + q]
+        tokens.append((gram, seen[gram]))
+        seen[gram] += 1
+    return tokens
+
+
+@lru_cache(maxsize=4096)
+def _length_window(length: int, threshold: float) -> tuple[int, int]:
+    """Partner lengths that can reach threshold (SequenceMatcher.real_quick_ratio)."""
+    low = math.ceil(length * threshold / (2 - threshold) - 1e-9)
+    high = math.floor(length * (2 - threshold) / threshold + 1e-9)
+    return max(low, 0), high
+
+
+@lru_cache(maxsize=65536)
+def _required_overlap(len_a: int, len_b: int, threshold: float, q: int) -> int:
+    """Minimum shared q-grams for a pair of lengths to reach threshold.
+
+    A ratio of at least threshold needs M >= threshold * (len_a + len_b) / 2
+    matched characters. Each unmatched character of a breaks at most q of
+    its q-grams and each gap opened by an unmatched character of b breaks at
+    most q - 1, so a keeps at least
+    len_a - q + 1 - q * (len_a - M) - (q - 1) * (len_b - M) of its q-grams
+    intact in b; symmetrically for b.
+    """
+    matched = math.ceil(threshold * (len_a + len_b) / 2 - 1e-9)
+    unmatched_a = len_a - matched
+    unmatched_b = len_b - matched
+    return max(
+        len_a - q + 1 - q * unmatched_a - (q - 1) * unmatched_b,
+        len_b - q + 1 - q * unmatched_b - (q - 1) * unmatched_a,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _min_required_overlap(length: int, threshold: float, q: int) -> int:
+    """Smallest required overlap over every partner length in the window."""
+    low, high = _length_window(length, threshold)
+    return min(
+        _required_overlap(length, other, threshold, q) for other in range(low, high + 1)
+    )
+
+
+def qgram_candidate_pairs(
+    left: Sequence[str], right: Sequence[str], threshold: float, q: int = 3
+) -> set[tuple[int, int]]:
+    """Find every pair whose SequenceMatcher ratio can reach threshold.
+
+    Uses prefix filtering: with q-gram tokens ordered rarest first, two
+    strings that must share k tokens share one of their first len - k + 1.
+    Only those prefixes are indexed and probed, and candidates are then
+    checked against the length window and their exact q-gram overlap.
+    Strings too short to bound are compared with every length-compatible
+    partner.
+
+    Args:
+        left: Strings to compare, exactly as they will be scored
+        right: Strings to compare against
+        threshold: Minimum ratio of interest (0.0 to 1.0)
+        q: Gram length
+
+    Returns:
+        (left index, right index) pairs; a superset of the pairs scoring
+        at or above threshold
+    """
+    if threshold <= 0:
+        return {(i, j) for i in range(len(left)) for j in range(len(right))}
+    if threshold > 1 or not left or not right:
+        return set()
+
+    left_tokens = [_qgram_tokens(text, q) for text in left]
+    right_tokens = [_qgram_tokens(text, q) for text in right]
+    frequency: Counter[tuple[str, int]] = Counter()
+    for tokens in left_tokens:
+        frequency.update(tokens)
+    for tokens in right_tokens:
+        frequency.update(tokens)
+
+    def prefix(
+        text: str, tokens: list[tuple[str, int]]
+    ) -> list[tuple[str, int]] | None:
+        required = _min_required_overlap(len(text), threshold, q)
+        if required <= 0:
+            return None
+        tokens = sorted(tokens, key=lambda token: (frequency[token], token))
+        return tokens[: len(tokens) - required + 1]
+
+    index: dict[tuple[str, int], list[int]] = defaultdict(list)
+    unbounded_right: list[int] = []
+    for j, text in enumerate(right):
+        right_prefix = prefix(text, right_tokens[j])
+        if right_prefix is None:
+            unbounded_right.append(j)
+            continue
+        for token in right_prefix:
+            index[token].append(j)
+
+    right_lengths = [len(text) for text in right]
+    right_sets = [set(tokens) for tokens in right_tokens]
+    pairs: set[tuple[int, int]] = set()
+    for i, text in enumerate(left):
+        left_prefix = prefix(text, left_tokens[i])
+        if left_prefix is None:
+            candidates = set(range(len(right)))
+        else:
+            candidates = set(unbounded_right)
+            for token in left_prefix:
+                posting = index.get(token)
+                if posting:
+                    candidates.update(posting)
+
+        len_a = len(text)
+        low, high = _length_window(len_a, threshold)
+        left_set = set(left_tokens[i])
+        for j in candidates:
+            len_b = right_lengths[j]
+            if not low <= len_b <= high:
+                continue
+            required = _required_overlap(len_a, len_b, threshold, q)
+            if required > 0 and len(left_set & right_sets[j]) < required:
+                continue
+            pairs.add((i, j))
+    return pairs
+
+
+def _minhash_signature(text: str, num_bins: int, shingle_size: int) -> list[int]:
+    """One-permutation MinHash of a text's character shingles.
+
+    Each shingle is hashed once with CRC32 (stable across processes) and
+    the hash picks its bin, so a signature costs one pass over the text.
+    """
+    shingles = {
+        text[start : start + shingle_size]
+        for start in range(max(1, len(text) - shingle_size + 1))
+    }
+    signature = [_EMPTY_BIN] * num_bins
+    for shingle in shingles:
+        value = zlib.crc32(shingle.encode("utf-8"))
+        bin_index = value % num_bins
+        if value < signature[bin_index]:
+            signature[bin_index] = value
+    return signature
+
+
+def minhash_candidate_pairs(
+    left: Sequence[str],
+    right: Sequence[str],
+    num_bins: int = 64,
+    band_size: int = 4,
+    shingle_size: int = 5,
+) -> set[tuple[int, int]]:
+    """Find pairs of near-duplicate texts with MinHash LSH banding.
+
+    Two texts become candidates when any band of band_size signature bins
+    agrees. With the defaults, pairs whose shingle sets have a Jaccard
+    similarity of 0.6 are kept about 89% of the time, 0.8 over 99.9%,
+    and unrelated text almost never.
+
+    Args:
+        left: Texts to compare; empty texts are never candidates
+        right: Texts to compare against
+        num_bins: Signature length (a multiple of band_size)
+        band_size: Bins per LSH band
+        shingle_size: Character shingle length
+
+    Returns:
+        (left index, right index) pairs worth verifying
+    """
+    bands = num_bins // band_size
+    buckets: dict[tuple[int, ...], list[int]] = defaultdict(list)
+    for j, text in enumerate(right):
+        if not text:
+            continue
+        signature = _minhash_signature(text, num_bins, shingle_size)
+        for band in range(bands):
+            start = band * band_size
+            buckets[(band, *signature[start : start + band_size])].append(j)
+
+    pairs: set[tuple[int, int]] = set()
+    for i, text in enumerate(left):
+        if not text:
+            continue
+        signature = _minhash_signature(text, num_bins, shingle_size)
+        for band in range(bands):
+            start = band * band_size
+            for j in buckets.get((band, *signature[start : start + band_size]), ()):
+                pairs.add((i, j))
+    return pairs
@@ -0,0 +1,80 @@
+"""Normalized records of the synced fields of baseline, local and remote issues.
+
+Three-way analysis diffs every synced field of every issue against its
+baseline on each sync, long markdown bodies included. A SyncRecord holds
+exactly the values the change computers compare, normalized the same way,
+so an issue whose local and remote records both equal its baseline record
+can be reported unchanged with a single comparison per side.
+
+Records compare the values themselves rather than hashes of them: string
+equality is far cheaper than hashing, and equal records imply that the
+field-level comparison would find no change.
+"""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+from roadmap.core.services.sync.sync_change_computer import _convert_enum_field
+
+
+class SyncRecord(NamedTuple):
+    """Synced field values as compute_changes / compute_changes_remote see them."""
+
+    status: Any
+    assignee: Any
+    content: Any
+    labels: Any
+
+
+def baseline_record(baseline: Any) -> SyncRecord | None:
+    """Build the record of a baseline state.
+
+    Returns:
+        SyncRecord, or None if the values cannot be read
+    """
+    try:
+        return SyncRecord(
+            getattr(baseline, "status", None),
+            getattr(baseline, "assignee", None),
+            getattr(baseline, "content", None),
+            getattr(baseline, "labels", None),
+        )
+    except Exception:
+        return None
+
+
+def local_record(local: Any) -> SyncRecord | None:
+    """Build the record of a local issue.
+
+    Returns:
+        SyncRecord, or None if the values cannot be normalized
+    """
+    try:
+        status = local.status
+        return SyncRecord(
+            status.value if hasattr(status, "value") else str(status),
+            local.assignee,
+            local.content,
+            sorted(local.labels or []),
+        )
+    except Exception:
+        return None
+
+
+def remote_record(remote_state: dict[str, Any]) -> SyncRecord | None:
+    """Build the record of a normalized remote state.
+
+    Returns:
+        SyncRecord, or None if the values cannot be normalized
+    """
+    try:
+        labels = remote_state.get("labels", [])
+        return SyncRecord(
+            _convert_enum_field("status", remote_state.get("status")),
+            remote_state.get("assignee"),
+            remote_state.get("content") or remote_state.get("description") or "",
+            sorted(labels) if labels else [],
+        )
+    except Exception:
+        return None
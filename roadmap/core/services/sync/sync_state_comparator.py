@@ -26,6 +26,14 @@ from roadmap.core.services.sync.sync_conflict_resolver import Conflict, Conflict
 from roadmap.core.services.sync.sync_key_normalizer import (
     normalize_remote_keys as _normalize_remote_keys_helper,
 )
+from roadmap.core.services.sync.sync_record import (
+    SyncRecord,
+    local_record,
+    remote_record,
+)
+from roadmap.core.services.sync.sync_record import (
+    baseline_record as _baseline_record,
+)
 from roadmap.core.services.sync.sync_report import IssueChange
 from roadmap.core.services.sync.sync_state import IssueBaseState
 from roadmap.core.services.sync.sync_state_normalizer import (
@@ -37,6 +45,9 @@ from roadmap.core.services.sync.sync_state_normalizer import (
 from roadmap.core.services.sync.sync_three_way import (
     build_issue_change as _build_issue_change_helper,
 )
+from roadmap.core.services.sync.sync_three_way import (
+    build_unchanged_issue_change as _build_unchanged_issue_change_helper,
+)
 
 logger = get_logger()
 
@@ -591,6 +602,39 @@ class SyncStateComparator:
             logger=self.logger,
         )
 
+    def _build_unchanged_issue_change(
+        self,
+        issue_id: str,
+        local: Issue | None,
+        remote: Any | None,
+        baseline: IssueBaseState | None,
+        baseline_record: SyncRecord | None,
+    ) -> IssueChange | None:
+        """Build a no-change IssueChange if both sides still match the baseline.
+
+        Compares whole sync records only; returns None when any side is
+        missing or differs, leaving the issue to the field-level analysis.
+        """
+        if local is None or remote is None or baseline_record is None:
+            return None
+
+        if local_record(local) != baseline_record:
+            return None
+
+        remote_state = self._normalize_remote_state(remote)
+        if remote_state is None or remote_record(remote_state) != baseline_record:
+            return None
+
+        return _build_unchanged_issue_change_helper(
+            issue_id,
+            local,
+            remote,
+            remote_state,
+            baseline,  # type: ignore[arg-type]
+            resolve_title=self._resolve_issue_title,
+            extract_timestamp=self._extract_timestamp,
+        )
+
     def analyze_three_way(
         self,
         local: dict[str, Issue],
@@ -601,6 +645,8 @@ class SyncStateComparator:
 
         Compares baseline → local and baseline → remote to identify
         what changed in each direction, providing complete conflict context.
+        Issues whose local and remote sync records both equal the baseline
+        record are reported as unchanged without field-level diffs.
 
         Args:
             local: Dict of local issues keyed by ID
@@ -627,17 +673,33 @@ class SyncStateComparator:
         # Normalize remote keys to match local UUIDs (if backend aware)
         local, remote = self._normalize_remote_keys(local, remote)
 
+        # Build each baseline record once; local and remote ones are built per issue
+        baseline_records = {
+            issue_id: _baseline_record(state) for issue_id, state in baseline.items()
+        }
+
         changes = []
+        unchanged_count = 0
         all_issue_ids = set(local.keys()) | set(remote.keys())
 
         for issue_id in all_issue_ids:
             try:
-                change = self._build_issue_change(
+                local_issue = local.get(issue_id)
+                remote_issue = remote.get(issue_id)
+                base_state = baseline.get(issue_id)
+                change = self._build_unchanged_issue_change(
                     issue_id,
-                    local.get(issue_id),
-                    remote.get(issue_id),
-                    baseline.get(issue_id) if baseline else None,
+                    local_issue,
+                    remote_issue,
+                    base_state,
+                    baseline_records.get(issue_id),
                 )
+                if change is not None:
+                    unchanged_count += 1
+                else:
+                    change = self._build_issue_change(
+                        issue_id, local_issue, remote_issue, base_state
+                    )
                 changes.append(change)
                 self.logger.debug(
                     "three_way_analysis_complete",
@@ -654,7 +716,11 @@ class SyncStateComparator:
                     f"Failed to analyze {issue_id} in three-way merge: {str(e)}"
                 ) from e
 
-        self.logger.info("analyze_three_way_complete", change_count=len(changes))
+        self.logger.info(
+            "analyze_three_way_complete",
+            change_count=len(changes),
+            record_unchanged_count=unchanged_count,
+        )
         return changes
 
     def _compute_changes(
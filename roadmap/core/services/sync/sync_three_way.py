@@ -68,11 +68,45 @@ def build_issue_change(
         else:
             change.conflict_type = "no_change"
 
-    last_sync = None
-    if baseline is not None and getattr(baseline, "updated_at", None):
-        last_sync = baseline.updated_at
-    elif remote is not None:
-        last_sync = extract_timestamp(remote, "updated_at")
-    change.last_sync_time = last_sync
+    change.last_sync_time = _last_sync_time(baseline, remote, extract_timestamp)
 
     return change
+
+
+def build_unchanged_issue_change(
+    issue_id: str,
+    local: Any,
+    remote: Any,
+    remote_state: dict[str, Any],
+    baseline: IssueBaseState,
+    *,
+    resolve_title: Callable[[str, Any, Any, Any], str],
+    extract_timestamp: Callable[[Any, str], Any],
+) -> IssueChange:
+    """Construct a no-change IssueChange without field-level comparison.
+
+    For issues whose local and remote sync records both equal the
+    baseline's; the result matches what build_issue_change reports for
+    such an issue.
+    """
+    change = IssueChange(
+        issue_id=issue_id, title=resolve_title(issue_id, local, remote, baseline)
+    )
+    change.baseline_state = baseline
+    change.local_state = local
+    change.remote_state = remote_state
+    change.conflict_type = "no_change"
+    change.last_sync_time = _last_sync_time(baseline, remote, extract_timestamp)
+    return change
+
+
+def _last_sync_time(
+    baseline: IssueBaseState | None,
+    remote: Any | None,
+    extract_timestamp: Callable[[Any, str], Any],
+) -> Any:
+    if baseline is not None and getattr(baseline, "updated_at", None):
+        return baseline.updated_at
+    if remote is not None:
+        return extract_timestamp(remote, "updated_at")
+    return None
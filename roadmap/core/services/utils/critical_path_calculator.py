@@ -1,13 +1,26 @@
 """Critical path analysis for issue dependencies.
 
-Calculates which issues are on the critical path and impact project timeline.
+Calculates which issues are on the critical path and impact project timeline
+using the critical path method (CPM): a forward pass over the issues in
+topological order (Kahn's algorithm over Issue.depends_on) gives earliest
+start/finish times, a backward pass gives latest start/finish times, and
+issues with zero slack form the duration-weighted critical path. Everything
+runs in O(V + E). Issues caught in dependency cycles cannot be scheduled;
+the cycles are reported in the result.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 
 from roadmap.core.domain.issue import Issue
 from roadmap.core.domain.milestone import Milestone
+from roadmap.core.services.utils.graph_components import (
+    strongly_connected_components,
+)
+
+# Slack at or below this many hours counts as zero (float rounding)
+_SLACK_TOLERANCE = 1e-9
 
 
 @dataclass
@@ -22,6 +35,11 @@ class PathNode:
     end_date: datetime | None = None
     slack_time: float = 0.0  # Time available before blocking other tasks
     is_critical: bool = False
+    # Schedule offsets in hours from project start
+    earliest_start: float = 0.0
+    earliest_finish: float = 0.0
+    latest_start: float = 0.0
+    latest_finish: float = 0.0
 
 
 @dataclass
@@ -34,6 +52,8 @@ class CriticalPathResult:
     blocking_issues: dict[str, list[str]]  # issue_id -> list of blocked issue_ids
     project_end_date: datetime | None = None
     issues_by_criticality: dict[str, list[str]] = field(default_factory=dict)
+    dependency_cycles: list[list[str]] = field(default_factory=list)
+    schedule: dict[str, PathNode] = field(default_factory=dict)  # every issue
 
 
 class CriticalPathCalculator:
@@ -65,21 +85,27 @@ class CriticalPathCalculator:
 
         # Build dependency graph
         graph = self._build_dependency_graph(issues)
+        nodes = self._create_nodes(issues, graph)
+
+        # Order issues so every issue follows its dependencies
+        order, dependents = self._topological_order(nodes)
+        cycles = (
+            self._find_dependency_cycles(nodes, order)
+            if len(order) < len(nodes)
+            else []
+        )
 
-        # Calculate earliest start/end dates
-        node_data = self._calculate_schedule(issues, graph)
+        # Earliest/latest start and finish, slack
+        self._calculate_schedule(nodes, order, dependents)
 
         # Find critical path
-        critical_path = self._find_critical_path(node_data, graph)
+        critical_path = self._find_critical_path(nodes, order)
 
         # Analyze blocking relationships
         blocking_issues = self._analyze_blocking(issues)
 
-        # Calculate slack time
-        self._calculate_slack(node_data, critical_path)
-
         # Determine project end date
-        project_end_date = self._calculate_project_end_date(node_data, milestone)
+        project_end_date = self._calculate_project_end_date(nodes, milestone)
 
         return CriticalPathResult(
             critical_path=critical_path,
@@ -88,6 +114,8 @@ class CriticalPathCalculator:
             blocking_issues=blocking_issues,
             project_end_date=project_end_date,
             issues_by_criticality=self._group_by_criticality(issues, critical_path),
+            dependency_cycles=cycles,
+            schedule=nodes,
         )
 
     def _build_dependency_graph(self, issues: list[Issue]) -> dict[str, list[str]]:
@@ -102,10 +130,10 @@ class CriticalPathCalculator:
         graph = {issue.id: issue.depends_on or [] for issue in issues}
         return graph
 
-    def _calculate_schedule(
+    def _create_nodes(
         self, issues: list[Issue], graph: dict[str, list[str]]
     ) -> dict[str, PathNode]:
-        """Calculate earliest start and end times.
+        """Create a schedule node per issue.
 
         Args:
             issues: List of issues
@@ -114,140 +142,177 @@ class CriticalPathCalculator:
         Returns:
             Dictionary mapping issue_id to PathNode
         """
-        nodes = {}
-        for issue in issues:
-            duration = self._estimate_duration(issue)
-            nodes[issue.id] = PathNode(
+        return {
+            issue.id: PathNode(
                 issue_id=issue.id,
                 issue_title=issue.title,
-                duration_hours=duration,
+                duration_hours=self._estimate_duration(issue),
                 dependencies=graph.get(issue.id, []),
             )
+            for issue in issues
+        }
 
-        # Calculate earliest start/end times using topological sort
-        start_times = {}
-        visiting = set()  # Track nodes currently being processed to detect cycles
-
-        def calculate_start_time(issue_id: str) -> float:
-            if issue_id in start_times:
-                return start_times[issue_id]
-
-            # Detect circular dependencies
-            if issue_id in visiting:
-                # Return 0 for circular refs (they shouldn't exist, but graceful fallback)
-                return 0.0
-
-            visiting.add(issue_id)
-
-            try:
-                dependencies = graph.get(issue_id, [])
-                if not dependencies:
-                    start_times[issue_id] = 0.0
-                    return 0.0
-
-                # Max end time of all dependencies
-                max_end_time = 0.0
-                for dep_id in dependencies:
-                    if dep_id in nodes:
-                        dep_start = calculate_start_time(dep_id)
-                        dep_duration = nodes[dep_id].duration_hours
-                        max_end_time = max(max_end_time, dep_start + dep_duration)
-
-                start_times[issue_id] = max_end_time
-                return max_end_time
-            finally:
-                visiting.discard(issue_id)
-
-        # Calculate all start times
-        for issue_id in nodes:
-            start_time = calculate_start_time(issue_id)
-            nodes[issue_id].start_date = datetime.now(UTC) + timedelta(hours=start_time)
-            nodes[issue_id].end_date = datetime.now(UTC) + timedelta(
-                hours=start_time + nodes[issue_id].duration_hours
-            )
+    def _topological_order(
+        self, nodes: dict[str, PathNode]
+    ) -> tuple[list[str], dict[str, list[str]]]:
+        """Order issues after their dependencies with Kahn's algorithm.
 
-        return nodes
+        Dependencies on issues outside the analyzed set are ignored.
 
-    def _find_critical_path(
-        self, nodes: dict[str, PathNode], graph: dict[str, list[str]]
-    ) -> list[PathNode]:
-        """Find the critical path (longest duration path through dependencies).
+        Args:
+            nodes: Dictionary of nodes
+
+        Returns:
+            Tuple of (topological order, issue_id -> dependent issue_ids).
+            Issues in or behind a dependency cycle are left out of the order.
+        """
+        dependents: dict[str, list[str]] = {issue_id: [] for issue_id in nodes}
+        pending = dict.fromkeys(nodes, 0)
+        for issue_id, node in nodes.items():
+            for dep_id in node.dependencies:
+                if dep_id in nodes:
+                    dependents[dep_id].append(issue_id)
+                    pending[issue_id] += 1
+
+        ready = deque(issue_id for issue_id, count in pending.items() if count == 0)
+        order = []
+        while ready:
+            issue_id = ready.popleft()
+            order.append(issue_id)
+            for dependent_id in dependents[issue_id]:
+                pending[dependent_id] -= 1
+                if pending[dependent_id] == 0:
+                    ready.append(dependent_id)
+
+        return order, dependents
+
+    def _find_dependency_cycles(
+        self, nodes: dict[str, PathNode], order: list[str]
+    ) -> list[list[str]]:
+        """Find the dependency cycles among issues Kahn's algorithm left over.
+
+        Uses Tarjan's strongly connected components over the leftover issues;
+        issues that merely depend on a cycle are not reported as cycles.
 
         Args:
-            nodes: Dictionary of nodes with schedule info
-            graph: Dependency graph
+            nodes: Dictionary of nodes
+            order: Topological order of the schedulable issues
 
         Returns:
-            List of PathNode objects on critical path, ordered by dependency
+            One list of issue IDs per cycle
         """
-        if not nodes:
-            return []
+        ordered = set(order)
+        remaining = [issue_id for issue_id in nodes if issue_id not in ordered]
+        remaining_set = set(remaining)
 
-        # Find leaf nodes (no blocks)
-        leaf_nodes = [
-            issue_id
-            for issue_id, _ in nodes.items()
-            if not any(issue_id in graph.get(other_id, []) for other_id in nodes)
+        graph = {
+            issue_id: [d for d in nodes[issue_id].dependencies if d in remaining_set]
+            for issue_id in remaining
+        }
+        return [
+            component
+            for component in strongly_connected_components(graph)
+            if len(component) > 1 or component[0] in graph[component[0]]
         ]
 
-        if not leaf_nodes:
-            # If no clear leaf, use nodes with latest end dates
-            leaf_nodes = sorted(
-                nodes.keys(),
-                key=lambda x: nodes[x].end_date or datetime.now(UTC),
-                reverse=True,
-            )[:1]
-
-        # Trace back from leaf nodes to find longest path
-        critical_paths = []
+    def _calculate_schedule(
+        self,
+        nodes: dict[str, PathNode],
+        order: list[str],
+        dependents: dict[str, list[str]],
+    ) -> None:
+        """Run the CPM forward and backward passes.
 
-        for leaf_id in leaf_nodes:
-            path = self._trace_path_backward(leaf_id, nodes, graph)
-            critical_paths.append(path)
+        Sets earliest/latest start and finish, slack, criticality and
+        calendar dates on every node. Issues outside the topological order
+        (cycles) start after their schedulable dependencies and are never
+        critical.
 
-        # Return longest path
-        critical_path = max(critical_paths, key=lambda p: len(p), default=[])
+        Args:
+            nodes: Dictionary of nodes
+            order: Topological order of the schedulable issues
+            dependents: issue_id -> dependent issue_ids
+        """
+        scheduled = set(order)
+        unscheduled = [issue_id for issue_id in nodes if issue_id not in scheduled]
+
+        # Forward pass: earliest start is the latest dependency finish
+        for issue_id in order + unscheduled:
+            node = nodes[issue_id]
+            node.earliest_start = max(
+                (
+                    nodes[dep_id].earliest_finish
+                    for dep_id in node.dependencies
+                    if dep_id in scheduled
+                ),
+                default=0.0,
+            )
+            node.earliest_finish = node.earliest_start + node.duration_hours
+            node.latest_start = node.earliest_start
+            node.latest_finish = node.earliest_finish
 
-        # Mark critical nodes
-        for node in critical_path:
-            node.is_critical = True
+        # Backward pass: latest finish is the earliest dependent latest start
+        project_duration = max(
+            (nodes[issue_id].earliest_finish for issue_id in order), default=0.0
+        )
+        for issue_id in reversed(order):
+            node = nodes[issue_id]
+            node.latest_finish = min(
+                (
+                    nodes[dependent_id].latest_start
+                    for dependent_id in dependents[issue_id]
+                    if dependent_id in scheduled
+                ),
+                default=project_duration,
+            )
+            node.latest_start = node.latest_finish - node.duration_hours
+            node.slack_time = max(0.0, node.latest_start - node.earliest_start)
+            node.is_critical = node.slack_time <= _SLACK_TOLERANCE
 
-        return critical_path
+        now = datetime.now(UTC)
+        for node in nodes.values():
+            node.start_date = now + timedelta(hours=node.earliest_start)
+            node.end_date = now + timedelta(hours=node.earliest_finish)
 
-    def _trace_path_backward(
-        self, issue_id: str, nodes: dict[str, PathNode], graph: dict[str, list[str]]
+    def _find_critical_path(
+        self, nodes: dict[str, PathNode], order: list[str]
     ) -> list[PathNode]:
-        """Trace path backward from a node to root dependencies.
+        """Find the critical path (longest duration path through dependencies).
+
+        Starts at the issue that finishes last and follows zero-slack
+        dependencies whose finish is exactly the current issue's start.
 
         Args:
-            issue_id: Starting issue ID
-            nodes: Node dictionary
-            graph: Dependency graph
+            nodes: Dictionary of nodes with schedule info
+            order: Topological order of the schedulable issues
 
         Returns:
-            List of nodes in dependency chain
+            List of PathNode objects on critical path, ordered by dependency
         """
-        path = []
-        current_id = issue_id
-        visited = set()  # Track visited nodes to prevent infinite loops
-
-        while current_id in nodes:
-            # Detect circular dependencies
-            if current_id in visited:
-                break
-
-            visited.add(current_id)
-            path.append(nodes[current_id])
-            dependencies = graph.get(current_id, [])
-
-            if not dependencies:
-                break
+        if not order:
+            return []
 
-            # Follow the dependency with longest duration
-            current_id = max(
-                dependencies,
-                key=lambda d: nodes.get(d, PathNode("", "", 0)).duration_hours,
+        current = max(
+            (nodes[issue_id] for issue_id in order),
+            key=lambda node: node.earliest_finish,
+        )
+        path = [current]
+        while current.earliest_start > _SLACK_TOLERANCE:
+            predecessor = next(
+                (
+                    nodes[dep_id]
+                    for dep_id in current.dependencies
+                    if dep_id in nodes
+                    and nodes[dep_id].is_critical
+                    and abs(nodes[dep_id].earliest_finish - current.earliest_start)
+                    <= _SLACK_TOLERANCE
+                ),
+                None,
             )
+            if predecessor is None:
+                break
+            path.append(predecessor)
+            current = predecessor
 
         return list(reversed(path))
 
@@ -265,28 +330,6 @@ class CriticalPathCalculator:
 
         return float(issue.estimated_hours)
 
-    def _calculate_slack(
-        self, nodes: dict[str, PathNode], critical_path: list[PathNode]
-    ) -> None:
-        """Calculate slack time for non-critical paths.
-
-        Args:
-            nodes: Dictionary of all nodes
-            critical_path: List of critical path nodes
-        """
-        # Critical path nodes have no slack
-        critical_ids = {node.issue_id for node in critical_path}
-
-        if critical_path:
-            max_end_time = max(
-                (node.end_date or datetime.now(UTC)) for node in critical_path
-            )
-
-            for node_id, node in nodes.items():
-                if node_id not in critical_ids and node.end_date:
-                    slack_hours = (max_end_time - node.end_date).total_seconds() / 3600
-                    node.slack_time = max(0.0, slack_hours)
-
     def _calculate_project_end_date(
         self,
         nodes: dict[str, PathNode],
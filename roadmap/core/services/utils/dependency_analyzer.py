@@ -17,6 +17,9 @@ from roadmap.common.logging.error_logging import (
 )
 from roadmap.common.observability.instrumentation import traced
 from roadmap.core.domain.issue import Issue
+from roadmap.core.services.utils.graph_components import (
+    strongly_connected_components,
+)
 
 logger = get_logger(__name__)
 
@@ -104,6 +107,10 @@ class DependencyAnalyzer:
         """Initialize the analyzer."""
         self._issue_map: dict[str, Issue] = {}
         self._analyzed = False
+        # Adjacency over existing issues, built once per analyzed issue set
+        self._depends_graph: dict[str, list[str]] = {}
+        self._blocks_graph: dict[str, list[str]] = {}
+        self._chain_depths: dict[str, int] = {}
 
     @traced("analyze_dependencies")
     def analyze(self, issues: list[Issue]) -> DependencyAnalysisResult:
@@ -117,6 +124,7 @@ class DependencyAnalyzer:
         """
         try:
             self._issue_map = {issue.id: issue for issue in issues}
+            self._build_graphs()
             self._analyzed = True
 
             result = DependencyAnalysisResult(
@@ -127,10 +135,16 @@ class DependencyAnalyzer:
                 issues_with_problems=0,
             )
 
+            # Cycles and chain depths for all issues in one pass
+            cycles = self._find_cycles()
+
             # Check all issues
             for issue in issues:
                 self._check_issue_dependencies(issue, result)
 
+            for cycle in cycles:
+                self._add_circular_problems(cycle, result)
+
             result.issues_with_problems = len({p.issue_id for p in result.problems})
 
             return result
@@ -224,7 +238,7 @@ class DependencyAnalyzer:
 
         # Check for deep chains
         if issue.depends_on:
-            max_depth = self._find_max_chain_depth(issue.id, set(), 0)
+            max_depth = self._chain_depths.get(issue.id, 0)
             if max_depth > 5:
                 result.problems.append(
                     DependencyIssue(
@@ -236,92 +250,99 @@ class DependencyAnalyzer:
                     )
                 )
 
-        # Check for circular dependencies
-        if issue.depends_on:
-            for dep_id in issue.depends_on:
-                cycle = self._find_cycle_from(dep_id, issue.id, set())
-                if cycle:
-                    # Convert set to sorted list for consistent output
-                    cycle_list = sorted(list(cycle) + [issue.id])
-                    if cycle_list not in result.circular_chains:
-                        result.circular_chains.append(cycle_list)
-                        result.problems.append(
-                            DependencyIssue(
-                                issue_id=issue.id,
-                                issue_type=DependencyIssueType.CIRCULAR,
-                                message=f"Circular dependency detected: {' → '.join(cycle_list)} → {issue.id}",
-                                affected_issues=cycle_list,
-                            )
-                        )
-
-    def _find_cycle_from(
-        self, current_id: str, target_id: str, visited: set[str]
-    ) -> set[str] | None:
-        """Find if there's a path from current_id back to target_id.
+    def _add_circular_problems(
+        self, members: list[str], result: DependencyAnalysisResult
+    ):
+        """Record one dependency cycle and a problem for each issue in it.
 
         Args:
-            current_id: ID to start searching from
-            target_id: ID we're trying to reach (forming a cycle)
-            visited: IDs already visited in this search
-
-        Returns:
-            Set of IDs in the cycle if found, None otherwise
+            members: Sorted IDs of the issues forming the cycle
+            result: Result to add the cycle and problems to
         """
-        if current_id not in self._issue_map:
-            return None
-
-        if current_id in visited:
-            return None  # Already visited this node, not our cycle
-
-        if current_id == target_id:
-            return {current_id}  # Found the cycle!
-
-        visited.add(current_id)
-        issue = self._issue_map[current_id]
+        path = self._cycle_path(members)
+        result.circular_chains.append(members)
+        for issue_id in members:
+            result.problems.append(
+                DependencyIssue(
+                    issue_id=issue_id,
+                    issue_type=DependencyIssueType.CIRCULAR,
+                    message=f"Circular dependency detected: {' → '.join(path)} → {path[0]}",
+                    affected_issues=members,
+                )
+            )
 
-        # Check all issues this one depends on
-        for dep_id in issue.depends_on or []:
-            result = self._find_cycle_from(dep_id, target_id, visited.copy())
-            if result:
-                result.add(current_id)
-                return result
+    def _build_graphs(self):
+        """Build the depends_on and blocks adjacency over existing issues.
 
-        return None
+        References to issues outside the set are dropped here; they are
+        reported as broken dependencies or orphaned blockers instead.
+        """
+        issue_map = self._issue_map
+        self._depends_graph = {
+            issue_id: [d for d in issue.depends_on or [] if d in issue_map]
+            for issue_id, issue in issue_map.items()
+        }
+        self._blocks_graph = {
+            issue_id: [b for b in issue.blocks or [] if b in issue_map]
+            for issue_id, issue in issue_map.items()
+        }
+        self._chain_depths = {}
+
+    def _find_cycles(self) -> list[list[str]]:
+        """Find every dependency cycle and the chain depth of every issue.
+
+        Takes the strongly connected components of the depends_on graph.
+        They come out dependencies-first, so each component's chain depth is
+        computed from already finished ones and memoized in
+        self._chain_depths. A component counts as one level of
+        the chain; a dependency on a missing issue counts as one level too.
 
-    def _find_max_chain_depth(
-        self, current_id: str, visited: set[str], depth: int
-    ) -> int:
-        """Find the maximum dependency chain depth from current issue.
+        Returns:
+            Sorted issue IDs of each component with more than one issue
+        """
+        depths = self._chain_depths
+        cycles: list[list[str]] = []
+
+        for members in strongly_connected_components(self._depends_graph):
+            component = set(members)
+            depth = self._component_depth(component)
+            for member in component:
+                depths[member] = depth
+            if len(component) > 1:
+                cycles.append(sorted(component))
+
+        return cycles
+
+    def _component_depth(self, component: set[str]) -> int:
+        """Chain depth of a component whose dependencies are all finished."""
+        depth = 0
+        for member in component:
+            issue = self._issue_map[member]
+            for dep_id in issue.depends_on or []:
+                if dep_id in component or dep_id not in self._issue_map:
+                    depth = max(depth, 1)
+                else:
+                    depth = max(depth, 1 + self._chain_depths[dep_id])
+        return depth
+
+    def _cycle_path(self, members: list[str]) -> list[str]:
+        """Walk depends_on inside a component until it loops back.
 
         Args:
-            current_id: Issue ID to start from
-            visited: Set of visited IDs (to avoid infinite loops)
-            depth: Current depth in the chain
+            members: Sorted IDs of a strongly connected component
 
         Returns:
-            Maximum chain depth found
+            Issue IDs of one concrete cycle, in dependency order
         """
-        if current_id not in self._issue_map:
-            return depth
-
-        if current_id in visited:
-            return depth  # Cycle detected, return current depth
-
-        visited.add(current_id)
-        issue = self._issue_map[current_id]
-
-        if not issue.depends_on:
-            return depth  # No further dependencies
-
-        # Find the maximum depth through any dependency
-        max_depth = depth
-        for dep_id in issue.depends_on:
-            depth_through_dep = self._find_max_chain_depth(
-                dep_id, visited.copy(), depth + 1
-            )
-            max_depth = max(max_depth, depth_through_dep)
-
-        return max_depth
+        in_component = set(members)
+        positions: dict[str, int] = {}
+        path: list[str] = []
+        current = members[0]
+        while current not in positions:
+            positions[current] = len(path)
+            path.append(current)
+            current = next(d for d in self._depends_graph[current] if d in in_component)
+        return path[positions[current] :]
 
     @traced("get_issues_affecting")
     def get_issues_affecting(self, issue_id: str) -> list[str]:
@@ -333,27 +354,15 @@ class DependencyAnalyzer:
         Returns:
             List of issue IDs that would be affected if this issue changes
         """
-        if issue_id not in self._issue_map:
+        if not self._analyzed or issue_id not in self._issue_map:
             return []
 
-        affected = set()
-        self._collect_affected(issue_id, affected)
+        # Issues this one blocks are affected, and so on down the chain
+        affected: set[str] = set()
+        pending = [issue_id]
+        while pending:
+            for blocked_id in self._blocks_graph[pending.pop()]:
+                if blocked_id not in affected:
+                    affected.add(blocked_id)
+                    pending.append(blocked_id)
         return sorted(affected)
-
-    def _collect_affected(self, issue_id: str, affected: set[str]):
-        """Recursively collect all issues affected by this one.
-
-        An issue is affected if this one blocks it (directly or indirectly).
-        """
-        if not self._analyzed:
-            return
-
-        # Find all issues that depend on this one (it affects them)
-        if issue_id in self._issue_map:
-            issue = self._issue_map[issue_id]
-            for blocked_id in issue.blocks or []:
-                if blocked_id in self._issue_map:
-                    if blocked_id not in affected:
-                        affected.add(blocked_id)
-                        # Recursively get issues affected by the blocked issue
-                        self._collect_affected(blocked_id, affected)
@@ -0,0 +1,62 @@
+"""Strongly connected components of issue dependency graphs."""
+
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+
+
+def strongly_connected_components[T: Hashable](
+    graph: Mapping[T, Iterable[T]],
+) -> Iterator[list[T]]:
+    """Yield the strongly connected components of a directed graph.
+
+    Runs an iterative version of Tarjan's algorithm, so deep dependency
+    chains do not hit the recursion limit. Components are yielded in reverse
+    topological order: a component comes after every component it has an
+    edge to, so with edges pointing at dependencies, dependencies come first.
+
+    Args:
+        graph: Adjacency mapping; every edge target must be a key
+
+    Yields:
+        The nodes of each component, starting from the node it was reached by
+    """
+    index: dict[T, int] = {}
+    low: dict[T, int] = {}
+    stack: list[T] = []
+    on_stack: set[T] = set()
+
+    for root in graph:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            node, edges = work[-1]
+            for target in edges:
+                if target not in index:
+                    index[target] = low[target] = len(index)
+                    stack.append(target)
+                    on_stack.add(target)
+                    work.append((target, iter(graph[target])))
+                    break
+                if target in on_stack:
+                    low[node] = min(low[node], index[target])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] != index[node]:
+                    continue
+
+                component: list[T] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                component.reverse()
+                yield component
@@ -19,9 +19,13 @@ This design:
 - Scales well for future features
 """
 
+import functools
+from collections.abc import Callable
+from functools import cached_property
 from pathlib import Path
 
 from roadmap.common.logging import get_logger
+from roadmap.common.services.profiling import get_profiler
 from roadmap.common.utils.path_utils import build_roadmap_paths
 from roadmap.core.services import (
     ConfigurationService,
@@ -51,6 +55,30 @@ from roadmap.infrastructure.git.git_integration_ops import GitIntegrationOps
 logger = get_logger(__name__)
 
 
+def _component[T](build: Callable[["RoadmapCore"], T]) -> cached_property[T]:
+    """Build a RoadmapCore component on first access and cache it.
+
+    The first build of each component is recorded in the session profiler
+    as ``core.<name>``, which shows what a command spent on construction.
+    Assigning the attribute (e.g. a mock in tests) replaces the component.
+    """
+    operation = f"core.{build.__name__.lstrip('_')}"
+
+    @functools.wraps(build)
+    def timed_build(self: "RoadmapCore") -> T:
+        profiler = get_profiler()
+        profiler.start_operation(operation)
+        try:
+            component = build(self)
+        except Exception:
+            profiler.end_operation(operation, error=True)
+            raise
+        profiler.end_operation(operation)
+        return component
+
+    return cached_property(timed_build)
+
+
 class RoadmapCore:
     """Lightweight service container and coordinator of domain coordinators.
 
@@ -71,7 +99,7 @@ class RoadmapCore:
     def __init__(
         self, root_path: Path | None = None, roadmap_dir_name: str = ".roadmap"
     ):
-        """Initialize RoadmapCore with service setup and coordinators.
+        """Initialize RoadmapCore paths; services and coordinators are lazy.
 
         Args:
             root_path: Root path for the roadmap (defaults to cwd)
@@ -91,90 +119,128 @@ class RoadmapCore:
         self.config_file = paths["config_file"]
         self.db_dir = paths["db_dir"]
 
-        # Initialize core infrastructure
-        self._git = CoordinationGateway.get_git_integration()
-        self._git.root_path = self.root_path
+        # Keep reference to init manager for setup (needed before creating coordinators)
+        self._init_manager = InitializationManager(
+            self.root_path, self.roadmap_dir_name
+        )
 
-        # Initialize StateManager with correct project-local database path
-        db_path = self.db_dir / "state.db"
-        self.db = CoordinationGateway.get_state_manager(db_path=db_path)
+        # Infrastructure, services and coordinators are built on first access
+        # (see _component), so a command only pays for the pieces it touches.
 
-        # Initialize GitSyncMonitor with StateManager for database sync
-        self.git_sync_monitor = CoordinationGateway.get_git_sync_monitor()
-        self.git_sync_monitor.repo_path = self.root_path
-        self.git_sync_monitor.state_manager = self.db
+    # ========== LAZILY BUILT COMPONENTS ==========
 
-        # Initialize remote links from YAML (Phase 3)
-        try:
-            self.db.initialize_remote_links(self.root_path)
-        except Exception as e:
-            from roadmap.common.logging import get_logger
+    @_component
+    def _git(self):
+        """Git integration for the roadmap root."""
+        git = CoordinationGateway.get_git_integration()
+        git.root_path = self.root_path
+        return git
 
-            logger = get_logger(__name__)
-            logger.warning(
-                "failed_to_initialize_remote_links_in_core",
-                error=str(e),
-                severity="operational",
-            )
+    @_component
+    def db(self):
+        """StateManager on the project-local database, wired to GitSyncMonitor."""
+        db = CoordinationGateway.get_state_manager(db_path=self.db_dir / "state.db")
 
         # Wire GitSyncMonitor into StateManager for transparent cache sync
-        self.db._git_sync_monitor = self.git_sync_monitor
-
-        self.github_service = GitHubIntegrationService(
+        git_sync_monitor = CoordinationGateway.get_git_sync_monitor()
+        git_sync_monitor.repo_path = self.root_path
+        git_sync_monitor.state_manager = db
+        db._git_sync_monitor = git_sync_monitor
+
+        # Remote links are loaded from YAML on first use of db.remote_links
+        db.defer_remote_links_initialization(self.root_path)
+        return db
+
+    @_component
+    def git_sync_monitor(self):
+        """GitSyncMonitor keeping the database in sync with git changes."""
+        return self.db._git_sync_monitor
+
+    @_component
+    def github_service(self):
+        """GitHub integration service."""
+        return GitHubIntegrationService(
             root_path=self.root_path, config_file=self.config_file
         )
-        self.config_service = ConfigurationService()
 
-        # Initialize repositories (abstraction layer)
-        issue_repository = CoordinationGateway.get_yaml_issue_repository(
+    @_component
+    def config_service(self):
+        """Configuration service."""
+        return ConfigurationService()
+
+    @_component
+    def _issue_repository(self):
+        """YAML issue repository shared by the issue and milestone services."""
+        return CoordinationGateway.get_yaml_issue_repository(
             db=self.db, issues_dir=self.issues_dir
         )
 
+    @_component
+    def issue_service(self):
+        """Issue service over the YAML issue repository."""
+        return IssueService(self._issue_repository)
+
+    @_component
+    def milestone_service(self):
+        """Milestone service over the YAML milestone repository."""
         from roadmap.adapters.persistence.yaml_repositories import (
             YAMLMilestoneRepository,
-            YAMLProjectRepository,
         )
 
-        milestone_repository = YAMLMilestoneRepository(self.db, self.milestones_dir)
-        project_repository = YAMLProjectRepository(self.db, self.projects_dir)
-
-        # Initialize services with repository injection
-        # (decoupled from implementation)
-        self.issue_service = IssueService(issue_repository)
-        self.milestone_service = MilestoneService(
-            milestone_repository,
-            issue_repository=issue_repository,
+        return MilestoneService(
+            YAMLMilestoneRepository(self.db, self.milestones_dir),
+            issue_repository=self._issue_repository,
             issues_dir=self.issues_dir,
             milestones_dir=self.milestones_dir,
         )
-        self.project_service = ProjectService(project_repository, self.milestones_dir)
 
-        # Keep reference to init manager for setup (needed before creating coordinators)
-        self._init_manager = InitializationManager(
-            self.root_path, self.roadmap_dir_name
+    @_component
+    def project_service(self):
+        """Project service over the YAML project repository."""
+        from roadmap.adapters.persistence.yaml_repositories import (
+            YAMLProjectRepository,
+        )
+
+        return ProjectService(
+            YAMLProjectRepository(self.db, self.projects_dir), self.milestones_dir
         )
 
-        # Initialize operations managers
+    @_component
+    def issues(self) -> IssueCoordinator:
+        """Issue coordinator."""
         issue_ops = IssueOperations(self.issue_service, self.issues_dir)
+        return IssueCoordinator(issue_ops, core=self)
+
+    @_component
+    def milestones(self) -> MilestoneCoordinator:
+        """Milestone coordinator."""
         milestone_ops = MilestoneOperations(self.milestone_service)
-        project_ops = ProjectOperations(self.project_service)
+        return MilestoneCoordinator(milestone_ops, self.milestones_dir, core=self)
 
+    @_component
+    def projects(self) -> ProjectCoordinator:
+        """Project coordinator."""
+        return ProjectCoordinator(ProjectOperations(self.project_service), core=self)
+
+    @_component
+    def team(self) -> TeamCoordinator:
+        """Team coordinator."""
         # Determine appropriate assignee validator based on sync backend
         assignee_validator = self._get_assignee_validator()
         user_ops = UserOperations(
             self.github_service, self.issue_service, assignee_validator
         )
-        git_ops = GitIntegrationOps(self._git, self)
+        return TeamCoordinator(user_ops, core=self)
 
-        # Initialize domain coordinators (pass self for initialization check)
-        self.issues = IssueCoordinator(issue_ops, core=self)
-        self.milestones = MilestoneCoordinator(
-            milestone_ops, self.milestones_dir, core=self
-        )
-        self.projects = ProjectCoordinator(project_ops, core=self)
-        self.team = TeamCoordinator(user_ops, core=self)
-        self.git = GitCoordinator(git_ops, core=self)
-        self.validation = ValidationCoordinator(self.github_service, core=self)
+    @_component
+    def git(self) -> GitCoordinator:
+        """Git coordinator."""
+        return GitCoordinator(GitIntegrationOps(self._git, self), core=self)
+
+    @_component
+    def validation(self) -> ValidationCoordinator:
+        """Validation coordinator."""
+        return ValidationCoordinator(self.github_service, core=self)
 
     def is_initialized(self) -> bool:
         """Check if roadmap is initialized in current directory."""
@@ -242,6 +308,10 @@ class RoadmapCore:
 
     def close(self) -> None:
         """Close any database resources held by this core."""
+        if "_issue_repository" in self.__dict__:
+            self._issue_repository.close()
+        if "db" not in self.__dict__:
+            return
         try:
             self.db.close()
         except Exception as e:
@@ -332,7 +402,7 @@ class RoadmapCore:
             console: Rich console instance
             show_progress: Whether to show progress
         """
-        if not self.db.has_file_changes():
+        if not self.db.has_file_changes(self.roadmap_dir):
             return
 
         if show_progress:
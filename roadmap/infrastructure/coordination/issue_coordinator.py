@@ -76,6 +76,36 @@ class IssueCoordinator:
             assignee=assignee,
         )
 
+    def query(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        issue_type: IssueType | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[Issue] | None:
+        """Query issues through the issue list index.
+
+        Returns:
+            List of matching Issue objects, or None if the index is stale
+            and callers should fall back to list()
+        """
+        return self._ops.query_issues(
+            status=status,
+            priority=priority,
+            issue_type=issue_type,
+            assignee=assignee,
+            milestone=milestone,
+            backlog=backlog,
+            overdue=overdue,
+            open_only=open_only,
+            blocked_only=blocked_only,
+        )
+
     def list_all_including_archived(self) -> list[Issue]:
         """List all issues including archived ones.
 
@@ -152,3 +182,7 @@ class IssueCoordinator:
             List of similar milestone names found
         """
         return self._ops.get_similar_milestone_names(milestone_name, max_results)
+
+    def clear_cache(self) -> None:
+        """Drop cached issue lists so the next read sees changes on disk."""
+        self._ops.clear_cache()
@@ -131,6 +131,46 @@ class IssueOperations:
             assignee=assignee,
         )
 
+    def query_issues(
+        self,
+        status: Status | None = None,
+        priority: Priority | None = None,
+        issue_type: IssueType | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[Issue] | None:
+        """Query issues through the issue list index.
+
+        Args:
+            status: Filter by issue status (optional)
+            priority: Filter by priority (optional)
+            issue_type: Filter by issue type (optional)
+            assignee: Filter by assignee (optional)
+            milestone: Filter by milestone name (optional)
+            backlog: Only issues without a milestone
+            overdue: Only issues past their due date
+            open_only: Exclude closed issues
+            blocked_only: Only blocked issues
+
+        Returns:
+            List of matching Issue objects, or None if the index is stale
+        """
+        return self.issue_service.query_issues(
+            status=status,
+            priority=priority,
+            issue_type=issue_type,
+            assignee=assignee,
+            milestone=milestone,
+            backlog=backlog,
+            overdue=overdue,
+            open_only=open_only,
+            blocked_only=blocked_only,
+        )
+
     def list_all_including_archived(self) -> list[Issue]:
         """List all issues including archived ones.
 
@@ -293,6 +333,11 @@ class IssueOperations:
         all_issues = self.list_issues()
         return [issue for issue in all_issues if issue.milestone == milestone_name]
 
+    def clear_cache(self) -> None:
+        """Drop cached issue lists so the next read sees changes on disk."""
+        self._milestone_cache.clear()
+        self.issue_service.clear_cache()
+
     def get_issues_by_milestone(self) -> dict[str, list[Issue]]:
         """Get all issues grouped by milestone, including backlog.
 
@@ -113,6 +113,12 @@ class MilestoneCoordinator:
         """Get progress statistics for a milestone."""
         return self._ops.get_milestone_progress(milestone_name)
 
+    def get_all_progress(
+        self, milestone_names: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get progress statistics for many milestones at once."""
+        return self._ops.get_all_milestones_progress(milestone_names)
+
     def get_next(self) -> Milestone | None:
         """Get the next upcoming milestone based on due date."""
         return self._ops.get_next_milestone()
@@ -166,6 +166,24 @@ class MilestoneOperations:
         logger.info("getting_milestone_progress", milestone_name=milestone_name)
         return self.milestone_service.get_milestone_progress(milestone_name)
 
+    @safe_operation(OperationType.READ, "Milestone")
+    def get_all_milestones_progress(
+        self, milestone_names: list[str] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """Get progress statistics for many milestones with one pass over issues.
+
+        Args:
+            milestone_names: Milestones to report (default: all with issues)
+
+        Returns:
+            Dictionary mapping milestone name to its progress metrics
+        """
+        logger.info(
+            "getting_all_milestones_progress",
+            milestone_count=len(milestone_names) if milestone_names else None,
+        )
+        return self.milestone_service.get_all_milestones_progress(milestone_names)
+
     def get_next_milestone(self) -> Milestone | None:
         """Get the next upcoming milestone based on due date.
 
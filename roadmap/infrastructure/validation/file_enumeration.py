@@ -30,17 +30,96 @@ Usage:
         id_value="abc12345",
         parser_func=IssueParser.parse_issue_file
     )
+
+    # Cold loads of large directories parsed in worker processes
+    issues = FileEnumerationService.enumerate_and_parse(
+        directory=issues_dir,
+        parser_func=IssueParser.parse_issue_file,
+        split_parser=SplitParser(IssueParser.read_issue_file, IssueParser.build_issue),
+    )
 """
 
+import multiprocessing
+import os
+import sys
+import threading
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
+from roadmap.common.cache import get_parsed_file_cache
 from roadmap.common.errors.error_standards import OperationType, safe_operation
 from roadmap.common.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Cache misses needed before parsing moves to a process pool; below this the
+# cost of starting workers outweighs the parallel speedup
+PARALLEL_PARSE_THRESHOLD = 2000
+
+# Chunks handed to each worker; more than one evens out uneven chunks
+_CHUNKS_PER_WORKER = 4
+
+
+class SplitParser(NamedTuple):
+    """A parser split into a worker-side read and a parent-side build.
+
+    ``read`` runs in worker processes: it must be a picklable module-level
+    function (or static method) returning picklable data, and should do the
+    CPU-heavy part such as YAML parsing. ``build`` turns that data into the
+    parsed object in the parent, where validation happens.
+    """
+
+    read: Callable[[Path], Any]
+    build: Callable[[Any, Path], Any]
+
+
+def _read_chunk(
+    read: Callable[[Path], Any], paths: list[Path]
+) -> list[tuple[Any, tuple[str, str] | None]]:
+    """Run a SplitParser read over a chunk of files in a worker process.
+
+    Returns:
+        One (data, None) or (None, (error_type, error)) pair per path
+    """
+    results: list[tuple[Any, tuple[str, str] | None]] = []
+    for path in paths:
+        try:
+            results.append((read(path), None))
+        except Exception as e:
+            results.append((None, (type(e).__name__, str(e))))
+    return results
+
+
+def _is_single_threaded() -> bool:
+    """Check whether the calling thread is the only one in the process.
+
+    Counts OS threads where /proc allows it, which also sees threads started
+    outside the threading module (C extensions, embedding hosts).
+    """
+    try:
+        return len(os.listdir("/proc/self/task")) == 1
+    except OSError:
+        return threading.active_count() == 1
+
+
+def _pool_context():
+    """Multiprocessing context for parse workers.
+
+    Forked workers inherit the already-imported parser modules; spawned
+    workers would re-import roadmap before parsing anything. Forking while
+    other threads run can copy a lock one of them holds (logging, SQLite,
+    imports) into a child that then deadlocks, so fork is only used while
+    the caller is the only thread. Otherwise workers come from a fork
+    server, which starts single-threaded and imports roadmap once.
+    """
+    if sys.platform.startswith("linux"):
+        if _is_single_threaded():
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context()
+
 
 class FileEnumerationService:
     """Unified service for enumerating and filtering markdown files.
@@ -50,6 +129,9 @@ class FileEnumerationService:
     - Filtering backup files
     - Parsing files with error handling
     - Finding items by ID pattern
+
+    Parsed objects are served from the process-wide ParsedFileCache when the
+    underlying file is unchanged since it was last parsed.
     """
 
     @staticmethod
@@ -58,6 +140,7 @@ class FileEnumerationService:
         directory: Path,
         parser_func: Callable[[Path], Any],
         backup_filter: bool = True,
+        split_parser: SplitParser | None = None,
     ) -> list[Any]:
         """Enumerate files and parse with consistent error handling.
 
@@ -65,6 +148,9 @@ class FileEnumerationService:
             directory: Directory to enumerate
             parser_func: Parser function (e.g., IssueParser.parse_issue_file)
             backup_filter: Skip .backup files if True
+            split_parser: Read/build halves of parser_func. When given and at
+                least PARALLEL_PARSE_THRESHOLD files miss the cache, the reads
+                run in a process pool; results are cached under parser_func.
 
         Returns:
             List of parsed objects (failed items skipped with logging)
@@ -78,37 +164,165 @@ class FileEnumerationService:
             )
             return []
 
-        results = []
+        cache = get_parsed_file_cache()
         # Use rglob to recursively search subdirectories (e.g., issues organized by milestone)
-        for file_path in directory.rglob("*.md"):
+        files = [
+            file_path
+            for file_path in directory.rglob("*.md")
             # Filter backup files if requested
-            if backup_filter and ".backup" in file_path.name:
-                continue
+            if not (backup_filter and ".backup" in file_path.name)
+        ]
 
-            try:
-                obj = parser_func(file_path)
-                # Preserve the file path on the object for later updates
-                if obj is not None:
-                    try:
-                        obj.file_path = str(file_path)
-                    except (AttributeError, TypeError):
-                        # Object doesn't support attribute assignment (e.g., dict)
-                        # This can happen in tests with mocks
-                        pass
-                    results.append(obj)
-            except Exception as e:
-                logger.debug(
-                    "enumerate_and_parse_skip_file",
-                    file=file_path.name,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
-                continue
+        if split_parser is not None and len(files) >= PARALLEL_PARSE_THRESHOLD:
+            parsed = FileEnumerationService._parse_with_pool(
+                files, parser_func, split_parser
+            )
+        else:
+            parsed = [
+                FileEnumerationService._parse_file(file_path, parser_func)
+                for file_path in files
+            ]
+
+        results = []
+        for file_path, obj in zip(files, parsed, strict=True):
+            # Preserve the file path on the object for later updates
+            if obj is not None:
+                try:
+                    obj.file_path = str(file_path)
+                except (AttributeError, TypeError):
+                    # Object doesn't support attribute assignment (e.g., dict)
+                    # This can happen in tests with mocks
+                    pass
+                results.append(obj)
 
         logger.debug(
             "enumerate_and_parse_complete",
             directory=str(directory),
             count=len(results),
+            cache_hits=cache.hits,
+            cache_misses=cache.misses,
+        )
+        return results
+
+    @staticmethod
+    def _parse_file(file_path: Path, parser_func: Callable[[Path], Any]) -> Any:
+        """Parse one file through the cache, or return None if it fails."""
+        try:
+            return get_parsed_file_cache().get_or_parse(file_path, parser_func)
+        except Exception as e:
+            FileEnumerationService._log_skip(file_path, type(e).__name__, str(e))
+            return None
+
+    @staticmethod
+    def _log_skip(file_path: Path, error_type: str, error: str) -> None:
+        logger.debug(
+            "enumerate_and_parse_skip_file",
+            file=file_path.name,
+            error=error,
+            error_type=error_type,
+        )
+
+    @staticmethod
+    def _parse_with_pool(
+        files: list[Path],
+        parser_func: Callable[[Path], Any],
+        split_parser: SplitParser,
+        workers: int | None = None,
+    ) -> list[Any]:
+        """Parse files, reading cache misses in worker processes.
+
+        Cached files are served from the cache. If fewer than
+        PARALLEL_PARSE_THRESHOLD files miss, only one CPU is available, or
+        the pool cannot run, the misses are parsed in this process instead.
+
+        Args:
+            files: Files to parse
+            parser_func: Parser the results are cached under
+            split_parser: Read/build halves of parser_func
+            workers: Worker processes (default: CPU count)
+
+        Returns:
+            Parsed object or None (failed) per file, in the order of files
+        """
+        cache = get_parsed_file_cache()
+        parsed: list[Any] = [None] * len(files)
+        misses: list[tuple[int, tuple[int, int, int]]] = []
+        for index, file_path in enumerate(files):
+            cached, signature = cache.lookup(file_path, parser_func)
+            if cached is not None:
+                parsed[index] = cached
+            elif signature is not None:
+                misses.append((index, signature))
+            else:
+                # File vanished or is unreadable; let the parser report it
+                parsed[index] = FileEnumerationService._parse_file(
+                    file_path, parser_func
+                )
+
+        workers = workers or os.cpu_count() or 1
+        raw: list[tuple[Any, tuple[str, str] | None]] | None = None
+        if len(misses) >= PARALLEL_PARSE_THRESHOLD and workers > 1:
+            raw = FileEnumerationService._read_in_pool(
+                [files[index] for index, _ in misses], split_parser.read, workers
+            )
+
+        for position, (index, signature) in enumerate(misses):
+            file_path = files[index]
+            try:
+                if raw is None:
+                    obj = parser_func(file_path)
+                else:
+                    data, error = raw[position]
+                    if error is not None:
+                        FileEnumerationService._log_skip(file_path, *error)
+                        continue
+                    obj = split_parser.build(data, file_path)
+            except Exception as e:
+                FileEnumerationService._log_skip(file_path, type(e).__name__, str(e))
+                continue
+            cache.store(file_path, parser_func, signature, obj)
+            parsed[index] = obj
+
+        return parsed
+
+    @staticmethod
+    def _read_in_pool(
+        paths: list[Path], read: Callable[[Path], Any], workers: int
+    ) -> list[tuple[Any, tuple[str, str] | None]] | None:
+        """Run read over paths in a process pool, preserving order.
+
+        Returns:
+            One (data, error) pair per path, or None if the pool failed
+        """
+        chunk_size = -(-len(paths) // (workers * _CHUNKS_PER_WORKER))
+        chunks = [
+            paths[start : start + chunk_size]
+            for start in range(0, len(paths), chunk_size)
+        ]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers, mp_context=_pool_context()
+            ) as pool:
+                results = []
+                for chunk_results in pool.map(
+                    _read_chunk, [read] * len(chunks), chunks
+                ):
+                    results.extend(chunk_results)
+        except Exception as e:
+            logger.warning(
+                "parallel_parse_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                files=len(paths),
+                severity="operational",
+            )
+            return None
+
+        logger.debug(
+            "parallel_parse_complete",
+            files=len(paths),
+            workers=workers,
+            chunks=len(chunks),
         )
         return results
 
@@ -176,7 +390,7 @@ class FileEnumerationService:
         pattern = f"{id_value}-*.md"
         for file_path in directory.rglob(pattern):
             try:
-                obj = parser_func(file_path)
+                obj = get_parsed_file_cache().get_or_parse(file_path, parser_func)
                 # Preserve the file path on the object for later updates
                 if obj is not None:
                     try:
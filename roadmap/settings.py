@@ -83,6 +83,9 @@ _validators = [
     Validator("sync.duplicate_auto_resolve_threshold", default=0.95, gte=0.0, lte=1.0),
     # GitHub API rate limiting
     Validator("github.api_batch_delay_seconds", default=1.0, gte=0.1),
+    # OpenTelemetry tracing (opt-in, e.g. ROADMAP_TRACING__ENABLED=true)
+    Validator("tracing.enabled", default=False, is_type_of=bool),
+    Validator("tracing.endpoint", default="http://localhost:4317"),
 ]
 
 # Initialize dynaconf with our configuration
@@ -297,6 +300,14 @@ def get_github_config() -> dict[str, Any]:
     }
 
 
+def get_tracing_config() -> dict[str, Any]:
+    """Get OpenTelemetry tracing configuration."""
+    return {
+        "enabled": settings.tracing.enabled,
+        "endpoint": settings.tracing.endpoint,
+    }
+
+
 def get_export_settings() -> dict[str, Any]:
     """Get export settings."""
     return {
@@ -1,200 +1,290 @@
-"""Performance baseline measurement using the built-in profiler.
+"""End-to-end performance benchmark of the roadmap CLI.
 
-This script measures current CLI performance using the official profiling system.
-Results are stored for comparison against future optimizations.
+Generates synthetic .roadmap trees (issues spread over milestones, projects
+and an archive) inside temporary git repositories, runs real CLI commands
+against them in fresh interpreters, and records each command's wall time
+together with its profiler breakdown. ``sync`` runs against a local stub of
+the GitHub API, so no network access or token is needed.
+
+Results are written as JSON and compared with a committed baseline; commands
+that got slower than the threshold are flagged as regressions.
 
 Usage:
     uv run python scripts/baseline_profiler.py
-    uv run python scripts/baseline_profiler.py --profile-file baseline.json
+    uv run python scripts/baseline_profiler.py --sizes 100,1000,10000,50000
+    uv run python scripts/baseline_profiler.py --fail-on-regression
+    uv run python scripts/baseline_profiler.py --update-baseline
 """
 
 import json
+import os
 import platform
+import re
+import statistics
 import subprocess
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from urllib.parse import parse_qs, urlparse
 
 import click
+import yaml
 from structlog import get_logger
 
-from roadmap.common.cache import clear_session_cache
-from roadmap.common.services import get_profiler
-
-logger = get_logger()
-
-
-def simulate_operations():
-    """Simulate typical CLI operations to establish baseline.
-
-    These represent common workflows users would run.
-
-    NOTE: These are still simulated. To measure REAL operations,
-    we would need to create actual roadmap projects with data.
-    This baseline is useful for tracking profiler infrastructure overhead
-    and relative changes, but doesn't reflect production performance yet.
-    """
-    profiler = get_profiler()
-
-    # Simulate issue listing operation
-    profiler.start_operation("list_issues_parse")
-    # Simulate parsing/formatting ~500 lines
-    for i in range(500):
-        _ = i * 2  # lightweight processing
-    profiler.end_operation("list_issues_parse")
-
-    # Simulate team member lookup
-    profiler.start_operation("get_team_members_api")
-    # Simulate API call overhead
-    import time
-
-    time.sleep(0.01)  # 10ms simulated network
-    profiler.end_operation("get_team_members_api")
-
-    # Simulate milestone fetching
-    profiler.start_operation("get_milestones_api")
-    time.sleep(0.015)  # 15ms simulated network
-    profiler.end_operation("get_milestones_api")
-
-    # Simulate issue detail loading
-    profiler.start_operation("fetch_issue_details")
-    time.sleep(0.008)  # 8ms simulated I/O
-    profiler.end_operation("fetch_issue_details")
-
-    # Simulate issue creation workflow
-    profiler.start_operation("validate_issue_data")
-    for i in range(100):
-        _ = str(i)  # lightweight validation
-    profiler.end_operation("validate_issue_data")
-
-    # Simulate file I/O
-    profiler.start_operation("read_config_file")
-    time.sleep(0.005)  # 5ms simulated file I/O
-    profiler.end_operation("read_config_file")
-
-    # Simulate formatting output
-    profiler.start_operation("format_output")
-    for i in range(1000):
-        _ = f"item_{i}"  # string formatting
-    profiler.end_operation("format_output")
-
-    # Simulate successful operation
-    profiler.start_operation("sync_to_github")
-    time.sleep(0.020)  # 20ms simulated network
-    profiler.end_operation("sync_to_github")
-
-    # Simulate an operation with error
-    profiler.start_operation("fetch_with_retry")
-    try:
-        time.sleep(0.003)
-        raise ValueError("Simulated network error")
-    except Exception as e:
-        logger.debug("simulated_error_caught", error=str(e))
-        profiler.end_operation("fetch_with_retry", error=True)
-
+REPO_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(REPO_ROOT))
 
-@click.command()
-@click.option(
-    "--profile-file",
-    default=None,
-    help="Output file for profiler results (default: docs/performance/performance_baseline_DATE.json)",
-)
-@click.option(
-    "--iterations",
-    default=3,
-    help="Number of times to run the simulation",
-    type=int,
+from scripts.startup_profiler import (  # noqa: E402
+    GITHUB_API_URL_ENV,
+    profile_command,
 )
-def establish_baseline(profile_file: str | None, iterations: int):
-    """Establish performance baseline using the official profiler.
+from tests.fixtures.issue_corpus import generate_roadmap_tree  # noqa: E402
 
-    This runs simulated operations and collects profiling data to create
-    a baseline for measuring performance improvements.
-
-    Note: These are simulated operations for now. Real baselines should
-    measure actual CLI commands against real data when available.
-    """
-    # Determine output path
-    if profile_file is None:
-        # Create docs/performance directory if it doesn't exist
-        perf_dir = Path(__file__).parent.parent / "docs" / "performance"
-        perf_dir.mkdir(parents=True, exist_ok=True)
-
-        # Generate timestamp-based filename
-        timestamp = datetime.now(UTC).strftime("%Y-%m-%d")
-        profile_file = str(perf_dir / f"performance_baseline_{timestamp}.json")
-    else:
-        # Ensure parent directory exists
-        Path(profile_file).parent.mkdir(parents=True, exist_ok=True)
-
-    click.echo()
-    click.secho("=" * 70, fg="cyan")
-    click.secho("ESTABLISHING PERFORMANCE BASELINE", fg="cyan", bold=True)
-    click.secho("Using Official Profiling System", fg="cyan")
-    click.secho("(With Simulated Operations)", fg="yellow")
-    click.secho("=" * 70, fg="cyan")
-    click.echo()
-    click.secho(
-        "⚠️  WARNING: These are simulated operations, not real CLI commands", fg="yellow"
-    )
-    click.secho(
-        "   Baseline is useful for tracking relative improvements.", fg="yellow"
-    )
-    click.echo()
+logger = get_logger()
 
-    profiler = get_profiler()
+PERFORMANCE_DIR = REPO_ROOT / "docs" / "performance"
+DEFAULT_BASELINE = PERFORMANCE_DIR / "benchmark_baseline.json"
+
+# Benchmarked commands. {issue_id} is an issue in the middle of the tree and
+# {workdir} a scratch directory outside the repository.
+COMMANDS = {
+    "issue list": "issue list",
+    "issue list --status --priority": "issue list --status todo --priority high",
+    "issue list --milestone": "issue list --milestone m1",
+    "issue view": "issue view {issue_id}",
+    "status": "status",
+    "today": "today",
+    "analysis critical-path": "analysis critical-path",
+    "data export": "data export --format json -o {workdir}/export.json",
+    "health scan": "health scan",
+    "sync": "sync --dry-run",
+}
+
+GITHUB_OWNER = "bench"
+GITHUB_REPO = "roadmap"
+REMOTE_ONLY_ISSUES = 10
+
+
+def remote_issues(local_count: int) -> list[dict]:
+    """Build the stub's GitHub issues: every other local issue plus a few new ones."""
+    issues = []
+    for number, n in enumerate(
+        [*range(0, local_count, 2), *range(-REMOTE_ONLY_ISSUES, 0)], start=1
+    ):
+        title = f"Synthetic issue {n}" if n >= 0 else f"Remote-only issue {-n}"
+        issues.append(
+            {
+                "id": number,
+                "number": number,
+                "title": title,
+                "state": "closed" if n % 5 == 4 else "open",
+                "body": f"Remote body of {title.lower()}.",
+                "labels": [{"name": "synthetic"}],
+                "assignee": {"login": f"user{n % 7}"},
+                "milestone": None,
+                "created_at": "2026-01-01T00:00:00Z",
+                "updated_at": "2026-01-03T00:00:00Z",
+                "html_url": f"https://github.com/{GITHUB_OWNER}/{GITHUB_REPO}/issues/{number}",
+            }
+        )
+    return issues
+
+
+class _StubGitHubHandler(BaseHTTPRequestHandler):
+    """Serves the subset of the GitHub REST/GraphQL API that sync reads."""
+
+    issues: list[dict] = []
+    per_page_default = 30
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler API
+        pass
+
+    def _send(self, payload, headers: dict[str, str] | None = None):
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _issues_page(self, url):
+        query = parse_qs(url.query)
+        page = int(query.get("page", ["1"])[0])
+        per_page = int(query.get("per_page", [str(self.per_page_default)])[0])
+        issues = self.issues
+        if "since" in query:
+            issues = [i for i in issues if i["updated_at"] >= query["since"][0]]
+        start = (page - 1) * per_page
+        headers = {}
+        if start + per_page < len(issues):
+            next_url = f"{url.path}?page={page + 1}&per_page={per_page}"
+            headers["Link"] = f'<http://{self.headers["Host"]}{next_url}>; rel="next"'
+        return issues[start : start + per_page], headers
+
+    def do_GET(self):  # noqa: N802 - BaseHTTPRequestHandler API
+        url = urlparse(self.path)
+        repo = f"/repos/{GITHUB_OWNER}/{GITHUB_REPO}"
+        if url.path == "/user":
+            self._send({"login": GITHUB_OWNER})
+        elif url.path == repo:
+            self._send(
+                {
+                    "full_name": f"{GITHUB_OWNER}/{GITHUB_REPO}",
+                    "permissions": {"admin": True, "push": True, "pull": True},
+                }
+            )
+        elif url.path == f"{repo}/issues":
+            self._send(*self._issues_page(url))
+        elif match := re.fullmatch(rf"{repo}/issues/(\d+)", url.path):
+            number = int(match.group(1))
+            self._send(self.issues[number - 1] if number <= len(self.issues) else {})
+        elif url.path.startswith(f"{repo}/") and url.path.endswith(
+            ("/milestones", "/labels", "/comments", "/collaborators")
+        ):
+            self._send([])
+        else:
+            self._send({})
 
-    click.echo(f"📊 Running {iterations} iterations of simulated operations...")
-    click.echo()
+    def do_POST(self):  # noqa: N802 - BaseHTTPRequestHandler API
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._send({"data": {}} if self.path == "/graphql" else {})
 
-    for iteration in range(iterations):
-        click.echo(f"  Iteration {iteration + 1}/{iterations}...", nl=False)
+    do_PATCH = do_POST  # noqa: N815 - BaseHTTPRequestHandler API
 
-        # Clear for fresh session
-        clear_session_cache()
-        profiler.clear()
 
-        # Run simulated operations
-        simulate_operations()
+@contextmanager
+def stub_github(issues: list[dict]):
+    """Serve ``issues`` from a stub GitHub API; yields its base URL."""
+    handler = type("StubGitHubHandler", (_StubGitHubHandler,), {"issues": issues})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _git(project: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=project, check=True, capture_output=True)
+
+
+def create_project(project: Path, issues: int) -> dict[str, list[str]]:
+    """Initialize a git repository with a synthetic roadmap of ``issues`` issues."""
+    project.mkdir(parents=True)
+    _git(project, "init", "-q")
+    _git(project, "config", "user.email", "bench@example.com")
+    _git(project, "config", "user.name", "bench")
+    profile_command("init --yes --non-interactive --skip-github -p bench", project)
+
+    roadmap_dir = project / ".roadmap"
+    tree = generate_roadmap_tree(roadmap_dir, issues)
+
+    config_path = roadmap_dir / "config.yaml"
+    config = yaml.safe_load(config_path.read_text()) or {}
+    config.setdefault("github", {}).update(
+        {
+            "owner": GITHUB_OWNER,
+            "repo": GITHUB_REPO,
+            "enabled": True,
+            "sync_enabled": True,
+        }
+    )
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False))
+
+    _git(project, "add", "-A")
+    _git(project, "commit", "-q", "-m", "Synthetic roadmap")
+    return tree
+
+
+def run_command(command: str, project: Path, env: dict[str, str], iterations: int):
+    """Run a command ``iterations`` times; summarize the runs and keep the last profile."""
+    runs = []
+    profile: dict = {}
+    for _ in range(iterations):
+        profile = profile_command(command, project, env)
+        if not profile:
+            return {"command": command, "crashed": True}
+        runs.append(profile["import_ms"] + profile["command_ms"])
+    return {
+        "command": command,
+        "median_ms": round(statistics.median(runs), 1),
+        "runs_ms": [round(run, 1) for run in runs],
+        "import_ms": round(profile["import_ms"], 1),
+        "exit_code": profile["exit_code"],
+        "operations": profile["operations"],
+    }
 
-        click.echo(" ✅")
 
-    click.echo()
-    click.secho("-" * 70, fg="cyan")
+def benchmark_size(issues: int, iterations: int, commands: list[str]) -> dict:
+    """Benchmark every command against a fresh tree of ``issues`` issues."""
+    with tempfile.TemporaryDirectory(prefix="roadmap-bench-") as tmp:
+        project = Path(tmp) / "project"
+        workdir = Path(tmp) / "work"
+        workdir.mkdir()
+
+        click.echo(f"  generating {issues} issues...", nl=False)
+        tree = create_project(project, issues)
+        click.echo(" done")
+
+        placeholders = {
+            "issue_id": tree["issues"][len(tree["issues"]) // 2],
+            "workdir": str(workdir),
+        }
+        with stub_github(remote_issues(issues)) as api_url:
+            env = {GITHUB_API_URL_ENV: api_url, "GITHUB_TOKEN": "stub-token"}
+
+            # The first command after generation builds the state database;
+            # time it separately so the commands below all run warm.
+            cold = run_command("status", project, env, 1)
+            click.echo(
+                f"  {'cold start (status)':34} {cold.get('median_ms', 0):9.1f}ms"
+            )
 
-    # Generate report
-    report = profiler.get_report()
+            results = {}
+            for name in commands:
+                command = COMMANDS[name].format(**placeholders)
+                results[name] = result = run_command(command, project, env, iterations)
+                if result.get("crashed"):
+                    click.secho(f"  {name:34} crashed", fg="red")
+                else:
+                    click.echo(f"  {name:34} {result['median_ms']:9.1f}ms")
 
-    click.secho("📈 BASELINE REPORT", fg="cyan", bold=True)
-    click.secho("-" * 70, fg="cyan")
-    click.echo()
-    click.echo(report.format())
-    click.echo()
+    return {
+        "tree": {kind: len(ids) for kind, ids in tree.items()},
+        "cold_start": cold,
+        "commands": results,
+    }
 
-    # Collect system information
-    def get_python_version() -> str:
-        """Get Python version."""
-        import sys
 
-        return f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+def get_system_info() -> dict:
+    """Describe the machine the benchmark ran on."""
 
     def get_cpu_info() -> str:
-        """Get CPU information."""
         try:
             result = subprocess.run(
-                ["sysctl", "-n", "hw.brand_string"]
+                ["sysctl", "-n", "machdep.cpu.brand_string"]
                 if platform.system() == "Darwin"
-                else ["lscpu"],
+                else ["grep", "-m1", "model name", "/proc/cpuinfo"],
                 capture_output=True,
                 text=True,
                 timeout=5,
             )
-            return result.stdout.strip() if result.returncode == 0 else "Unknown"
+            if result.returncode != 0:
+                return "Unknown"
+            return result.stdout.split(":", 1)[-1].strip()
         except Exception as e:
             logger.debug("system_info_retrieval_failed", error=str(e))
             return "Unknown"
 
     def get_memory_gb() -> float:
-        """Get total system memory in GB."""
         try:
             result = subprocess.run(
                 ["sysctl", "-n", "hw.memsize"]
@@ -207,91 +297,205 @@ def establish_baseline(profile_file: str | None, iterations: int):
             if result.returncode == 0:
                 if platform.system() == "Darwin":
                     return float(result.stdout.strip()) / (1024**3)
-                else:
-                    # Parse "MemTotal: XXXX kB"
-                    kb = int(result.stdout.split()[1])
-                    return kb / (1024**2)
+                # Parse "MemTotal: XXXX kB"
+                return int(result.stdout.split()[1]) / (1024**2)
             return 0.0
         except Exception as e:
             logger.debug("memory_info_retrieval_failed", error=str(e))
             return 0.0
 
-    # Save detailed results
-    output_path = Path(profile_file)
-    results_dict = report.get_dict()
-    results_dict["baseline_timestamp"] = datetime.now(UTC).isoformat()
-    results_dict["iterations_run"] = iterations
-
-    # Add system information metadata
-    results_dict["system_info"] = {
+    return {
         "os": platform.system(),
-        "os_version": platform.version(),
         "platform": platform.platform(),
-        "python_version": get_python_version(),
+        "python_version": platform.python_version(),
         "cpu": get_cpu_info(),
-        "memory_gb": get_memory_gb(),
-        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "memory_gb": round(get_memory_gb(), 1),
     }
 
-    # Try to get roadmap version from pyproject.toml
+
+def get_roadmap_version() -> str:
+    """Read the roadmap version from pyproject.toml."""
     try:
-        pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
-        if pyproject_path.exists():
-            with open(pyproject_path) as f:
-                for line in f:
-                    if line.strip().startswith('version = "'):
-                        version = line.split('"')[1]
-                        results_dict["roadmap_version"] = version
-                        break
+        with open(REPO_ROOT / "pyproject.toml") as f:
+            for line in f:
+                if line.strip().startswith('version = "'):
+                    return line.split('"')[1]
     except Exception as e:
         logger.debug("version_extraction_failed", error=str(e))
-        results_dict["roadmap_version"] = "unknown"
+    return "unknown"
 
-    output_path.write_text(json.dumps(results_dict, indent=2))
 
-    click.secho("-" * 70, fg="cyan")
-    click.secho(f"✅ Baseline saved to: {profile_file}", fg="green")
+def find_regressions(
+    results: dict, baseline: dict, threshold: float, min_delta_ms: float
+) -> list[tuple[str, str, float, float]]:
+    """Compare median times with the baseline.
+
+    A command regressed when it is slower than its baseline median by more
+    than ``threshold`` (a fraction) and by at least ``min_delta_ms``, so
+    noise on fast commands is not reported.
+
+    Returns:
+        List of (size, command, baseline_ms, current_ms) for each regression
+    """
+    regressions = []
+    for size, size_results in results["sizes"].items():
+        baseline_commands = baseline.get("sizes", {}).get(size, {}).get("commands", {})
+        for name, result in size_results["commands"].items():
+            before = baseline_commands.get(name, {}).get("median_ms")
+            after = result.get("median_ms")
+            if before is None or after is None:
+                continue
+            if after > before * (1 + threshold) and after - before >= min_delta_ms:
+                regressions.append((size, name, before, after))
+    return regressions
+
+
+def print_comparison(results: dict, baseline: dict) -> None:
+    """Print each command's median next to its baseline median."""
     click.echo()
+    click.secho(
+        f"  {'size':>6}  {'command':34} {'baseline':>10} {'current':>10} {'change':>8}",
+        bold=True,
+    )
+    for size, size_results in results["sizes"].items():
+        baseline_commands = baseline.get("sizes", {}).get(size, {}).get("commands", {})
+        for name, result in size_results["commands"].items():
+            before = baseline_commands.get(name, {}).get("median_ms")
+            after = result.get("median_ms")
+            if before is None or after is None:
+                change = ""
+            else:
+                change = f"{(after - before) / before:+.0%}"
+            click.echo(
+                f"  {size:>6}  {name:34} "
+                f"{before if before is not None else '-':>10} "
+                f"{after if after is not None else '-':>10} {change:>8}"
+            )
 
-    # Summary statistics
-    click.secho("📊 SUMMARY", fg="cyan", bold=True)
-    click.secho("-" * 70, fg="cyan")
-    click.echo(f"  Total Time:        {results_dict['total_time_ms']:.2f}ms")
-    click.echo(f"  Total Operations:  {results_dict['total_operations']}")
-    click.echo(f"  Success Rate:      {results_dict['success_rate']:.1%}")
 
-    # Show system info
-    sys_info = results_dict.get("system_info", {})
-    if sys_info:
+@click.command()
+@click.option(
+    "--sizes",
+    default="100,1000",
+    help="Comma-separated issue counts to benchmark (e.g. 100,1000,10000,50000)",
+)
+@click.option(
+    "--commands",
+    "command_names",
+    default=",".join(COMMANDS),
+    help="Comma-separated names of the commands to run",
+)
+@click.option(
+    "--iterations",
+    default=3,
+    type=int,
+    help="Runs per command; the median is reported",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Results file (default: docs/performance/benchmark_DATE.json)",
+)
+@click.option(
+    "--baseline",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=DEFAULT_BASELINE,
+    show_default=True,
+    help="Baseline results to compare against",
+)
+@click.option(
+    "--threshold",
+    default=0.25,
+    show_default=True,
+    type=float,
+    help="Slowdown (fraction of the baseline median) flagged as a regression",
+)
+@click.option(
+    "--min-delta-ms",
+    default=50.0,
+    show_default=True,
+    type=float,
+    help="Ignore slowdowns smaller than this many milliseconds",
+)
+@click.option(
+    "--fail-on-regression",
+    is_flag=True,
+    help="Exit with status 1 if any command regressed",
+)
+@click.option(
+    "--update-baseline",
+    is_flag=True,
+    help="Write the results to the baseline file as well",
+)
+def benchmark(
+    sizes: str,
+    command_names: str,
+    iterations: int,
+    output: Path | None,
+    baseline: Path,
+    threshold: float,
+    min_delta_ms: float,
+    fail_on_regression: bool,
+    update_baseline: bool,
+):
+    """Benchmark real CLI commands against synthetic roadmaps."""
+    issue_counts = [int(size) for size in sizes.split(",")]
+    commands = [name.strip() for name in command_names.split(",")]
+    unknown = [name for name in commands if name not in COMMANDS]
+    if unknown:
+        raise click.BadParameter(
+            f"unknown commands: {', '.join(unknown)}", param_hint="--commands"
+        )
+
+    results = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "roadmap_version": get_roadmap_version(),
+        "system_info": get_system_info(),
+        "iterations": iterations,
+        "sizes": {},
+    }
+    for issues in issue_counts:
         click.echo()
-        click.secho("💻 SYSTEM INFO", fg="blue")
-        click.echo(f"  OS:             {sys_info.get('os', 'Unknown')}")
-        click.echo(f"  Python:         {sys_info.get('python_version', 'Unknown')}")
-        click.echo(f"  CPU:            {sys_info.get('cpu', 'Unknown')}")
-        click.echo(f"  Memory:         {sys_info.get('memory_gb', 0):.1f} GB")
-
-    # Find slowest operation
-    slowest_op = None
-    for op_name, op_data in results_dict.get("operations", {}).items():
-        if (
-            slowest_op is None
-            or op_data["total_ms"] > results_dict["operations"][slowest_op]["total_ms"]
-        ):
-            slowest_op = op_name
+        click.secho(f"{issues} issues", fg="cyan", bold=True)
+        results["sizes"][str(issues)] = benchmark_size(issues, iterations, commands)
 
-    if slowest_op:
-        click.echo(f"  Slowest Operation: {slowest_op}")
+    if output is None:
+        output = PERFORMANCE_DIR / f"benchmark_{datetime.now(UTC):%Y-%m-%d}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2) + "\n")
     click.echo()
+    click.secho(f"Results saved to {output}", fg="green")
+
+    regressions = []
+    if baseline.exists():
+        baseline_results = json.loads(baseline.read_text())
+        print_comparison(results, baseline_results)
+        regressions = find_regressions(
+            results, baseline_results, threshold, min_delta_ms
+        )
+        click.echo()
+        if regressions:
+            click.secho(f"{len(regressions)} regression(s):", fg="red", bold=True)
+            for size, name, before, after in regressions:
+                click.secho(
+                    f"  {size} issues, {name}: {before:.1f}ms -> {after:.1f}ms",
+                    fg="red",
+                )
+        else:
+            click.secho("No regressions against the baseline", fg="green")
+    else:
+        click.secho(f"No baseline at {baseline}", fg="yellow")
 
-    click.secho("💾 Next Steps:", fg="blue")
-    click.echo("  1. After optimizations, run this script again")
-    click.echo("  2. Compare results to measure improvement")
-    click.echo("  3. Track improvements over time")
-    click.echo()
+    if update_baseline:
+        baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline.write_text(json.dumps(results, indent=2) + "\n")
+        click.secho(f"Baseline updated: {baseline}", fg="green")
 
-    click.secho("=" * 70, fg="cyan")
-    click.echo()
+    if regressions and fail_on_regression:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
-    establish_baseline()  # type: ignore[call-arg]
+    benchmark()
@@ -0,0 +1,138 @@
+"""Per-command startup profile for the roadmap CLI.
+
+Runs each command in a fresh interpreter and reports where its time went:
+importing the CLI, building RoadmapCore components (recorded by the
+profiler as ``core.<component>``), and the rest of the command. Component
+times include the components they build in turn (e.g. core.issues includes
+core.db).
+
+Usage:
+    uv run python scripts/startup_profiler.py
+    uv run python scripts/startup_profiler.py --project ~/work/app "issue list" today
+"""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import click
+
+DEFAULT_COMMANDS = ("today", "issue list", "milestone list", "status")
+
+# Runs inside the child interpreter: times the CLI import and the command,
+# then dumps the session profiler to the file named by argv[1]. When
+# GITHUB_API_URL_ENV is set, GitHub API requests go to that URL instead
+# (used to sync against a stub server).
+GITHUB_API_URL_ENV = "ROADMAP_PROFILE_GITHUB_API_URL"
+
+_DRIVER = """
+import json, os, sys, time
+
+stub_url = os.environ.get("ROADMAP_PROFILE_GITHUB_API_URL")
+if stub_url:
+    import requests
+
+    send = requests.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        if isinstance(url, str) and url.startswith("https://api.github.com"):
+            url = stub_url + url[len("https://api.github.com"):]
+        return send(self, method, url, *args, **kwargs)
+
+    requests.Session.request = request
+
+start = time.perf_counter()
+from roadmap.adapters.cli import main
+from roadmap.common.services import get_profiler
+
+imported = time.perf_counter()
+exit_code = 0
+try:
+    main(sys.argv[2:], standalone_mode=False)
+except SystemExit as e:
+    exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+except Exception:
+    exit_code = 1
+finished = time.perf_counter()
+
+with open(sys.argv[1], "w") as f:
+    json.dump(
+        {
+            "import_ms": (imported - start) * 1000,
+            "command_ms": (finished - imported) * 1000,
+            "exit_code": exit_code,
+            "operations": get_profiler().get_report().get_dict()["operations"],
+        },
+        f,
+    )
+"""
+
+
+def profile_command(
+    command: str, project: Path, env: dict[str, str] | None = None
+) -> dict:
+    """Run one CLI command in a fresh interpreter and collect its profile.
+
+    Args:
+        command: CLI arguments, shell-quoted
+        project: Directory to run the command in
+        env: Extra environment variables for the child interpreter
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "profile.json"
+        subprocess.run(
+            [sys.executable, "-c", _DRIVER, str(output), *shlex.split(command)],
+            cwd=project,
+            env={**os.environ, **(env or {})},
+            capture_output=True,
+            text=True,
+            timeout=1800,
+        )
+        if not output.exists():
+            return {}
+        return json.loads(output.read_text())
+
+
+@click.command()
+@click.argument("commands", nargs=-1)
+@click.option(
+    "--project",
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=Path.cwd(),
+    help="Roadmap project directory to run the commands in (default: cwd)",
+)
+def startup_profile(commands: tuple[str, ...], project: Path):
+    """Show where each CLI command spends its startup time."""
+    for command in commands or DEFAULT_COMMANDS:
+        profile = profile_command(command, project)
+
+        click.echo()
+        click.secho(f"roadmap {command}", fg="cyan", bold=True)
+        if not profile:
+            click.secho("  command crashed before reporting", fg="red")
+            continue
+
+        click.echo(
+            f"  {'import roadmap.adapters.cli':36} {profile['import_ms']:9.1f}ms"
+        )
+        click.echo(f"  {'command (total)':36} {profile['command_ms']:9.1f}ms")
+
+        core_builds = sorted(
+            (
+                (name, stats["total_ms"])
+                for name, stats in profile["operations"].items()
+                if name.startswith("core.")
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for name, total_ms in core_builds:
+            click.echo(f"    {name:34} {total_ms:9.1f}ms")
+
+
+if __name__ == "__main__":
+    startup_profile()
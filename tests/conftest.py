@@ -461,16 +461,22 @@ def clear_session_cache_between_tests():
     - Ensures each test has a clean environment
     - Critical for CLI/command testing where cache persists
     """
-    from roadmap.common.cache import clear_session_cache
+    from roadmap.adapters.github.rate_limiter import reset_rate_limiter
+    from roadmap.adapters.github.response_cache import disable_response_cache
+    from roadmap.common.cache import clear_session_cache, get_parsed_file_cache
 
     # Clear before test
     clear_session_cache()
+    get_parsed_file_cache().clear()
 
     # Test runs here
     yield
 
     # Clear after test
     clear_session_cache()
+    get_parsed_file_cache().clear()
+    disable_response_cache()
+    reset_rate_limiter()
 
 
 # ============================================================================
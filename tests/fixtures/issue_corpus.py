@@ -0,0 +1,232 @@
+"""Synthetic issue corpus generator for performance tests.
+
+Writes realistic issue markdown files straight to disk (bypassing the
+YAML dumper) so that large corpora can be created quickly.
+
+Usage:
+    from tests.fixtures.issue_corpus import generate_issue_corpus
+
+    ids = generate_issue_corpus(tmp_path / ".roadmap" / "issues", count=1000)
+
+    # Whole tree: issues plus milestones, projects and archive
+    tree = generate_roadmap_tree(tmp_path / ".roadmap", issues=1000)
+"""
+
+from pathlib import Path
+
+STATUSES = ("todo", "in-progress", "blocked", "review", "closed")
+PRIORITIES = ("low", "medium", "high", "critical")
+
+ISSUE_TEMPLATE = """---
+id: '{id}'
+title: 'Synthetic issue {n}'
+headline: 'Synthetic issue {n}'
+priority: {priority}
+status: {status}
+archived: false
+issue_type: feature
+milestone: {milestone}
+labels:
+- synthetic
+- batch-{batch}
+remote_ids: {{}}
+created: '2026-01-01T00:00:00+00:00'
+updated: '2026-01-02T00:00:00+00:00'
+assignee: {assignee}
+estimated_hours: {hours}
+due_date: null
+depends_on: [{depends_on}]
+blocks: []
+actual_start_date: null
+actual_end_date: null
+progress_percentage: null
+handoff_notes: null
+previous_assignee: null
+handoff_date: null
+git_branches: []
+git_commits: []
+completed_date: null
+comments: []
+---
+
+# Synthetic issue {n}
+
+## Description
+
+{body}
+
+## Acceptance Criteria
+
+- [ ] Criterion 1
+- [ ] Criterion 2
+"""
+
+
+MILESTONE_TEMPLATE = """---
+name: {name}
+headline: 'Synthetic milestone {n}'
+due_date: '2026-{month:02d}-01T00:00:00'
+status: {status}
+archived: {archived}
+github_milestone: null
+created: '2026-01-01T00:00:00+00:00'
+updated: '2026-01-02T00:00:00+00:00'
+project_id: {project_id}
+calculated_progress: null
+last_progress_update: null
+completion_velocity: null
+risk_level: low
+actual_start_date: null
+actual_end_date: null
+comments: []
+---
+
+# {name}
+"""
+
+PROJECT_TEMPLATE = """---
+id: '{id}'
+name: synthetic-project-{n}
+description: Synthetic project {n}
+owner: user{n}
+priority: medium
+status: active
+created: '2026-01-01T00:00:00+00:00'
+updated: '2026-01-02T00:00:00+00:00'
+tags: []
+---
+
+# synthetic-project-{n}
+"""
+
+
+def synthetic_issue_id(n: int) -> str:
+    """Return the deterministic 8-character ID used for issue ``n``."""
+    return f"{n:08x}"
+
+
+def generate_issue_corpus(
+    issues_dir: Path,
+    count: int,
+    milestones: int = 10,
+    body_paragraphs: int = 3,
+    with_dependencies: bool = False,
+    chain_length: int | None = None,
+    first: int = 0,
+) -> list[str]:
+    """Write ``count`` synthetic issue files under ``issues_dir``.
+
+    Issues are spread round-robin across ``milestones`` milestone
+    directories plus the backlog.
+
+    Args:
+        issues_dir: Target issues directory (created if missing)
+        count: Number of issues to generate
+        milestones: Number of milestone directories to spread issues across
+        body_paragraphs: Paragraphs of filler text per issue body
+        with_dependencies: If True, each issue depends on its predecessor
+        chain_length: With dependencies, start a new chain every
+            ``chain_length`` issues instead of chaining them all
+        first: Number of the first issue, so several corpora can share a
+            roadmap without ID clashes
+
+    Returns:
+        List of generated issue IDs in creation order
+    """
+    paragraph = (
+        "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do "
+        "eiusmod tempor incididunt ut labore et dolore magna aliqua."
+    )
+    body = "\n\n".join([paragraph] * body_paragraphs)
+    ids = []
+    for n in range(first, first + count):
+        issue_id = synthetic_issue_id(n)
+        bucket = n % (milestones + 1)
+        milestone = "backlog" if bucket == milestones else f"m{bucket}"
+        target = issues_dir / milestone
+        target.mkdir(parents=True, exist_ok=True)
+        chained = n > first and (chain_length is None or (n - first) % chain_length)
+        depends_on = (
+            f"'{synthetic_issue_id(n - 1)}'" if with_dependencies and chained else ""
+        )
+        (target / f"{issue_id}-synthetic-issue-{n}.md").write_text(
+            ISSUE_TEMPLATE.format(
+                id=issue_id,
+                n=n,
+                priority=PRIORITIES[n % len(PRIORITIES)],
+                status=STATUSES[n % len(STATUSES)],
+                milestone=milestone,
+                batch=n % 7,
+                assignee=f"user{n % 5}" if n % 3 else "null",
+                hours=float(n % 8 + 1),
+                depends_on=depends_on,
+                body=body,
+            ),
+            encoding="utf-8",
+        )
+        ids.append(issue_id)
+    return ids
+
+
+def generate_roadmap_tree(roadmap_dir: Path, issues: int) -> dict[str, list[str]]:
+    """Write a synthetic .roadmap tree scaled to ``issues`` active issues.
+
+    Besides the issues (in dependency chains of 25), the tree holds one
+    milestone per 250 issues (at least 4), one project per 5,000 issues
+    (at least 2), and an archive with a tenth as many closed issues plus
+    a tenth of the milestones.
+
+    Args:
+        roadmap_dir: The .roadmap directory to write into
+        issues: Number of active issues
+
+    Returns:
+        Dict with the generated "issues", "milestones", "projects" and
+        "archived_issues" identifiers
+    """
+    milestone_count = max(4, issues // 250)
+    project_count = max(2, issues // 5000)
+    archived_milestones = max(1, milestone_count // 10)
+
+    projects = [synthetic_issue_id(0x7000_0000 + n) for n in range(project_count)]
+    projects_dir = roadmap_dir / "projects"
+    projects_dir.mkdir(parents=True, exist_ok=True)
+    for n, project_id in enumerate(projects):
+        (projects_dir / f"{project_id}-synthetic-project-{n}.md").write_text(
+            PROJECT_TEMPLATE.format(id=project_id, n=n), encoding="utf-8"
+        )
+
+    milestones = [f"m{n}" for n in range(milestone_count)]
+    for n in range(milestone_count + archived_milestones):
+        archived = n >= milestone_count
+        target = roadmap_dir / ("archive/milestones" if archived else "milestones")
+        target.mkdir(parents=True, exist_ok=True)
+        (target / f"m{n}.md").write_text(
+            MILESTONE_TEMPLATE.format(
+                name=f"m{n}",
+                n=n,
+                month=n % 12 + 1,
+                status="closed" if archived else "open",
+                archived=str(archived).lower(),
+                project_id=projects[n % project_count],
+            ),
+            encoding="utf-8",
+        )
+
+    return {
+        "issues": generate_issue_corpus(
+            roadmap_dir / "issues",
+            issues,
+            milestones=milestone_count,
+            with_dependencies=True,
+            chain_length=25,
+        ),
+        "milestones": milestones,
+        "projects": projects,
+        "archived_issues": generate_issue_corpus(
+            roadmap_dir / "archive" / "issues",
+            max(1, issues // 10),
+            milestones=milestone_count,
+            first=issues,
+        ),
+    }
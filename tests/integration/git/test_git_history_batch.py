@@ -0,0 +1,128 @@
+"""Integration tests for batched git object reads."""
+
+import os
+import subprocess
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from roadmap.adapters.persistence.git_history import (
+    GitObjectReader,
+    get_file_at_timestamp,
+    get_files_at_timestamp,
+)
+
+pytestmark = [pytest.mark.integration, pytest.mark.filesystem]
+
+
+def _git(repo, *args, env=None):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True, env=env
+    ).stdout
+
+
+def _commit_at(repo, when, message):
+    date = when.isoformat()
+    _git(repo, "add", "-A")
+    _git(
+        repo,
+        "-c",
+        "user.email=test@example.com",
+        "-c",
+        "user.name=Test User",
+        "commit",
+        "-m",
+        message,
+        "--date",
+        date,
+        env={**os.environ, "GIT_COMMITTER_DATE": date},
+    )
+
+
+@pytest.fixture
+def history(tmp_path):
+    """Create a repo whose issue files change across two dated commits."""
+    repo = tmp_path / "repo"
+    issues = repo / ".roadmap" / "issues"
+    (issues / "backlog").mkdir(parents=True)
+    _git(repo, "init")
+
+    first = datetime(2026, 1, 1, tzinfo=UTC)
+    (issues / "backlog" / "one.md").write_text("status: todo\n")
+    (issues / "two.md").write_text("status: todo\n")
+    _commit_at(repo, first, "first")
+
+    second = first + timedelta(days=2)
+    (issues / "backlog" / "one.md").write_text("status: closed\n")
+    (issues / "three.md").write_text("status: todo\n")
+    _commit_at(repo, second, "second")
+
+    return repo, issues, first + timedelta(days=1)
+
+
+class TestGitObjectReader:
+    """Test reading objects over one cat-file process."""
+
+    def test_reads_blobs_and_reports_missing(self, history):
+        repo, _, _ = history
+
+        with GitObjectReader(str(repo)) as reader:
+            assert (
+                reader.read_blob("HEAD:.roadmap/issues/backlog/one.md")
+                == b"status: closed\n"
+            )
+            assert reader.read_blob("HEAD:.roadmap/issues/missing.md") is None
+            assert reader.read_blob("HEAD:.roadmap/issues/two.md") == b"status: todo\n"
+
+        assert reader._process is None
+
+
+class TestGetFilesAtTimestamp:
+    """Test reconstructing many files at a timestamp in one pass."""
+
+    def test_matches_per_file_reads(self, history):
+        repo, issues, between = history
+        paths = [
+            str(issues / "backlog" / "one.md"),
+            str(issues / "two.md"),
+        ]
+
+        contents = get_files_at_timestamp(paths, between, cwd=str(repo))
+
+        assert contents == {
+            paths[0]: "status: todo\n",
+            paths[1]: "status: todo\n",
+        }
+        for path in paths:
+            relative = str(path).removeprefix(f"{repo}/")
+            assert get_file_at_timestamp(relative, between, cwd=str(repo)) == (
+                contents[path].strip()
+            )
+
+    def test_omits_files_created_after_timestamp(self, history):
+        repo, issues, between = history
+        three = str(issues / "three.md")
+
+        assert get_files_at_timestamp([three], between, cwd=str(repo)) == {}
+        assert get_files_at_timestamp([three], datetime.now(UTC), cwd=str(repo)) == {
+            three: "status: todo\n"
+        }
+
+    def test_accepts_paths_relative_to_cwd(self, history):
+        repo, _, between = history
+
+        contents = get_files_at_timestamp(
+            ["backlog/one.md"], between, cwd=str(repo / ".roadmap" / "issues")
+        )
+
+        assert contents == {"backlog/one.md": "status: todo\n"}
+
+    def test_skips_undecodable_file(self, history):
+        repo, issues, _ = history
+        (issues / "binary.md").write_bytes(b"status: \xff\xfe\n")
+        _commit_at(repo, datetime(2026, 1, 5, tzinfo=UTC), "binary")
+        paths = [str(issues / "binary.md"), str(issues / "two.md")]
+
+        contents = get_files_at_timestamp(paths, datetime.now(UTC), cwd=str(repo))
+
+        assert contents == {paths[1]: "status: todo\n"}
@@ -0,0 +1,201 @@
+"""Integration tests for the SQLite issue list index kept fresh via git."""
+
+import subprocess
+
+import pytest
+
+from roadmap.adapters.git.git_command_executor import GitCommandExecutor
+from roadmap.adapters.git.sync_monitor import GitSyncMonitor
+from roadmap.adapters.persistence.parser import IssueParser
+from roadmap.adapters.persistence.storage.state_manager import StateManager
+from roadmap.adapters.persistence.yaml_repositories import YAMLIssueRepository
+from roadmap.common.cache import get_parsed_file_cache
+from roadmap.common.constants import Priority, Status
+from roadmap.core.domain.issue import Issue
+
+pytestmark = [pytest.mark.integration, pytest.mark.filesystem]
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _commit(repo, message="Update issues"):
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", message)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create an empty git repository that ignores the database."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test User")
+    (repo / ".gitignore").write_text(".roadmap/db/\n")
+    return repo
+
+
+@pytest.fixture
+def repository(git_repo):
+    """Create a YAML issue repository wired to a GitSyncMonitor."""
+    state_manager = StateManager(db_path=git_repo / ".roadmap" / "db" / "state.db")
+    state_manager._git_sync_monitor = GitSyncMonitor(
+        repo_path=git_repo, state_manager=state_manager
+    )
+    issues_dir = git_repo / ".roadmap" / "issues"
+    issues_dir.mkdir(parents=True)
+    yield YAMLIssueRepository(state_manager, issues_dir)
+    state_manager.close()
+
+
+def _save(repository, issue_id, **fields):
+    issue = Issue(id=issue_id, title=issue_id, headline=issue_id, **fields)
+    path = repository.issues_dir / "backlog" / f"{issue_id}.md"
+    IssueParser.save_issue_file(issue, path)
+    return path
+
+
+def _ids(issues):
+    return [issue.id for issue in issues]
+
+
+def _paths(repository):
+    return repository.db.issue_list_index.query(f"{repository.issues_dir}/")
+
+
+def _refresh_after_commit(repository):
+    repository.db._git_sync_monitor.clear_cache()
+    get_parsed_file_cache().clear()
+
+
+class TestIssueListIndexSync:
+    """Test that indexed queries track committed and uncommitted changes."""
+
+    def test_not_in_git_repository_falls_back(self, tmp_path):
+        state_manager = StateManager(db_path=tmp_path / "state.db")
+        state_manager._git_sync_monitor = GitSyncMonitor(
+            repo_path=tmp_path, state_manager=state_manager
+        )
+        repository = YAMLIssueRepository(state_manager, tmp_path / "issues")
+
+        assert repository.query() is None
+        state_manager.close()
+
+    def test_query_matches_committed_issues(self, git_repo, repository):
+        _save(repository, "high", priority=Priority.HIGH, status=Status.BLOCKED)
+        _save(repository, "low", priority=Priority.LOW)
+        _commit(git_repo)
+
+        assert _ids(repository.query()) == ["high", "low"]
+        assert _ids(repository.query(blocked_only=True)) == ["high"]
+        assert _ids(repository.query(priority="low")) == ["low"]
+
+    def test_query_tracks_new_commits(self, git_repo, repository):
+        _save(repository, "one")
+        _commit(git_repo)
+        assert _ids(repository.query(status="todo")) == ["one"]
+
+        _save(repository, "one", status=Status.CLOSED)
+        _save(repository, "two")
+        _commit(git_repo)
+        _refresh_after_commit(repository)
+
+        assert _ids(repository.query(status="todo")) == ["two"]
+        assert _ids(repository.query(status="closed")) == ["one"]
+
+    def test_query_tracks_uncommitted_changes_and_reverts(self, git_repo, repository):
+        path = _save(repository, "one")
+        _commit(git_repo)
+        assert _ids(repository.query(assignee="alice")) == []
+
+        _save(repository, "one", assignee="alice")
+        _save(repository, "untracked")
+        assert _ids(repository.query(assignee="alice")) == ["one"]
+        assert set(_ids(repository.query())) == {"one", "untracked"}
+
+        _git(git_repo, "checkout", "--", str(path))
+        (repository.issues_dir / "backlog" / "untracked.md").unlink()
+        get_parsed_file_cache().clear()
+
+        assert _ids(repository.query(assignee="alice")) == []
+        assert _ids(repository.query()) == ["one"]
+
+    def test_query_matches_yaml_list(self, git_repo, repository):
+        _save(repository, "a", priority=Priority.CRITICAL, milestone="v1")
+        _save(repository, "b", priority=Priority.MEDIUM)
+        _save(repository, "c", priority=Priority.HIGH, status=Status.CLOSED)
+        _commit(git_repo)
+
+        indexed = repository.query()
+        listed = repository.list()
+
+        assert sorted(indexed, key=lambda i: i.id) == sorted(listed, key=lambda i: i.id)
+        assert _ids(repository.query(backlog=True, open_only=True)) == ["b"]
+
+    def test_delta_sync_before_first_build_leaves_index_unsynced(
+        self, git_repo, repository
+    ):
+        for issue_id in ("a", "b", "c", "d"):
+            _save(repository, issue_id)
+        _commit(git_repo)
+        monitor = repository.db._git_sync_monitor
+        assert monitor._save_last_synced_commit()
+
+        _save(repository, "e")
+        _commit(git_repo)
+        _refresh_after_commit(repository)
+        repository.db.get_sync_baseline()
+
+        assert repository.db.issue_list_index.get_synced_commit() is None
+        assert sorted(_ids(repository.query())) == sorted(_ids(repository.list()))
+        assert len(repository.query()) == 5
+
+    def test_query_drops_renamed_issue_files(self, git_repo, repository):
+        path = _save(repository, "one")
+        _commit(git_repo)
+        assert _ids(repository.query()) == ["one"]
+
+        _git(git_repo, "mv", str(path), str(path.with_name("renamed.md")))
+
+        assert _ids(repository.query()) == ["one"]
+        assert [str(p) for p in _paths(repository)] == [
+            str(path.with_name("renamed.md"))
+        ]
+
+    def test_refresh_runs_one_git_command_when_head_unchanged(
+        self, git_repo, repository
+    ):
+        _save(repository, "one")
+        _commit(git_repo)
+        _save(repository, "two")
+        assert sorted(_ids(repository.query())) == ["one", "two"]
+
+        monitor = repository.db._git_sync_monitor
+        calls = []
+        run = monitor.git_executor.run
+
+        def counting_run(args, cwd=None):
+            calls.append(args[0])
+            return run(args, cwd)
+
+        monitor.git_executor.run = counting_run
+        _save(repository, "three")
+
+        assert sorted(_ids(repository.query())) == ["one", "three", "two"]
+        assert calls == ["status"]
+
+    def test_query_tracks_uncommitted_changes_from_subdirectory(
+        self, git_repo, repository
+    ):
+        _save(repository, "one")
+        _commit(git_repo)
+        monitor = repository.db._git_sync_monitor
+        # The CLI builds the executor from the working directory
+        (git_repo / "docs").mkdir()
+        monitor.git_executor = GitCommandExecutor(git_repo / "docs")
+
+        _save(repository, "one", assignee="alice")
+
+        assert _ids(repository.query(assignee="alice")) == ["one"]
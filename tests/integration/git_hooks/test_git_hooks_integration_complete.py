@@ -114,8 +114,14 @@ class TestGitHooksIntegration:
         log_file = repo_path / ".git" / "roadmap-hooks.log"
         if log_file.exists():
             log_content = log_file.read_text()
-            assert "Post-commit hook tracked commit" in log_content
-            assert feature_id in log_content or "issues:" in log_content
+            head = subprocess.run(
+                ["git", "rev-parse", "--short=7", "HEAD"],
+                cwd=repo_path,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+            assert f"Commit: {head}" in log_content
 
         # Test commit with completion marker
         bug_file = repo_path / "bugfix.py"
@@ -138,9 +144,7 @@ class TestGitHooksIntegration:
         if log_file.exists():
             log_content = log_file.read_text()
             commit_logs = [
-                line
-                for line in log_content.split("\n")
-                if "Post-commit hook tracked commit" in line
+                line for line in log_content.split("\n") if " - Commit: " in line
             ]
             assert len(commit_logs) >= 2  # Should have at least 2 commit entries
 
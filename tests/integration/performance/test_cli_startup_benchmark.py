@@ -0,0 +1,80 @@
+"""Benchmark: `roadmap --help` cold start stays within budget.
+
+Startup is measured with ``python -X importtime`` in a fresh interpreter.
+Tracing is opt-in, so a normal invocation must not import any
+OpenTelemetry module; the OTLP gRPC exporter alone costs ~150ms to import.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+# Cumulative import time of roadmap.adapters.cli, in seconds
+STARTUP_BUDGET_SECONDS = 4.0
+
+
+def _run_with_importtime(args: list[str], cwd, **env_overrides) -> str:
+    """Invoke the CLI in a fresh interpreter and return the importtime log."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("ROADMAP_")}
+    env.update(env_overrides)
+    completed = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"from roadmap.adapters.cli import main; main({args!r})",
+        ],
+        cwd=cwd,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    return completed.stderr
+
+
+def _cumulative_seconds(importtime_log: str, module: str) -> float:
+    """Cumulative import time of a top-level module, from an importtime log."""
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if name.strip() == module and not name.startswith("  "):
+            return int(cumulative) / 1_000_000
+    raise AssertionError(f"{module} not found in importtime output")
+
+
+def _imported_modules(importtime_log: str) -> set[str]:
+    return {
+        line.rsplit("|", 1)[1].strip()
+        for line in importtime_log.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def test_help_cold_start_within_budget(tmp_path):
+    """`roadmap --help` imports the CLI within the startup budget."""
+    log = _run_with_importtime(["--help"], tmp_path)
+
+    seconds = _cumulative_seconds(log, "roadmap.adapters.cli")
+    print(f"\nroadmap --help import time: {seconds:.3f}s")
+    assert seconds < STARTUP_BUDGET_SECONDS
+    assert not any(m.startswith("opentelemetry") for m in _imported_modules(log))
+
+
+def test_subcommand_skips_opentelemetry_unless_enabled(tmp_path):
+    """Running a command only loads the OTLP exporter when tracing is on."""
+    default_log = _run_with_importtime(["issue", "--help"], tmp_path)
+    traced_log = _run_with_importtime(
+        ["issue", "--help"], tmp_path, ROADMAP_TRACING__ENABLED="true"
+    )
+
+    exporter = "opentelemetry.exporter.otlp.proto.grpc.trace_exporter"
+    assert exporter not in _imported_modules(default_log)
+    assert exporter in _imported_modules(traced_log)
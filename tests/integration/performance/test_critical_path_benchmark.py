@@ -0,0 +1,66 @@
+"""Benchmark: critical path analysis scales linearly with the issue graph.
+
+The calculator orders issues topologically and runs one forward and one
+backward pass, so a 20k-issue dependency graph is analyzed in O(V + E).
+The previous implementation scanned every issue's dependency list for every
+issue to find path ends, which grew quadratically with the issue count.
+"""
+
+import random
+import time
+
+import pytest
+
+from roadmap.core.domain.issue import Issue
+from roadmap.core.services.utils.critical_path_calculator import (
+    CriticalPathCalculator,
+)
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+
+def _build_dag(count: int, seed: int = 7) -> list[Issue]:
+    """Build a random DAG where each issue depends on up to 3 earlier issues."""
+    rng = random.Random(seed)
+    issues = []
+    for i in range(count):
+        deps = (
+            [f"issue-{j}" for j in rng.sample(range(i), min(i, rng.randint(0, 3)))]
+            if i
+            else []
+        )
+        issues.append(
+            Issue(
+                id=f"issue-{i}",
+                title=f"Issue {i}",
+                estimated_hours=float(rng.randint(1, 16)),
+                depends_on=deps,
+            )
+        )
+    return issues
+
+
+def _time_analysis(issues: list[Issue]) -> float:
+    calculator = CriticalPathCalculator()
+    start = time.perf_counter()
+    result = calculator.calculate_critical_path(issues)
+    elapsed = time.perf_counter() - start
+
+    assert result.critical_path
+    assert result.dependency_cycles == []
+    assert result.total_duration == max(
+        node.earliest_finish for node in result.schedule.values()
+    )
+    return elapsed
+
+
+def test_critical_path_scales_linearly_to_20k_issues():
+    """10x more issues costs roughly 10x the time, not 100x."""
+    timings = {count: _time_analysis(_build_dag(count)) for count in (2000, 20000)}
+
+    print(
+        "\ncritical path: "
+        + ", ".join(f"{n} issues={t:.3f}s" for n, t in timings.items())
+    )
+    # Linear growth would be 10x; quadratic would be 100x
+    assert timings[20000] < timings[2000] * 30
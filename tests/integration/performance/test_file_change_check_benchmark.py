@@ -0,0 +1,93 @@
+"""Benchmark: no-change check over 10k synced files.
+
+Compares the stat-first check (one SELECT for all file_sync_state rows, one
+stat() per file) with the previous approach of hashing every file and
+querying its row on its own.
+"""
+
+import hashlib
+import time
+from unittest import mock
+
+import pytest
+
+from roadmap.adapters.persistence.database_manager import DatabaseManager
+from roadmap.adapters.persistence.file_parser import FileParser
+from roadmap.adapters.persistence.storage.queries import QueryService
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+FILE_COUNT = 10_000
+
+
+@pytest.fixture
+def synced_roadmap(tmp_path):
+    """A roadmap directory whose files all have up-to-date sync rows."""
+    (tmp_path / "db").mkdir()
+    manager = DatabaseManager(db_path=tmp_path / "db" / "state.db")
+    issues_dir = tmp_path / "issues"
+    issues_dir.mkdir()
+    rows = []
+    for i in range(FILE_COUNT):
+        file_path = issues_dir / f"issue-{i:05d}.md"
+        file_path.write_text(f"---\nid: issue-{i:05d}\ntitle: Issue {i}\n---\n" * 8)
+        metadata = FileParser.extract_file_metadata(file_path)
+        rows.append(
+            (
+                str(file_path),
+                metadata["hash"],
+                metadata["size"],
+                metadata["mtime_ns"],
+                metadata["inode"],
+            )
+        )
+    with manager.transaction() as conn:
+        conn.executemany(
+            "INSERT INTO file_sync_state "
+            "(file_path, content_hash, file_size, mtime_ns, inode) "
+            "VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+    yield manager, issues_dir
+    manager.close()
+
+
+def _hash_every_file(manager, md_files) -> bool:
+    with manager.transaction() as conn:
+        for file_path in md_files:
+            current_hash = hashlib.sha256(file_path.read_bytes()).hexdigest()
+            row = conn.execute(
+                "SELECT content_hash FROM file_sync_state WHERE file_path = ?",
+                (str(file_path),),
+            ).fetchone()
+            if not row or row[0] != current_hash:
+                return True
+    return False
+
+
+def _best_of(runs: int, check) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        assert check() is False
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def test_stat_first_no_change_check(synced_roadmap):
+    manager, issues_dir = synced_roadmap
+    state_manager = mock.MagicMock()
+    state_manager.db_path = manager.db_path
+    state_manager.transaction = manager.transaction
+    service = QueryService(state_manager)
+
+    hashed_s = _best_of(
+        3, lambda: _hash_every_file(manager, list(issues_dir.rglob("*.md")))
+    )
+    stat_first_s = _best_of(3, service.has_file_changes)
+
+    print(
+        f"\n{FILE_COUNT} files, no changes: hash every file "
+        f"{hashed_s * 1000:.1f}ms, stat-first {stat_first_s * 1000:.1f}ms"
+    )
+    assert stat_first_s < hashed_s
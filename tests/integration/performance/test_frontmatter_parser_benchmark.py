@@ -0,0 +1,88 @@
+"""Benchmark: frontmatter parser throughput over a 10k issue corpus.
+
+Compares the legacy parser (whole-document DOTALL regex + pure-Python
+``yaml.safe_load``) against ``FrontmatterParser.parse_file`` (anchored
+delimiter scan + libyaml ``CSafeLoader``), the frontmatter-only loader, and
+eager vs lazy-body ``Issue`` parsing.
+"""
+
+import re
+import time
+
+import pytest
+import yaml
+
+from roadmap.adapters.persistence.parser import FrontmatterParser, IssueParser
+from roadmap.adapters.persistence.parser.frontmatter import YAMLLoader
+from tests.fixtures.issue_corpus import generate_issue_corpus
+
+pytestmark = [pytest.mark.performance, pytest.mark.filesystem]
+
+CORPUS_SIZE = 10_000
+LEGACY_SAMPLE = 1_000
+ISSUE_SAMPLE = 2_000
+ROUNDS = 3
+
+LEGACY_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+
+def _legacy_parse_file(path):
+    content = path.read_text(encoding="utf-8")
+    match = LEGACY_PATTERN.match(content)
+    assert match is not None
+    frontmatter_str, body = match.groups()
+    return yaml.safe_load(frontmatter_str), body.strip()
+
+
+def _files_per_second(parse, files) -> float:
+    start = time.perf_counter()
+    for path in files:
+        parse(path)
+    return len(files) / (time.perf_counter() - start)
+
+
+def test_parser_throughput_on_10k_corpus(tmp_path):
+    """New parser must be at least 2x faster than the legacy one."""
+    generate_issue_corpus(tmp_path / "issues", CORPUS_SIZE)
+    files = sorted((tmp_path / "issues").rglob("*.md"))
+    assert len(files) == CORPUS_SIZE
+
+    # The legacy parser is slow; a 1k sample gives a stable rate
+    legacy = _files_per_second(_legacy_parse_file, files[:LEGACY_SAMPLE])
+    new = _files_per_second(FrontmatterParser.parse_file, files)
+    frontmatter_only = _files_per_second(
+        FrontmatterParser.parse_frontmatter_file, files
+    )
+
+    print(
+        f"\nloader={YAMLLoader.__name__} legacy={legacy:,.0f} files/s "
+        f"parse_file={new:,.0f} files/s "
+        f"parse_frontmatter_file={frontmatter_only:,.0f} files/s"
+    )
+    assert FrontmatterParser.parse_file(files[0]) == _legacy_parse_file(files[0])
+    if YAMLLoader is yaml.CSafeLoader:
+        assert new > legacy * 2
+
+
+def test_lazy_issue_parsing_on_10k_corpus(tmp_path):
+    """Deferring the body must not be slower than eager issue parsing."""
+    generate_issue_corpus(tmp_path / "issues", CORPUS_SIZE)
+    files = sorted((tmp_path / "issues").rglob("*.md"))
+
+    # Lazy and eager run at similar rates, so interleave rounds and compare
+    # the best of each to keep load from other test workers out of the result
+    eager = lazy = 0.0
+    for _ in range(ROUNDS):
+        eager = max(
+            eager, _files_per_second(IssueParser.parse_issue_file, files[:ISSUE_SAMPLE])
+        )
+        lazy = max(
+            lazy,
+            _files_per_second(IssueParser.parse_issue_file_lazy, files[:ISSUE_SAMPLE]),
+        )
+
+    print(f"\neager={eager:,.0f} issues/s lazy={lazy:,.0f} issues/s")
+    assert IssueParser.parse_issue_file_lazy(files[0]) == (
+        IssueParser.parse_issue_file(files[0])
+    )
+    assert lazy > eager * 0.8
@@ -0,0 +1,52 @@
+"""Benchmark: YAMLIssueRepository.get() stays flat as the issue count grows.
+
+With the persistent ID → path index, a lookup parses a single file
+regardless of how many issues exist. Without it, every lookup parsed the
+whole tree, so time grew linearly with the corpus size.
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from roadmap.adapters.persistence.yaml_repositories import YAMLIssueRepository
+from tests.fixtures.issue_corpus import generate_issue_corpus
+
+pytestmark = [pytest.mark.performance, pytest.mark.filesystem]
+
+LOOKUPS = 50
+
+
+def _time_lookups(repo: YAMLIssueRepository, ids: list[str]) -> float:
+    """Return the mean seconds per get() over a spread of IDs."""
+    step = max(1, len(ids) // LOOKUPS)
+    sample = ids[::step][:LOOKUPS]
+    start = time.perf_counter()
+    for issue_id in sample:
+        assert repo.get(issue_id) is not None
+    return (time.perf_counter() - start) / len(sample)
+
+
+def test_get_time_is_flat_across_corpus_sizes(tmp_path):
+    """Warm-index get() on 2000 issues costs about the same as on 100."""
+    timings = {}
+    for count in (100, 2000):
+        issues_dir = tmp_path / str(count) / ".roadmap" / "issues"
+        ids = generate_issue_corpus(issues_dir, count)
+
+        # First command pays the one-off rescan that builds the index
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        repo.get(ids[0])
+        repo.close()
+
+        timings[count] = _time_lookups(
+            YAMLIssueRepository(MagicMock(), issues_dir), ids
+        )
+
+    print(
+        "\nget() mean: "
+        + ", ".join(f"{n} issues={t * 1000:.2f}ms" for n, t in timings.items())
+    )
+    # 20x more issues must not make single lookups meaningfully slower
+    assert timings[2000] < timings[100] * 3
@@ -0,0 +1,67 @@
+"""Benchmark: cold issue loads parsed in a process pool.
+
+Reading and YAML-parsing issue files is ~95% of a cold load and runs in
+worker processes; pydantic validation stays in the parent. This prints the
+speedup curve over worker counts for 1k/10k/50k generated issues and, on
+machines with more than one core, checks that the pool actually helps.
+"""
+
+import os
+import time
+
+import pytest
+
+from roadmap.adapters.persistence.parser import IssueParser
+from roadmap.common.cache import get_parsed_file_cache
+from roadmap.infrastructure.validation import file_enumeration
+from roadmap.infrastructure.validation.file_enumeration import (
+    FileEnumerationService,
+    SplitParser,
+)
+from tests.fixtures.issue_corpus import generate_issue_corpus
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+ISSUE_SPLIT_PARSER = SplitParser(IssueParser.read_issue_file, IssueParser.build_issue)
+CPUS = os.cpu_count() or 1
+
+
+def _worker_counts() -> list[int]:
+    counts = [1]
+    while counts[-1] * 2 <= CPUS:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != CPUS:
+        counts.append(CPUS)
+    return counts
+
+
+def _cold_load(files, workers: int) -> float:
+    get_parsed_file_cache().clear()
+    start = time.perf_counter()
+    parsed = FileEnumerationService._parse_with_pool(
+        files, IssueParser.parse_issue_file, ISSUE_SPLIT_PARSER, workers=workers
+    )
+    elapsed = time.perf_counter() - start
+    assert all(issue is not None for issue in parsed)
+    return elapsed
+
+
+@pytest.mark.parametrize("count", [1000, 10000, 50000])
+def test_parallel_parse_speedup_curve(tmp_path, monkeypatch, count):
+    """Cold-load time per worker count; more cores must not be slower."""
+    monkeypatch.setattr(file_enumeration, "PARALLEL_PARSE_THRESHOLD", 1)
+    issues_dir = tmp_path / "issues"
+    generate_issue_corpus(issues_dir, count)
+    files = list(issues_dir.rglob("*.md"))
+
+    timings = {workers: _cold_load(files, workers) for workers in _worker_counts()}
+
+    print(
+        f"\n{count} issues: "
+        + ", ".join(
+            f"{workers} cpu={seconds:.2f}s ({timings[1] / seconds:.1f}x)"
+            for workers, seconds in timings.items()
+        )
+    )
+    if CPUS > 1 and count >= 10000:
+        assert timings[CPUS] < timings[1] * 0.8
@@ -367,6 +367,27 @@ class TestRoadmapCore:
         assert progress["progress"] == 0.0
         assert progress["by_status"] == {}
 
+    def test_get_all_milestones_progress(self, core):
+        """Test batch milestone progress matches per-milestone progress."""
+        core.initialize()
+        core.milestones.create("v1-0", "First release")
+        core.milestones.create("v2-0", "Second release")
+        core.milestones.create("empty", "No issues")
+
+        for n, milestone in enumerate(["v1-0", "v1-0", "v2-0", "v2-0", "v2-0"]):
+            issue = core.issues.create(f"Issue {n}")
+            core.issues.assign_to_milestone(issue.id, milestone)
+            if n % 2 == 0:
+                core.issues.update(issue.id, status=Status.CLOSED)
+        core.issues.create("Unassigned issue")
+
+        names = ["v1-0", "v2-0", "empty"]
+        progress = core.milestones.get_all_progress(names)
+
+        assert progress == {name: core.milestones.get_progress(name) for name in names}
+        assert progress["v2-0"]["completed"] == 2
+        assert set(core.milestones.get_all_progress()) == {"v1-0", "v2-0"}
+
     def test_delete_milestone(self, core):
         """Test deleting a milestone."""
 
@@ -0,0 +1,186 @@
+"""Tests for stat-first change detection against file_sync_state."""
+
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from roadmap.adapters.persistence.database_manager import DatabaseManager
+from roadmap.adapters.persistence.file_parser import FileParser
+from roadmap.adapters.persistence.file_sync_index import (
+    check_file,
+    load_synced_file,
+    load_synced_files,
+    refresh_synced_stats,
+)
+from roadmap.adapters.persistence.sync_orchestrator import SyncOrchestrator
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """Create a DatabaseManager backed by a temporary database."""
+    manager = DatabaseManager(db_path=tmp_path / "state.db")
+    yield manager
+    manager.close()
+
+
+def _record(db_manager, file_path, content_hash=None, stat=None):
+    """Store a file_sync_state row for file_path, with or without its stat."""
+    with db_manager.transaction() as conn:
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO file_sync_state
+            (file_path, content_hash, file_size, mtime_ns, inode)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            (
+                str(file_path),
+                content_hash or FileParser.calculate_file_hash(file_path),
+                stat.st_size if stat else None,
+                stat.st_mtime_ns if stat else None,
+                stat.st_ino if stat else None,
+            ),
+        )
+
+
+class TestCheckFile:
+    """Test check_file change decisions."""
+
+    def test_matching_stat_skips_hashing(self, db_manager, tmp_path):
+        file_path = tmp_path / "issue.md"
+        file_path.write_text("content")
+        _record(db_manager, file_path, stat=file_path.stat())
+        hash_file = Mock()
+
+        synced = load_synced_file(db_manager._get_connection(), str(file_path))
+        changed, stale = check_file(file_path, synced, hash_file)
+
+        assert (changed, stale) == (False, None)
+        hash_file.assert_not_called()
+
+    def test_touched_file_is_unchanged_with_stale_stat(self, db_manager, tmp_path):
+        file_path = tmp_path / "issue.md"
+        file_path.write_text("content")
+        _record(db_manager, file_path, stat=file_path.stat())
+        stat = file_path.stat()
+        os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        synced = load_synced_file(db_manager._get_connection(), str(file_path))
+        changed, stale = check_file(file_path, synced)
+
+        assert changed is False
+        assert stale is not None
+        assert stale.st_mtime_ns == stat.st_mtime_ns + 1_000_000
+
+    def test_edited_file_is_changed(self, db_manager, tmp_path):
+        file_path = tmp_path / "issue.md"
+        file_path.write_text("content")
+        _record(db_manager, file_path, stat=file_path.stat())
+        file_path.write_text("edited content")
+
+        synced = load_synced_file(db_manager._get_connection(), str(file_path))
+
+        assert check_file(file_path, synced) == (True, None)
+
+    def test_row_without_stat_falls_back_to_hash(self, db_manager, tmp_path):
+        file_path = tmp_path / "issue.md"
+        file_path.write_text("content")
+        _record(db_manager, file_path)
+
+        synced = load_synced_file(db_manager._get_connection(), str(file_path))
+        changed, stale = check_file(file_path, synced)
+
+        assert changed is False
+        assert stale is not None
+
+    def test_unsynced_or_missing_file_is_changed(self, db_manager, tmp_path):
+        file_path = tmp_path / "issue.md"
+        file_path.write_text("content")
+        _record(db_manager, file_path, stat=file_path.stat())
+        synced = load_synced_file(db_manager._get_connection(), str(file_path))
+        file_path.unlink()
+
+        assert check_file(file_path, None) == (True, None)
+        assert check_file(file_path, synced) == (True, None)
+
+
+class TestSyncedFileRows:
+    """Test loading and refreshing file_sync_state rows."""
+
+    def test_load_synced_files_reads_all_rows(self, db_manager, tmp_path):
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text(name)
+            _record(db_manager, tmp_path / name, stat=(tmp_path / name).stat())
+
+        synced_files = load_synced_files(db_manager._get_connection())
+
+        assert set(synced_files) == {str(tmp_path / "a.md"), str(tmp_path / "b.md")}
+        assert synced_files[str(tmp_path / "a.md")].file_size == 4
+
+    def test_refresh_synced_stats_makes_stat_match(self, db_manager, tmp_path):
+        file_path = tmp_path / "issue.md"
+        file_path.write_text("content")
+        _record(db_manager, file_path)
+
+        with db_manager.transaction() as conn:
+            refresh_synced_stats(conn, [(str(file_path), file_path.stat())])
+
+        synced = load_synced_file(db_manager._get_connection(), str(file_path))
+        assert synced is not None
+        assert synced.matches_stat(file_path.stat())
+
+
+class TestOrchestratorStatFirst:
+    """Test that incremental sync relies on stat before hashing."""
+
+    def test_unchanged_files_are_not_hashed_after_stats_refresh(
+        self, db_manager, tmp_path
+    ):
+        roadmap_dir = tmp_path / ".roadmap"
+        issues_dir = roadmap_dir / "issues"
+        issues_dir.mkdir(parents=True)
+        files = [issues_dir / f"issue-{i}.md" for i in range(3)]
+        for file_path in files:
+            file_path.write_text(f"---\nid: {file_path.stem}\n---\n")
+            _record(db_manager, file_path)
+
+        orchestrator = SyncOrchestrator(
+            db_manager._get_connection, db_manager.transaction
+        )
+        first = orchestrator.sync_directory_incremental(roadmap_dir)
+
+        hash_file = Mock(side_effect=FileParser.calculate_file_hash)
+        orchestrator._parser.calculate_file_hash = hash_file
+        second = orchestrator.sync_directory_incremental(roadmap_dir)
+
+        assert first["files_changed"] == 0
+        assert second["files_checked"] == 3
+        assert second["files_changed"] == 0
+        hash_file.assert_not_called()
+
+
+class TestFileSyncStateMigration:
+    """Test that older databases gain the stat columns."""
+
+    def test_migration_adds_stat_columns(self, tmp_path):
+        db_path = tmp_path / "state.db"
+        manager = DatabaseManager(db_path=db_path)
+        conn = manager._get_connection()
+        conn.executescript(
+            """
+            DROP TABLE file_sync_state;
+            CREATE TABLE file_sync_state (
+                file_path TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                file_size INTEGER,
+                last_modified TIMESTAMP,
+                last_synced TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            """
+        )
+        manager._run_migrations()
+
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(file_sync_state)")}
+        manager.close()
+
+        assert {"mtime_ns", "inode"} <= columns
@@ -224,11 +224,17 @@ class TestFileSynchronizerHasFileChangedErrors:
         test_file = tmp_path / "test.md"
         test_file.write_text("# Test")
 
-        # Mock calculate_file_hash to raise exception
-        with patch.object(
-            synchronizer._parser,
-            "calculate_file_hash",
-            side_effect=Exception("Hash calculation failed"),
+        # Stored stat differs, so the file is hashed and the hash raises
+        sync_status = {"file_path": str(test_file), "content_hash": "old_hash"}
+        with (
+            patch.object(
+                synchronizer, "get_file_sync_status", return_value=sync_status
+            ),
+            patch.object(
+                synchronizer._parser,
+                "calculate_file_hash",
+                side_effect=Exception("Hash calculation failed"),
+            ),
         ):
             with patch(
                 "roadmap.adapters.persistence.file_synchronizer.logger"
@@ -0,0 +1,145 @@
+"""Tests for the SQLite issue list index."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from roadmap.adapters.persistence.storage import StateManager
+from roadmap.common.constants import IssueType, Priority, Status
+from roadmap.core.domain.issue import Issue
+
+
+@pytest.fixture
+def index(tmp_path):
+    """Create an issue list index backed by a fresh database."""
+    state_manager = StateManager(db_path=tmp_path / "state.db")
+    yield state_manager.issue_list_index
+    state_manager.close()
+
+
+@pytest.fixture
+def issues_dir(tmp_path):
+    """Return the directory the indexed issue paths live under."""
+    return str(tmp_path / "issues")
+
+
+def _record(index, issues_dir, issue_id, **fields):
+    path = f"{issues_dir}/{issue_id}.md"
+    index.record(Issue(id=issue_id, title=issue_id, **fields), path)
+    return path
+
+
+class TestIssueListIndexRepository:
+    """Test recording and querying index rows."""
+
+    def test_query_filters_on_indexed_columns(self, index, issues_dir):
+        bug = _record(
+            index,
+            issues_dir,
+            "bug",
+            issue_type=IssueType.BUG,
+            assignee="alice",
+            milestone="v1",
+        )
+        _record(index, issues_dir, "feature", issue_type=IssueType.FEATURE)
+
+        prefix = f"{issues_dir}/"
+        assert index.query(prefix, issue_type="bug") == [bug]
+        assert index.query(prefix, assignee="alice", milestone="v1") == [bug]
+        assert index.query(prefix, assignee="bob") == []
+
+    def test_query_backlog_open_and_blocked(self, index, issues_dir):
+        backlog = _record(index, issues_dir, "backlog", milestone="")
+        blocked = _record(
+            index, issues_dir, "blocked", milestone="v1", status=Status.BLOCKED
+        )
+        _record(index, issues_dir, "closed", milestone="v1", status=Status.CLOSED)
+
+        prefix = f"{issues_dir}/"
+        assert index.query(prefix, backlog=True) == [backlog]
+        assert set(index.query(prefix, open_only=True)) == {backlog, blocked}
+        assert index.query(prefix, blocked_only=True) == [blocked]
+
+    def test_query_overdue_compares_in_utc(self, index, issues_dir):
+        now = datetime.now(UTC)
+        overdue = _record(
+            index,
+            issues_dir,
+            "overdue",
+            due_date=(now - timedelta(hours=1)).astimezone(
+                datetime.now().astimezone().tzinfo
+            ),
+        )
+        _record(index, issues_dir, "future", due_date=now + timedelta(days=1))
+        _record(index, issues_dir, "undated")
+
+        assert index.query(f"{issues_dir}/", overdue=True) == [overdue]
+
+    def test_query_orders_by_priority_then_created(self, index, issues_dir):
+        now = datetime.now(UTC)
+        low = _record(index, issues_dir, "low", priority=Priority.LOW, created=now)
+        newer = _record(index, issues_dir, "newer", priority=Priority.HIGH, created=now)
+        older = _record(
+            index,
+            issues_dir,
+            "older",
+            priority=Priority.HIGH,
+            created=now - timedelta(days=1),
+        )
+
+        assert index.query(f"{issues_dir}/") == [older, newer, low]
+
+    def test_query_is_limited_to_path_prefix(self, index, issues_dir, tmp_path):
+        active = _record(index, issues_dir, "active")
+        index.record(
+            Issue(id="archived", title="archived"),
+            str(tmp_path / "archive" / "issues" / "archived.md"),
+        )
+
+        assert index.query(f"{issues_dir}/") == [active]
+
+    def test_record_replaces_and_remove_deletes(self, index, issues_dir):
+        path = _record(index, issues_dir, "one", status=Status.TODO)
+        index.record(Issue(id="one", title="one", status=Status.CLOSED), path)
+
+        assert index.query(f"{issues_dir}/", status="todo") == []
+        assert index.query(f"{issues_dir}/", status="closed") == [path]
+
+        index.remove(path)
+        assert index.query(f"{issues_dir}/") == []
+
+    def test_record_many_and_remove_many_use_one_transaction_each(
+        self, index, issues_dir
+    ):
+        transaction = index._transaction
+        transactions = []
+
+        def counting_transaction():
+            transactions.append(1)
+            return transaction()
+
+        index._transaction = counting_transaction
+        paths = [f"{issues_dir}/{n}.md" for n in range(50)]
+
+        index.record_many(
+            (Issue(id=str(n), title=str(n)), path) for n, path in enumerate(paths)
+        )
+        assert sorted(index.query(f"{issues_dir}/")) == sorted(paths)
+
+        index.remove_many(paths[:40])
+        assert sorted(index.query(f"{issues_dir}/")) == sorted(paths[40:])
+
+        index.record_many([])
+        index.remove_many([])
+        assert len(transactions) == 2
+
+    def test_clear_resets_rows_and_markers(self, index, issues_dir):
+        _record(index, issues_dir, "one")
+        index.set_synced_commit("abc123")
+        index.set_dirty_paths({".roadmap/issues/one.md"})
+
+        index.clear()
+
+        assert index.query(f"{issues_dir}/") == []
+        assert index.get_synced_commit() is None
+        assert index.get_dirty_paths() == set()
@@ -0,0 +1,211 @@
+"""Tests for the persistent issue ID → path index."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from roadmap.adapters.persistence import issue_index
+from roadmap.adapters.persistence.issue_index import IssuePathIndex
+from roadmap.adapters.persistence.yaml_repositories import YAMLIssueRepository
+from roadmap.core.domain.issue import Issue
+from roadmap.infrastructure.validation.file_enumeration import FileEnumerationService
+
+
+@pytest.fixture
+def issues_dir(tmp_path):
+    """Create an empty issues directory inside a fake .roadmap tree."""
+    path = tmp_path / ".roadmap" / "issues"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestIssuePathIndex:
+    """Test the sidecar index itself."""
+
+    def test_default_location_is_db_dir(self, issues_dir):
+        index = IssuePathIndex(issues_dir)
+
+        assert index.index_path == issues_dir.parent / "db" / "issue_index.json"
+
+    def test_record_and_lookup_roundtrip_across_instances(self, issues_dir):
+        file_path = issues_dir / "backlog" / "abc12345-title.md"
+        file_path.parent.mkdir()
+        file_path.write_text("---\nid: abc12345\n---\n")
+
+        index = IssuePathIndex(issues_dir)
+        index.record("abc12345", file_path)
+        index.flush()
+
+        reloaded = IssuePathIndex(issues_dir)
+        assert reloaded.lookup("abc12345") == file_path
+        assert reloaded.lookup("abc1") == file_path
+        assert len(reloaded) == 1
+
+    def test_lookup_drops_entries_for_missing_files(self, issues_dir):
+        file_path = issues_dir / "abc12345-title.md"
+        file_path.write_text("x")
+        index = IssuePathIndex(issues_dir)
+        index.record("abc12345", file_path)
+
+        file_path.unlink()
+
+        assert index.lookup("abc12345") is None
+        assert len(index) == 0
+
+    def test_record_ignores_files_outside_issues_dir(self, issues_dir, tmp_path):
+        outside = tmp_path / "elsewhere.md"
+        outside.write_text("x")
+        index = IssuePathIndex(issues_dir)
+
+        index.record("abc12345", outside)
+
+        assert len(index) == 0
+
+    def test_corrupt_index_is_treated_as_empty(self, issues_dir):
+        index_path = issues_dir.parent / "db" / "issue_index.json"
+        index_path.parent.mkdir()
+        index_path.write_text("{not json")
+
+        assert IssuePathIndex(issues_dir).lookup("abc") is None
+
+    def test_flush_without_changes_writes_nothing(self, issues_dir):
+        index = IssuePathIndex(issues_dir)
+        index.flush()
+
+        assert not index.index_path.exists()
+
+    def test_changes_are_written_by_flush_or_at_exit(self, issues_dir):
+        file_path = issues_dir / "abc12345-title.md"
+        file_path.write_text("x")
+        index = IssuePathIndex(issues_dir)
+
+        index.record("abc12345", file_path)
+        assert not index.index_path.exists()
+
+        issue_index._flush_pending()
+        assert IssuePathIndex(issues_dir).lookup("abc12345") == file_path
+        assert index not in issue_index._pending_flush
+
+    def test_failed_replace_keeps_previous_index(self, issues_dir):
+        file_path = issues_dir / "abc12345-title.md"
+        file_path.write_text("x")
+        index = IssuePathIndex(issues_dir)
+        index.record("abc12345", file_path)
+        index.flush()
+
+        index.remove("abc12345")
+        with patch.object(issue_index.os, "replace", side_effect=OSError("busy")):
+            index.flush()
+
+        assert IssuePathIndex(issues_dir).lookup("abc12345") == file_path
+        assert list(index.index_path.parent.iterdir()) == [index.index_path]
+
+
+class TestYAMLIssueRepositoryIndex:
+    """Test that the repository consults the index before rescanning."""
+
+    def _save(self, repo, issue_id, milestone=None):
+        issue = Issue(id=issue_id, title=f"Issue {issue_id}", milestone=milestone)
+        repo.save(issue)
+        return issue
+
+    def test_get_uses_index_without_rescan(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        self._save(repo, "aaaa1111")
+        self._save(repo, "bbbb2222")
+        repo.close()
+
+        fresh_repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        with patch(
+            "roadmap.adapters.persistence.yaml_repositories.FileEnumerationService"
+        ) as mock_enum:
+            issue = fresh_repo.get("bbbb")
+
+        mock_enum.enumerate_with_filter.assert_not_called()
+        assert issue is not None
+        assert issue.id == "bbbb2222"
+
+    def test_get_falls_back_to_rescan_and_rebuilds_index(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        self._save(repo, "aaaa1111")
+        repo.close()
+        repo.path_index.index_path.unlink()
+
+        fresh_repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        found = fresh_repo.get("aaaa1111")
+        fresh_repo.close()
+        assert found is not None
+        assert found.id == "aaaa1111"
+        assert IssuePathIndex(issues_dir).lookup("aaaa1111") is not None
+
+    def test_get_detects_moved_file(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        issue = self._save(repo, "aaaa1111")
+        repo.close()
+        moved = issues_dir / "v1" / issue.filename
+        moved.parent.mkdir()
+        (issues_dir / "backlog" / issue.filename).rename(moved)
+
+        found = YAMLIssueRepository(MagicMock(), issues_dir).get("aaaa1111")
+
+        assert found is not None
+        assert found.file_path == str(moved)
+
+    def test_update_and_delete_keep_index_current(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        self._save(repo, "aaaa1111")
+
+        repo.update("aaaa1111", {"milestone": "v2"})
+        moved = repo.path_index.lookup("aaaa1111")
+        assert moved is not None
+        assert moved.parent.name == "v2"
+
+        assert repo.delete("aaaa1111") is True
+        repo.close()
+        assert IssuePathIndex(issues_dir).lookup("aaaa1111") is None
+        assert repo.get("aaaa1111") is None
+
+    def test_miss_rescans_once_until_directory_changes(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        self._save(repo, "aaaa1111")
+        enumerate_with_filter = FileEnumerationService.enumerate_with_filter
+
+        with patch.object(
+            FileEnumerationService,
+            "enumerate_with_filter",
+            side_effect=enumerate_with_filter,
+        ) as scan:
+            assert repo.get("ffff9999") is None
+            assert repo.get("ffff9999") is None
+            assert scan.call_count == 1
+
+            self._save(repo, "ffff9999")
+            repo.path_index.clear()
+            found = repo.get("ffff9999")
+
+        assert scan.call_count == 2
+        assert found is not None
+
+    def test_save_and_get_defer_index_write_until_close(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        self._save(repo, "aaaa1111")
+        self._save(repo, "bbbb2222")
+        assert repo.get("aaaa1111") is not None
+        assert not repo.path_index.index_path.exists()
+
+        with patch.object(
+            IssuePathIndex, "flush", autospec=True, side_effect=IssuePathIndex.flush
+        ) as flush:
+            repo.close()
+
+        assert flush.call_count == 1
+        assert len(IssuePathIndex(issues_dir)) == 2
+
+    def test_miss_keeps_existing_index_entries(self, issues_dir):
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        self._save(repo, "aaaa1111")
+
+        assert repo.get("ffff9999") is None
+        repo.close()
+
+        assert IssuePathIndex(issues_dir).lookup("aaaa1111") is not None
@@ -0,0 +1,99 @@
+"""EXPLAIN QUERY PLAN regression tests for state.db lookups.
+
+Each query here mirrors one issued by QueryService, the repositories or the
+foreign key cascades. None of them may fall back to a full table scan.
+"""
+
+import pytest
+
+from roadmap.adapters.persistence.storage import StateManager
+
+INDEXED_QUERIES = {
+    "milestone_by_title": ("SELECT id FROM milestones WHERE title = ?", ("v1",)),
+    "milestone_issue_count": (
+        "SELECT COUNT(*) FROM issues WHERE milestone_id = ?",
+        ("m1",),
+    ),
+    "milestone_closed_count": (
+        "SELECT COUNT(*) FROM issues WHERE milestone_id = ? AND status = 'closed'",
+        ("m1",),
+    ),
+    "issues_by_status_and_priority": (
+        "SELECT id FROM issues WHERE status = ? AND priority = ?",
+        ("todo", "high"),
+    ),
+    "issues_by_assignee": ("SELECT id FROM issues WHERE assignee = ?", ("alice",)),
+    "issue_status_counts": (
+        "SELECT status, COUNT(*) FROM issues GROUP BY status ORDER BY status",
+        (),
+    ),
+    "dependents_of_issue": (
+        "SELECT issue_id FROM issue_dependencies WHERE depends_on_id = ?",
+        ("i1",),
+    ),
+    "issues_with_label": (
+        "SELECT issue_id FROM issue_labels WHERE label = ?",
+        ("bug",),
+    ),
+    "remote_link_by_issue": (
+        "SELECT remote_id FROM issue_remote_links WHERE issue_uuid = ? AND backend_name = ?",
+        ("i1", "github"),
+    ),
+    "remote_link_by_remote_id": (
+        "SELECT issue_uuid FROM issue_remote_links WHERE backend_name = ? AND remote_id = ?",
+        ("github", "42"),
+    ),
+    "remote_links_for_backend": (
+        "SELECT issue_uuid, remote_id FROM issue_remote_links WHERE backend_name = ?",
+        ("github",),
+    ),
+    "file_sync_state_by_path": (
+        "SELECT content_hash FROM file_sync_state WHERE file_path = ?",
+        ("issues/one.md",),
+    ),
+    "issue_list_by_status": (
+        "SELECT file_path FROM issue_list_index WHERE status = ?",
+        ("todo",),
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def connection(tmp_path_factory):
+    """Open a freshly migrated database."""
+    state_manager = StateManager(db_path=tmp_path_factory.mktemp("db") / "state.db")
+    yield state_manager._get_connection()
+    state_manager.close()
+
+
+def _table_scans(connection, sql, params):
+    """Return plan steps that read a table without using any index."""
+    plan = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [
+        row[3] for row in plan if row[3].startswith("SCAN") and "INDEX" not in row[3]
+    ]
+
+
+@pytest.mark.parametrize("name", sorted(INDEXED_QUERIES))
+def test_query_uses_index(connection, name):
+    sql, params = INDEXED_QUERIES[name]
+    assert _table_scans(connection, sql, params) == []
+
+
+def test_deleting_issue_does_not_scan_dependencies(connection):
+    # The ON DELETE CASCADE from depends_on_id runs this lookup per deleted issue
+    assert (
+        _table_scans(
+            connection,
+            "DELETE FROM issue_dependencies WHERE depends_on_id = ?",
+            ("i1",),
+        )
+        == []
+    )
+
+
+def test_milestone_counts_use_covering_index(connection):
+    sql, params = INDEXED_QUERIES["milestone_closed_count"]
+    plan = connection.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+
+    assert any("COVERING INDEX idx_issues_milestone_status" in row[3] for row in plan)
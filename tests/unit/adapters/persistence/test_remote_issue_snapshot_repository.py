@@ -0,0 +1,92 @@
+"""Tests for the remote issue snapshot repository."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from roadmap.adapters.persistence.storage import StateManager
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    """Create a snapshot repository backed by a fresh database."""
+    state_manager = StateManager(db_path=tmp_path / "state.db")
+    yield state_manager.remote_issue_snapshots
+    state_manager.close()
+
+
+def _issue(number, updated_at, title="t"):
+    return {"number": number, "title": title, "updated_at": updated_at}
+
+
+class TestRemoteIssueSnapshotRepository:
+    """Test snapshot storage and high-water marks."""
+
+    def test_upsert_merges_changes_into_snapshot(self, snapshots):
+        snapshots.replace_all(
+            "github",
+            "o/r",
+            [_issue(2, "2026-01-01T00:00:00Z"), _issue(10, "2026-01-01T00:00:00Z")],
+        )
+
+        snapshots.upsert(
+            "github",
+            "o/r",
+            [
+                _issue(2, "2026-01-02T00:00:00Z", "new"),
+                _issue(3, "2026-01-02T00:00:00Z"),
+            ],
+        )
+
+        assert [
+            (i["number"], i["title"]) for i in snapshots.get_all("github", "o/r")
+        ] == [
+            (2, "new"),
+            (3, "t"),
+            (10, "t"),
+        ]
+
+    def test_replace_all_drops_missing_issues(self, snapshots):
+        snapshots.upsert("github", "o/r", [_issue(1, "2026-01-01T00:00:00Z")])
+
+        snapshots.replace_all("github", "o/r", [_issue(2, "2026-01-01T00:00:00Z")])
+
+        assert [i["number"] for i in snapshots.get_all("github", "o/r")] == [2]
+
+    def test_repositories_are_isolated(self, snapshots):
+        snapshots.upsert("github", "o/a", [_issue(1, "2026-01-01T00:00:00Z")])
+        snapshots.set_high_water_mark("github", "o/a", "2026-01-01T00:00:00Z")
+
+        assert snapshots.get_all("github", "o/b") == []
+        assert snapshots.get_high_water_mark("github", "o/b") is None
+
+    def test_clear_removes_snapshot_and_high_water_mark(self, snapshots):
+        snapshots.upsert("github", "o/r", [_issue(1, "2026-01-01T00:00:00Z")])
+        snapshots.set_high_water_mark("github", "o/r", "2026-01-01T00:00:00Z")
+        assert snapshots.get_high_water_mark("github", "o/r") == "2026-01-01T00:00:00Z"
+
+        snapshots.clear("github", "o/r")
+
+        assert snapshots.get_all("github", "o/r") == []
+        assert snapshots.get_high_water_mark("github", "o/r") is None
+        assert snapshots.get_last_full_fetch("github", "o/r") is None
+
+    def test_delete_removes_only_given_issues(self, snapshots):
+        snapshots.upsert(
+            "github",
+            "o/r",
+            [_issue(1, "2026-01-01T00:00:00Z"), _issue(2, "2026-01-01T00:00:00Z")],
+        )
+
+        snapshots.delete("github", "o/r", [1, 99])
+
+        assert [i["number"] for i in snapshots.get_all("github", "o/r")] == [2]
+
+    def test_replace_all_records_full_fetch_time(self, snapshots):
+        assert snapshots.get_last_full_fetch("github", "o/r") is None
+        before = datetime.now(UTC)
+
+        snapshots.replace_all("github", "o/r", [_issue(1, "2026-01-01T00:00:00Z")])
+
+        last_full = snapshots.get_last_full_fetch("github", "o/r")
+        assert last_full is not None and last_full >= before
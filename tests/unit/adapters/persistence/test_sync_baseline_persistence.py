@@ -65,6 +65,7 @@ class TestSyncBaselineSchema(unittest.TestCase):
             "headline",
             "content",
             "labels",
+            "content_hash",
             "synced_at",
         ]
 
@@ -402,6 +403,71 @@ class TestSyncBaselinePersistence(unittest.TestCase):
         except ValueError:
             self.fail(f"synced_at '{synced_at}' is not valid ISO format")
 
+    def _stored_rows(self):
+        conn = self.state_manager._get_connection()
+        return {
+            row["issue_id"]: (row["content_hash"], row["synced_at"])
+            for row in conn.execute(
+                "SELECT issue_id, content_hash, synced_at FROM sync_base_state"
+            ).fetchall()
+        }
+
+    def test_baseline_save_writes_only_delta(self):
+        """Test that unchanged rows are kept and only changes are written."""
+        baseline = {
+            f"issue-{n}": {
+                "status": "open",
+                "assignee": "alice",
+                "milestone": None,
+                "headline": f"Issue {n}",
+                "content": f"Body {n}",
+                "labels": ["bug"],
+            }
+            for n in range(3)
+        }
+        self.state_manager.save_sync_baseline(baseline)
+        before = self._stored_rows()
+
+        # Mark stored rows so a rewrite would be visible
+        with self.state_manager.transaction() as conn:
+            conn.execute("UPDATE sync_base_state SET synced_at = 'untouched'")
+
+        updated = dict(baseline)
+        updated["issue-1"] = {**baseline["issue-1"], "status": "closed"}
+        del updated["issue-2"]
+        updated["issue-3"] = {**baseline["issue-0"], "headline": "Issue 3"}
+        self.assertTrue(self.state_manager.save_sync_baseline(updated))
+
+        after = self._stored_rows()
+        self.assertEqual(set(after), {"issue-0", "issue-1", "issue-3"})
+        self.assertEqual(after["issue-0"], (before["issue-0"][0], "untouched"))
+        self.assertNotEqual(after["issue-1"][0], before["issue-1"][0])
+        self.assertNotEqual(after["issue-1"][1], "untouched")
+        self.assertNotEqual(after["issue-3"][1], "untouched")
+
+        retrieved = self.state_manager.get_sync_baseline()
+        assert isinstance(retrieved, dict)  # Type guard
+        self.assertEqual(retrieved["issue-1"]["status"], "closed")
+        self.assertEqual(retrieved["issue-3"]["headline"], "Issue 3")
+
+    def test_baseline_rows_without_hash_are_rewritten(self):
+        """Test that rows written before content hashes existed get refreshed."""
+        with self.state_manager.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO sync_base_state (issue_id, status, labels, synced_at)
+                VALUES ('issue-1', 'open', '[]', 'legacy')
+            """
+            )
+
+        self.state_manager.save_sync_baseline(
+            {"issue-1": {"status": "open", "headline": "Test", "labels": []}}
+        )
+
+        content_hash, synced_at = self._stored_rows()["issue-1"]
+        self.assertIsNotNone(content_hash)
+        self.assertNotEqual(synced_at, "legacy")
+
 
 class TestSyncBaselineDataMigration(unittest.TestCase):
     """Test baseline data migration and schema compatibility."""
@@ -291,3 +291,38 @@ class TestYAMLIssueRepositoryIntegration:
         assert len(result) == 5
         assert all(issue in result for issue in mock_active_issues)
         assert all(issue in result for issue in mock_archived_issues)
+
+
+class TestYAMLIssueRepositoryLazyBodies:
+    """Test saving issues listed with deferred bodies."""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        issues_dir = tmp_path / "issues"
+        issues_dir.mkdir()
+        repo = YAMLIssueRepository(MagicMock(), issues_dir)
+        repo.save(
+            Issue(
+                id="abc12345",
+                title="Original",
+                headline="Summary",
+                content="Body that must survive",
+            )
+        )
+        return repo
+
+    @pytest.mark.parametrize(
+        "field, value", [("milestone", "v2"), ("title", "Renamed issue")]
+    )
+    def test_save_after_list_keeps_body_when_file_moves(self, repository, field, value):
+        """Test a listed issue saved to a new path keeps its markdown body."""
+        issue = repository.list()[0]
+        setattr(issue, field, value)
+
+        repository.save(issue)
+
+        saved = repository.get("abc12345")
+        assert saved is not None
+        assert getattr(saved, field) == value
+        assert saved.content == "Body that must survive"
+        assert len(list(repository.issues_dir.rglob("abc12345-*.md"))) == 1
@@ -170,7 +170,7 @@ def test_apply_or_create_local_issue_creates_and_links_when_missing(
         ),
     )
 
-    helper._apply_or_create_local_issue(
+    written = helper._apply_or_create_local_issue(
         issue_id="N-1",
         matching_local_issue=None,
         updates={"title": "New", "content": "Body", "labels": ["enhancement"]},
@@ -188,3 +188,4 @@ def test_apply_or_create_local_issue_creates_and_links_when_missing(
 
     assert created_payloads
     assert linked == [("N-1", "github", 101)]
+    assert written is created
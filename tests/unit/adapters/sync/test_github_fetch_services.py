@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import MagicMock, patch
@@ -162,3 +163,185 @@ def test_dict_to_sync_milestone_requires_number_and_title() -> None:
 
     with pytest.raises(ValueError):
         service._dict_to_sync_milestone({"number": 8})
+
+
+class _FakeSnapshotRepo:
+    """In-memory stand-in for RemoteIssueSnapshotRepository."""
+
+    def __init__(
+        self,
+        high_water: str | None = None,
+        last_full_fetch: datetime | None = None,
+    ) -> None:
+        self.issues: dict[int, dict] = {}
+        self.high_water = high_water
+        self.last_full_fetch = last_full_fetch or datetime.now(UTC)
+
+    def get_high_water_mark(self, backend_name: str, repository: str) -> str | None:
+        return self.high_water
+
+    def get_last_full_fetch(self, backend_name: str, repository: str) -> datetime:
+        return self.last_full_fetch
+
+    def set_high_water_mark(
+        self, backend_name: str, repository: str, updated_at: str
+    ) -> None:
+        self.high_water = updated_at
+
+    def replace_all(self, backend_name: str, repository: str, issues: list) -> None:
+        self.issues = {issue["number"]: issue for issue in issues}
+        self.last_full_fetch = datetime.now(UTC)
+
+    def upsert(self, backend_name: str, repository: str, issues: list) -> None:
+        self.issues.update({issue["number"]: issue for issue in issues})
+
+    def get_all(self, backend_name: str, repository: str) -> list[dict]:
+        return [self.issues[number] for number in sorted(self.issues)]
+
+
+def _incremental_service(client: MagicMock, snapshot_repo, **config) -> Any:
+    return GitHubIssueFetchService(
+        github_client=client,
+        config={"owner": "acme", "repo": "roadmap", **config},
+        helpers=MagicMock(),
+        snapshot_repo=snapshot_repo,
+    )
+
+
+def test_github_issue_fetch_service_seeds_snapshot_with_full_fetch() -> None:
+    client = MagicMock()
+    client.get_issues.return_value = [
+        {
+            "number": 1,
+            "title": "one",
+            "state": "open",
+            "labels": [{"name": "bug", "color": "f00"}],
+            "assignee": {"login": "alice", "id": 7},
+            "updated_at": "2026-01-02T00:00:00Z",
+        },
+        {"number": 2, "title": "two", "updated_at": "2026-01-01T00:00:00Z"},
+    ]
+    snapshot_repo = _FakeSnapshotRepo()
+
+    result = _incremental_service(client, snapshot_repo).get_issues()
+
+    client.get_issues.assert_called_once_with("acme", "roadmap", state="all")
+    assert set(result) == {"1", "2"}
+    assert snapshot_repo.high_water == "2026-01-02T00:00:00Z"
+    assert snapshot_repo.issues[1]["labels"] == ["bug"]
+    assert snapshot_repo.issues[1]["assignee"] == {"login": "alice"}
+
+
+def test_github_issue_fetch_service_merges_changes_since_high_water() -> None:
+    client = MagicMock()
+    client.get_issues.return_value = [
+        {"number": 2, "title": "renamed", "updated_at": "2026-01-05T00:00:00Z"}
+    ]
+    snapshot_repo = _FakeSnapshotRepo(high_water="2026-01-02T00:00:00Z")
+    snapshot_repo.issues = {
+        1: {"number": 1, "title": "one", "updated_at": "2026-01-02T00:00:00Z"},
+        2: {"number": 2, "title": "two", "updated_at": "2026-01-01T00:00:00Z"},
+    }
+
+    result = _incremental_service(client, snapshot_repo).get_issues()
+
+    client.get_issues.assert_called_once_with(
+        "acme", "roadmap", state="all", since="2026-01-02T00:00:00Z"
+    )
+    assert {key: issue.title for key, issue in result.items()} == {
+        "1": "one",
+        "2": "renamed",
+    }
+    assert snapshot_repo.high_water == "2026-01-05T00:00:00Z"
+
+
+def test_github_issue_fetch_service_stale_snapshot_is_replaced_by_full_fetch() -> None:
+    client = MagicMock()
+    client.get_issues.return_value = [
+        {"number": 2, "title": "two", "updated_at": "2026-01-01T00:00:00Z"}
+    ]
+    snapshot_repo = _FakeSnapshotRepo(
+        high_water="2026-01-02T00:00:00Z",
+        last_full_fetch=datetime.now(UTC) - timedelta(days=8),
+    )
+    snapshot_repo.issues = {
+        1: {"number": 1, "title": "deleted", "updated_at": "2026-01-02T00:00:00Z"},
+        2: {"number": 2, "title": "two", "updated_at": "2026-01-01T00:00:00Z"},
+    }
+
+    result = _incremental_service(client, snapshot_repo).get_issues()
+
+    client.get_issues.assert_called_once_with("acme", "roadmap", state="all")
+    assert set(result) == {"2"}
+    assert set(snapshot_repo.issues) == {2}
+
+
+def test_github_issue_fetch_service_full_fetch_interval_is_configurable() -> None:
+    client = MagicMock()
+    client.get_issues.return_value = []
+    snapshot_repo = _FakeSnapshotRepo(
+        high_water="2026-01-02T00:00:00Z",
+        last_full_fetch=datetime.now(UTC) - timedelta(days=8),
+    )
+
+    _incremental_service(
+        client, snapshot_repo, sync_settings={"full_fetch_interval_days": 30}
+    ).get_issues()
+
+    client.get_issues.assert_called_once_with(
+        "acme", "roadmap", state="all", since="2026-01-02T00:00:00Z"
+    )
+
+
+def test_github_issue_fetch_service_incremental_fetch_can_be_disabled() -> None:
+    client = MagicMock()
+    client.get_issues.return_value = []
+    snapshot_repo = _FakeSnapshotRepo(high_water="2026-01-02T00:00:00Z")
+
+    _incremental_service(client, snapshot_repo, incremental_fetch=False).get_issues()
+
+    client.get_issues.assert_called_once_with("acme", "roadmap", state="all")
+    assert snapshot_repo.high_water == "2026-01-02T00:00:00Z"
+
+
+def test_github_issue_fetch_service_graphql_mode_lists_with_graphql() -> None:
+    client = MagicMock()
+    client.get_issues_graphql.return_value = [
+        {"number": 3, "title": "three", "updated_at": "2026-01-06T00:00:00Z"}
+    ]
+    snapshot_repo = _FakeSnapshotRepo(high_water="2026-01-02T00:00:00Z")
+
+    result = _incremental_service(
+        client, snapshot_repo, sync_settings={"issue_fetch_api": "graphql"}
+    ).get_issues()
+
+    client.get_issues_graphql.assert_called_once_with(
+        "acme", "roadmap", state="all", since="2026-01-02T00:00:00Z"
+    )
+    client.get_issues.assert_not_called()
+    assert set(result) == {"3"}
+
+
+def test_github_issue_fetch_service_graphql_failure_falls_back_to_rest() -> None:
+    client = MagicMock()
+    client.get_issues_graphql.side_effect = RuntimeError("graphql disabled")
+    client.get_issues.return_value = [{"number": 1, "title": "one"}]
+
+    result = _incremental_service(
+        client, None, sync_settings={"issue_fetch_api": "graphql"}
+    ).get_issues()
+
+    client.get_issues.assert_called_once_with("acme", "roadmap", state="all")
+    assert set(result) == {"1"}
+
+
+def test_github_issue_fetch_service_unknown_fetch_api_uses_rest() -> None:
+    client = MagicMock()
+    client.get_issues.return_value = []
+
+    _incremental_service(
+        client, None, sync_settings={"issue_fetch_api": "soap"}
+    ).get_issues()
+
+    client.get_issues_graphql.assert_not_called()
+    client.get_issues.assert_called_once_with("acme", "roadmap", state="all")
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+import time
 from types import SimpleNamespace
 from typing import Any, cast
 
@@ -21,9 +23,20 @@ def test_create_interval_defaults_and_invalid_values() -> None:
         config={"sync_settings": {"create_min_interval_seconds": "invalid"}}
     )
 
-    assert GitHubSyncOps(backend_default)._create_min_interval_seconds == 1.0
+    assert GitHubSyncOps(backend_default)._create_min_interval_seconds == 0.0
     assert GitHubSyncOps(backend_valid)._create_min_interval_seconds == 2.5
-    assert GitHubSyncOps(backend_invalid)._create_min_interval_seconds == 1.0
+    assert GitHubSyncOps(backend_invalid)._create_min_interval_seconds == 0.0
+
+
+def test_pull_workers_defaults_and_invalid_values() -> None:
+    def workers(value: Any) -> int:
+        backend = SimpleNamespace(config={"sync_settings": {"pull_workers": value}})
+        return GitHubSyncOps(backend)._pull_workers
+
+    assert GitHubSyncOps(SimpleNamespace(config={}))._pull_workers == 5
+    assert workers("3") == 3
+    assert workers(0) == 1
+    assert workers("many") == 5
 
 
 def test_sync_labels_enabled_reads_config_flag() -> None:
@@ -326,3 +339,156 @@ def test_pull_single_milestone_returns_core_missing_error() -> None:
 
     assert success is False
     assert error == "Core not available"
+
+
+class _PullBackend:
+    """Backend double recording how each pulled issue was matched and written."""
+
+    def __init__(self, local_issues: list[Any]) -> None:
+        self.config: dict[str, Any] = {}
+        self.list_calls = 0
+        self.writes: list[tuple[str, Any]] = []
+        self.core = SimpleNamespace(issues=SimpleNamespace(list=self._list))
+        self._local_issues = local_issues
+
+    def _list(self) -> list[Any]:
+        self.list_calls += 1
+        return list(self._local_issues)
+
+    def _find_matching_local_issue(self, title: str, github_id: Any) -> Any:
+        raise AssertionError("pulled issues should be matched from the index")
+
+    def _apply_or_create_local_issue(
+        self, issue_id, matching_local_issue, updates, github_id, remote_issue=None
+    ) -> Any:
+        self.writes.append((str(github_id), matching_local_issue))
+        return matching_local_issue or SimpleNamespace(
+            id=f"local-{github_id}",
+            title=updates["title"],
+            remote_ids={"github": str(github_id)},
+        )
+
+
+def _remote_issue(number: int, title: str) -> SyncIssue:
+    return SyncIssue(
+        id=str(number),
+        title=title,
+        status="open",
+        backend_id=str(number),
+        remote_ids={"github": str(number)},
+    )
+
+
+def _pull(ops: GitHubSyncOps, issues: list[SyncIssue]) -> SyncReport:
+    return ops._pull_issues_phase(
+        issues_to_pull=[(f"_remote_{i.id}", i.id, i) for i in issues],
+        all_remote_milestones={},
+        milestone_pull_report=SyncReport(),
+        report=SyncReport(),
+    )
+
+
+def test_pull_issues_phase_lists_local_issues_once() -> None:
+    linked = SimpleNamespace(id="L-1", title="Other", remote_ids={"github": "3"})
+    titled = SimpleNamespace(id="L-2", title="Issue 5", remote_ids={})
+    backend = _PullBackend([linked, titled])
+    issues = [_remote_issue(n, f"Issue {n}") for n in range(1, 21)]
+
+    result = _pull(GitHubSyncOps(backend), issues)
+
+    assert result.pulled == [f"_remote_{n}" for n in range(1, 21)]
+    assert backend.list_calls == 1
+    assert [github_id for github_id, _ in backend.writes] == [
+        str(n) for n in range(1, 21)
+    ]
+    assert backend.writes[2] == ("3", linked)
+    assert backend.writes[4] == ("5", titled)
+
+
+def test_pull_issues_phase_matches_titles_written_earlier_in_run() -> None:
+    backend = _PullBackend([])
+    first, duplicate = _remote_issue(1, "Same title"), _remote_issue(2, "same TITLE")
+
+    _pull(GitHubSyncOps(backend), [first, duplicate])
+
+    assert backend.writes[0] == ("1", None)
+    assert backend.writes[1][1].id == "local-1"
+
+
+def test_pull_issues_phase_prepares_on_pool_and_writes_on_caller() -> None:
+    backend = _PullBackend([])
+    backend.config = {"sync_settings": {"pull_workers": 4}}
+    ops = GitHubSyncOps(backend)
+    prepare_threads: set[int] = set()
+    write_threads: set[int] = set()
+    prepare = ops._prepare_pull
+    apply = backend._apply_or_create_local_issue
+
+    def recording_prepare(sync_issue, local_issues=None):
+        prepare_threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return prepare(sync_issue, local_issues)
+
+    def recording_apply(*args, **kwargs):
+        write_threads.add(threading.get_ident())
+        return apply(*args, **kwargs)
+
+    ops._prepare_pull = recording_prepare  # type: ignore[method-assign]
+    backend._apply_or_create_local_issue = recording_apply  # type: ignore[method-assign]
+    issues = [_remote_issue(n, f"Issue {n}") for n in range(1, 13)]
+
+    result = _pull(ops, issues)
+
+    assert result.pulled == [f"_remote_{n}" for n in range(1, 13)]
+    assert [github_id for github_id, _ in backend.writes] == [
+        str(n) for n in range(1, 13)
+    ]
+    assert threading.get_ident() not in prepare_threads
+    assert write_threads == {threading.get_ident()}
+
+
+def test_pull_issues_phase_reports_prepare_failure_per_issue() -> None:
+    backend = _PullBackend([])
+    ops = GitHubSyncOps(backend)
+    prepare = ops._prepare_pull
+
+    def failing_prepare(sync_issue, local_issues=None):
+        if sync_issue.id == "2":
+            raise ValueError("bad payload")
+        return prepare(sync_issue, local_issues)
+
+    ops._prepare_pull = failing_prepare  # type: ignore[method-assign]
+
+    result = _pull(ops, [_remote_issue(n, f"Issue {n}") for n in range(1, 4)])
+
+    assert result.pulled == ["_remote_1", "_remote_3"]
+    assert "bad payload" in result.errors["_remote_2"]
+    assert [github_id for github_id, _ in backend.writes] == ["1", "3"]
+
+
+def test_pull_single_milestone_uses_and_updates_local_index() -> None:
+    created: list[str] = []
+
+    class _Milestones:
+        def list(self):
+            raise AssertionError("local milestones should come from the index")
+
+        def create(self, name, headline, due_date, status):
+            created.append(name)
+            return SimpleNamespace(name=name)
+
+        def update(self, name, **updates):
+            return True
+
+    backend = SimpleNamespace(core=SimpleNamespace(milestones=_Milestones()), config={})
+    ops = GitHubSyncOps(backend)
+    ops._link_milestone_to_github = lambda name, number: True  # type: ignore[method-assign]
+    local_milestones: dict[str, Any] = {}
+    remote = SimpleNamespace(
+        name="v1-0", backend_id=1, status="open", due_date=None, headline=""
+    )
+
+    assert ops._pull_single_milestone(remote, local_milestones) == (True, None)
+    assert ops._pull_single_milestone(remote, local_milestones) == (True, None)
+    assert created == ["v1-0"]
+    assert set(local_milestones) == {"v1-0"}
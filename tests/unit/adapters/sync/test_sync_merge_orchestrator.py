@@ -2,8 +2,10 @@
 
 from types import SimpleNamespace
 from typing import Any, cast
+from unittest.mock import MagicMock
 
 from roadmap.adapters.sync.sync_merge_orchestrator import SyncMergeOrchestrator
+from roadmap.core.domain.issue import Issue
 
 
 class _FakeResult:
@@ -27,7 +29,7 @@ def _change(
     local_only: bool = False,
     remote_only: bool = False,
 ):
-    local_state = SimpleNamespace(id=issue_id, status="todo") if local_only else None
+    local_state = Issue(id=issue_id, title=f"Issue {issue_id}") if local_only else None
     remote_state = {"status": "open", "backend_id": issue_id} if remote_only else {}
 
     return SimpleNamespace(
@@ -145,3 +147,28 @@ def test_analyze_all_issues_respects_push_only_and_pull_only():
     assert "push" in push_types
     assert "push" not in pull_types
     assert "pull" in pull_types
+
+
+def test_analyze_all_issues_starts_remote_snapshot():
+    orchestrator = _orchestrator()
+    started = []
+    orchestrator.backend.begin_remote_snapshot = lambda: started.append(True)
+    orchestrator.backend.authenticate = lambda: _FakeResult(error="auth failed")
+
+    orchestrator.analyze_all_issues()
+
+    assert started == [True]
+
+
+def test_sync_all_issues_ends_remote_snapshot_after_every_run():
+    orchestrator = _orchestrator()
+    calls = []
+    orchestrator.backend.begin_remote_snapshot = lambda: calls.append("begin")
+    orchestrator.backend.end_remote_snapshot = lambda: calls.append("end")
+    orchestrator._observability = MagicMock()
+    orchestrator._sync_initialize = lambda *args: (None, None)
+
+    orchestrator.sync_all_issues(dry_run=True)
+    orchestrator.sync_all_issues(dry_run=False)
+
+    assert calls == ["begin", "end", "begin", "end"]
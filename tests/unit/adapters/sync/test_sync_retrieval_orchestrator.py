@@ -8,6 +8,7 @@ from unittest.mock import Mock
 import pytest
 
 from roadmap.adapters.sync.sync_retrieval_orchestrator import SyncRetrievalOrchestrator
+from roadmap.core.domain.issue import Issue
 from roadmap.core.models.sync_models import SyncIssue
 from roadmap.core.services.baseline.baseline_selector import BaselineStrategy
 from roadmap.core.services.sync.sync_state import IssueBaseState, SyncState
@@ -158,3 +159,17 @@ def test_build_baseline_from_remote_issues_maps_fields():
     assert state.status == "in_progress"
     assert state.assignee == "dev"
     assert state.labels == ["sync"]
+
+
+def test_find_issue_file_uses_issue_file_path(tmp_path):
+    orchestrator = object.__new__(SyncRetrievalOrchestrator)
+    orchestrator._search_issue_file = Mock(return_value=None)
+    issue_file = tmp_path / "A-issue.md"
+    issue_file.write_text("---\nid: A\n---\n")
+
+    found = orchestrator._find_issue_file(
+        Issue(id="A", title="Issue", file_path=str(issue_file))
+    )
+
+    assert found == issue_file
+    orchestrator._search_issue_file.assert_not_called()
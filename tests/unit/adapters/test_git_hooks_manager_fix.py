@@ -35,9 +35,10 @@ class TestGitHooksManagerFix:
                 in content
             )
 
-            # Verify it has proper method name (underscores instead of hyphens)
+            # Verify it calls the handler method (underscores instead of hyphens)
             handler_name = hook_name.replace("-", "_")
-            assert f'getattr(hook_manager, "{handler_name}")' in content
+            assert f'getattr(hook_manager, "handle_{handler_name}")' in content
+            assert hasattr(GitHookManager, f"handle_{handler_name}")
 
             # Verify heredoc syntax for python code
             assert "PYTHON_HOOK_EOF" in content
@@ -62,6 +63,14 @@ class TestGitHooksManagerFix:
                 except SyntaxError as e:
                     pytest.fail(f"Hook {hook_name} has invalid Python syntax: {e}")
 
+            # The daemon client runs from its own heredoc
+            start_idx = content.find("PYTHON_CLIENT_EOF'") + len("PYTHON_CLIENT_EOF'")
+            end_idx = content.find("PYTHON_CLIENT_EOF", start_idx)
+            try:
+                compile(content[start_idx:end_idx], "<hook_client>", "exec")
+            except SyntaxError as e:
+                pytest.fail(f"Hook {hook_name} has invalid client syntax: {e}")
+
     def test_handler_methods_exist(self):
         """Test that all handler methods exist on GitHookManager."""
         mock_core = MagicMock(spec=RoadmapCore)
@@ -0,0 +1,157 @@
+"""Tests for listing issues through GitHub GraphQL against recorded responses."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests
+
+from roadmap.adapters.github.handlers.base import GitHubAPIError
+from roadmap.adapters.github.handlers.issues import (
+    GRAPHQL_MIN_PAGE_SIZE,
+    IssueHandler,
+    estimate_issue_page_cost,
+)
+
+FIXTURES = Path(__file__).parents[2] / "fixtures" / "github_graphql"
+
+
+class _StubGraphQL(BaseHTTPRequestHandler):
+    """Serve recorded GraphQL pages by cursor and REST issues by number."""
+
+    pages: dict[str | None, dict] = {}
+    rest_issues: dict[str, dict] = {}
+    failures: list[int] = []
+    queries: list[dict] = []
+    gets: list[str] = []
+
+    def _reply(self, status: int, payload) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("X-RateLimit-Resource", "graphql")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802
+        length = int(self.headers["Content-Length"])
+        request = json.loads(self.rfile.read(length))
+        self.queries.append(request["variables"])
+        if self.failures:
+            self._reply(self.failures.pop(0), {"message": "Server Error"})
+            return
+        self._reply(200, self.pages[request["variables"]["after"]])
+
+    def do_GET(self):  # noqa: N802
+        self.gets.append(self.path)
+        self._reply(200, self.rest_issues[self.path])
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Run the stub GitHub API with the recorded issue pages."""
+    _StubGraphQL.pages = {
+        None: json.loads((FIXTURES / "issues_page_1.json").read_text()),
+        "Y3Vyc29yOjI=": json.loads((FIXTURES / "issues_page_2.json").read_text()),
+    }
+    _StubGraphQL.rest_issues = {
+        "/repos/o/r/issues/3": {
+            "number": 3,
+            "labels": [{"name": f"label-{i}"} for i in range(1, 22)],
+        }
+    }
+    _StubGraphQL.failures = []
+    _StubGraphQL.queries = []
+    _StubGraphQL.gets = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGraphQL)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _handler(base_url):
+    session = requests.Session()
+    session.headers["Authorization"] = "token t"
+    handler = IssueHandler(session, "o", "r")
+    handler.BASE_URL = base_url
+    return handler
+
+
+class TestGraphQLIssueListing:
+    """Test IssueHandler.get_issues_graphql."""
+
+    def test_lists_all_pages_in_rest_shape(self, stub_server):
+        issues = _handler(stub_server).get_issues_graphql()
+
+        assert [issue["number"] for issue in issues] == [1, 2, 3]
+        assert issues[0] == {
+            "number": 1,
+            "node_id": "I_kwDOA1",
+            "title": "Set up CI",
+            "body": "Run the test suite on every push.",
+            "state": "closed",
+            "labels": [{"name": "ci"}, {"name": "status:done"}],
+            "assignee": {"login": "octocat"},
+            "assignees": [{"login": "octocat"}, {"login": "hubot"}],
+            "milestone": {"number": 4, "title": "v1.0"},
+            "updated_at": "2026-10-01T09:30:00Z",
+        }
+        assert issues[1]["assignee"] is None
+        assert issues[1]["milestone"] is None
+        assert [q["after"] for q in _StubGraphQL.queries] == [None, "Y3Vyc29yOjI="]
+
+    def test_truncated_labels_are_completed_from_rest(self, stub_server):
+        issues = _handler(stub_server).get_issues_graphql()
+
+        assert _StubGraphQL.gets == ["/repos/o/r/issues/3"]
+        assert len(issues[2]["labels"]) == 21
+
+    def test_state_and_since_are_forwarded(self, stub_server):
+        _handler(stub_server).get_issues_graphql(
+            state="open", since="2026-10-01T00:00:00Z"
+        )
+
+        assert _StubGraphQL.queries[0]["states"] == ["OPEN"]
+        assert _StubGraphQL.queries[0]["since"] == "2026-10-01T00:00:00Z"
+
+    def test_failed_page_is_retried_smaller(self, stub_server):
+        _StubGraphQL.failures = [502]
+
+        issues = _handler(stub_server).get_issues_graphql()
+
+        assert len(issues) == 3
+        assert [q["first"] for q in _StubGraphQL.queries] == [100, 50, 100]
+        assert [q["after"] for q in _StubGraphQL.queries][:2] == [None, None]
+
+    def test_failure_at_smallest_page_raises(self, stub_server):
+        _StubGraphQL.failures = [502, 502]
+
+        with pytest.raises(GitHubAPIError):
+            _handler(stub_server).get_issues_graphql(page_size=GRAPHQL_MIN_PAGE_SIZE)
+
+    def test_graphql_errors_without_data_raise(self, stub_server):
+        _StubGraphQL.pages[None] = {"errors": [{"message": "Bad credentials"}]}
+
+        with pytest.raises(GitHubAPIError, match="Bad credentials"):
+            _handler(stub_server).get_issues_graphql(page_size=GRAPHQL_MIN_PAGE_SIZE)
+
+    def test_page_size_is_capped_by_remaining_budget(self, stub_server):
+        page = _StubGraphQL.pages[None]
+        page["data"]["rateLimit"]["remaining"] = 1
+
+        _handler(stub_server).get_issues_graphql()
+
+        assert _StubGraphQL.queries[1]["first"] == 50
+
+
+def test_estimate_issue_page_cost():
+    assert estimate_issue_page_cost(10) == 1
+    assert estimate_issue_page_cost(100) == 2
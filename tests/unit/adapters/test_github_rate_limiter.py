@@ -0,0 +1,266 @@
+"""Tests for the adaptive GitHub rate limiter."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from roadmap.adapters.github import rate_limiter
+from roadmap.adapters.github.handlers.base import BaseGitHubHandler
+from roadmap.adapters.github.rate_limiter import (
+    CONTENT_CREATION_PER_MINUTE,
+    PRIMARY_RESERVE,
+    GitHubRateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    reset_rate_limiter,
+)
+from roadmap.common.errors import GitHubRateLimitError
+
+
+class FakeClock:
+    """Clock whose sleep advances time instead of blocking."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def limiter(clock):
+    return GitHubRateLimiter(
+        max_concurrency=4, clock=clock, wall_clock=clock, sleep=clock.sleep
+    )
+
+
+def _response(status: int = 200, text: str = "", **headers) -> SimpleNamespace:
+    return SimpleNamespace(
+        status_code=status,
+        text=text,
+        headers={key.replace("_", "-"): value for key, value in headers.items()},
+    )
+
+
+class TestTokenBucket:
+    """Test the bucket behind the secondary limits."""
+
+    def test_no_window_exceeds_the_limit(self, clock):
+        bucket = TokenBucket(100, 60, clock)
+        granted_at = []
+        for _ in range(200):
+            clock.now += bucket.reserve(1)
+            granted_at.append(clock.now)
+
+        for i, start in enumerate(granted_at):
+            in_window = [t for t in granted_at[i:] if t < start + 60]
+            assert len(in_window) <= 90
+
+    def test_overdraw_waits_for_refill(self, clock):
+        bucket = TokenBucket(100, 60, clock)
+
+        assert bucket.reserve(bucket.capacity) == 0.0
+        assert bucket.reserve(bucket.rate) == pytest.approx(1.0)
+
+
+class TestGitHubRateLimiter:
+    """Test pacing, budgets and adaptive concurrency."""
+
+    def test_reads_within_budget_do_not_wait(self, limiter, clock):
+        for _ in range(50):
+            with limiter.request("GET"):
+                pass
+
+        assert clock.sleeps == []
+        assert limiter.stats().requests == 50
+
+    def test_content_creation_is_paced(self, limiter, clock):
+        for _ in range(CONTENT_CREATION_PER_MINUTE):
+            with limiter.request("POST"):
+                pass
+
+        stats = limiter.stats()
+        assert stats.throttled_requests > 0
+        assert clock.now - 1000.0 >= 60 * 0.75
+
+    def test_graphql_queries_are_not_content_creation(self, limiter, clock):
+        for _ in range(CONTENT_CREATION_PER_MINUTE):
+            with limiter.request("POST", "graphql", mutation=False):
+                pass
+
+        assert clock.sleeps == []
+
+    def test_exhausted_primary_budget_waits_for_reset(self, limiter, clock):
+        reset = int(clock.now) + 30
+        limiter.record_response(
+            _response(
+                X_RateLimit_Remaining=str(PRIMARY_RESERVE),
+                X_RateLimit_Reset=str(reset),
+                X_RateLimit_Resource="core",
+            )
+        )
+
+        limiter.acquire("GET")
+        limiter.release()
+
+        assert clock.now >= reset
+        assert limiter.stats().primary_limit_waits == 1
+        assert limiter.stats().remaining == {"core": PRIMARY_RESERVE}
+
+    def test_primary_wait_beyond_max_wait_raises(self, limiter, clock):
+        reset = int(clock.now) + 3600
+        limiter.record_response(
+            _response(
+                X_RateLimit_Remaining="0",
+                X_RateLimit_Reset=str(reset),
+                X_RateLimit_Resource="core",
+            )
+        )
+
+        with pytest.raises(GitHubRateLimitError, match="1970-01-01 01:16:40 UTC") as e:
+            limiter.acquire("GET")
+
+        assert e.value.resource == "core"
+        assert e.value.reset_at == reset
+        assert clock.sleeps == []
+        with limiter.request("POST", "graphql", mutation=False):
+            pass
+        assert limiter.stats().requests == 1
+
+    def test_max_wait_is_configurable(self, clock):
+        limiter = GitHubRateLimiter(
+            clock=clock, wall_clock=clock, sleep=clock.sleep, max_wait=7200
+        )
+        reset = int(clock.now) + 3600
+        limiter.record_response(
+            _response(
+                X_RateLimit_Remaining="0",
+                X_RateLimit_Reset=str(reset),
+                X_RateLimit_Resource="core",
+            )
+        )
+
+        limiter.acquire("GET")
+
+        assert clock.now >= reset
+
+    def test_long_waits_are_logged_before_sleeping(self, limiter, clock):
+        events = []
+        limiter.record_response(_response(429, Retry_After="30"))
+        clock.sleeps = events
+
+        with patch.object(rate_limiter.logger, "warning") as warning:
+            warning.side_effect = lambda event, **_kw: events.append(event)
+            limiter.acquire("GET")
+
+        assert events == ["github_rate_limit_long_wait", 30.0]
+
+    def test_other_resources_keep_their_budget(self, limiter, clock):
+        limiter.record_response(
+            _response(
+                X_RateLimit_Remaining="0",
+                X_RateLimit_Reset=str(int(clock.now) + 30),
+                X_RateLimit_Resource="core",
+            )
+        )
+
+        with limiter.request("POST", "graphql", mutation=False):
+            pass
+
+        assert clock.sleeps == []
+
+    def test_secondary_limit_pauses_and_halves_concurrency(self, limiter, clock):
+        retry = limiter.record_response(_response(403, Retry_After="7"))
+
+        assert retry is True
+        assert limiter.concurrency == 2
+        limiter.acquire("GET")
+        limiter.release()
+        assert clock.sleeps[0] == pytest.approx(7.0)
+        assert limiter.stats().secondary_limit_hits == 1
+
+    def test_secondary_limit_without_retry_after_backs_off(self, limiter, clock):
+        limiter.record_response(
+            _response(403, text="You have exceeded a secondary rate limit")
+        )
+        limiter.record_response(_response(429))
+
+        limiter.acquire("GET")
+        limiter.release()
+
+        assert clock.sleeps[0] == pytest.approx(120.0)
+        assert limiter.concurrency == 1
+
+    def test_concurrency_recovers_after_successes(self, limiter):
+        limiter.record_response(_response(429, Retry_After="1"))
+        assert limiter.concurrency == 2
+
+        for _ in range(2 + 3):
+            limiter.record_response(_response(200))
+
+        assert limiter.concurrency == 4
+
+    def test_plain_forbidden_is_not_retried(self, limiter):
+        response = _response(403, text="Resource not accessible")
+
+        assert limiter.record_response(response) is False
+        assert limiter.concurrency == 4
+
+    def test_mock_responses_are_ignored(self, limiter, clock):
+        assert limiter.record_response(MagicMock()) is False
+
+        limiter.acquire("GET")
+        limiter.release()
+
+        assert clock.sleeps == []
+
+    def test_reset_stats_keeps_budgets(self, limiter, clock):
+        limiter.record_response(
+            _response(X_RateLimit_Remaining="42", X_RateLimit_Reset="0")
+        )
+        with limiter.request("GET"):
+            pass
+
+        limiter.reset_stats()
+
+        stats = limiter.stats()
+        assert stats.requests == 0
+        assert stats.remaining == {"core": 42}
+
+
+def test_rate_limiter_is_process_wide():
+    limiter = get_rate_limiter()
+
+    assert get_rate_limiter() is limiter
+    reset_rate_limiter()
+    assert get_rate_limiter() is not limiter
+
+
+def test_handler_resends_rate_limited_requests(clock):
+    limiter = GitHubRateLimiter(clock=clock, wall_clock=clock, sleep=clock.sleep)
+    session = MagicMock()
+    ok = _response(200)
+    ok.raise_for_status = lambda: None
+    session.request.side_effect = [_response(429, Retry_After="3"), ok]
+    handler = BaseGitHubHandler(session, "owner", "repo")
+
+    with patch(
+        "roadmap.adapters.github.handlers.base.get_rate_limiter",
+        return_value=limiter,
+    ):
+        response = handler._make_request("POST", "/repos/owner/repo/issues")
+
+    assert response is ok
+    assert session.request.call_count == 2
+    assert clock.sleeps[0] == pytest.approx(3.0)
@@ -0,0 +1,131 @@
+"""Tests that one sync reads remote GitHub state through a shared snapshot."""
+
+import json
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from roadmap.adapters.github.handlers.base import BaseGitHubHandler
+from roadmap.adapters.sync.backends.github_sync_backend import GitHubSyncBackend
+from roadmap.adapters.sync.backends.github_sync_ops import GitHubSyncOps
+
+ISSUES = [
+    {
+        "number": 1,
+        "node_id": "I_kwDOA1",
+        "title": "Set up CI",
+        "state": "open",
+        "labels": [{"name": "bug"}],
+        "milestone": {"number": 4, "title": "v1.0"},
+        "updated_at": "2026-10-01T09:30:00Z",
+    },
+    {
+        "number": 2,
+        "node_id": "I_kwDOA2",
+        "title": "Write docs",
+        "state": "closed",
+        "labels": [],
+        "updated_at": "2026-10-02T09:30:00Z",
+    },
+]
+MILESTONES = [{"number": 4, "node_id": "MI_kwDOA4", "title": "v1.0", "state": "open"}]
+LABELS = [{"name": "bug", "color": "d73a4a"}]
+
+
+class _StubGitHub(BaseHTTPRequestHandler):
+    """Serve one page each of issues, milestones and labels, counting GETs."""
+
+    requests_seen: Counter = Counter()
+
+    def do_GET(self):  # noqa: N802
+        path, _, query = self.path.partition("?")
+        self.requests_seen[path] += 1
+        routes = {
+            "/repos/o/r/issues": ISSUES,
+            "/repos/o/r/milestones": MILESTONES,
+            "/repos/o/r/labels": LABELS,
+        }
+        payload = routes.get(path, []) if "page=1" in query else []
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    """A GitHub sync backend whose API calls go to a local stub server."""
+    _StubGitHub.requests_seen = Counter()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitHub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        BaseGitHubHandler, "BASE_URL", f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    yield GitHubSyncBackend(
+        MagicMock(),
+        {"owner": "o", "repo": "r", "token": "t", "incremental_fetch": False},
+    )
+    server.shutdown()
+    server.server_close()
+
+
+def _run_sync_reads(backend):
+    """Make the remote reads of analysis, apply and pull dependency resolution."""
+    backend.get_issues()
+    backend.get_issues()
+    backend.get_milestones()
+    ops = GitHubSyncOps(backend)
+    ops._fetch_remote_data()
+    ops._ensure_labels_exist(["bug"])
+    GitHubSyncOps(backend)._ensure_labels_exist(["bug"])
+
+
+def test_without_snapshot_every_phase_refetches(backend):
+    _run_sync_reads(backend)
+
+    assert _StubGitHub.requests_seen["/repos/o/r/issues"] >= 3
+    assert _StubGitHub.requests_seen["/repos/o/r/milestones"] >= 2
+    assert _StubGitHub.requests_seen["/repos/o/r/labels"] >= 2
+
+
+def test_snapshot_fetches_each_resource_once(backend):
+    backend.begin_remote_snapshot()
+
+    _run_sync_reads(backend)
+
+    assert _StubGitHub.requests_seen == {
+        "/repos/o/r/issues": 1,
+        "/repos/o/r/milestones": 1,
+        "/repos/o/r/labels": 1,
+    }
+    assert set(backend.get_issues().unwrap()) == {"1", "2"}
+
+
+def test_ending_snapshot_refetches(backend):
+    backend.begin_remote_snapshot()
+    backend.get_issues()
+    backend.end_remote_snapshot()
+
+    backend.get_issues()
+
+    assert _StubGitHub.requests_seen["/repos/o/r/issues"] == 2
+
+
+def test_snapshot_indexes_by_number_and_node_id(backend):
+    snapshot = backend.begin_remote_snapshot()
+
+    assert snapshot.issue_by_number(1).title == "Set up CI"
+    assert snapshot.issue_by_node_id("I_kwDOA2").backend_id == 2
+    assert snapshot.milestone_by_number("4").name == "v1.0"
+    assert snapshot.milestone_by_node_id("MI_kwDOA4").name == "v1.0"
+    assert snapshot.milestone_number_by_title("v1.0") == "4"
+    assert snapshot.issue_by_node_id("missing") is None
@@ -0,0 +1,208 @@
+"""Tests for conditional GitHub requests served from the response cache."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from roadmap.adapters.github.handlers.base import BaseGitHubHandler
+from roadmap.adapters.github.response_cache import (
+    GitHubResponseCache,
+    enable_response_cache,
+    get_response_cache,
+)
+
+
+class _StubGitHub(BaseHTTPRequestHandler):
+    """Serve paginated JSON pages with ETags, honouring If-None-Match."""
+
+    pages: dict[str, list] = {}
+    etags: dict[str, str] = {}
+    requests_seen: list[tuple[str, str, str | None]] = []
+
+    def do_GET(self):  # noqa: N802
+        if_none_match = self.headers.get("If-None-Match")
+        self.requests_seen.append(("GET", self.path, if_none_match))
+
+        path, _, query = self.path.partition("?")
+        page = "2" if "page=2" in query else "1"
+        key = f"{path}#{page}"
+        etag = self.etags[key]
+
+        if if_none_match == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = json.dumps(self.pages[key]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("ETag", etag)
+        if page == "1" and f"{path}#2" in self.pages:
+            self.send_header("Link", f'<{path}?page=2>; rel="next"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):  # noqa: N802
+        self.requests_seen.append(("POST", self.path, None))
+        body = b"{}"
+        self.send_response(201)
+        self.send_header("ETag", '"post"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    """Run the stub GitHub API on a free local port."""
+    _StubGitHub.pages = {
+        "/repos/o/r/issues#1": [{"number": 1}],
+        "/repos/o/r/issues#2": [{"number": 2}],
+    }
+    _StubGitHub.etags = {
+        "/repos/o/r/issues#1": '"v1-p1"',
+        "/repos/o/r/issues#2": '"v1-p2"',
+    }
+    _StubGitHub.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubGitHub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _handler(base_url, token="token-a"):
+    session = requests.Session()
+    session.headers["Authorization"] = f"token {token}"
+    handler = BaseGitHubHandler(session, "o", "r")
+    handler.BASE_URL = base_url
+    return handler
+
+
+class TestConditionalRequests:
+    """Test ETag round trips through BaseGitHubHandler."""
+
+    def test_disabled_cache_sends_plain_requests(self, stub_server):
+        handler = _handler(stub_server)
+
+        handler._make_request("GET", "/repos/o/r/issues")
+        handler._make_request("GET", "/repos/o/r/issues")
+
+        assert get_response_cache() is None
+        assert [seen[2] for seen in _StubGitHub.requests_seen] == [None, None]
+
+    def test_not_modified_serves_cached_pages(self, stub_server, tmp_path):
+        cache = enable_response_cache(tmp_path)
+        handler = _handler(stub_server)
+
+        first = handler._paginate_request("GET", "/repos/o/r/issues")
+        second = handler._paginate_request("GET", "/repos/o/r/issues")
+
+        assert first == second == [{"number": 1}, {"number": 2}]
+        assert [seen[2] for seen in _StubGitHub.requests_seen] == [
+            None,
+            None,
+            '"v1-p1"',
+            '"v1-p2"',
+        ]
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert cache.hit_rate == 0.5
+
+    def test_changed_etag_refreshes_body(self, stub_server, tmp_path):
+        cache = enable_response_cache(tmp_path)
+        handler = _handler(stub_server)
+        handler._make_request("GET", "/repos/o/r/issues")
+
+        _StubGitHub.pages["/repos/o/r/issues#1"] = [{"number": 3}]
+        _StubGitHub.etags["/repos/o/r/issues#1"] = '"v2-p1"'
+
+        assert handler._make_request("GET", "/repos/o/r/issues").json() == [
+            {"number": 3}
+        ]
+        assert handler._make_request("GET", "/repos/o/r/issues").json() == [
+            {"number": 3}
+        ]
+        assert cache.hits == 1
+
+    def test_cache_persists_to_disk(self, stub_server, tmp_path):
+        enable_response_cache(tmp_path)
+        _handler(stub_server)._make_request("GET", "/repos/o/r/issues")
+
+        reopened = GitHubResponseCache(tmp_path / "github_response_cache.db")
+        key = reopened.make_key(
+            f"{stub_server}/repos/o/r/issues", None, "token token-a"
+        )
+
+        cached = reopened.get(key)
+        assert cached is not None
+        assert cached.etag == '"v1-p1"'
+
+    def test_tokens_do_not_share_entries(self, stub_server, tmp_path):
+        enable_response_cache(tmp_path)
+
+        _handler(stub_server, "token-a")._make_request("GET", "/repos/o/r/issues")
+        _handler(stub_server, "token-b")._make_request("GET", "/repos/o/r/issues")
+
+        assert [seen[2] for seen in _StubGitHub.requests_seen] == [None, None]
+
+    def test_non_get_requests_bypass_cache(self, stub_server, tmp_path):
+        cache = enable_response_cache(tmp_path)
+        handler = _handler(stub_server)
+
+        handler._make_request("POST", "/repos/o/r/issues", json={})
+        handler._make_request("POST", "/repos/o/r/issues", json={})
+
+        assert (cache.hits, cache.misses) == (0, 0)
+
+
+def _stored_rows(cache):
+    return (
+        cache._get_connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+    )
+
+
+def _ok_response(url, etag):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers["ETag"] = etag
+    response._content = b"[]"
+    return response
+
+
+class TestCacheGrowth:
+    """Test that the cache table stays bounded across syncs."""
+
+    def test_since_param_does_not_add_rows(self, tmp_path):
+        cache = GitHubResponseCache(tmp_path / "cache.db")
+        url = "https://api.github.com/repos/o/r/issues"
+
+        for since in ("2026-10-01T00:00:00Z", "2026-10-02T00:00:00Z"):
+            key = cache.make_key(url, {"page": 1, "since": since}, "token t")
+            cache.store(key, _ok_response(url, f'"{since}"'))
+
+        assert _stored_rows(cache) == 1
+        assert cache.make_key(url, {"since": "a"}, None) == cache.make_key(
+            url, None, None
+        )
+
+    def test_store_prunes_oldest_rows_beyond_cap(self, tmp_path):
+        cache = GitHubResponseCache(tmp_path / "cache.db", max_entries=3)
+        url = "https://api.github.com/repos/o/r/issues"
+        keys = [cache.make_key(url, {"page": page}, None) for page in range(5)]
+
+        for key in keys:
+            cache.store(key, _ok_response(url, '"v1"'))
+
+        assert _stored_rows(cache) == 3
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[-1]) is not None
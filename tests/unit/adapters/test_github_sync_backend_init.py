@@ -8,6 +8,11 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from roadmap.adapters.github.rate_limiter import (
+    DEFAULT_MAX_WAIT_SECONDS,
+    get_rate_limiter,
+    reset_rate_limiter,
+)
 from roadmap.adapters.sync.backends.github_sync_backend import GitHubSyncBackend
 from roadmap.core.domain.issue import Issue
 from roadmap.core.interfaces import SyncConflict, SyncReport
@@ -33,6 +38,26 @@ def test_init_requires_owner_and_repo() -> None:
         GitHubSyncBackend(core=cast(Any, SimpleNamespace()), config={"token": "abc"})
 
 
+@pytest.mark.parametrize(
+    ("max_wait", "expected"),
+    [(60, 60.0), (-1, DEFAULT_MAX_WAIT_SECONDS), ("x", DEFAULT_MAX_WAIT_SECONDS)],
+)
+def test_init_applies_rate_limit_max_wait(max_wait: Any, expected: float) -> None:
+    reset_rate_limiter()
+    try:
+        _build_backend(
+            {
+                "token": "token",
+                "owner": "owner",
+                "repo": "repo",
+                "sync_settings": {"rate_limit_max_wait_seconds": max_wait},
+            }
+        )
+        assert get_rate_limiter().max_wait == expected
+    finally:
+        reset_rate_limiter()
+
+
 def test_authenticate_success_sets_client() -> None:
     backend = _build_backend()
     expected_client = MagicMock()
@@ -96,7 +121,7 @@ def test_get_issues_uses_fetch_service_and_returns_ok(
     expected_issues = {"123": SimpleNamespace(id="123")}
 
     class _FetchService:
-        def __init__(self, _client, _config, _helpers):
+        def __init__(self, _client, _config, _helpers, snapshot_repo=None):
             pass
 
         def get_issues(self):
@@ -249,3 +274,22 @@ def test_post_graphql_with_backoff_retries_rate_limit(
 
     assert result == {"data": {"ok": True}}
     assert sleep_calls == [2.0]
+
+
+def test_delete_issues_evicts_deleted_numbers_from_snapshot() -> None:
+    backend = _build_backend()
+    snapshot_repo = MagicMock()
+    backend.remote_issue_snapshot_repo = snapshot_repo
+    cast(Any, backend)._resolve_issue_node_ids = lambda batch, *_: (
+        {number: f"I_{number}" for number in batch},
+        [],
+    )
+    cast(Any, backend)._delete_issues_batch = lambda node_ids, _token: (
+        len(node_ids) - 1,
+        False,
+        [3],
+    )
+
+    assert backend.delete_issues([1, 2, 3]) == 2
+
+    snapshot_repo.delete.assert_called_once_with("github", "owner/repo", [1, 2])
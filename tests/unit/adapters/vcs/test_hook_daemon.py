@@ -0,0 +1,174 @@
+"""Tests for the Git hook daemon."""
+
+import subprocess
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from roadmap.adapters.git.git_hooks_manager import GitHookManager
+from roadmap.adapters.git.hook_daemon import (
+    HookDaemon,
+    is_daemon_running,
+    send_hook_event,
+    stop_daemon,
+)
+from roadmap.adapters.git.hook_script_generator import HookContentGenerator
+
+
+@pytest.fixture
+def running_daemon(tmp_path):
+    """Serve a HookDaemon with a mocked hook manager on a temporary socket."""
+    socket_path = tmp_path / "hooks.sock"
+    hook_manager = MagicMock()
+    daemon = HookDaemon(hook_manager, socket_path)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    assert daemon.wait_ready(5)
+    yield daemon, hook_manager, socket_path
+    daemon.shutdown()
+    thread.join(5)
+
+
+class TestHookDaemon:
+    """Test the daemon protocol and event handling."""
+
+    def test_receive_replies(self):
+        daemon = HookDaemon(MagicMock())
+
+        assert daemon.receive("ping") == "pong"
+        assert daemon.receive("post-commit abc123") == "queued"
+        assert daemon.receive("rm-rf /") == "unknown"
+
+    def test_queued_event_is_applied_with_fresh_caches(self, running_daemon):
+        daemon, hook_manager, socket_path = running_daemon
+        applied = threading.Event()
+        hook_manager.handle_hook.side_effect = lambda *args: applied.set()
+
+        assert send_hook_event("post-commit", "abc123", socket_path)
+        assert applied.wait(5)
+
+        hook_manager.core.issues.clear_cache.assert_called_once()
+        hook_manager.handle_hook.assert_called_once_with("post-commit", "abc123")
+
+    def test_empty_ref_is_passed_as_none(self, running_daemon):
+        daemon, hook_manager, socket_path = running_daemon
+        applied = threading.Event()
+        hook_manager.handle_hook.side_effect = lambda *args: applied.set()
+
+        assert send_hook_event("post-checkout", None, socket_path)
+        assert applied.wait(5)
+
+        hook_manager.handle_hook.assert_called_once_with("post-checkout", None)
+
+    def test_failing_event_does_not_stop_the_daemon(self, running_daemon):
+        daemon, hook_manager, socket_path = running_daemon
+        applied = threading.Event()
+
+        def handle(hook_name, ref):
+            if hook_name == "post-commit":
+                raise RuntimeError("boom")
+            applied.set()
+
+        hook_manager.handle_hook.side_effect = handle
+
+        assert send_hook_event("post-commit", "abc", socket_path)
+        assert send_hook_event("post-merge", "def", socket_path)
+        assert applied.wait(5)
+        assert is_daemon_running(socket_path)
+
+    def test_stop_removes_socket(self, running_daemon):
+        daemon, hook_manager, socket_path = running_daemon
+
+        assert stop_daemon(socket_path)
+
+        for _ in range(50):
+            if not socket_path.exists():
+                break
+            time.sleep(0.1)
+        assert not socket_path.exists()
+        assert not is_daemon_running(socket_path)
+
+    def test_client_without_daemon(self, tmp_path):
+        socket_path = tmp_path / "hooks.sock"
+
+        assert not send_hook_event("post-commit", "abc", socket_path)
+        assert not is_daemon_running(socket_path)
+        assert not stop_daemon(socket_path)
+
+    def test_stale_socket_is_replaced(self, tmp_path):
+        socket_path = tmp_path / "hooks.sock"
+        socket_path.write_text("")
+        daemon = HookDaemon(MagicMock(), socket_path)
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            assert daemon.wait_ready(5)
+            assert is_daemon_running(socket_path)
+        finally:
+            daemon.shutdown()
+            thread.join(5)
+
+
+class TestHookDispatch:
+    """Test dispatching hook events with the ref the hook reported."""
+
+    def test_handle_hook_passes_ref(self):
+        with patch("roadmap.adapters.git.git_hooks_manager.GitIntegration"):
+            manager = GitHookManager(MagicMock())
+        manager.handle_post_commit = MagicMock()
+
+        manager.handle_hook("post-commit", "abc123")
+
+        manager.handle_post_commit.assert_called_once_with("abc123")
+
+    def test_known_commit_skips_git(self):
+        with patch("roadmap.adapters.git.git_hooks_manager.GitIntegration"):
+            manager = GitHookManager(MagicMock())
+
+        with (
+            patch("roadmap.adapters.git.git_hooks_manager.subprocess.run") as run,
+            patch.object(manager, "_log_hook_activity") as log_activity,
+            patch.object(manager, "_trigger_auto_sync_on_commit"),
+        ):
+            manager.handle_post_commit("abc1234567")
+
+        run.assert_not_called()
+        log_activity.assert_called_once_with("Commit", "abc1234")
+
+
+class TestHookScriptClient:
+    """Test the daemon client embedded in generated hook scripts."""
+
+    @pytest.fixture
+    def hook_script(self, tmp_path):
+        """Write a post-commit hook into a throwaway repository layout."""
+        hooks_dir = tmp_path / ".git" / "hooks"
+        hooks_dir.mkdir(parents=True)
+        hook_file = hooks_dir / "post-commit"
+        hook_file.write_text(HookContentGenerator.generate("post-commit"))
+        hook_file.chmod(0o755)
+        return hook_file
+
+    def test_hook_hands_event_to_daemon(self, tmp_path, hook_script):
+        hook_manager = MagicMock()
+        applied = threading.Event()
+        hook_manager.handle_hook.side_effect = lambda *args: applied.set()
+        daemon = HookDaemon(hook_manager, tmp_path / ".git" / "roadmap-hooks.sock")
+        thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+        thread.start()
+
+        try:
+            assert daemon.wait_ready(5)
+            result = subprocess.run(
+                ["bash", str(hook_script)], capture_output=True, text=True
+            )
+            assert result.returncode == 0
+            assert applied.wait(5)
+        finally:
+            daemon.shutdown()
+            thread.join(5)
+
+        hook_manager.handle_hook.assert_called_once_with("post-commit", None)
@@ -1,9 +1,12 @@
 """Tests for core roadmap functionality."""
 
 from datetime import datetime
+from typing import Any, cast
+from unittest.mock import patch
 
 import pytest
 
+from roadmap.common.services.profiling import get_profiler
 from roadmap.core.domain import MilestoneStatus, Priority, Status
 from roadmap.infrastructure.coordination.core import RoadmapCore
 from tests.unit.application.test_data_factory import TestDataFactory
@@ -417,3 +420,77 @@ class TestRoadmapCore:
 
         result = core.milestones.delete("non-existent")
         assert not result
+
+
+class TestRoadmapCoreLazyConstruction:
+    """RoadmapCore builds infrastructure, services and coordinators on demand."""
+
+    def test_construction_builds_nothing(self, temp_dir):
+        """Creating a core opens no database and builds no coordinators."""
+        core = RoadmapCore(temp_dir)
+
+        for name in ("db", "github_service", "issues", "milestones", "team"):
+            assert name not in core.__dict__
+        assert not (core.db_dir / "state.db").exists()
+
+    def test_coordinator_builds_only_what_it_needs(self, temp_dir):
+        """Using issues does not build the GitHub service or validation."""
+        core = RoadmapCore(temp_dir)
+        core.initialize()
+
+        assert core.issues.list() == []
+        assert "db" in core.__dict__
+        assert "github_service" not in core.__dict__
+        assert "validation" not in core.__dict__
+        core.close()
+
+    def test_components_are_cached(self, temp_dir):
+        """Repeated access returns the same instance."""
+        core = RoadmapCore(temp_dir)
+
+        assert core.issues is core.issues
+        assert core.git_sync_monitor is core.db._git_sync_monitor
+        core.close()
+
+    def test_assigned_component_replaces_lazy_one(self, temp_dir):
+        """Tests and callers can still assign components directly."""
+        core = RoadmapCore(temp_dir)
+        replacement = object()
+
+        cast(Any, core).github_service = replacement
+
+        assert core.github_service is replacement
+
+    def test_remote_links_load_on_first_use(self, temp_dir):
+        """The YAML remote-link scan runs once, on first db.remote_links access."""
+        core = RoadmapCore(temp_dir)
+
+        with patch.object(type(core.db), "_initialize_remote_links_impl") as scan:
+            scan.assert_not_called()
+            first = core.db.remote_links
+            second = core.db.remote_links
+        assert first is second
+        scan.assert_called_once_with(temp_dir)
+        core.close()
+
+    def test_close_without_database_is_noop(self, temp_dir):
+        """Closing a core that never opened the database does not open it."""
+        core = RoadmapCore(temp_dir)
+
+        core.close()
+
+        assert "db" not in core.__dict__
+
+    def test_builds_are_profiled(self, temp_dir):
+        """First builds are recorded in the session profiler."""
+        profiler = get_profiler()
+        profiler.clear()
+        core = RoadmapCore(temp_dir)
+
+        assert core.issues is not None
+        issues_profile = profiler.get_profile("core.issues")
+        db_profile = profiler.get_profile("core.db")
+        assert issues_profile is not None and issues_profile.count == 1
+        assert db_profile is not None and db_profile.count == 1
+        assert profiler.get_profile("core.validation") is None
+        core.close()
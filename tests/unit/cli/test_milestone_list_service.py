@@ -134,27 +134,29 @@ class TestMilestoneProgressService:
         """Test getting progress for multiple milestones."""
         mock_core = TestDataFactory.create_mock_core(is_initialized=True)
 
-        def progress_side_effect(name):
-            if name == "v1-0":
-                return {"total": 10, "completed": 5}
-            else:
-                return {"total": 8, "completed": 8}
-
-        mock_core.milestones.get_progress.side_effect = progress_side_effect
+        mock_core.milestones.get_all_progress.return_value = {
+            "v1-0": {"total": 10, "completed": 5},
+            "v2-0": {"total": 8, "completed": 8},
+        }
 
         mock_ms1 = MagicMock()
         mock_ms1.name = "v1-0"
         mock_ms2 = MagicMock()
         mock_ms2.name = "v2-0"
+        mock_ms3 = MagicMock()
+        mock_ms3.name = "v3-0"
 
         result = MilestoneProgressService.get_all_milestones_progress(
-            mock_core, [mock_ms1, mock_ms2]
+            mock_core, [mock_ms1, mock_ms2, mock_ms3]
         )
 
-        assert "v1-0" in result
-        assert "v2-0" in result
+        mock_core.milestones.get_all_progress.assert_called_once_with(
+            ["v1-0", "v2-0", "v3-0"]
+        )
+        mock_core.milestones.get_progress.assert_not_called()
         assert result["v1-0"]["percentage"] == 50.0
         assert result["v2-0"]["percentage"] == 100.0
+        assert result["v3-0"] == {"total": 0, "completed": 0, "percentage": 0}
 
 
 class TestMilestoneTimeEstimateService:
@@ -219,9 +221,8 @@ class TestMilestoneListService:
         mock_ms.get_estimated_time_display.return_value = "40 hours"
 
         mock_core.milestones.list.return_value = [mock_ms]
-        mock_core.milestones.get_progress.return_value = {
-            "total": 10,
-            "completed": 5,
+        mock_core.milestones.get_all_progress.return_value = {
+            "v1-0": {"total": 10, "completed": 5},
         }
         mock_core.issues.list.return_value = []
 
@@ -248,10 +249,7 @@ class TestMilestoneListService:
         mock_ms_future.status.value = "open"
 
         mock_core.milestones.list.return_value = [mock_ms_past, mock_ms_future]
-        mock_core.milestones.get_progress.return_value = {
-            "total": 0,
-            "completed": 0,
-        }
+        mock_core.milestones.get_all_progress.return_value = {}
         mock_core.issues.list.return_value = []
 
         service = MilestoneListService(mock_core)
@@ -130,14 +130,10 @@ class TestMilestoneProgressService:
         """Test getting progress for multiple milestones."""
         mock_core = TestDataFactory.create_mock_core(is_initialized=True)
 
-        def progress_side_effect(name):
-            if name == "v1-0":
-                return {"total": 10, "completed": 5}
-            elif name == "v2-0":
-                return {"total": 20, "completed": 20}
-            return {"total": 0, "completed": 0}
-
-        mock_core.db.get_milestone_progress.side_effect = progress_side_effect
+        mock_core.db.get_all_milestones_progress.return_value = {
+            "v1-0": {"total": 10, "completed": 5},
+            "v2-0": {"total": 20, "completed": 20},
+        }
 
         # Create mock milestones with .name attribute
         mock_milestone_1 = MagicMock()
@@ -154,6 +150,7 @@ class TestMilestoneProgressService:
         assert "v2-0" in result
         assert result["v1-0"]["percentage"] == 50.0
         assert result["v2-0"]["percentage"] == 100.0
+        mock_core.db.get_milestone_progress.assert_not_called()
 
     def test_get_milestone_progress_handles_exception(self):
         """Test that exceptions are handled gracefully."""
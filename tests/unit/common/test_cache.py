@@ -3,11 +3,14 @@
 import time
 
 from roadmap.common.cache import (
+    ParsedFileCache,
     SessionCache,
     cache_result,
     clear_session_cache,
+    get_parsed_file_cache,
     get_session_cache,
 )
+from roadmap.core.domain.issue import Issue
 
 
 class TestSessionCache:
@@ -203,3 +206,131 @@ class TestCacheDecorator:
         # Cache expired, function called again
         function_with_ttl()
         assert call_count == 2
+
+
+class TestParsedFileCache:
+    """Test ParsedFileCache stat validation, LRU eviction and counters."""
+
+    @staticmethod
+    def _parser(calls):
+        def parse(path):
+            calls.append(path)
+            return Issue(id="abc12345", title=path.read_text())
+
+        return parse
+
+    def test_unchanged_file_is_served_from_cache(self, tmp_path):
+        """Test second lookup of an unchanged file skips the parser."""
+        path = tmp_path / "issue.md"
+        path.write_text("First")
+        calls = []
+        parser = self._parser(calls)
+        cache = ParsedFileCache()
+
+        first = cache.get_or_parse(path, parser)
+        second = cache.get_or_parse(path, parser)
+
+        assert len(calls) == 1
+        assert second.title == "First"
+        assert second is not first
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_returned_objects_are_private_copies(self, tmp_path):
+        """Test mutating a returned object does not corrupt the cache."""
+        path = tmp_path / "issue.md"
+        path.write_text("Original")
+        parser = self._parser([])
+        cache = ParsedFileCache()
+
+        cache.get_or_parse(path, parser).title = "Mutated"
+
+        assert cache.get_or_parse(path, parser).title == "Original"
+
+    def test_changed_file_is_reparsed(self, tmp_path):
+        """Test a change in size/mtime invalidates the entry."""
+        path = tmp_path / "issue.md"
+        path.write_text("Short")
+        calls = []
+        parser = self._parser(calls)
+        cache = ParsedFileCache()
+
+        cache.get_or_parse(path, parser)
+        path.write_text("Much longer title")
+
+        assert cache.get_or_parse(path, parser).title == "Much longer title"
+        assert len(calls) == 2
+
+    def test_explicit_invalidation(self, tmp_path):
+        """Test invalidate() forces a reparse."""
+        path = tmp_path / "issue.md"
+        path.write_text("Title")
+        calls = []
+        parser = self._parser(calls)
+        cache = ParsedFileCache()
+
+        cache.get_or_parse(path, parser)
+        cache.invalidate(path)
+        cache.get_or_parse(path, parser)
+
+        assert len(calls) == 2
+
+    def test_lru_eviction(self, tmp_path):
+        """Test least recently used files are evicted beyond max_entries."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.md"
+            path.write_text(name)
+            paths.append(path)
+        calls = []
+        parser = self._parser(calls)
+        cache = ParsedFileCache(max_entries=2)
+
+        for path in paths:
+            cache.get_or_parse(path, parser)
+        cache.get_or_parse(paths[0], parser)
+
+        assert cache.get_stats()["entries"] == 2
+        assert cache.get_stats()["evictions"] == 2
+        assert len(calls) == 4
+
+    def test_non_model_results_are_not_cached(self, tmp_path):
+        """Test parsers returning plain objects bypass the cache."""
+        path = tmp_path / "data.md"
+        path.write_text("x")
+        sentinel = object()
+        cache = ParsedFileCache()
+
+        assert cache.get_or_parse(path, lambda p: sentinel) is sentinel
+        assert cache.get_stats()["entries"] == 0
+
+    def test_save_invalidates_global_cache(self, tmp_path):
+        """Test writing through FrontmatterParser drops cached entries."""
+        from roadmap.adapters.persistence.parser import IssueParser
+
+        path = tmp_path / "abc12345-title.md"
+        IssueParser.save_issue_file(Issue(id="abc12345", title="Before"), path)
+        cache = get_parsed_file_cache()
+        cache.get_or_parse(path, IssueParser.parse_issue_file)
+
+        IssueParser.save_issue_file(Issue(id="abc12345", title="After"), path)
+
+        assert cache.get_stats()["entries"] == 0
+        assert cache.get_or_parse(path, IssueParser.parse_issue_file).title == "After"
+
+    def test_lookup_then_store(self, tmp_path):
+        """Test lookup() reports a miss with the signature store() caches under."""
+        path = tmp_path / "issue.md"
+        path.write_text("Stored")
+        parser = self._parser([])
+        cache = ParsedFileCache()
+
+        cached, signature = cache.lookup(path, parser)
+        assert cached is None
+        assert signature is not None
+        cache.store(path, parser, signature, Issue(id="abc12345", title="Stored"))
+
+        cached, _ = cache.lookup(path, parser)
+        assert cached.title == "Stored"
+        assert cached.file_path == str(path)
+        assert cache.lookup(tmp_path / "missing.md", parser) == (None, None)
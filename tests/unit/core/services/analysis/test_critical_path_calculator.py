@@ -311,3 +311,71 @@ class TestCriticalPathCalculator:
 
         # Should use default estimate for issue 1
         assert result.total_duration > 0
+
+
+class TestCriticalPathSchedule:
+    """Tests for the CPM forward/backward pass schedule."""
+
+    def test_earliest_and_latest_times(self, calculator, complex_issues):
+        """Issue 2 can slip by the 8h difference between branches 2 and 3."""
+        result = calculator.calculate_critical_path(complex_issues)
+        schedule = result.schedule
+
+        assert schedule["2"].earliest_start == 4.0
+        assert schedule["2"].latest_start == 12.0
+        assert schedule["2"].slack_time == 8.0
+        assert schedule["5"].earliest_start == 28.0
+        assert schedule["5"].latest_finish == 36.0
+
+    def test_zero_slack_issues_are_critical(self, calculator, complex_issues):
+        """Only zero-slack issues are marked critical."""
+        result = calculator.calculate_critical_path(complex_issues)
+
+        critical = {i for i, node in result.schedule.items() if node.is_critical}
+        assert critical == {"1", "3", "5"}
+        assert result.schedule["4"].slack_time == 28.0
+
+    def test_path_follows_duration_not_hop_count(self, calculator):
+        """A single long issue outweighs a longer chain of short ones."""
+        issues = [
+            Issue(id="a", title="a", estimated_hours=1.0),
+            Issue(id="b", title="b", estimated_hours=1.0, depends_on=["a"]),
+            Issue(id="c", title="c", estimated_hours=1.0, depends_on=["b"]),
+            Issue(id="long", title="long", estimated_hours=40.0),
+            Issue(id="end", title="end", estimated_hours=2.0, depends_on=["c", "long"]),
+        ]
+        result = calculator.calculate_critical_path(issues)
+
+        assert result.critical_issue_ids == ["long", "end"]
+        assert result.total_duration == 42.0
+        assert result.schedule["a"].slack_time == 37.0
+
+    def test_dependency_cycles_are_reported(self, calculator):
+        """Cycles are listed and their issues kept off the critical path."""
+        issues = [
+            Issue(id="root", title="root", estimated_hours=4.0),
+            Issue(id="A", title="A", estimated_hours=4.0, depends_on=["root", "B"]),
+            Issue(id="B", title="B", estimated_hours=4.0, depends_on=["A"]),
+            Issue(id="after", title="after", estimated_hours=4.0, depends_on=["B"]),
+            Issue(id="self", title="self", estimated_hours=4.0, depends_on=["self"]),
+        ]
+        result = calculator.calculate_critical_path(issues)
+
+        cycles = sorted(sorted(cycle) for cycle in result.dependency_cycles)
+        assert cycles == [["A", "B"], ["self"]]
+        assert result.critical_issue_ids == ["root"]
+        assert not result.schedule["after"].is_critical
+
+    def test_acyclic_graph_has_no_cycles(self, calculator, complex_issues):
+        """A DAG reports no dependency cycles."""
+        result = calculator.calculate_critical_path(complex_issues)
+
+        assert result.dependency_cycles == []
+
+    def test_unknown_dependencies_are_ignored(self, calculator):
+        """Dependencies outside the analyzed set do not delay an issue."""
+        issues = [Issue(id="x", title="x", estimated_hours=2.0, depends_on=["gone"])]
+        result = calculator.calculate_critical_path(issues)
+
+        assert result.critical_issue_ids == ["x"]
+        assert result.schedule["x"].earliest_start == 0.0
@@ -259,3 +259,74 @@ class TestDependencyAnalyzer:
 
         # Should be healthy - bidirectional links exist
         assert len(result.circular_chains) == 0
+
+    def test_cycle_reported_once_with_problem_per_member(self):
+        """A cycle is one circular chain, with a problem for each issue in it."""
+        issues = [
+            self.create_issue("1", depends_on=["2"], blocks=[]),
+            self.create_issue("2", depends_on=["3"], blocks=[]),
+            self.create_issue("3", depends_on=["1"], blocks=[]),
+            self.create_issue("4", depends_on=["3"], blocks=[]),
+        ]
+
+        result = DependencyAnalyzer().analyze(issues)
+
+        assert result.circular_chains == [["1", "2", "3"]]
+        circular = [
+            p for p in result.problems if p.issue_type == DependencyIssueType.CIRCULAR
+        ]
+        assert sorted(p.issue_id for p in circular) == ["1", "2", "3"]
+        assert circular[0].message == ("Circular dependency detected: 1 → 2 → 3 → 1")
+
+    def test_separate_cycles_are_reported_separately(self):
+        """Disjoint cycles each get their own chain."""
+        issues = [
+            self.create_issue("a", depends_on=["b"], blocks=[]),
+            self.create_issue("b", depends_on=["a"], blocks=[]),
+            self.create_issue("c", depends_on=["d"], blocks=[]),
+            self.create_issue("d", depends_on=["c", "a"], blocks=[]),
+        ]
+
+        result = DependencyAnalyzer().analyze(issues)
+
+        assert sorted(result.circular_chains) == [["a", "b"], ["c", "d"]]
+
+    def test_deep_chain_length(self):
+        """Chain depth counts dependency levels, including missing issues."""
+        issues = [self.create_issue("0", depends_on=["missing"], blocks=[])]
+        issues += [
+            self.create_issue(str(i), depends_on=[str(i - 1)], blocks=[])
+            for i in range(1, 7)
+        ]
+
+        result = DependencyAnalyzer().analyze(issues)
+
+        deep = {
+            p.issue_id: p.chain_length
+            for p in result.problems
+            if p.issue_type == DependencyIssueType.DEEP_CHAIN
+        }
+        assert deep == {"5": 6, "6": 7}
+
+    def test_long_chain_does_not_hit_recursion_limit(self):
+        """Chains far deeper than the recursion limit are analyzed."""
+        count = 5000
+        issues = [
+            self.create_issue(
+                str(i),
+                depends_on=[str(i - 1)] if i else [],
+                blocks=[str(i + 1)] if i < count - 1 else [],
+            )
+            for i in range(count)
+        ]
+
+        analyzer = DependencyAnalyzer()
+        result = analyzer.analyze(issues)
+
+        longest = max(
+            p.chain_length or 0
+            for p in result.problems
+            if p.issue_type == DependencyIssueType.DEEP_CHAIN
+        )
+        assert longest == count - 1
+        assert len(analyzer.get_issues_affecting("0")) == count - 1
@@ -383,3 +383,83 @@ class TestThreeWayAnalysis:
         assert not change.local_changes
         assert not change.remote_changes
         assert change.conflict_type == "no_change"
+
+
+class TestThreeWayRecordShortcut:
+    """Test that record-matched issues skip field-level comparison."""
+
+    @staticmethod
+    def _issue_set(n: int):
+        updated = datetime(2026, 1, 1, tzinfo=UTC)
+        baseline, local, remote = {}, {}, {}
+        for i in range(n):
+            issue_id = f"issue-{i}"
+            baseline[issue_id] = IssueBaseState(
+                id=issue_id,
+                status="todo",
+                assignee="alice",
+                content=f"Body {i}",
+                labels=["bug", "ui"],
+                updated_at=updated,
+            )
+            local[issue_id] = Issue(
+                id=issue_id,
+                title=f"Issue {i}",
+                status=Status.CLOSED if i % 3 == 2 else Status.TODO,
+                assignee="alice",
+                content=f"Body {i}",
+                labels=["ui", "bug"],
+            )
+            remote[issue_id] = {
+                "id": issue_id,
+                "title": f"Issue {i}",
+                "status": "todo",
+                "assignee": "bob" if i % 4 == 3 else "alice",
+                "description": f"Body {i}",
+                "labels": ["bug", "ui"],
+                "updated_at": updated.isoformat(),
+            }
+        return local, remote, baseline
+
+    def test_unchanged_issues_skip_field_comparison(self, monkeypatch):
+        """Issues matching the baseline on both sides are not diffed field by field."""
+        comparator = SyncStateComparator()
+        local, remote, baseline = self._issue_set(1)
+
+        def fail(*_args, **_kwargs):
+            raise AssertionError("field-level comparison should be skipped")
+
+        monkeypatch.setattr(comparator, "_compute_changes", fail)
+        monkeypatch.setattr(comparator, "_compute_changes_remote", fail)
+
+        (change,) = comparator.analyze_three_way(local, remote, baseline)
+        assert change.conflict_type == "no_change"
+        assert change.has_conflict is False
+        assert change.remote_state is not None
+        assert change.last_sync_time == baseline["issue-0"].updated_at
+
+    def test_record_shortcut_matches_full_analysis(self, monkeypatch):
+        """The shortcut reports the same changes as the field-level path."""
+        local, remote, baseline = self._issue_set(24)
+        fast = SyncStateComparator().analyze_three_way(local, remote, baseline)
+
+        slow_comparator = SyncStateComparator()
+        monkeypatch.setattr(
+            slow_comparator, "_build_unchanged_issue_change", lambda *_args: None
+        )
+        slow = slow_comparator.analyze_three_way(local, remote, baseline)
+
+        def summary(changes):
+            return {
+                c.issue_id: (
+                    c.conflict_type,
+                    c.has_conflict,
+                    c.local_changes,
+                    c.remote_changes,
+                    c.last_sync_time,
+                )
+                for c in changes
+            }
+
+        assert summary(fast) == summary(slow)
+        assert {c.conflict_type for c in fast} >= {"no_change", "both_changed"}
@@ -10,7 +10,7 @@ Tests cover:
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -130,6 +130,68 @@ Issue content here"""
         with pytest.raises(BaselineRetrievalError):
             retriever.get_local_baseline(issue_file, datetime.now(UTC))
 
+    def test_get_local_baselines_reads_all_files_at_once(self, temp_dir_context):
+        """Test batch retrieval skips files missing from history."""
+        retriever, mock_persistence, mock_parser, issues_dir = self._make_retriever(
+            temp_dir_context=temp_dir_context
+        )
+        one = issues_dir / "one.md"
+        two = issues_dir / "two.md"
+        mock_persistence.get_files_at_timestamp.return_value = {
+            str(one): "---\nid: one\ntitle: One\nstatus: closed\n---\n",
+        }
+
+        baselines = retriever.get_local_baselines(
+            {"one": one, "two": two}, datetime.now(UTC)
+        )
+
+        mock_persistence.get_files_at_timestamp.assert_called_once()
+        assert list(baselines) == ["one"]
+        assert baselines["one"].status == "closed"
+
+    def test_get_local_baselines_skips_issue_that_fails(self, temp_dir_context):
+        """Test one unreadable file does not abort the batch."""
+        retriever, mock_persistence, mock_parser, issues_dir = self._make_retriever(
+            temp_dir_context=temp_dir_context
+        )
+        one = issues_dir / "one.md"
+        two = issues_dir / "two.md"
+        mock_persistence.get_files_at_timestamp.return_value = {
+            str(one): "---\nid: one\ntitle: One\nstatus: closed\n---\n",
+            str(two): "---\nid: two\ntitle: Two\nstatus: todo\n---\n",
+        }
+        extract = retriever._extract_baseline_from_content
+
+        def fail_on_one(content, issue_file):
+            if issue_file == one:
+                raise ValueError("bad blob")
+            return extract(content, issue_file)
+
+        with patch.object(
+            retriever, "_extract_baseline_from_content", side_effect=fail_on_one
+        ):
+            baselines = retriever.get_local_baselines(
+                {"one": one, "two": two}, datetime.now(UTC)
+            )
+
+        assert list(baselines) == ["two"]
+
+    def test_get_local_baselines_git_error(self, temp_dir_context):
+        """Test batch retrieval surfaces git errors."""
+        from roadmap.core.interfaces.persistence import GitHistoryError
+
+        retriever, mock_persistence, mock_parser, issues_dir = self._make_retriever(
+            temp_dir_context=temp_dir_context
+        )
+        mock_persistence.get_files_at_timestamp.side_effect = GitHistoryError(
+            "Git command failed"
+        )
+
+        with pytest.raises(BaselineRetrievalError):
+            retriever.get_local_baselines(
+                {"one": issues_dir / "one.md"}, datetime.now(UTC)
+            )
+
 
 class TestGetRemoteBaseline:
     """Test remote baseline retrieval from sync_metadata."""
@@ -17,6 +17,7 @@ from roadmap.core.services.sync.duplicate_detector import (
     MatchType,
     RecommendedAction,
 )
+from roadmap.core.services.sync.remote_issue_index import RemoteIssueIndex
 
 
 @pytest.fixture
@@ -202,6 +203,41 @@ class TestDuplicateDetector:
         assert match.confidence == 1.0
         assert match.recommended_action == RecommendedAction.MANUAL_REVIEW
 
+    def test_detect_id_collision_with_shared_remote_index(self, detector):
+        """Test detect_all and remote_self_dedup reuse a prebuilt index."""
+        local_issue = Issue(
+            id="local-1",
+            title="Local title",
+            status=Status.TODO,
+            remote_ids={"github": 42},
+        )
+        remote_issues = {
+            "42": SyncIssue(
+                id="remote-42",
+                title="Completely different",
+                status="open",
+                backend_name="github",
+                backend_id=42,
+            ),
+            "43": SyncIssue(
+                id="remote-43",
+                title="Another issue",
+                status="open",
+                backend_name="github",
+                backend_id=43,
+            ),
+        }
+        remote_index = RemoteIssueIndex(remote_issues)
+
+        matches = detector.detect_all([local_issue], remote_issues, remote_index)
+
+        assert [(m.match_type, m.remote_issue.id) for m in matches] == [
+            (MatchType.ID_COLLISION, "remote-42")
+        ]
+        assert detector.remote_self_dedup(remote_issues, remote_index) == (
+            remote_issues
+        )
+
     def test_detect_title_exact_match(self, detector):
         """Test exact title matching."""
         local_issue = Issue(
@@ -316,6 +352,66 @@ class TestDuplicateDetector:
         matches = detector.detect_all([local_issue], {"remote-1": remote_issue})
         assert len(matches) == 0
 
+    def test_detect_content_duplicates_when_enabled(self):
+        """Test content matching finds different titles over the same body."""
+        body = "Users cannot log in with OAuth after the token refresh expires."
+        local_issue = Issue(
+            id="local-1", title="Login broken", content=body, status=Status.TODO
+        )
+        remote_issue = SyncIssue(
+            id="remote-1",
+            title="OAuth refresh failure",
+            headline=body + " ",
+            status="open",
+            backend_id=123,
+        )
+        remote_issues = {"remote-1": remote_issue}
+
+        assert DuplicateDetector().detect_all([local_issue], remote_issues) == []
+
+        matches = DuplicateDetector(enable_content_matching=True).detect_all(
+            [local_issue], remote_issues
+        )
+
+        assert [m.match_type for m in matches] == [MatchType.CONTENT_SIMILAR]
+        details = matches[0].similarity_details
+        assert details is not None
+        assert details["content_similarity"] == 1.0
+
+    def test_title_matching_agrees_with_all_pairs_scan(self, detector):
+        """Test indexed title matching finds exactly the all-pairs matches."""
+        titles = [
+            "Fix login crash",
+            "Fix login crashes",
+            "Fix logout crash",
+            "Add milestone filter",
+            "Add milestone filters",
+            "Update CLI docs",
+            "fix login crash ",
+            "Sync",
+        ]
+        local_issues = [
+            Issue(id=f"local-{i}", title=title, status=Status.TODO)
+            for i, title in enumerate(titles)
+        ]
+        remote_issues = {
+            f"remote-{i}": SyncIssue(
+                id=f"remote-{i}", title=title, status="open", backend_id=i
+            )
+            for i, title in enumerate(reversed(titles))
+        }
+
+        matches = detector.detect_all(local_issues, remote_issues)
+
+        expected = {
+            (local.id, remote.id)
+            for local in local_issues
+            for remote in remote_issues.values()
+            if detector._calculate_text_similarity(local.title, remote.title)
+            >= detector.title_similarity_threshold
+        }
+        assert {(m.local_issue.id, m.remote_issue.id) for m in matches} == expected
+
     def test_calculate_text_similarity_identical(self, detector):
         """Test text similarity calculation with identical text."""
         text1 = "Fix authentication bug"
@@ -0,0 +1,46 @@
+"""Tests for the remote issue lookup index."""
+
+from roadmap.core.models.sync_models import SyncIssue
+from roadmap.core.services.sync.remote_issue_index import RemoteIssueIndex
+
+
+def _remote(issue_id, backend_id, backend_name="github"):
+    return SyncIssue(
+        id=issue_id,
+        title=issue_id,
+        status="open",
+        backend_name=backend_name,
+        backend_id=backend_id,
+    )
+
+
+class TestRemoteIssueIndex:
+    """Test backend-ID and ID lookups."""
+
+    def test_with_backend_id_normalizes_and_filters_backend(self):
+        remote_issues = {
+            "1": _remote("a", 7),
+            "2": _remote("b", "7"),
+            "3": _remote("c", 7, backend_name="gitlab"),
+            "4": _remote("d", 8),
+        }
+        index = RemoteIssueIndex(remote_issues)
+
+        assert list(index.with_backend_id("7")) == ["1", "2", "3"]
+        assert list(index.with_backend_id(7, "github")) == ["1", "2"]
+        assert index.with_backend_id(99) == {}
+
+    def test_backend_id_groups_skip_issues_without_backend_id(self):
+        index = RemoteIssueIndex(
+            {"1": _remote("a", 5), "2": _remote("b", None), "3": _remote("c", 5)}
+        )
+
+        assert index.backend_id_groups() == {"5": ["1", "3"]}
+        assert len(index) == 3
+
+    def test_get_by_id_returns_first_match(self):
+        first = _remote("dup", 1)
+        index = RemoteIssueIndex({"1": first, "2": _remote("dup", 2)})
+
+        assert index.get_by_id("dup") is first
+        assert index.get_by_id("missing") is None
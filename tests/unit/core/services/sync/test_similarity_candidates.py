@@ -0,0 +1,98 @@
+"""Tests for similarity candidate pair generation."""
+
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from roadmap.core.services.sync.similarity_candidates import (
+    minhash_candidate_pairs,
+    qgram_candidate_pairs,
+)
+
+WORDS = [
+    "fix",
+    "add",
+    "login",
+    "oauth",
+    "token",
+    "sync",
+    "github",
+    "milestone",
+    "crash",
+    "when",
+    "the",
+    "issue",
+    "list",
+    "filter",
+    "slow",
+    "update",
+    "docs",
+    "cli",
+]
+
+
+def _random_strings(rng, count):
+    strings = [" ".join(rng.choices(WORDS, k=rng.randint(1, 6))) for _ in range(count)]
+    # Near-copies with a single character edit, plus very short strings
+    strings += [s[:-1] + "x" for s in strings[: count // 4] if s]
+    strings += ["", "a", "ab", "fix"]
+    return strings
+
+
+def _all_pairs(left, right, threshold):
+    return {
+        (i, j)
+        for i, a in enumerate(left)
+        for j, b in enumerate(right)
+        if SequenceMatcher(None, a, b).ratio() >= threshold
+    }
+
+
+class TestQGramCandidatePairs:
+    """Test the lossless q-gram candidate filter."""
+
+    @pytest.mark.parametrize("threshold", [0.6, 0.8, 0.9, 0.95])
+    @pytest.mark.parametrize("q", [2, 3])
+    def test_keeps_every_pair_at_or_above_threshold(self, threshold, q):
+        rng = random.Random(f"{threshold}-{q}")
+        left = _random_strings(rng, 60)
+        right = _random_strings(rng, 60)
+
+        candidates = qgram_candidate_pairs(left, right, threshold, q=q)
+
+        assert _all_pairs(left, right, threshold) <= candidates
+
+    def test_prunes_unrelated_pairs(self):
+        left = ["fix login crash with oauth token", "update cli docs"]
+        right = ["fix login crash with oauth tokens", "milestone list is slow"]
+
+        assert qgram_candidate_pairs(left, right, 0.9) == {(0, 0)}
+
+    def test_threshold_edges(self):
+        assert qgram_candidate_pairs(["a"], ["b", "c"], 0.0) == {(0, 0), (0, 1)}
+        assert qgram_candidate_pairs(["a"], ["a"], 1.5) == set()
+        assert qgram_candidate_pairs([], ["a"], 0.9) == set()
+
+
+class TestMinHashCandidatePairs:
+    """Test the MinHash LSH candidate filter."""
+
+    def test_finds_near_duplicate_text(self):
+        body = (
+            "Users cannot log in with OAuth after the token refresh. "
+            "Steps: open the app, wait an hour, reload the dashboard."
+        )
+        left = [body, "Completely different text about milestone reporting."]
+        right = ["Unrelated notes on the CLI help output.", body + " Thanks!"]
+
+        assert minhash_candidate_pairs(left, right) == {(0, 1)}
+
+    def test_is_deterministic_and_skips_empty_text(self):
+        left = ["", "same text here", "same text here"]
+        right = ["same text here", ""]
+
+        first = minhash_candidate_pairs(left, right)
+
+        assert first == {(1, 0), (2, 0)}
+        assert minhash_candidate_pairs(left, right) == first
@@ -0,0 +1,43 @@
+"""Tests for normalized sync records."""
+
+from roadmap.common.constants import Status
+from roadmap.core.domain.issue import Issue
+from roadmap.core.services.sync.sync_record import (
+    baseline_record,
+    local_record,
+    remote_record,
+)
+from roadmap.core.services.sync.sync_state import IssueBaseState
+
+
+def test_equivalent_states_have_equal_records():
+    """Baseline, local and remote records agree when the synced fields do."""
+    baseline = IssueBaseState(
+        id="issue-1", status="todo", assignee="alice", content="Body", labels=["a", "b"]
+    )
+    local = Issue(
+        id="issue-1",
+        title="Title",
+        status=Status.TODO,
+        assignee="alice",
+        content="Body",
+        labels=["b", "a"],
+    )
+    remote = {
+        "status": "TODO",
+        "assignee": "alice",
+        "description": "Body",
+        "labels": ["b", "a"],
+    }
+
+    record = baseline_record(baseline)
+    assert record is not None
+    assert local_record(local) == record
+    assert remote_record(remote) == record
+    assert remote_record({**remote, "description": "Edited"}) != record
+
+
+def test_unreadable_values_have_no_record():
+    """Values the change computers cannot normalize yield no record."""
+    assert remote_record({"labels": ["a", None]}) is None
+    assert local_record(object()) is None
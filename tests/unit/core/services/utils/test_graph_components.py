@@ -0,0 +1,26 @@
+"""Tests for strongly connected components of dependency graphs."""
+
+from roadmap.core.services.utils.graph_components import (
+    strongly_connected_components,
+)
+
+
+def test_components_come_out_dependencies_first():
+    graph = {"a": ["b"], "b": ["c"], "c": ["b", "d"], "d": []}
+
+    components = list(strongly_connected_components(graph))
+
+    assert [sorted(c) for c in components] == [["d"], ["b", "c"], ["a"]]
+
+
+def test_self_loop_is_a_single_node_component():
+    assert list(strongly_connected_components({"a": ["a"]})) == [["a"]]
+
+
+def test_deep_chain_does_not_recurse():
+    graph = {str(i): [str(i + 1)] for i in range(5000)}
+    graph["5000"] = ["0"]
+
+    (component,) = strongly_connected_components(graph)
+
+    assert len(component) == 5001
@@ -1,16 +1,19 @@
 """Tests for parser functionality."""
 
+import re
 import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
+import yaml
 
 from roadmap.adapters.persistence.parser import (
     FrontmatterParser,
+    IssueParser,
     MilestoneParser,
 )
-from roadmap.core.domain import Milestone, MilestoneStatus
+from roadmap.core.domain import Issue, Milestone, MilestoneStatus, Status
 
 pytestmark = pytest.mark.unit
 
@@ -251,3 +254,125 @@ class TestMilestoneParser:
         assert parsed_milestone.content == original_milestone.content
         assert parsed_milestone.created == original_milestone.created
         assert parsed_milestone.updated == original_milestone.updated
+
+
+class TestFrontmatterFastPath:
+    """Test the delimiter scan and frontmatter-only loader."""
+
+    LEGACY_PATTERN = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)$", re.DOTALL)
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            "---\ntitle: A\n---\nBody\n",
+            "---  \n\ntitle: A\n---   \n\n\nBody with --- inside\n---\nmore\n",
+            "---\ntitle: '---'\n---\nBody\n",
+            "---\n---\n",
+            "---\ntitle: A\n---",
+            "--- title\n---\nBody\n",
+            "Plain body\n---\nnot: frontmatter\n---\n",
+        ],
+    )
+    def test_parse_content_matches_legacy_regex(self, content):
+        """Test the anchored delimiter scan agrees with the legacy regex."""
+        match = self.LEGACY_PATTERN.match(content)
+        if match:
+            expected = (yaml.safe_load(match.group(1)) or {}, match.group(2).strip())
+        else:
+            expected = ({}, content)
+
+        assert FrontmatterParser.parse_content(content) == expected
+
+    def test_parse_frontmatter_file_stops_at_closing_delimiter(self, tmp_path):
+        """Test frontmatter-only parsing across chunk boundaries."""
+        path = tmp_path / "issue.md"
+        padding = "x" * (FrontmatterParser.READ_CHUNK_SIZE * 2)
+        path.write_text(f"---\ntitle: A\nnote: {padding}\n---\n\nBody\n")
+
+        frontmatter = FrontmatterParser.parse_frontmatter_file(path)
+
+        assert frontmatter == {"title": "A", "note": padding}
+
+    @pytest.mark.parametrize(
+        "content",
+        ["No frontmatter\n", "---\ntitle: A\nnever closed\n"],
+    )
+    def test_parse_frontmatter_file_without_frontmatter(self, tmp_path, content):
+        """Test files without a complete frontmatter block yield {}."""
+        path = tmp_path / "issue.md"
+        path.write_text(content)
+
+        assert FrontmatterParser.parse_frontmatter_file(path) == {}
+
+    def test_parse_frontmatter_file_missing(self, tmp_path):
+        """Test a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            FrontmatterParser.parse_frontmatter_file(tmp_path / "missing.md")
+
+
+class TestLazyIssueContent:
+    """Test deferred loading of issue bodies."""
+
+    @pytest.fixture
+    def issue_file(self, tmp_path):
+        """Write an issue with a headline and a markdown body."""
+        path = tmp_path / "abc12345-lazy.md"
+        IssueParser.save_issue_file(
+            Issue(
+                id="abc12345",
+                title="Lazy",
+                headline="Summary",
+                status=Status.IN_PROGRESS,
+                content="Body text",
+            ),
+            path,
+        )
+        return path
+
+    def test_body_is_read_on_first_access(self, issue_file, monkeypatch):
+        """Test the body is only read when content is accessed."""
+        calls = []
+        original = FrontmatterParser.parse_body_file
+        monkeypatch.setattr(
+            FrontmatterParser,
+            "parse_body_file",
+            lambda path: calls.append(path) or original(path),
+        )
+        issue = IssueParser.parse_issue_file_lazy(issue_file)
+
+        assert issue.status == Status.IN_PROGRESS
+        assert calls == []
+        assert issue.content == "Body text"
+        assert issue.content == "Body text"
+        assert len(calls) == 1
+
+    def test_lazy_issue_matches_eager_issue(self, issue_file):
+        """Test lazy and eager parsing produce equal issues and dumps."""
+        eager = IssueParser.parse_issue_file(issue_file)
+
+        assert IssueParser.parse_issue_file_lazy(issue_file) == eager
+        lazy_dump = IssueParser.parse_issue_file_lazy(issue_file).model_dump()
+        assert lazy_dump == eager.model_dump()
+
+    def test_assigning_content_skips_loader(self, issue_file):
+        """Test assigning content before reading it discards the loader."""
+        issue = IssueParser.parse_issue_file_lazy(issue_file)
+        issue.content = "Replaced"
+
+        assert issue.content == "Replaced"
+
+    def test_lazy_issue_keeps_content_in_field_views(self, issue_file):
+        """Test dict(), model_dump() and copies of a lazy issue carry content."""
+        issue = IssueParser.parse_issue_file_lazy(issue_file)
+
+        assert dict(issue)["content"] == "Body text"
+        assert issue.model_copy(deep=True).content == "Body text"
+        assert Issue.model_validate(issue.model_dump()).content == "Body text"
+
+    def test_moved_file_raises_on_content_access(self, issue_file):
+        """Test a file moved before content is read raises instead of blanking."""
+        issue = IssueParser.parse_issue_file_lazy(issue_file)
+        issue_file.rename(issue_file.with_name("archived.md"))
+
+        with pytest.raises(FileNotFoundError):
+            _ = issue.content
@@ -322,6 +322,32 @@ class TestStateManagerMilestoneRetrieval:
         assert isinstance(result, dict)
         assert "total" in result or result == {}
 
+    def test_get_all_milestones_progress_matches_single_queries(self, state_manager):
+        """Test grouped milestone progress equals per-milestone progress."""
+        with state_manager.transaction() as conn:
+            conn.execute("INSERT INTO projects (id, name) VALUES ('p1', 'Project')")
+            conn.executemany(
+                "INSERT INTO milestones (id, project_id, title) VALUES (?, 'p1', ?)",
+                [("m1", "v1-0"), ("m2", "v2-0"), ("m3", "empty")],
+            )
+            conn.executemany(
+                "INSERT INTO issues (id, milestone_id, title, status) VALUES (?, ?, 'Issue', ?)",
+                [
+                    ("i1", "m1", "closed"),
+                    ("i2", "m1", "todo"),
+                    ("i3", "m2", "closed"),
+                    ("i4", None, "closed"),
+                ],
+            )
+
+        progress = state_manager.get_all_milestones_progress()
+
+        assert progress == {
+            name: state_manager.get_milestone_progress(name)
+            for name in ["v1-0", "v2-0", "empty"]
+        }
+        assert progress["v1-0"] == {"total": 2, "completed": 1}
+
 
 class TestStateManagerSafetyChecks:
     """Test safety checks for write operations."""
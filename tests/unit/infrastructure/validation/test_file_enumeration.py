@@ -0,0 +1,145 @@
+"""Tests for FileEnumerationService parsing, including the process-pool path."""
+
+import threading
+
+import pytest
+
+from roadmap.adapters.persistence.parser import IssueParser
+from roadmap.common.cache import get_parsed_file_cache
+from roadmap.infrastructure.validation import file_enumeration
+from roadmap.infrastructure.validation.file_enumeration import (
+    FileEnumerationService,
+    SplitParser,
+)
+from tests.fixtures.issue_corpus import generate_issue_corpus
+
+ISSUE_SPLIT_PARSER = SplitParser(IssueParser.read_issue_file, IssueParser.build_issue)
+
+
+@pytest.fixture
+def issues_dir(tmp_path):
+    """Directory with 12 generated issues, one broken file and one backup."""
+    directory = tmp_path / "issues"
+    generate_issue_corpus(directory, 12)
+    (directory / "broken.md").write_text("---\nid: [unclosed\n---\n")
+    (directory / "old.backup.md").write_text("---\nid: backup\n---\n")
+    return directory
+
+
+@pytest.fixture
+def low_threshold(monkeypatch):
+    """Use the pool for any directory in these tests."""
+    monkeypatch.setattr(file_enumeration, "PARALLEL_PARSE_THRESHOLD", 2)
+
+
+def _issue_files(directory):
+    return sorted(p for p in directory.rglob("*.md") if ".backup" not in p.name)
+
+
+def _titles(issues):
+    return sorted(issue.title for issue in issues)
+
+
+class TestEnumerateAndParse:
+    """Tests for FileEnumerationService.enumerate_and_parse."""
+
+    def test_sequential_parse_skips_broken_and_backup_files(self, issues_dir):
+        """Broken files are skipped and backups filtered."""
+        issues = FileEnumerationService.enumerate_and_parse(
+            issues_dir, IssueParser.parse_issue_file
+        )
+
+        assert len(issues) == 12
+        assert all(issue.file_path for issue in issues)
+
+    def test_pool_matches_sequential_parse(self, issues_dir, low_threshold):
+        """Worker-parsed issues equal the sequentially parsed ones, in order."""
+        sequential = FileEnumerationService.enumerate_and_parse(
+            issues_dir, IssueParser.parse_issue_file
+        )
+        get_parsed_file_cache().clear()
+
+        files = _issue_files(issues_dir)
+        pooled = FileEnumerationService._parse_with_pool(
+            files, IssueParser.parse_issue_file, ISSUE_SPLIT_PARSER, workers=2
+        )
+
+        parsed = [issue for issue in pooled if issue is not None]
+        assert _titles(parsed) == _titles(sequential)
+        assert [issue.file_path for issue in parsed] == [
+            str(path) for path in files if path.name != "broken.md"
+        ]
+
+    def test_pool_results_are_cached(self, issues_dir, low_threshold):
+        """A cold pooled load warms the cache for the plain parser."""
+        FileEnumerationService.enumerate_and_parse(
+            issues_dir, IssueParser.parse_issue_file, split_parser=ISSUE_SPLIT_PARSER
+        )
+        cache = get_parsed_file_cache()
+        hits = cache.hits
+
+        FileEnumerationService.enumerate_and_parse(
+            issues_dir, IssueParser.parse_issue_file
+        )
+
+        assert cache.hits - hits == 12
+
+    def test_pool_uses_fork_server_while_other_threads_run(
+        self, issues_dir, low_threshold, monkeypatch
+    ):
+        """Workers are not forked from a process with other live threads."""
+        monkeypatch.setattr(file_enumeration.sys, "platform", "linux")
+        monkeypatch.setattr(file_enumeration, "_is_single_threaded", lambda: True)
+        assert file_enumeration._pool_context().get_start_method() == "fork"
+
+        monkeypatch.setattr(file_enumeration, "_is_single_threaded", lambda: False)
+        assert file_enumeration._pool_context().get_start_method() == "forkserver"
+
+        files = _issue_files(issues_dir)
+        parsed = FileEnumerationService._parse_with_pool(
+            files, IssueParser.parse_issue_file, ISSUE_SPLIT_PARSER, workers=2
+        )
+
+        assert len([issue for issue in parsed if issue is not None]) == 12
+
+    def test_other_threads_are_detected(self):
+        """A live helper thread rules out forking."""
+        release = threading.Event()
+        helper = threading.Thread(target=release.wait)
+        helper.start()
+        try:
+            assert not file_enumeration._is_single_threaded()
+        finally:
+            release.set()
+            helper.join()
+
+    def test_pool_failure_falls_back_to_sequential(
+        self, issues_dir, low_threshold, monkeypatch
+    ):
+        """If workers cannot run, files are parsed in-process."""
+
+        def broken_pool(*_args, **_kwargs):
+            raise OSError("no processes")
+
+        monkeypatch.setattr(file_enumeration, "ProcessPoolExecutor", broken_pool)
+
+        files = _issue_files(issues_dir)
+        parsed = FileEnumerationService._parse_with_pool(
+            files, IssueParser.parse_issue_file, ISSUE_SPLIT_PARSER, workers=2
+        )
+
+        assert len([issue for issue in parsed if issue is not None]) == 12
+
+    def test_small_directories_stay_in_process(self, issues_dir, monkeypatch):
+        """Below the threshold no pool is started."""
+
+        def unexpected_pool(*_args, **_kwargs):
+            raise AssertionError("pool should not start")
+
+        monkeypatch.setattr(file_enumeration, "ProcessPoolExecutor", unexpected_pool)
+
+        issues = FileEnumerationService.enumerate_and_parse(
+            issues_dir, IssueParser.parse_issue_file, split_parser=ISSUE_SPLIT_PARSER
+        )
+
+        assert len(issues) == 12
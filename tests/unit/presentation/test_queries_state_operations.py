@@ -4,6 +4,7 @@ Tests for state checking and progress calculations.
 Covers file change detection and milestone progress tracking.
 """
 
+import os
 from pathlib import Path
 from unittest import mock
 
@@ -50,151 +51,119 @@ class TestHasFileChanges:
                 result = service.has_file_changes()
                 assert result is expected
 
-    def test_has_file_changes_with_new_file(self, mock_path_factory):
-        """Test has_file_changes detects new markdown files."""
-        mock_state_manager = mock.MagicMock()
-        mock_roadmap_dir = Path("/test/.roadmap")
-        mock_state_manager.db_path = mock_roadmap_dir / "db.sqlite"
-
-        mock_file = mock_path_factory(name="issues/test.md", exists=True)
-        mock_file.read_bytes = mock.Mock(return_value=b"file content")
-
-        mock_conn = mock.MagicMock()
-        mock_conn.execute.return_value.fetchone.return_value = None  # No stored hash
-
-        with mock.patch("hashlib.sha256") as mock_hash:
-            mock_hash.return_value.hexdigest.return_value = "abc123"
+    @pytest.fixture
+    def synced_roadmap(self, tmp_path):
+        """A roadmap directory with one issue file recorded in file_sync_state."""
+        from roadmap.adapters.persistence.database_manager import DatabaseManager
 
-            with mock.patch.object(Path, "exists", return_value=True):
-                with mock.patch("pathlib.Path.rglob") as mock_rglob:
-                    mock_rglob.return_value = [mock_file]
+        (tmp_path / "db").mkdir()
+        manager = DatabaseManager(db_path=tmp_path / "db" / "state.db")
+        issue_file = tmp_path / "issues" / "issue-1.md"
+        issue_file.parent.mkdir()
+        issue_file.write_text("---\nid: issue-1\n---\n")
+        self._record(manager, issue_file)
 
-                    with mock.patch.object(
-                        mock_state_manager, "transaction"
-                    ) as mock_transaction:
-                        mock_transaction.return_value.__enter__.return_value = mock_conn
-
-                        service = QueryService(mock_state_manager)
-                        result = service.has_file_changes()
-
-                        # New file (no stored hash) means changes detected
-                        assert result is True
-
-    def test_has_file_changes_with_modified_file(self, mock_path_factory):
-        """Test has_file_changes detects modified markdown files."""
         mock_state_manager = mock.MagicMock()
-        mock_roadmap_dir = Path("/test/.roadmap")
-        mock_state_manager.db_path = mock_roadmap_dir / "db.sqlite"
-
-        mock_file = mock_path_factory(name="issues/test.md", exists=True)
-        mock_file.read_bytes = mock.Mock(return_value=b"new content")
-
-        mock_conn = mock.MagicMock()
-        # Stored hash is different from current hash
-        mock_conn.execute.return_value.fetchone.return_value = ("old_hash_value",)
-
-        with mock.patch("hashlib.sha256") as mock_hash:
-            mock_hash.return_value.hexdigest.return_value = "new_hash_value"
-
-            with mock.patch.object(Path, "exists", return_value=True):
-                with mock.patch("pathlib.Path.rglob") as mock_rglob:
-                    mock_rglob.return_value = [mock_file]
-
-                    with mock.patch.object(
-                        mock_state_manager, "transaction"
-                    ) as mock_transaction:
-                        mock_transaction.return_value.__enter__.return_value = mock_conn
-
-                        service = QueryService(mock_state_manager)
-                        result = service.has_file_changes()
-
-                        # Modified file (different hash) means changes detected
-                        assert result is True
-
-    def test_has_file_changes_no_changes(self, mock_path_factory):
+        mock_state_manager.db_path = manager.db_path
+        mock_state_manager.transaction = manager.transaction
+        yield QueryService(mock_state_manager), manager, issue_file
+        manager.close()
+
+    @staticmethod
+    def _record(manager, file_path):
+        from roadmap.adapters.persistence.file_parser import FileParser
+
+        metadata = FileParser.extract_file_metadata(file_path)
+        with manager.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO file_sync_state "
+                "(file_path, content_hash, file_size, mtime_ns, inode) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    str(file_path),
+                    metadata["hash"],
+                    metadata["size"],
+                    metadata["mtime_ns"],
+                    metadata["inode"],
+                ),
+            )
+
+    def test_has_file_changes_no_changes(self, synced_roadmap):
         """Test has_file_changes when files haven't changed."""
-        mock_state_manager = mock.MagicMock()
-        mock_roadmap_dir = Path("/test/.roadmap")
-        mock_state_manager.db_path = mock_roadmap_dir / "db.sqlite"
+        service, _, _ = synced_roadmap
 
-        mock_file = mock_path_factory(name="issues/test.md", exists=True)
-        mock_file.read_bytes = mock.Mock(return_value=b"file content")
+        assert service.has_file_changes() is False
 
-        test_hash = "abc123def456"
-        mock_conn = mock.MagicMock()
-        mock_conn.execute.return_value.fetchone.return_value = (test_hash,)
-
-        with mock.patch("hashlib.sha256") as mock_hash:
-            mock_hash.return_value.hexdigest.return_value = test_hash
-
-            with mock.patch.object(Path, "exists", return_value=True):
-                with mock.patch.object(Path, "rglob") as mock_rglob:
-                    mock_rglob.return_value = [mock_file]
-
-                    with mock.patch.object(
-                        mock_state_manager, "transaction"
-                    ) as mock_transaction:
-                        mock_transaction.return_value.__enter__.return_value = mock_conn
+    def test_has_file_changes_with_new_file(self, synced_roadmap):
+        """Test has_file_changes detects new markdown files."""
+        service, _, issue_file = synced_roadmap
+        (issue_file.parent / "issue-2.md").write_text("---\nid: issue-2\n---\n")
 
-                        with mock.patch.object(
-                            Path, "parent", new_callable=mock.PropertyMock
-                        ):
-                            service = QueryService(mock_state_manager)
-                            result = service.has_file_changes()
+        assert service.has_file_changes() is True
 
-                            # Same hash means no changes
-                            assert result is False
+    def test_has_file_changes_with_modified_file(self, synced_roadmap):
+        """Test has_file_changes detects modified markdown files."""
+        service, _, issue_file = synced_roadmap
+        issue_file.write_text("---\nid: issue-1\ntitle: Edited\n---\n")
+
+        assert service.has_file_changes() is True
+
+    def test_has_file_changes_touched_file(self, synced_roadmap):
+        """Test a touched but unedited file is unchanged and its stat refreshed."""
+        service, manager, issue_file = synced_roadmap
+        stat = issue_file.stat()
+        os.utime(issue_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert service.has_file_changes() is False
+        row = (
+            manager._get_connection()
+            .execute(
+                "SELECT mtime_ns FROM file_sync_state WHERE file_path = ?",
+                (str(issue_file),),
+            )
+            .fetchone()
+        )
+        assert row[0] == stat.st_mtime_ns + 1_000_000
 
-    def test_has_file_changes_transaction_error(self, mock_path_factory):
+    def test_has_file_changes_transaction_error(self, synced_roadmap):
         """Test has_file_changes handles transaction errors."""
-        mock_state_manager = mock.MagicMock()
-        mock_state_manager.db_path = Path("/test/.roadmap/db.sqlite")
-
-        mock_file = mock_path_factory(name="issues/test.md", exists=True)
-        mock_file.read_bytes = mock.Mock(return_value=b"content")
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch("pathlib.Path.rglob") as mock_rglob:
-                mock_rglob.return_value = [mock_file]
-
-                with mock.patch.object(mock_state_manager, "transaction") as mock_tx:
-                    mock_tx.side_effect = Exception("Database error")
-
-                    service = QueryService(mock_state_manager)
-                    result = service.has_file_changes()
-
-                    # On error, assume changes exist to be safe
-                    assert result is True
-
-    def test_has_file_changes_file_disappeared(self, mock_path_factory):
-        """Test has_file_changes when file disappears during check."""
-        mock_state_manager = mock.MagicMock()
-        mock_state_manager.db_path = Path("/test/.roadmap/db.sqlite")
-
-        mock_file = mock_path_factory(
-            name="issues/test.md",
-            exists=False,  # File disappeared
+        service, _, _ = synced_roadmap
+        service.state_manager.transaction = mock.Mock(
+            side_effect=Exception("Database error")
         )
 
-        mock_conn = mock.MagicMock()
-
-        with mock.patch.object(Path, "exists", return_value=True):
-            with mock.patch.object(Path, "rglob") as mock_rglob:
-                mock_rglob.return_value = [mock_file]
-
-                with mock.patch.object(
-                    mock_state_manager, "transaction"
-                ) as mock_transaction:
-                    mock_transaction.return_value.__enter__.return_value = mock_conn
-
-                    with mock.patch.object(
-                        Path, "parent", new_callable=mock.PropertyMock
-                    ):
-                        service = QueryService(mock_state_manager)
-                        result = service.has_file_changes()
-
-                        # File disappeared, continue checking
-                        assert result is False
+        # On error, assume changes exist to be safe
+        assert service.has_file_changes() is True
+
+    def test_has_file_changes_file_disappeared(self, synced_roadmap):
+        """Test has_file_changes when a synced file has been removed."""
+        service, _, issue_file = synced_roadmap
+        issue_file.unlink()
+
+        assert service.has_file_changes() is False
+
+    def test_has_file_changes_with_core_layout(self, tmp_path):
+        """Test the .roadmap/db/state.db layout RoadmapCore uses scans .roadmap."""
+        from roadmap.adapters.persistence.storage import StateManager
+        from roadmap.common.utils.path_utils import build_roadmap_paths
+
+        paths = build_roadmap_paths(tmp_path)
+        paths["db_dir"].mkdir(parents=True)
+        state_manager = StateManager(db_path=paths["db_dir"] / "state.db")
+        issue_file = paths["issues_dir"] / "backlog" / "issue-1.md"
+        issue_file.parent.mkdir(parents=True)
+        issue_file.write_text("---\nid: issue-1\n---\n")
+
+        try:
+            assert state_manager.has_file_changes() is True
+            self._record(state_manager._db_manager, issue_file)
+            assert state_manager.has_file_changes() is False
+            assert state_manager.has_file_changes(paths["roadmap_dir"]) is False
+
+            issue_file.write_text("---\nid: issue-1\ntitle: Edited\n---\n")
+            assert state_manager.has_file_changes() is True
+        finally:
+            state_manager.close()
 
 
 class TestGetMilestoneProgress:
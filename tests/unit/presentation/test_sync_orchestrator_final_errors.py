@@ -60,7 +60,13 @@ class TestHasFileChanged:
         else:
             mock_conn = mock.MagicMock()
             if stored_hash is not None:
-                mock_conn.execute.return_value.fetchone.return_value = (stored_hash,)
+                mock_conn.execute.return_value.fetchone.return_value = (
+                    "test.md",
+                    stored_hash,
+                    None,
+                    None,
+                    None,
+                )
             else:
                 mock_conn.execute.return_value.fetchone.return_value = None
             mock_get_conn.return_value = mock_conn
@@ -31,6 +31,20 @@ class _Repo:
         del milestone, status
         return list(self.items.values())
 
+    def query(
+        self,
+        status: str | None = None,
+        priority: str | None = None,
+        issue_type: str | None = None,
+        assignee: str | None = None,
+        milestone: str | None = None,
+        backlog: bool = False,
+        overdue: bool = False,
+        open_only: bool = False,
+        blocked_only: bool = False,
+    ) -> list[Issue] | None:
+        return None
+
     def update(self, issue_id: str, updates: dict) -> Issue | None:
         issue = self.items.get(issue_id)
         if issue is None: